@@ -3,15 +3,14 @@
 import asyncio
 from logging.config import fileConfig
 
-from sqlalchemy import pool
 from sqlalchemy.engine import Connection
-from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 
 # Import application settings and models
 from app.core.config import settings
-from app.models.base import Base
+from app.db.session import EngineRole, create_engine
+from app.models import Base
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -72,11 +71,7 @@ async def run_async_migrations() -> None:
 
     """
 
-    connectable = async_engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    connectable = create_engine(EngineRole.MIGRATION)
 
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
@@ -0,0 +1,73 @@
+"""add_llm_cache_entries
+
+Revision ID: 3f9a1c2d7b64
+Revises: 78b576fc3930
+Create Date: 2026-10-16 09:12:40.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a1c2d7b64"
+down_revision: Union[str, None] = "78b576fc3930"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_cache_entries",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(length=255), nullable=False),
+        sa.Column("response", postgresql.JSONB(), nullable=False),
+        sa.Column("latency_ms", sa.Integer(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cache_key"),
+    )
+    op.create_index(
+        op.f("ix_llm_cache_entries_deleted_at"),
+        "llm_cache_entries",
+        ["deleted_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_llm_cache_entries_expires_at"),
+        "llm_cache_entries",
+        ["expires_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_llm_cache_entries_id"), "llm_cache_entries", ["id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_llm_cache_entries_id"), table_name="llm_cache_entries")
+    op.drop_index(
+        op.f("ix_llm_cache_entries_expires_at"), table_name="llm_cache_entries"
+    )
+    op.drop_index(
+        op.f("ix_llm_cache_entries_deleted_at"), table_name="llm_cache_entries"
+    )
+    op.drop_table("llm_cache_entries")
@@ -0,0 +1,90 @@
+"""add_evidence
+
+Revision ID: 5e2b9d04c7a1
+Revises: c3d8f1a64b27
+Create Date: 2026-10-17 11:38:05.264019
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2b9d04c7a1"
+down_revision: Union[str, None] = "c3d8f1a64b27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evidence",
+        sa.Column("assessment_id", sa.UUID(), nullable=False),
+        sa.Column("supplier_domain", sa.String(length=255), nullable=False),
+        sa.Column("source_url", sa.Text(), nullable=False),
+        sa.Column("source_type", sa.String(length=32), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("collector_tool", sa.String(length=64), nullable=False),
+        sa.Column("collected_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("reliability", sa.String(length=16), nullable=True),
+        sa.Column("recency", sa.String(length=16), nullable=True),
+        sa.Column("relevance_score", sa.Float(), nullable=True),
+        sa.Column(
+            "risk_categories",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'[]'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "assessment_id", "content_hash", name="uq_evidence_assessment_content"
+        ),
+    )
+    op.create_index(
+        "ix_evidence_live_created_at_id",
+        "evidence",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_evidence_deleted_at",
+        "evidence",
+        ["deleted_at"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_evidence_supplier_domain",
+        "evidence",
+        ["supplier_domain"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evidence_supplier_domain", table_name="evidence")
+    op.drop_index("ix_evidence_deleted_at", table_name="evidence")
+    op.drop_index("ix_evidence_live_created_at_id", table_name="evidence")
+    op.drop_table("evidence")
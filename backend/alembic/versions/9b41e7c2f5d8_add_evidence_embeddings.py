@@ -0,0 +1,109 @@
+"""add_evidence_embeddings
+
+Revision ID: 9b41e7c2f5d8
+Revises: 5e2b9d04c7a1
+Create Date: 2026-10-17 14:02:51.730118
+
+Enables the pgvector extension (shipped by the pgvector/pgvector image) and
+adds evidence_embeddings with an HNSW index over half-precision vectors.
+The vector dimension must match EMBEDDING_DIMENSIONS.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import HALFVEC
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b41e7c2f5d8"
+down_revision: Union[str, None] = "5e2b9d04c7a1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMBEDDING_DIMENSIONS = 1536
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    op.create_table(
+        "evidence_embeddings",
+        sa.Column("evidence_id", sa.UUID(), nullable=False),
+        sa.Column("chunk_index", sa.Integer(), nullable=False),
+        sa.Column("supplier_domain", sa.String(length=255), nullable=False),
+        sa.Column("source_type", sa.String(length=32), nullable=False),
+        sa.Column("collected_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("embedding_model", sa.String(length=64), nullable=False),
+        sa.Column("embedding", HALFVEC(EMBEDDING_DIMENSIONS), nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["evidence_id"], ["evidence.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "evidence_id", "chunk_index", name="uq_evidence_embeddings_chunk"
+        ),
+    )
+    op.create_index(
+        "ix_evidence_embeddings_live_created_at_id",
+        "evidence_embeddings",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_evidence_embeddings_deleted_at",
+        "evidence_embeddings",
+        ["deleted_at"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+    )
+    op.create_index(
+        "ix_evidence_embeddings_content_hash",
+        "evidence_embeddings",
+        ["content_hash"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_evidence_embeddings_supplier",
+        "evidence_embeddings",
+        ["supplier_domain", "collected_at"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_evidence_embeddings_hnsw",
+        "evidence_embeddings",
+        ["embedding"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_with={"m": 16, "ef_construction": 64},
+        postgresql_ops={"embedding": "halfvec_cosine_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evidence_embeddings_hnsw", table_name="evidence_embeddings")
+    op.drop_index("ix_evidence_embeddings_supplier", table_name="evidence_embeddings")
+    op.drop_index(
+        "ix_evidence_embeddings_content_hash", table_name="evidence_embeddings"
+    )
+    op.drop_index("ix_evidence_embeddings_deleted_at", table_name="evidence_embeddings")
+    op.drop_index(
+        "ix_evidence_embeddings_live_created_at_id", table_name="evidence_embeddings"
+    )
+    op.drop_table("evidence_embeddings")
@@ -0,0 +1,81 @@
+"""add_workflow_checkpoints
+
+Revision ID: a7c41e9b2d05
+Revises: 3f9a1c2d7b64
+Create Date: 2026-10-16 14:03:11.482913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c41e9b2d05"
+down_revision: Union[str, None] = "3f9a1c2d7b64"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "workflow_checkpoints",
+        sa.Column("thread_id", sa.String(length=255), nullable=False),
+        sa.Column("checkpoint_ns", sa.String(length=255), nullable=False),
+        sa.Column("checkpoint_id", sa.String(length=64), nullable=False),
+        sa.Column("parent_checkpoint_id", sa.String(length=64), nullable=True),
+        sa.Column("type", sa.String(length=64), nullable=False),
+        sa.Column("checkpoint", sa.LargeBinary(), nullable=False),
+        sa.Column("channel_versions", postgresql.JSONB(), nullable=False),
+        sa.Column("metadata", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("thread_id", "checkpoint_ns", "checkpoint_id"),
+    )
+    op.create_index(
+        op.f("ix_workflow_checkpoints_created_at"),
+        "workflow_checkpoints",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_table(
+        "workflow_checkpoint_blobs",
+        sa.Column("thread_id", sa.String(length=255), nullable=False),
+        sa.Column("checkpoint_ns", sa.String(length=255), nullable=False),
+        sa.Column("channel", sa.String(length=255), nullable=False),
+        sa.Column("version", sa.String(length=64), nullable=False),
+        sa.Column("type", sa.String(length=64), nullable=False),
+        sa.Column("blob", sa.LargeBinary(), nullable=True),
+        sa.PrimaryKeyConstraint("thread_id", "checkpoint_ns", "channel", "version"),
+    )
+    op.create_table(
+        "workflow_checkpoint_writes",
+        sa.Column("thread_id", sa.String(length=255), nullable=False),
+        sa.Column("checkpoint_ns", sa.String(length=255), nullable=False),
+        sa.Column("checkpoint_id", sa.String(length=64), nullable=False),
+        sa.Column("task_id", sa.String(length=64), nullable=False),
+        sa.Column("idx", sa.Integer(), nullable=False),
+        sa.Column("channel", sa.String(length=255), nullable=False),
+        sa.Column("task_path", sa.String(length=1024), nullable=False),
+        sa.Column("type", sa.String(length=64), nullable=False),
+        sa.Column("blob", sa.LargeBinary(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "thread_id", "checkpoint_ns", "checkpoint_id", "task_id", "idx"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("workflow_checkpoint_writes")
+    op.drop_table("workflow_checkpoint_blobs")
+    op.drop_index(
+        op.f("ix_workflow_checkpoints_created_at"), table_name="workflow_checkpoints"
+    )
+    op.drop_table("workflow_checkpoints")
@@ -0,0 +1,79 @@
+"""base_model_partial_indexes
+
+Revision ID: c3d8f1a64b27
+Revises: a7c41e9b2d05
+Create Date: 2026-10-17 09:12:40.517302
+
+Applies the BaseModel index layout to every table that has its columns
+(id, created_at, deleted_at):
+
+- drops ix_<table>_id, which duplicated the primary key index;
+- replaces the full ix_<table>_deleted_at with one over soft-deleted rows;
+- replaces ix_<table>_created_at_id with ix_<table>_live_created_at_id over
+  live rows (deleted_at IS NULL), which keyset pagination uses.
+
+Indexes are built CONCURRENTLY so large tables stay writable. Ids are now
+generated as UUIDv7 by the application; existing ids are left unchanged.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d8f1a64b27"
+down_revision: Union[str, None] = "a7c41e9b2d05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _base_model_tables() -> list[str]:
+    inspector = sa.inspect(op.get_bind())
+    return [
+        table
+        for table in inspector.get_table_names()
+        if {"id", "created_at", "deleted_at"}
+        <= {column["name"] for column in inspector.get_columns(table)}
+    ]
+
+
+def upgrade() -> None:
+    tables = _base_model_tables()
+    with op.get_context().autocommit_block():
+        for table in tables:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                f"ix_{table}_live_created_at_id ON {table} (created_at, id) "
+                f"WHERE deleted_at IS NULL"
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_created_at_id")
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_deleted_at")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY ix_{table}_deleted_at ON {table} "
+                f"(deleted_at) WHERE deleted_at IS NOT NULL"
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_id")
+
+
+def downgrade() -> None:
+    tables = _base_model_tables()
+    with op.get_context().autocommit_block():
+        for table in tables:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_id "
+                f"ON {table} (id)"
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_deleted_at")
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY ix_{table}_deleted_at "
+                f"ON {table} (deleted_at)"
+            )
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                f"ix_{table}_created_at_id ON {table} (created_at, id)"
+            )
+            op.execute(
+                f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_live_created_at_id"
+            )
@@ -0,0 +1,507 @@
+"""Postgres checkpointer for the assessment workflow.
+
+Persists workflow state after every step through the shared async engine in
+app.db.session, so a retried assessment resumes from its last completed
+node instead of scraping everything again. Channel values are stored once
+per version and zlib-compressed above CHECKPOINT_COMPRESS_MIN_BYTES, so a
+step that only adds a summary does not rewrite the page snapshots.
+
+Only the async checkpointer API is implemented.
+"""
+
+import json
+import random
+import time
+import zlib
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.session import async_session_maker
+from app.models.checkpoint import (
+    WorkflowCheckpoint,
+    WorkflowCheckpointBlob,
+    WorkflowCheckpointWrite,
+)
+
+logger = get_logger(__name__)
+
+_COMPRESSED_SUFFIX = "+zlib"
+_COMPRESSION_LEVEL = 3  # favour speed; state is mostly scraped text
+
+
+class PostgresCheckpointSaver(BaseCheckpointSaver[str]):
+    """LangGraph checkpoint saver backed by SQLAlchemy async sessions."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+        compress_min_bytes: int = 1024,
+        slow_write_ms: int = 250,
+        retention_days: int = 7,
+        prune_batch_size: int = 500,
+    ) -> None:
+        super().__init__()
+        self.session_maker = session_maker
+        self.compress_min_bytes = compress_min_bytes
+        self.slow_write_ms = slow_write_ms
+        self.retention_days = retention_days
+        self.prune_batch_size = prune_batch_size
+        self._counters = {
+            "writes": 0,
+            "slow_writes": 0,
+            "write_ms_total": 0.0,
+            "write_ms_max": 0.0,
+            "bytes_raw": 0,
+            "bytes_stored": 0,
+        }
+
+    # -- reads ---------------------------------------------------------------
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Return the requested checkpoint, or the thread's latest one."""
+        configurable = config["configurable"]
+        query = select(WorkflowCheckpoint).where(
+            WorkflowCheckpoint.thread_id == configurable["thread_id"],
+            WorkflowCheckpoint.checkpoint_ns == configurable.get("checkpoint_ns", ""),
+        )
+        if checkpoint_id := get_checkpoint_id(config):
+            query = query.where(WorkflowCheckpoint.checkpoint_id == checkpoint_id)
+        else:
+            query = query.order_by(WorkflowCheckpoint.checkpoint_id.desc()).limit(1)
+
+        async with self.session_maker() as session:
+            row = await session.scalar(query)
+            if row is None:
+                return None
+            return await self._load_tuple(session, row)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """List checkpoints, newest first."""
+        query = select(WorkflowCheckpoint).order_by(
+            WorkflowCheckpoint.checkpoint_id.desc()
+        )
+        if config is not None:
+            configurable = config["configurable"]
+            query = query.where(
+                WorkflowCheckpoint.thread_id == configurable["thread_id"]
+            )
+            if (checkpoint_ns := configurable.get("checkpoint_ns")) is not None:
+                query = query.where(WorkflowCheckpoint.checkpoint_ns == checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                query = query.where(WorkflowCheckpoint.checkpoint_id == checkpoint_id)
+        if filter:
+            query = query.where(WorkflowCheckpoint.metadata_.contains(filter))
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            query = query.where(WorkflowCheckpoint.checkpoint_id < before_id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        async with self.session_maker() as session:
+            for row in (await session.scalars(query)).all():
+                yield await self._load_tuple(session, row)
+
+    # -- writes --------------------------------------------------------------
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Store a checkpoint and the channel values that changed in it."""
+        started = time.perf_counter()
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        values = checkpoint["channel_values"]
+        bookkeeping = {
+            key: value for key, value in checkpoint.items() if key != "channel_values"
+        }
+
+        blobs = []
+        for channel, version in new_versions.items():
+            value_type, blob = (
+                self._dump(values[channel]) if channel in values else ("empty", None)
+            )
+            blobs.append(
+                {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "channel": channel,
+                    "version": str(version),
+                    "type": value_type,
+                    "blob": blob,
+                }
+            )
+        checkpoint_type, checkpoint_blob = self._dump(bookkeeping)
+        row = {
+            "type": checkpoint_type,
+            "checkpoint": checkpoint_blob,
+            "channel_versions": checkpoint["channel_versions"],
+            "metadata_": _json_safe(get_checkpoint_metadata(config, metadata)),
+        }
+        statement = insert(WorkflowCheckpoint).values(
+            thread_id=thread_id,
+            checkpoint_ns=checkpoint_ns,
+            checkpoint_id=checkpoint["id"],
+            parent_checkpoint_id=configurable.get("checkpoint_id"),
+            **row,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["thread_id", "checkpoint_ns", "checkpoint_id"],
+            set_={"metadata" if k == "metadata_" else k: v for k, v in row.items()},
+        )
+
+        async with self.session_maker() as session, session.begin():
+            if blobs:
+                await session.execute(
+                    insert(WorkflowCheckpointBlob)
+                    .values(blobs)
+                    .on_conflict_do_nothing()
+                )
+            await session.execute(statement)
+        self._record_write(started, thread_id)
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store the writes of a task that finished within the current step."""
+        if not writes:
+            return
+        started = time.perf_counter()
+        configurable = config["configurable"]
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            value_type, blob = self._dump(value)
+            rows.append(
+                {
+                    "thread_id": configurable["thread_id"],
+                    "checkpoint_ns": configurable.get("checkpoint_ns", ""),
+                    "checkpoint_id": configurable["checkpoint_id"],
+                    "task_id": task_id,
+                    "idx": WRITES_IDX_MAP.get(channel, idx),
+                    "channel": channel,
+                    "task_path": task_path,
+                    "type": value_type,
+                    "blob": blob,
+                }
+            )
+        statement = insert(WorkflowCheckpointWrite).values(rows)
+        # Special writes (errors, interrupts) replace earlier ones; regular
+        # writes are idempotent per (task, index)
+        if all(channel in WRITES_IDX_MAP for channel, _ in writes):
+            statement = statement.on_conflict_do_update(
+                index_elements=[
+                    "thread_id",
+                    "checkpoint_ns",
+                    "checkpoint_id",
+                    "task_id",
+                    "idx",
+                ],
+                set_={
+                    "channel": statement.excluded.channel,
+                    "type": statement.excluded.type,
+                    "blob": statement.excluded.blob,
+                },
+            )
+        else:
+            statement = statement.on_conflict_do_nothing()
+
+        async with self.session_maker() as session, session.begin():
+            await session.execute(statement)
+        self._record_write(started, configurable["thread_id"])
+
+    # -- pruning -------------------------------------------------------------
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Delete every checkpoint, blob and write of a thread."""
+        await self.aprune([thread_id], strategy="delete")
+
+    async def aprune(
+        self, thread_ids: Sequence[str], *, strategy: str = "keep_latest"
+    ) -> None:
+        """Prune checkpoints for many threads in a few bulk statements.
+
+        Args:
+            thread_ids: Threads (assessment ids) to prune.
+            strategy: ``"keep_latest"`` keeps the latest checkpoint per
+                namespace and the values it references; ``"delete"`` removes
+                everything.
+
+        Raises:
+            ValueError: If the strategy is unknown.
+        """
+        if not thread_ids:
+            return
+        ids = list(thread_ids)
+        statements: list[Any]
+        if strategy == "delete":
+            statements = [
+                delete(model).where(model.thread_id.in_(ids))
+                for model in (
+                    WorkflowCheckpointWrite,
+                    WorkflowCheckpointBlob,
+                    WorkflowCheckpoint,
+                )
+            ]
+        elif strategy == "keep_latest":
+            latest = (
+                select(
+                    WorkflowCheckpoint.thread_id,
+                    WorkflowCheckpoint.checkpoint_ns,
+                    func.max(WorkflowCheckpoint.checkpoint_id),
+                )
+                .where(WorkflowCheckpoint.thread_id.in_(ids))
+                .group_by(
+                    WorkflowCheckpoint.thread_id, WorkflowCheckpoint.checkpoint_ns
+                )
+            )
+            referenced = (
+                select(WorkflowCheckpoint.checkpoint_id)
+                .where(
+                    WorkflowCheckpoint.thread_id == WorkflowCheckpointBlob.thread_id,
+                    WorkflowCheckpoint.checkpoint_ns
+                    == WorkflowCheckpointBlob.checkpoint_ns,
+                    WorkflowCheckpoint.channel_versions[
+                        WorkflowCheckpointBlob.channel
+                    ].astext
+                    == WorkflowCheckpointBlob.version,
+                )
+                .exists()
+            )
+            statements = [
+                delete(model).where(
+                    model.thread_id.in_(ids),
+                    tuple_(
+                        model.thread_id, model.checkpoint_ns, model.checkpoint_id
+                    ).not_in(latest),
+                )
+                for model in (WorkflowCheckpointWrite, WorkflowCheckpoint)
+            ]
+            statements.append(
+                delete(WorkflowCheckpointBlob).where(
+                    WorkflowCheckpointBlob.thread_id.in_(ids), ~referenced
+                )
+            )
+        else:
+            raise ValueError(f"Unknown prune strategy: {strategy}")
+
+        async with self.session_maker() as session, session.begin():
+            for statement in statements:
+                await session.execute(
+                    statement.execution_options(synchronize_session=False)
+                )
+
+    async def purge_expired(self) -> int:
+        """Delete threads idle for longer than the retention period.
+
+        Works in batches of ``prune_batch_size`` threads.
+
+        Returns:
+            The number of threads removed.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+        query = (
+            select(WorkflowCheckpoint.thread_id)
+            .group_by(WorkflowCheckpoint.thread_id)
+            .having(func.max(WorkflowCheckpoint.created_at) < cutoff)
+            .limit(self.prune_batch_size)
+        )
+        removed = 0
+        while True:
+            async with self.session_maker() as session:
+                thread_ids = list((await session.scalars(query)).all())
+            if not thread_ids:
+                break
+            await self.aprune(thread_ids, strategy="delete")
+            removed += len(thread_ids)
+            if len(thread_ids) < self.prune_batch_size:
+                break
+        return removed
+
+    # -- versions, metrics, serialization ------------------------------------
+
+    def get_next_version(self, current: str | None, channel: None = None) -> str:
+        """Return a monotonically increasing, collision-resistant version."""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    def stats(self) -> dict[str, Any]:
+        """Return write latency and compression counters."""
+        writes = self._counters["writes"]
+        raw = self._counters["bytes_raw"]
+        return {
+            "writes": writes,
+            "slow_writes": self._counters["slow_writes"],
+            "avg_write_ms": (
+                round(self._counters["write_ms_total"] / writes, 1) if writes else 0.0
+            ),
+            "max_write_ms": round(self._counters["write_ms_max"], 1),
+            "bytes_raw": raw,
+            "bytes_stored": self._counters["bytes_stored"],
+            "compression_ratio": (
+                round(self._counters["bytes_stored"] / raw, 3) if raw else 1.0
+            ),
+        }
+
+    def _record_write(self, started: float, thread_id: str) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._counters["writes"] += 1
+        self._counters["write_ms_total"] += elapsed_ms
+        self._counters["write_ms_max"] = max(self._counters["write_ms_max"], elapsed_ms)
+        if self.slow_write_ms and elapsed_ms > self.slow_write_ms:
+            self._counters["slow_writes"] += 1
+            logger.warning(
+                "checkpoint_write_slow",
+                thread_id=thread_id,
+                duration_ms=round(elapsed_ms),
+            )
+
+    def _dump(self, value: Any) -> tuple[str, bytes]:
+        """Serialize a value, compressing it when that pays off."""
+        value_type, data = self.serde.dumps_typed(value)
+        self._counters["bytes_raw"] += len(data)
+        if len(data) >= self.compress_min_bytes:
+            compressed = zlib.compress(data, _COMPRESSION_LEVEL)
+            if len(compressed) < len(data):
+                value_type, data = value_type + _COMPRESSED_SUFFIX, compressed
+        self._counters["bytes_stored"] += len(data)
+        return value_type, data
+
+    def _load(self, value_type: str, data: bytes | None) -> Any:
+        if value_type.endswith(_COMPRESSED_SUFFIX):
+            value_type = value_type.removesuffix(_COMPRESSED_SUFFIX)
+            data = zlib.decompress(data or b"")
+        return self.serde.loads_typed((value_type, data or b""))
+
+    async def _load_tuple(
+        self, session: AsyncSession, row: WorkflowCheckpoint
+    ) -> CheckpointTuple:
+        """Rebuild a checkpoint tuple with its channel values and pending writes."""
+        versions = [
+            (channel, str(version)) for channel, version in row.channel_versions.items()
+        ]
+        channel_values: dict[str, Any] = {}
+        if versions:
+            blobs = await session.execute(
+                select(
+                    WorkflowCheckpointBlob.channel,
+                    WorkflowCheckpointBlob.type,
+                    WorkflowCheckpointBlob.blob,
+                ).where(
+                    WorkflowCheckpointBlob.thread_id == row.thread_id,
+                    WorkflowCheckpointBlob.checkpoint_ns == row.checkpoint_ns,
+                    tuple_(
+                        WorkflowCheckpointBlob.channel, WorkflowCheckpointBlob.version
+                    ).in_(versions),
+                )
+            )
+            for channel, value_type, blob in blobs:
+                if value_type != "empty":
+                    channel_values[channel] = self._load(value_type, blob)
+
+        writes = await session.execute(
+            select(
+                WorkflowCheckpointWrite.task_id,
+                WorkflowCheckpointWrite.channel,
+                WorkflowCheckpointWrite.type,
+                WorkflowCheckpointWrite.blob,
+            ).where(
+                WorkflowCheckpointWrite.thread_id == row.thread_id,
+                WorkflowCheckpointWrite.checkpoint_ns == row.checkpoint_ns,
+                WorkflowCheckpointWrite.checkpoint_id == row.checkpoint_id,
+            )
+            # writes_sort_key order, as live execution applies them
+            .order_by(
+                WorkflowCheckpointWrite.task_path,
+                WorkflowCheckpointWrite.task_id,
+                WorkflowCheckpointWrite.idx,
+            )
+        )
+
+        def config_for(checkpoint_id: str) -> RunnableConfig:
+            return {
+                "configurable": {
+                    "thread_id": row.thread_id,
+                    "checkpoint_ns": row.checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            }
+
+        return CheckpointTuple(
+            config=config_for(row.checkpoint_id),
+            checkpoint=cast(
+                Checkpoint,
+                {
+                    **self._load(row.type, row.checkpoint),
+                    "channel_values": channel_values,
+                },
+            ),
+            metadata=cast(CheckpointMetadata, row.metadata_),
+            parent_config=(
+                config_for(row.parent_checkpoint_id)
+                if row.parent_checkpoint_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self._load(value_type, blob))
+                for task_id, channel, value_type, blob in writes
+            ],
+        )
+
+
+def _json_safe(metadata: Mapping[str, object]) -> dict[str, Any]:
+    """Coerce metadata to JSON (e.g. UUID run ids) for the JSONB column."""
+    return cast(dict[str, Any], json.loads(json.dumps(metadata, default=str)))
+
+
+# Process-wide checkpointer used by the worker
+checkpointer = PostgresCheckpointSaver(
+    compress_min_bytes=settings.CHECKPOINT_COMPRESS_MIN_BYTES,
+    slow_write_ms=settings.CHECKPOINT_SLOW_WRITE_MS,
+    retention_days=settings.CHECKPOINT_RETENTION_DAYS,
+    prune_batch_size=settings.CHECKPOINT_PRUNE_BATCH_SIZE,
+)
@@ -0,0 +1 @@
+"""Assessment workflow graph nodes."""
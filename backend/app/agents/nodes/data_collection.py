@@ -0,0 +1,166 @@
+"""Data collection nodes: corporate website and ESG page scraping."""
+
+from datetime import datetime
+from typing import Any
+from urllib.parse import urljoin, urlparse
+
+from app.agents.state import AssessmentState
+from app.agents.tools.fetch_scheduler import as_completed
+from app.agents.tools.page_cache import page_cache, to_run_cache
+from app.agents.tools.scrape_profiles import profile_for_source
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def find_esg_links(links: list[dict[str, Any]], base_url: str) -> list[str]:
+    """Find links that might lead to ESG/sustainability pages."""
+    esg_keywords = [
+        "sustainability",
+        "sustainable",
+        "esg",
+        "environment",
+        "environmental",
+        "csr",
+        "responsibility",
+        "ethics",
+        "governance",
+        "modern slavery",
+        "supply chain",
+        "carbon",
+        "climate",
+        "social",
+    ]
+
+    esg_links = []
+    seen = set()
+
+    for link in links:
+        href = link.get("href", "")
+        text = link.get("text", "").lower()
+
+        # Check if link text or URL contains ESG keywords
+        matches_keyword = any(kw in text or kw in href.lower() for kw in esg_keywords)
+
+        if matches_keyword and href not in seen:
+            # Ensure it's a valid URL on the same domain
+            parsed = urlparse(href)
+            base_parsed = urlparse(base_url)
+            if parsed.netloc == "" or parsed.netloc == base_parsed.netloc:
+                full_url = urljoin(base_url, href)
+                esg_links.append(full_url)
+                seen.add(href)
+
+    return esg_links[:3]  # Limit to 3 ESG pages
+
+
+async def collect_corporate(state: AssessmentState) -> dict[str, Any]:
+    """Node 1: Scrape main corporate information from supplier website."""
+    url = state["supplier_url"]
+    profile = profile_for_source("website")
+    result = await page_cache.get(url, state.get("page_cache"), profile)
+
+    if not result["success"]:
+        return {
+            "corporate_info": {},
+            "errors": [
+                f"Failed to scrape {url}: {result.get('error', 'Unknown error')}"
+            ],
+        }
+
+    # Try to find About page
+    about_links = [
+        link["href"]
+        for link in result.get("links", [])
+        if "about" in link.get("text", "").lower()
+        or "about" in link.get("href", "").lower()
+    ]
+
+    fetched = [result]
+    about_content = ""
+    about_url = None
+    if about_links:
+        about_result = await page_cache.get(
+            about_links[0], state.get("page_cache"), profile
+        )
+        fetched.append(about_result)
+        if about_result["success"]:
+            about_content = about_result["content"]
+            about_url = about_result.get("url") or about_links[0]
+
+    # Extract company name from title
+    title = result.get("title", "")
+    company_name = (
+        title.split("|")[0].split("-")[0].strip() if title else urlparse(url).netloc
+    )
+
+    return {
+        "supplier_name": company_name,
+        "corporate_info": {
+            "name": company_name,
+            "website": url,
+            "title": title,
+            "main_page_content": result["content"][:3000],
+            "about_page_content": about_content[:3000] if about_content else None,
+            "about_page_url": about_url,
+            "scraped_at": datetime.now().isoformat(),
+        },
+        "page_cache": to_run_cache(*fetched),
+    }
+
+
+async def collect_esg(state: AssessmentState) -> dict[str, Any]:
+    """Node 2: Find and scrape ESG/sustainability pages."""
+    url = state["supplier_url"]
+
+    # First, get links from homepage (usually already fetched this run)
+    homepage = await page_cache.get(
+        url, state.get("page_cache"), profile_for_source("website")
+    )
+    if not homepage["success"]:
+        return {
+            "esg_info": {"found": False, "pages": []},
+            "errors": ["Could not access homepage for ESG discovery"],
+        }
+
+    # Find ESG-related links
+    esg_links = find_esg_links(homepage.get("links", []), url)
+
+    if not esg_links:
+        return {
+            "esg_info": {"found": False, "pages": [], "note": "No ESG pages found"},
+            "page_cache": to_run_cache(homepage),
+        }
+
+    # Scrape ESG pages concurrently; the fetch scheduler applies the limits
+    async def fetch(esg_url: str) -> tuple[str, dict[str, Any]]:
+        result = await page_cache.get(
+            esg_url, state.get("page_cache"), profile_for_source("esg")
+        )
+        return esg_url, result
+
+    results: dict[str, dict[str, Any]] = {}
+    async for esg_url, result in as_completed(fetch(u) for u in esg_links):
+        logger.info("esg_page_scraped", url=esg_url, success=result["success"])
+        results[esg_url] = result
+
+    # Keep discovery order so the LLM prompt is deterministic
+    esg_pages = [
+        {
+            "url": esg_url,
+            "title": results[esg_url]["title"],
+            "content": results[esg_url]["content"][:3000],
+        }
+        for esg_url in esg_links
+        if results[esg_url]["success"]
+    ]
+
+    return {
+        "esg_info": {
+            "found": len(esg_pages) > 0,
+            "pages_discovered": len(esg_links),
+            "pages_scraped": len(esg_pages),
+            "pages": esg_pages,
+        },
+        "page_cache": to_run_cache(homepage, *results.values()),
+    }
@@ -0,0 +1,101 @@
+"""Evidence analysis node: LLM summary of the collected supplier data."""
+
+import os
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import HumanMessage
+
+from app.agents.state import AssessmentState, event_publisher
+from app.agents.tools.text_dedup import TextDeduplicator
+from app.core.config import settings
+from app.core.llm import get_llm, stream_llm
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def resolve_llm() -> BaseChatModel | None:
+    """Pick the LLM from provider env keys, falling back to app settings.
+
+    Clients come from the shared registry in app.core.llm, so repeated runs
+    in one process reuse the same client and HTTP connection pool.
+    """
+    common: dict[str, Any] = {"temperature": 0, "max_tokens": 1500}
+    if key := os.environ.get("OPENROUTER_API_KEY"):
+        model = os.environ.get("OPENROUTER_MODEL", "anthropic/claude-sonnet-4-20250514")
+        return get_llm("openrouter", model, api_key=key, **common)
+    if key := os.environ.get("OPENAI_API_KEY"):
+        model = os.environ.get("OPENAI_MODEL", "gpt-4o")
+        return get_llm("openai", model, api_key=key, **common)
+    if key := os.environ.get("ANTHROPIC_API_KEY"):
+        model = os.environ.get("ANTHROPIC_MODEL", "claude-sonnet-4-20250514")
+        return get_llm("anthropic", model, api_key=key, **common)
+    if settings.LLM_API_KEY:
+        return get_llm(**common)
+    return None
+
+
+async def process_data(state: AssessmentState) -> dict[str, Any]:
+    """Node 3: Use LLM to process and summarize findings."""
+    llm = resolve_llm()
+    if llm is None:
+        return {
+            "processed_summary": "[LLM processing skipped - No API key set. Set OPENROUTER_API_KEY, OPENAI_API_KEY, ANTHROPIC_API_KEY or LLM_API_KEY]",
+            "errors": ["No LLM API key configured"],
+        }
+
+    # Build context from collected data; paragraphs repeated across pages
+    # (navigation, cookie banners, footers) are only sent once
+    corporate = state.get("corporate_info", {})
+    esg = state.get("esg_info", {})
+    dedup = TextDeduplicator()
+
+    context_parts = [f"Company: {corporate.get('name', 'Unknown')}"]
+
+    if corporate.get("main_page_content"):
+        main_page = dedup.novel_text(corporate["main_page_content"])
+        context_parts.append(f"Main Page Content:\n{main_page[:2000]}")
+
+    if corporate.get("about_page_content"):
+        about_page = dedup.novel_text(corporate["about_page_content"])
+        if about_page:
+            context_parts.append(f"About Page Content:\n{about_page[:1500]}")
+
+    if esg.get("pages"):
+        for page in esg["pages"]:
+            esg_page = dedup.novel_text(page["content"])
+            if esg_page:
+                context_parts.append(f"ESG Page ({page['title']}):\n{esg_page[:1500]}")
+    logger.info("llm_context_deduplicated", **dedup.stats())
+
+    context = "\n\n---\n\n".join(context_parts)
+
+    prompt = f"""Analyze this supplier's publicly available information and provide a structured summary.
+
+{context}
+
+Provide a concise analysis covering:
+1. COMPANY OVERVIEW: Brief description, industry, key business areas
+2. ESG INDICATORS: Any sustainability initiatives, certifications, policies mentioned
+3. RISK SIGNALS: Any potential red flags or areas requiring further investigation
+4. DATA QUALITY: Assessment of how much relevant information was available
+
+Keep the response focused and professional. If information is limited, note that clearly."""
+
+    publisher = event_publisher(state)
+
+    async def on_token(text: str) -> None:
+        if publisher is not None:
+            await publisher.token(text, node="process_data")
+
+    try:
+        response = await stream_llm(llm, [HumanMessage(content=prompt)], on_token)
+        if publisher is not None:
+            await publisher.flush()
+        return {"processed_summary": response.content}
+    except Exception as e:
+        return {
+            "processed_summary": f"[LLM processing failed: {e}]",
+            "errors": [f"LLM error: {e}"],
+        }
@@ -0,0 +1,87 @@
+"""Report generation node."""
+
+from typing import Any
+
+from app.agents.state import AssessmentState
+
+
+async def generate_output(state: AssessmentState) -> dict[str, Any]:
+    """Node 4: Format the final plain-text report."""
+
+    corporate = state.get("corporate_info", {})
+    esg = state.get("esg_info", {})
+    screening = state.get("screening", {})
+    summary = state.get("processed_summary", "")
+    errors = state.get("errors", [])
+
+    # Build report
+    report = []
+    report.append("=" * 60)
+    report.append("       DATA COLLECTION AGENT - DEMO REPORT")
+    report.append("=" * 60)
+    report.append("")
+    report.append(f"Supplier: {corporate.get('name', 'Unknown')}")
+    report.append(f"URL: {state.get('supplier_url', 'N/A')}")
+    report.append(f"Scraped: {corporate.get('scraped_at', 'N/A')}")
+    report.append("")
+    report.append("-" * 60)
+    report.append("CORPORATE INFORMATION")
+    report.append("-" * 60)
+    report.append(f"Website Title: {corporate.get('title', 'N/A')}")
+    report.append(
+        f"About Page: {'Found' if corporate.get('about_page_content') else 'Not found'}"
+    )
+    report.append("")
+    report.append("-" * 60)
+    report.append("ESG INFORMATION")
+    report.append("-" * 60)
+    report.append(f"ESG Pages Found: {esg.get('found', False)}")
+    report.append(f"Pages Discovered: {esg.get('pages_discovered', 0)}")
+    report.append(f"Pages Scraped: {esg.get('pages_scraped', 0)}")
+
+    if esg.get("pages"):
+        report.append("\nESG Pages:")
+        for page in esg["pages"]:
+            report.append(f"  - {page['title']}: {page['url']}")
+
+    report.append("")
+    report.append("-" * 60)
+    report.append("WATCHLIST SCREENING")
+    report.append("-" * 60)
+    if not screening.get("checked"):
+        report.append("[Not checked - no watchlists loaded]")
+    elif not screening["matches"]:
+        report.append(f"No matches ({screening['entries']} list entries checked)")
+    else:
+        for match in screening["matches"]:
+            report.append(
+                f"  - {match['matched_name']} ({match['list']} "
+                f"{match['entry_id']}): score {match['score']}"
+            )
+    report.append("")
+    report.append("-" * 60)
+    report.append("LLM ANALYSIS")
+    report.append("-" * 60)
+    report.append(summary if summary else "[No analysis available]")
+    report.append("")
+
+    timings = state.get("node_timings", {})
+    if timings:
+        report.append("-" * 60)
+        report.append("NODE TIMINGS")
+        report.append("-" * 60)
+        for name, timing in timings.items():
+            report.append(f"  - {name}: {timing['duration_ms']} ms")
+        report.append("")
+
+    if errors:
+        report.append("-" * 60)
+        report.append("ERRORS ENCOUNTERED")
+        report.append("-" * 60)
+        for error in errors:
+            report.append(f"  - {error}")
+        report.append("")
+
+    report.append("=" * 60)
+
+    return {"report": "\n".join(report)}
@@ -0,0 +1,41 @@
+"""Watchlist screening node: match the supplier against sanctions lists."""
+
+from typing import Any
+
+from app.agents.state import AssessmentState
+from app.core.logging import get_logger
+from app.screening import best_matches, screening_engine
+
+logger = get_logger(__name__)
+
+
+async def screen_watchlists(state: AssessmentState) -> dict[str, Any]:
+    """Node: screen the supplier's name against the loaded watchlists.
+
+    Runs after the collectors, which determine the supplier name. Without
+    loaded lists the result records that the supplier was not checked.
+    """
+    if not screening_engine.ready:
+        return {"screening": {"checked": False}}
+
+    corporate = state.get("corporate_info", {})
+    names = list(
+        dict.fromkeys(
+            name for name in (state.get("supplier_name"), corporate.get("name")) if name
+        )
+    )
+    if not names:
+        return {"screening": {"checked": False}}
+
+    matches = best_matches(await screening_engine.screen_many(names))
+    if matches:
+        logger.info("watchlist_matches", names=names, matches=len(matches))
+    return {
+        "screening": {
+            "checked": True,
+            "names": names,
+            "entries": len(screening_engine),
+            "list_versions": dict(screening_engine.versions),
+            "matches": [match.as_dict() for match in matches],
+        }
+    }
@@ -0,0 +1,53 @@
+"""Assessment workflow state definition."""
+
+import operator
+from typing import Annotated, Any, TypedDict
+
+from app.core.events import EventPublisher
+
+
+def merge_dicts(left: dict[str, Any], right: dict[str, Any]) -> dict[str, Any]:
+    """State reducer: merge node updates into the existing mapping."""
+    return {**left, **right}
+
+
+class AssessmentState(TypedDict):
+    # Progress events are published for this id; empty disables publishing
+    assessment_id: str
+    supplier_url: str
+    supplier_name: str
+    corporate_info: dict[str, Any]
+    esg_info: dict[str, Any]
+    # Watchlist screening result: checked flag and matches
+    screening: dict[str, Any]
+    processed_summary: str
+    report: str
+    # Parallel branches append their own errors; the reducer concatenates them
+    errors: Annotated[list[str], operator.add]
+    # Per-node wall-clock timings, used to report the critical path
+    node_timings: Annotated[dict[str, dict[str, Any]], merge_dicts]
+    # Page snapshots fetched during this run, keyed by normalized URL
+    page_cache: Annotated[dict[str, dict[str, Any]], merge_dicts]
+
+
+def initial_state(supplier_url: str, assessment_id: str = "") -> AssessmentState:
+    """Return the starting state for assessing one supplier website."""
+    return {
+        "assessment_id": assessment_id,
+        "supplier_url": supplier_url,
+        "supplier_name": "",
+        "corporate_info": {},
+        "esg_info": {},
+        "screening": {},
+        "processed_summary": "",
+        "report": "",
+        "errors": [],
+        "node_timings": {},
+        "page_cache": {},
+    }
+
+
+def event_publisher(state: AssessmentState) -> EventPublisher | None:
+    """Return a progress event publisher if the run has an assessment id."""
+    assessment_id = state.get("assessment_id")
+    return EventPublisher(assessment_id) if assessment_id else None
@@ -0,0 +1 @@
+"""Tools used by agent workflow nodes (scraping, external APIs, file parsing)."""
@@ -0,0 +1,240 @@
+"""Long-lived pool of warm headless Chromium instances for scraping.
+
+Launching Chromium costs far more than loading a typical supplier page, so
+browsers are started once per process and leased out to scraping calls.
+Each pooled browser keeps a single reusable context; a lease gets exclusive
+use of one browser for the duration of a page visit. Browsers are relaunched
+when they disconnect, after serving a fixed number of pages, or when their
+resident memory exceeds the configured ceiling.
+"""
+
+import asyncio
+import mmap
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    async_playwright,
+)
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _BrowserSlot:
+    """A pooled browser together with its reusable context."""
+
+    index: int
+    browser: Browser | None = None
+    context: BrowserContext | None = None
+    pages_served: int = 0
+    launched_at: float = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return (
+            self.browser is not None
+            and self.context is not None
+            and self.browser.is_connected()
+        )
+
+
+class BrowserPool:
+    """Fixed-size pool of warm Chromium browsers with exclusive leasing.
+
+    Usage:
+        async with browser_pool.page() as page:
+            await page.goto(url)
+
+    The pool starts lazily on first lease, or eagerly via ``start()`` from
+    application/worker startup. ``close()`` shuts every browser down and
+    resets the pool so it can be started again on a new event loop.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        max_pages_per_browser: int,
+        max_memory_mb: int,
+        user_agent: str,
+    ) -> None:
+        self.size = max(1, size)
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_memory_mb = max_memory_mb
+        self.user_agent = user_agent
+
+        self._playwright: Playwright | None = None
+        self._slots: list[_BrowserSlot] = []
+        self._idle: asyncio.Queue[_BrowserSlot] | None = None
+        self._start_lock: asyncio.Lock | None = None
+        self._recycled = 0
+        self._leases = 0
+
+    @property
+    def started(self) -> bool:
+        return self._idle is not None
+
+    async def start(self) -> None:
+        """Launch the playwright runtime and warm every browser slot."""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self.started:
+                return
+            self._playwright = await async_playwright().start()
+            self._slots = [_BrowserSlot(index=i) for i in range(self.size)]
+            await asyncio.gather(*(self._launch(slot) for slot in self._slots))
+            idle: asyncio.Queue[_BrowserSlot] = asyncio.Queue()
+            for slot in self._slots:
+                idle.put_nowait(slot)
+            self._idle = idle
+            logger.info("browser_pool_started", size=self.size)
+
+    async def close(self) -> None:
+        """Close all browsers and stop the playwright runtime."""
+        if not self.started:
+            return
+        await asyncio.gather(
+            *(self._shutdown_slot(slot) for slot in self._slots),
+            return_exceptions=True,
+        )
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = None
+        self._slots = []
+        self._idle = None
+        self._start_lock = None
+        logger.info("browser_pool_closed", leases=self._leases, recycled=self._recycled)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[BrowserContext]:
+        """Lease a browser context for exclusive use.
+
+        The browser is health-checked before it is handed out and recycled
+        on return if it has reached its page or memory limits.
+        """
+        if not self.started:
+            await self.start()
+        assert self._idle is not None
+        idle = self._idle
+
+        slot = await idle.get()
+        try:
+            if not slot.healthy:
+                logger.warning("browser_unhealthy", slot=slot.index)
+                await self._relaunch(slot)
+            self._leases += 1
+            assert slot.context is not None
+            yield slot.context
+        finally:
+            slot.pages_served += 1
+            try:
+                if await self._should_recycle(slot):
+                    await self._relaunch(slot)
+            except Exception as e:
+                logger.warning("browser_recycle_failed", slot=slot.index, error=str(e))
+            finally:
+                idle.put_nowait(slot)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Lease a browser and open a fresh page in its shared context."""
+        async with self.lease() as context:
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                await page.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool counters for logging and health reporting."""
+        return {
+            "size": self.size,
+            "started": self.started,
+            "idle": self._idle.qsize() if self._idle is not None else 0,
+            "leases": self._leases,
+            "recycled": self._recycled,
+            "pages_served": [slot.pages_served for slot in self._slots],
+        }
+
+    async def _launch(self, slot: _BrowserSlot) -> None:
+        assert self._playwright is not None
+        slot.browser = await self._playwright.chromium.launch(headless=True)
+        slot.context = await slot.browser.new_context(user_agent=self.user_agent)
+        slot.pages_served = 0
+        slot.launched_at = time.monotonic()
+
+    async def _relaunch(self, slot: _BrowserSlot) -> None:
+        await self._shutdown_slot(slot)
+        await self._launch(slot)
+        self._recycled += 1
+        logger.info("browser_recycled", slot=slot.index)
+
+    async def _shutdown_slot(self, slot: _BrowserSlot) -> None:
+        browser, slot.browser, slot.context = slot.browser, None, None
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+
+    async def _should_recycle(self, slot: _BrowserSlot) -> bool:
+        if not slot.healthy:
+            return True
+        if (
+            self.max_pages_per_browser > 0
+            and slot.pages_served >= self.max_pages_per_browser
+        ):
+            return True
+        if self.max_memory_mb > 0:
+            assert slot.browser is not None
+            rss_mb = await _browser_rss_mb(slot.browser)
+            if rss_mb > self.max_memory_mb:
+                logger.info("browser_memory_ceiling", slot=slot.index, rss_mb=rss_mb)
+                return True
+        return False
+
+
+async def _browser_rss_mb(browser: Browser) -> float:
+    """Sum resident memory (MB) of a browser's processes via /proc.
+
+    Process ids come from the CDP SystemInfo domain. Returns 0.0 where that
+    is unavailable (non-Linux hosts, non-Chromium browsers).
+    """
+    try:
+        session = await browser.new_browser_cdp_session()
+        try:
+            info = await session.send("SystemInfo.getProcessInfo")
+        finally:
+            await session.detach()
+    except Exception:
+        return 0.0
+
+    total_pages = 0
+    for process in info.get("processInfo", []):
+        statm = Path(f"/proc/{process['id']}/statm")
+        try:
+            total_pages += int(statm.read_text().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+    return total_pages * mmap.PAGESIZE / (1024 * 1024)
+
+
+# Process-wide pool shared by every collection node
+browser_pool = BrowserPool(
+    size=settings.BROWSER_POOL_SIZE,
+    max_pages_per_browser=settings.BROWSER_MAX_PAGES_PER_BROWSER,
+    max_memory_mb=settings.BROWSER_MAX_MEMORY_MB,
+    user_agent=settings.SCRAPER_USER_AGENT,
+)
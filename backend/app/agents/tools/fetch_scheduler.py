@@ -0,0 +1,109 @@
+"""Bounded-concurrency scheduler for page fetches.
+
+Collection nodes fetch pages in parallel through a single process-wide
+scheduler that enforces a global concurrency cap, a per-host cap and a
+minimum delay between request starts against the same host, so parallel
+assessments stay polite to supplier websites.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
+
+from app.agents.tools.http_fetcher import tiered_fetcher
+from app.agents.tools.web_scraper import PageFetcher, scrape_page
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+@dataclass
+class _HostState:
+    """Concurrency and pacing state for one host."""
+
+    semaphore: asyncio.Semaphore
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    next_start: float = 0.0
+    users: int = 0
+
+
+class FetchScheduler:
+    """Throttle a page fetcher by global and per-host limits.
+
+    Usage:
+        snapshot = await fetch_scheduler.fetch(url)
+
+    ``fetch`` has the same signature as ``scrape_page`` so the scheduler can
+    be dropped in wherever a page fetcher is expected.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        per_host_concurrency: int,
+        politeness_delay_ms: int,
+        fetcher: PageFetcher = scrape_page,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self.politeness_delay = politeness_delay_ms / 1000
+        self.fetcher = fetcher
+        self._global: asyncio.Semaphore | None = None
+        self._hosts: dict[str, _HostState] = {}
+
+    async def fetch(self, url: str, profile: str | None = None) -> dict[str, Any]:
+        """Fetch a page once a global and a per-host slot are free."""
+        host = (urlsplit(url).hostname or "").lower()
+        state = self._host_state(host)
+        state.users += 1
+        try:
+            async with state.semaphore:
+                await self._wait_for_turn(state)
+                async with self._global_semaphore():
+                    return await self.fetcher(url, profile=profile)
+        finally:
+            state.users -= 1
+            # Forget idle hosts once their pacing window has passed
+            if state.users == 0 and state.next_start <= time.monotonic():
+                self._hosts.pop(host, None)
+
+    def _global_semaphore(self) -> asyncio.Semaphore:
+        if self._global is None:
+            self._global = asyncio.Semaphore(self.max_concurrency)
+        return self._global
+
+    def _host_state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(asyncio.Semaphore(self.per_host_concurrency))
+            self._hosts[host] = state
+        return state
+
+    async def _wait_for_turn(self, state: _HostState) -> None:
+        """Space out request starts to one host by the politeness delay."""
+        if self.politeness_delay <= 0:
+            return
+        async with state.lock:
+            now = time.monotonic()
+            wait = state.next_start - now
+            state.next_start = max(now, state.next_start) + self.politeness_delay
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+async def as_completed(aws: Iterable[Awaitable[T]]) -> AsyncIterator[T]:
+    """Yield awaitable results in completion order."""
+    for next_done in asyncio.as_completed(list(aws)):
+        yield await next_done
+
+
+# Process-wide scheduler shared by every collection node
+fetch_scheduler = FetchScheduler(
+    max_concurrency=settings.SCRAPER_MAX_CONCURRENCY,
+    per_host_concurrency=settings.SCRAPER_PER_HOST_CONCURRENCY,
+    politeness_delay_ms=settings.SCRAPER_POLITENESS_DELAY_MS,
+    fetcher=tiered_fetcher.fetch,
+)
@@ -0,0 +1,313 @@
+"""HTTP-first page fetcher with Playwright fallback.
+
+Most supplier pages are static or server-rendered and read fine from raw
+HTML, so pages are first fetched with a plain async GET over a pooled
+keep-alive client and parsed in-process. A page escalates to the browser
+tier only when the HTML looks JS-rendered (almost no text, SPA shell
+markers), when the site refuses plain clients, or when its domain is
+remembered as needing a browser. Only those two signals are remembered,
+per domain in process and in Redis, so later assessments skip the wasted
+HTTP attempt; a network error or a rate-limit/unavailable response sends
+just that page to the browser.
+"""
+
+import re
+import time
+from html.parser import HTMLParser
+from typing import Any
+from urllib.parse import urljoin, urlsplit
+
+import httpx
+import redis.asyncio as redis
+
+from app.agents.tools.web_scraper import PageFetcher, scrape_page
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import redis_pool
+
+logger = get_logger(__name__)
+
+_KEY_PREFIX = "fetch_tier:browser:"
+_MAX_TEXT_CHARS = 10000
+_SKIP_TAGS = {
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "svg",
+    "nav",
+    "footer",
+    "header",
+}
+_BLOCK_TAGS = {
+    "p",
+    "div",
+    "section",
+    "article",
+    "li",
+    "br",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "tr",
+}
+# Statuses that usually mean "not for plain clients" rather than "not here"
+_BLOCKED_STATUSES = {401, 403}
+# Rate limits and outages: escalate the page, but don't judge the domain
+_TRANSIENT_STATUSES = {429, 503}
+# Escalation reasons remembered for the domain (vs. "transient")
+_REMEMBERED_REASONS = {"js_rendered", "blocked"}
+_SPA_MARKERS = re.compile(
+    r'id="(?:root|app|__next|__nuxt)"\s*>\s*</div>'
+    r"|ng-app|data-reactroot|data-server-rendered"
+    r"|enable javascript|requires javascript",
+    re.IGNORECASE,
+)
+
+
+class _PageExtractor(HTMLParser):
+    """Extract title, visible text and links in the ``scrape_page`` shape."""
+
+    def __init__(self, base_url: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.title = ""
+        self.links: list[dict[str, str]] = []
+        self._chunks: list[str] = []
+        self._skip_depth = 0
+        self._in_title = False
+        self._link_href: str | None = None
+        self._link_text: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "title" and not self._skip_depth and not self.title:
+            self._in_title = True
+        elif tag == "a":
+            href = dict(attrs).get("href")
+            if href and not href.startswith(("javascript:", "mailto:", "tel:")):
+                self._link_href = urljoin(self.base_url, href)
+                self._link_text = []
+        if tag in _BLOCK_TAGS:
+            self._chunks.append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "title":
+            self._in_title = False
+        elif tag == "a" and self._link_href is not None:
+            text = " ".join("".join(self._link_text).split())
+            if 0 < len(text) < 100:
+                self.links.append({"href": self._link_href, "text": text})
+            self._link_href = None
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title += data
+            return
+        if self._link_href is not None:
+            self._link_text.append(data)
+        if not self._skip_depth:
+            self._chunks.append(data)
+
+    @property
+    def text(self) -> str:
+        lines = (" ".join(line.split()) for line in "".join(self._chunks).split("\n"))
+        return "\n".join(line for line in lines if line)[:_MAX_TEXT_CHARS]
+
+
+def extract_page(html: str, url: str) -> dict[str, Any]:
+    """Parse raw HTML into title, visible text and links."""
+    parser = _PageExtractor(url)
+    parser.feed(html)
+    parser.close()
+    return {
+        "url": url,
+        "title": " ".join(parser.title.split()),
+        "content": parser.text,
+        "links": parser.links,
+        "success": True,
+    }
+
+
+def looks_js_rendered(html: str, text: str, min_text_chars: int) -> bool:
+    """Guess whether a page needs a browser to produce its content."""
+    if len(text) < min_text_chars:
+        return True
+    # Server-rendered SPAs carry markers too, so only trust them on thin pages
+    return len(text) < min_text_chars * 5 and bool(_SPA_MARKERS.search(html))
+
+
+class TieredFetcher:
+    """Fetch pages over plain HTTP, escalating to the browser when needed.
+
+    ``fetch`` has the same signature as ``scrape_page``; returned snapshots
+    carry a ``tier`` key (http | browser).
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float,
+        max_connections: int,
+        min_text_chars: int,
+        domain_memory_ttl_seconds: int,
+        user_agent: str,
+        use_redis: bool = True,
+        browser_fetcher: PageFetcher = scrape_page,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.timeout_seconds = timeout_seconds
+        self.max_connections = max_connections
+        self.min_text_chars = min_text_chars
+        self.domain_memory_ttl_seconds = domain_memory_ttl_seconds
+        self.user_agent = user_agent
+        self.use_redis = use_redis
+        self.browser_fetcher = browser_fetcher
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._browser_domains: dict[str, float] = {}
+        self._counters = {"http": 0, "browser": 0, "escalated": 0, "remembered": 0}
+
+    async def fetch(self, url: str, profile: str | None = None) -> dict[str, Any]:
+        """Fetch a page from the cheapest tier that yields usable content.
+
+        ``profile`` selects the scrape profile if the browser tier is used.
+        """
+        domain = (urlsplit(url).hostname or "").lower()
+
+        if await self._needs_browser(domain):
+            self._counters["remembered"] += 1
+            return await self._browser(url, profile)
+
+        result, reason = await self._http(url)
+        if reason is None:
+            self._counters["http"] += 1
+            return result
+
+        self._counters["escalated"] += 1
+        if reason in _REMEMBERED_REASONS:
+            await self._remember_browser_domain(domain)
+        return await self._browser(url, profile)
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return per-tier counters and the share served without a browser."""
+        total = self._counters["http"] + self._counters["browser"]
+        return {
+            **self._counters,
+            "http_hit_rate": round(self._counters["http"] / total, 3) if total else 0.0,
+        }
+
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                follow_redirects=True,
+                headers={"User-Agent": self.user_agent},
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def _http(self, url: str) -> tuple[dict[str, Any], str | None]:
+        """Try the HTTP tier.
+
+        Returns:
+            The snapshot, and why to escalate to the browser (js_rendered,
+            blocked or transient), or None to keep the snapshot.
+        """
+        try:
+            response = await self._http_client().get(url)
+        except httpx.HTTPError as e:
+            logger.debug("http_fetch_failed", url=url, error=str(e))
+            return {}, "transient"
+
+        if response.status_code in _BLOCKED_STATUSES:
+            return {}, "blocked"
+        if response.status_code in _TRANSIENT_STATUSES:
+            return {}, "transient"
+        if response.status_code >= 400:
+            return _failure(url, f"HTTP {response.status_code}"), None
+        if "html" not in response.headers.get("content-type", "html"):
+            content_type = response.headers["content-type"]
+            return _failure(url, f"Unsupported content type: {content_type}"), None
+
+        html = response.text
+        page = extract_page(html, str(response.url))
+        page["url"] = url
+        if looks_js_rendered(html, page["content"], self.min_text_chars):
+            return {}, "js_rendered"
+        return {**page, "tier": "http"}, None
+
+    async def _browser(self, url: str, profile: str | None) -> dict[str, Any]:
+        self._counters["browser"] += 1
+        result = await self.browser_fetcher(url, profile=profile)
+        return {**result, "tier": "browser"}
+
+    async def _needs_browser(self, domain: str) -> bool:
+        expires = self._browser_domains.get(domain)
+        if expires is not None:
+            if expires > time.monotonic():
+                return True
+            del self._browser_domains[domain]
+        if not self.use_redis:
+            return False
+
+        client = redis.Redis(connection_pool=redis_pool)
+        try:
+            ttl = await client.ttl(f"{_KEY_PREFIX}{domain}")
+        except Exception as e:
+            logger.warning("fetch_tier_redis_unavailable", error=str(e))
+            return False
+        finally:
+            await client.aclose()
+        if ttl > 0:
+            self._browser_domains[domain] = time.monotonic() + ttl
+            return True
+        return False
+
+    async def _remember_browser_domain(self, domain: str) -> None:
+        ttl = self.domain_memory_ttl_seconds
+        self._browser_domains[domain] = time.monotonic() + ttl
+        if not self.use_redis:
+            return
+        client = redis.Redis(connection_pool=redis_pool)
+        try:
+            await client.set(f"{_KEY_PREFIX}{domain}", "1", ex=ttl)
+        except Exception as e:
+            logger.warning("fetch_tier_redis_unavailable", error=str(e))
+        finally:
+            await client.aclose()
+
+
+def _failure(url: str, error: str) -> dict[str, Any]:
+    return {
+        "url": url,
+        "title": "",
+        "content": "",
+        "links": [],
+        "success": False,
+        "error": error,
+        "tier": "http",
+    }
+
+
+# Process-wide fetcher shared by every collection node
+tiered_fetcher = TieredFetcher(
+    timeout_seconds=settings.HTTP_FETCH_TIMEOUT_SECONDS,
+    max_connections=settings.HTTP_FETCH_MAX_CONNECTIONS,
+    min_text_chars=settings.HTTP_FETCH_MIN_TEXT_CHARS,
+    domain_memory_ttl_seconds=settings.FETCH_TIER_MEMORY_TTL_SECONDS,
+    user_agent=settings.SCRAPER_USER_AGENT,
+)
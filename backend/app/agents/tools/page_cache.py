@@ -0,0 +1,210 @@
+"""Page snapshot cache for scraped supplier pages.
+
+Snapshots (title, extracted text, links and fetch metadata) are looked up in
+three places, cheapest first:
+
+1. The run cache carried in the graph state, so a page fetched by one node
+   is never re-rendered by another node of the same assessment.
+2. Redis, keyed by normalized URL with a TTL, so recent fetches are shared
+   across assessments (and tenants) of the same supplier.
+3. The network, via the HTTP-first tiered fetcher throttled by the fetch
+   scheduler.
+   Concurrent requests for the same URL in one process share a single
+   in-flight fetch.
+
+Only successful fetches are cached.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import redis.asyncio as redis
+
+from app.agents.tools.fetch_scheduler import fetch_scheduler
+from app.agents.tools.web_scraper import PageFetcher, scrape_page
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import redis_pool
+
+logger = get_logger(__name__)
+
+_KEY_PREFIX = "page_cache:"
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_TRACKING_PARAMS = ("utm_", "gclid", "fbclid", "mc_cid", "mc_eid")
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL so equivalent addresses share one cache entry.
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    query parameters, sorts the remaining parameters and strips a trailing
+    slash from non-root paths.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "https"
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = urlencode(
+        sorted(
+            (k, v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if not k.lower().startswith(_TRACKING_PARAMS)
+        )
+    )
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+class PageCache:
+    """Two-level (run state + Redis) cache in front of the page fetcher."""
+
+    def __init__(
+        self,
+        ttl_seconds: int,
+        use_redis: bool = True,
+        fetcher: PageFetcher = scrape_page,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.use_redis = use_redis
+        self.fetcher = fetcher
+        self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._counters = {"run_hits": 0, "redis_hits": 0, "shared": 0, "misses": 0}
+
+    async def get(
+        self,
+        url: str,
+        run_cache: Mapping[str, dict[str, Any]] | None = None,
+        profile: str | None = None,
+    ) -> dict[str, Any]:
+        """Return a page snapshot, fetching it only when no cache has it.
+
+        Args:
+            url: Page URL to load
+            run_cache: The ``page_cache`` mapping from the current graph state
+            profile: Scrape profile used if the page has to be rendered
+
+        Returns:
+            Snapshot dict in the ``scrape_page`` shape plus ``fetched_at``,
+            ``fetch_ms`` and ``cache`` (run | redis | shared | miss).
+        """
+        key = normalize_url(url)
+
+        if run_cache and key in run_cache:
+            self._counters["run_hits"] += 1
+            return {**run_cache[key], "cache": "run"}
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._counters["shared"] += 1
+            return {**await asyncio.shield(inflight), "cache": "shared"}
+
+        # Become the single loader for this URL until the lookup completes
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        try:
+            snapshot, source = await self._load(key, url, profile)
+            future.set_result(snapshot)
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an unobserved failure doesn't warn at GC
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+        return {**snapshot, "cache": source}
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for this process."""
+        lookups = sum(self._counters.values())
+        hits = lookups - self._counters["misses"]
+        return {
+            **self._counters,
+            "lookups": lookups,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+    async def _load(
+        self, key: str, url: str, profile: str | None
+    ) -> tuple[dict[str, Any], str]:
+        cached = await self._redis_get(key)
+        if cached is not None:
+            self._counters["redis_hits"] += 1
+            return cached, "redis"
+
+        self._counters["misses"] += 1
+        snapshot = await self._fetch(url, profile)
+        if snapshot["success"]:
+            await self._redis_set(key, snapshot)
+        return snapshot, "miss"
+
+    async def _fetch(self, url: str, profile: str | None) -> dict[str, Any]:
+        started = time.perf_counter()
+        result = await self.fetcher(url, profile=profile)
+        return {
+            **result,
+            "fetched_at": datetime.now().isoformat(),
+            "fetch_ms": round((time.perf_counter() - started) * 1000),
+        }
+
+    async def _redis_get(self, key: str) -> dict[str, Any] | None:
+        if not self.use_redis:
+            return None
+        client = redis.Redis(connection_pool=redis_pool)
+        try:
+            raw = await client.get(_redis_key(key))
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            logger.warning("page_cache_redis_unavailable", error=str(e))
+            return None
+        finally:
+            await client.aclose()
+
+    async def _redis_set(self, key: str, snapshot: dict[str, Any]) -> None:
+        if not self.use_redis:
+            return
+        client = redis.Redis(connection_pool=redis_pool)
+        try:
+            await client.set(_redis_key(key), json.dumps(snapshot), ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning("page_cache_redis_unavailable", error=str(e))
+        finally:
+            await client.aclose()
+
+
+def _redis_key(normalized_url: str) -> str:
+    digest = hashlib.sha256(normalized_url.encode()).hexdigest()
+    return f"{_KEY_PREFIX}{digest}"
+
+
+def to_run_cache(*snapshots: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Build a ``page_cache`` state update from fetched snapshots.
+
+    Failed fetches are left out so a later node can retry them.
+    """
+    return {
+        normalize_url(snapshot["url"]): {
+            k: v for k, v in snapshot.items() if k != "cache"
+        }
+        for snapshot in snapshots
+        if snapshot.get("success")
+    }
+
+
+# Process-wide cache shared by every collection node
+page_cache = PageCache(
+    ttl_seconds=settings.PAGE_CACHE_TTL_SECONDS,
+    fetcher=fetch_scheduler.fetch,
+)
@@ -0,0 +1,149 @@
+"""Scraping profiles for the browser tier.
+
+A profile decides which requests a page may make (images, media, fonts and
+third-party trackers are aborted by default), how navigation waits for the
+page, and how many response bytes a page may pull in. Waiting for
+``networkidle`` lets analytics beacons and lazy media keep pages busy for
+seconds, so profiles wait for ``domcontentloaded`` and then poll until the
+visible text stops changing.
+"""
+
+from dataclasses import dataclass, field
+from typing import Literal
+from urllib.parse import urlsplit
+
+from app.core.config import settings
+
+WaitUntil = Literal["commit", "domcontentloaded", "load", "networkidle"]
+
+# Analytics, tag managers, session recorders and ad networks; a request is a
+# tracker if its host is one of these or a subdomain of one
+TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "bat.bing.com",
+    "snap.licdn.com",
+    "hs-analytics.net",
+    "hs-scripts.com",
+    "segment.com",
+    "segment.io",
+    "mixpanel.com",
+    "fullstory.com",
+    "newrelic.com",
+    "nr-data.net",
+    "optimizely.com",
+    "cookielaw.org",
+    "cookiebot.com",
+)
+# Trackers served from a path of an otherwise legitimate host
+TRACKER_PATHS = (("facebook.com", "/tr"),)
+
+
+def _host_matches(host: str, tracker_host: str) -> bool:
+    return host == tracker_host or host.endswith("." + tracker_host)
+
+
+def is_tracker(url: str) -> bool:
+    """Return True if a request URL goes to a known tracker."""
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if any(_host_matches(host, tracker) for tracker in TRACKER_HOSTS):
+        return True
+    return any(
+        _host_matches(host, tracker)
+        and (parts.path == path or parts.path.startswith(path + "/"))
+        for tracker, path in TRACKER_PATHS
+    )
+
+
+@dataclass(frozen=True)
+class ScrapeProfile:
+    """Request filtering, wait strategy and byte budget for one page visit."""
+
+    name: str
+    blocked_resource_types: frozenset[str] = field(
+        default_factory=lambda: frozenset({"image", "media", "font"})
+    )
+    block_trackers: bool = True
+    wait_until: WaitUntil = "domcontentloaded"
+    timeout_ms: int = 30000
+    # Poll visible text until it stops changing, for at most this long
+    stability_timeout_ms: int = 3000
+    stability_interval_ms: int = 250
+    # Abort further subresource requests once responses exceed this (0 = off)
+    max_bytes: int = 5_000_000
+
+    def blocks(self, resource_type: str, url: str) -> bool:
+        """Return True if a subresource request should be aborted.
+
+        Navigation requests are never blocked (see ``_RequestFilter``).
+        """
+        if resource_type in self.blocked_resource_types:
+            return True
+        return self.block_trackers and is_tracker(url)
+
+
+PROFILES: dict[str, ScrapeProfile] = {
+    profile.name: profile
+    for profile in (
+        # Text-first pages such as homepages and About pages
+        ScrapeProfile(
+            name="lite",
+            blocked_resource_types=frozenset(
+                {"image", "media", "font", "stylesheet", "websocket", "manifest"}
+            ),
+            stability_timeout_ms=1500,
+            max_bytes=2_000_000,
+        ),
+        ScrapeProfile(name="standard"),
+        # Pages that render content late, e.g. ESG reports in JS widgets
+        ScrapeProfile(
+            name="thorough",
+            blocked_resource_types=frozenset({"media", "font"}),
+            wait_until="load",
+            stability_timeout_ms=6000,
+            stability_interval_ms=500,
+            max_bytes=15_000_000,
+        ),
+        # Legacy behaviour: load everything and wait for the network to idle
+        ScrapeProfile(
+            name="full",
+            blocked_resource_types=frozenset(),
+            block_trackers=False,
+            wait_until="networkidle",
+            stability_timeout_ms=0,
+            max_bytes=0,
+        ),
+    )
+}
+
+# Profile used for each evidence source type that is collected by browser
+SOURCE_PROFILES: dict[str, str] = {
+    "website": "lite",
+    "esg": "thorough",
+    "news": "standard",
+    "registry": "standard",
+}
+
+
+def get_profile(name: str | None = None) -> ScrapeProfile:
+    """Look up a profile by name, defaulting to SCRAPER_DEFAULT_PROFILE.
+
+    Raises:
+        ValueError: If no profile with that name exists.
+    """
+    key = name or settings.SCRAPER_DEFAULT_PROFILE
+    try:
+        return PROFILES[key]
+    except KeyError:
+        raise ValueError(f"Unknown scrape profile: {key}") from None
+
+
+def profile_for_source(source_type: str) -> str:
+    """Return the profile name configured for an evidence source type."""
+    return SOURCE_PROFILES.get(source_type, settings.SCRAPER_DEFAULT_PROFILE)
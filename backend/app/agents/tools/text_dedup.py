@@ -0,0 +1,279 @@
+"""Text normalization, chunking and near-duplicate removal for scraped pages.
+
+Supplier sites repeat the same boilerplate (cookie banners, mission
+statements, footers) on every page. Before text goes to the LLM or the
+embedder it is split into paragraphs (the scrapers emit one block of text
+per line), and each paragraph is checked against everything already seen:
+
+- exact duplicates by a hash of the case- and punctuation-folded text;
+- near duplicates (a reworded footer, a date that changed) by MinHash over
+  word 3-shingles, with LSH banding so a lookup only compares against
+  likely matches, never against every stored paragraph.
+
+A ``TextDeduplicator`` spans one assessment. For embeddings it can also be
+seeded with a supplier's history (signatures kept in Redis for
+TEXT_DEDUP_HISTORY_TTL_SECONDS), so text embedded by an earlier assessment
+is not embedded again.
+
+Usage:
+    dedup = TextDeduplicator()
+    novel_pages = [dedup.novel_text(page) for page in pages]
+"""
+
+import base64
+import hashlib
+import random
+import re
+import struct
+import unicodedata
+from collections import defaultdict
+from collections.abc import Iterable
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import redis_pool
+
+logger = get_logger(__name__)
+
+_HISTORY_KEY_PREFIX = "text_history:"
+
+_NUM_PERM = 64
+# 16 bands of 4 rows: pairs at 0.8 Jaccard similarity collide in at least
+# one band with probability > 0.999, pairs at 0.3 with probability < 0.13
+_BANDS = 16
+_ROWS = _NUM_PERM // _BANDS
+_SHINGLE_WORDS = 3
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+# Fixed seed: signatures must be comparable across processes and runs
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(_NUM_PERM)
+]
+_SIGNATURE = struct.Struct(f">{_NUM_PERM}Q")
+
+_INVISIBLE = dict.fromkeys(map(ord, "\u200b\u200c\u200d\u2060\ufeff\u00ad"))
+_WORD_RE = re.compile(r"\w+")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+Signature = tuple[int, ...]
+
+
+def normalize_text(text: str) -> str:
+    """Normalize Unicode and whitespace, keeping one paragraph per line."""
+    text = unicodedata.normalize("NFKC", text).translate(_INVISIBLE)
+    lines = (" ".join(line.split()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def split_paragraphs(text: str, max_chars: int | None = None) -> list[str]:
+    """Split text into normalized paragraphs of at most ``max_chars``.
+
+    Lines without letters or digits are dropped; longer lines are split at
+    sentence ends (or hard-wrapped if a sentence is longer than the limit).
+    """
+    max_chars = max_chars or settings.TEXT_CHUNK_MAX_CHARS
+    paragraphs = []
+    for line in normalize_text(text).splitlines():
+        if not _WORD_RE.search(line):
+            continue
+        if len(line) <= max_chars:
+            paragraphs.append(line)
+            continue
+        current = ""
+        for sentence in _SENTENCE_END_RE.split(line):
+            while len(sentence) > max_chars:
+                paragraphs.append(sentence[:max_chars])
+                sentence = sentence[max_chars:]
+            if current and len(current) + 1 + len(sentence) > max_chars:
+                paragraphs.append(current)
+                current = ""
+            current = f"{current} {sentence}" if current else sentence
+        if current:
+            paragraphs.append(current)
+    return paragraphs
+
+
+def pack_chunks(paragraphs: Iterable[str], max_chars: int | None = None) -> list[str]:
+    """Join consecutive paragraphs into chunks of at most ``max_chars``."""
+    max_chars = max_chars or settings.TEXT_CHUNK_MAX_CHARS
+    chunks, current = [], ""
+    for paragraph in paragraphs:
+        if current and len(current) + 1 + len(paragraph) > max_chars:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n{paragraph}" if current else paragraph
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def paragraph_key(paragraph: str) -> str:
+    """Return the exact-duplicate key: a hash of the folded words."""
+    words = _WORD_RE.findall(paragraph.casefold())
+    return hashlib.blake2b(" ".join(words).encode(), digest_size=16).hexdigest()
+
+
+def minhash(paragraph: str) -> Signature | None:
+    """Return the MinHash signature of a paragraph's word shingles.
+
+    Returns:
+        The signature, or None if the paragraph is too short to shingle
+        (short paragraphs are only checked for exact duplicates).
+    """
+    words = _WORD_RE.findall(paragraph.casefold())
+    if len(words) < _SHINGLE_WORDS + 3:
+        return None
+    shingles = {
+        int.from_bytes(
+            hashlib.blake2b(
+                " ".join(words[i : i + _SHINGLE_WORDS]).encode(), digest_size=8
+            ).digest()
+        )
+        for i in range(len(words) - _SHINGLE_WORDS + 1)
+    }
+    return tuple(
+        min((a * shingle + b) % _MERSENNE_PRIME for shingle in shingles)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def similarity(first: Signature, second: Signature) -> float:
+    """Estimate the Jaccard similarity of two paragraphs from their signatures."""
+    return sum(x == y for x, y in zip(first, second)) / _NUM_PERM
+
+
+class TextDeduplicator:
+    """Remembers paragraphs and reports whether new ones are novel."""
+
+    def __init__(self, threshold: float | None = None) -> None:
+        self.threshold = (
+            threshold if threshold is not None else settings.TEXT_DEDUP_SIMILARITY
+        )
+        self._keys: set[str] = set()
+        self._signatures: list[Signature] = []
+        self._buckets: defaultdict[tuple[int, Signature], list[int]] = defaultdict(list)
+        # Paragraphs first seen by this instance, for saving to the history
+        self._new: dict[str, Signature | None] = {}
+        self.kept = 0
+        self.exact_duplicates = 0
+        self.near_duplicates = 0
+        self.chars_in = 0
+        self.chars_kept = 0
+
+    def is_novel(self, paragraph: str) -> bool:
+        """Return True (and remember it) if nothing similar was seen before."""
+        self.chars_in += len(paragraph)
+        key = paragraph_key(paragraph)
+        if key in self._keys:
+            self.exact_duplicates += 1
+            return False
+        signature = minhash(paragraph)
+        if signature is not None and self._near_duplicate(signature):
+            self.near_duplicates += 1
+            return False
+        self._remember(key, signature)
+        self._new[key] = signature
+        self.kept += 1
+        self.chars_kept += len(paragraph)
+        return True
+
+    def novel_paragraphs(self, text: str) -> list[str]:
+        """Split text into paragraphs and return the novel ones."""
+        return [p for p in split_paragraphs(text) if self.is_novel(p)]
+
+    def novel_text(self, text: str) -> str:
+        """Return the novel paragraphs of ``text``, one per line."""
+        return "\n".join(self.novel_paragraphs(text))
+
+    def stats(self) -> dict[str, int]:
+        """Return paragraph and character counters for logging."""
+        return {
+            "kept": self.kept,
+            "exact_duplicates": self.exact_duplicates,
+            "near_duplicates": self.near_duplicates,
+            "chars_in": self.chars_in,
+            "chars_kept": self.chars_kept,
+        }
+
+    def _near_duplicate(self, signature: Signature) -> bool:
+        checked: set[int] = set()
+        for band in range(_BANDS):
+            rows = signature[band * _ROWS : (band + 1) * _ROWS]
+            for index in self._buckets.get((band, rows), ()):
+                if index in checked:
+                    continue
+                checked.add(index)
+                if similarity(signature, self._signatures[index]) >= self.threshold:
+                    return True
+        return False
+
+    def _remember(self, key: str, signature: Signature | None) -> None:
+        self._keys.add(key)
+        if signature is None:
+            return
+        index = len(self._signatures)
+        self._signatures.append(signature)
+        for band in range(_BANDS):
+            rows = signature[band * _ROWS : (band + 1) * _ROWS]
+            self._buckets[(band, rows)].append(index)
+
+
+async def load_supplier_history(supplier_domain: str) -> TextDeduplicator:
+    """Return a deduplicator seeded with a supplier's previously seen text.
+
+    Redis errors are logged and yield an empty history.
+    """
+    dedup = TextDeduplicator()
+    client = redis.Redis(connection_pool=redis_pool)
+    try:
+        # redis-py annotates hash commands as returning sync | async results
+        stored = await client.hgetall(  # type: ignore[misc]
+            _HISTORY_KEY_PREFIX + supplier_domain
+        )
+    except Exception as e:
+        logger.warning("text_history_unavailable", error=str(e))
+        stored = {}
+    finally:
+        await client.aclose()
+    for key, packed in stored.items():
+        signature = _SIGNATURE.unpack(base64.b64decode(packed)) if packed else None
+        dedup._remember(key, signature)
+    return dedup
+
+
+async def save_supplier_history(supplier_domain: str, dedup: TextDeduplicator) -> None:
+    """Add the paragraphs ``dedup`` saw first to the supplier's history.
+
+    Call this once the text has been stored (e.g. after commit), so a
+    rolled back run does not mark its text as seen. Redis errors are logged.
+    """
+    if not dedup._new:
+        return
+    redis_key = _HISTORY_KEY_PREFIX + supplier_domain
+    client = redis.Redis(connection_pool=redis_pool)
+    try:
+        entries = await client.hlen(redis_key)  # type: ignore[misc]
+        if entries >= settings.TEXT_DEDUP_HISTORY_MAX_ENTRIES:
+            logger.info("text_history_full", supplier_domain=supplier_domain)
+            return
+        mapping = {
+            # Base64: the shared Redis pool decodes responses as text
+            key: (
+                base64.b64encode(_SIGNATURE.pack(*signature)).decode()
+                if signature
+                else ""
+            )
+            for key, signature in dedup._new.items()
+        }
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.hset(redis_key, mapping=mapping)
+            pipe.expire(redis_key, settings.TEXT_DEDUP_HISTORY_TTL_SECONDS)
+            await pipe.execute()
+        dedup._new.clear()
+    except Exception as e:
+        logger.warning("text_history_unavailable", error=str(e))
+    finally:
+        await client.aclose()
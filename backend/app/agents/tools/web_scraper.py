@@ -0,0 +1,137 @@
+"""Playwright-based web scraper for supplier websites (ADR-007)."""
+
+import time
+from collections.abc import Awaitable
+from typing import Any, Protocol
+
+from playwright.async_api import Page, Request, Route
+
+from app.agents.tools.browser_pool import browser_pool
+from app.agents.tools.scrape_profiles import ScrapeProfile, get_profile
+
+
+class PageFetcher(Protocol):
+    """Signature shared by scrape_page and the layers wrapping it."""
+
+    def __call__(
+        self, url: str, profile: str | None = None
+    ) -> Awaitable[dict[str, Any]]: ...
+
+
+# Visible text with boilerplate elements removed, capped to keep prompts small
+_EXTRACT_TEXT_JS = """
+() => {
+    const body = document.body.cloneNode(true);
+    // Remove script and style elements
+    body.querySelectorAll('script, style, nav, footer, header').forEach(el => el.remove());
+    return body.innerText.substring(0, 10000);
+}
+"""
+
+# All anchor links, used for About/ESG page discovery
+_EXTRACT_LINKS_JS = """
+() => Array.from(document.querySelectorAll('a[href]'))
+    .map(a => ({href: a.href, text: a.innerText.trim()}))
+    .filter(l => l.text.length > 0 && l.text.length < 100)
+"""
+
+_TEXT_LENGTH_JS = "() => document.body ? document.body.innerText.length : 0"
+
+
+class _RequestFilter:
+    """Route handler enforcing a profile's blocking rules and byte budget."""
+
+    def __init__(self, profile: ScrapeProfile) -> None:
+        self.profile = profile
+        self.bytes_received = 0
+        self.blocked = 0
+
+    async def handle(self, route: Route, request: Request) -> None:
+        # Documents (the page itself and its frames) always load
+        if request.is_navigation_request():
+            await route.continue_()
+            return
+        over_budget = (
+            self.profile.max_bytes > 0 and self.bytes_received >= self.profile.max_bytes
+        )
+        if over_budget or self.profile.blocks(request.resource_type, request.url):
+            self.blocked += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def on_request_finished(self, request: Request) -> None:
+        """Count the bytes actually transferred for a finished request.
+
+        Uses the measured sizes, since chunked and compressed responses
+        carry no (or a misleading) ``content-length``.
+        """
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return
+        # Sizes are -1 when unknown
+        self.bytes_received += max(sizes["responseHeadersSize"], 0)
+        self.bytes_received += max(sizes["responseBodySize"], 0)
+
+
+async def _wait_for_stable_content(page: Page, profile: ScrapeProfile) -> None:
+    """Poll the visible text length until two consecutive reads agree."""
+    if profile.stability_timeout_ms <= 0:
+        return
+    deadline = time.monotonic() + profile.stability_timeout_ms / 1000
+    last_length = -1
+    while time.monotonic() < deadline:
+        length = await page.evaluate(_TEXT_LENGTH_JS)
+        if length and length == last_length:
+            return
+        last_length = length
+        await page.wait_for_timeout(profile.stability_interval_ms)
+
+
+async def scrape_page(url: str, profile: str | None = None) -> dict[str, Any]:
+    """Scrape a single page using a leased browser from the shared pool.
+
+    Args:
+        url: Page URL to load
+        profile: Scrape profile name (defaults to SCRAPER_DEFAULT_PROFILE)
+
+    Returns:
+        dict with url, title, content, links and success flag. On failure
+        ``success`` is False and ``error`` holds the exception message.
+    """
+    scrape_profile = get_profile(profile)
+    request_filter = _RequestFilter(scrape_profile)
+    try:
+        async with browser_pool.page() as page:
+            await page.route("**/*", request_filter.handle)
+            page.on("requestfinished", request_filter.on_request_finished)
+            await page.goto(
+                url,
+                wait_until=scrape_profile.wait_until,
+                timeout=scrape_profile.timeout_ms,
+            )
+            await _wait_for_stable_content(page, scrape_profile)
+            title = await page.title()
+            text_content = await page.evaluate(_EXTRACT_TEXT_JS)
+            links = await page.evaluate(_EXTRACT_LINKS_JS)
+
+        return {
+            "url": url,
+            "title": title,
+            "content": text_content,
+            "links": links,
+            "success": True,
+            "profile": scrape_profile.name,
+            "bytes_received": request_filter.bytes_received,
+            "requests_blocked": request_filter.blocked,
+        }
+    except Exception as e:
+        return {
+            "url": url,
+            "title": "",
+            "content": "",
+            "links": [],
+            "success": False,
+            "error": str(e),
+        }
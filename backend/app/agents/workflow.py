@@ -0,0 +1,170 @@
+"""Main assessment workflow.
+
+The LangGraph graph that assesses one supplier website: independent
+collectors run in parallel, then the LLM analysis and report nodes run once
+all of them have finished. Used by the ARQ worker (app.workers.tasks) and
+the standalone demo.
+"""
+
+import time
+from collections.abc import Awaitable
+from datetime import datetime
+from functools import cache
+from typing import Any, Protocol, cast
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.state import CompiledStateGraph
+
+from app.agents.nodes.data_collection import collect_corporate, collect_esg
+from app.agents.nodes.evidence_analysis import process_data
+from app.agents.nodes.report_generation import generate_output
+from app.agents.nodes.screening import screen_watchlists
+from app.agents.state import AssessmentState, event_publisher, initial_state
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+AssessmentGraph = CompiledStateGraph[
+    AssessmentState, None, AssessmentState, AssessmentState
+]
+
+
+class Node(Protocol):
+    """A graph node: reads the state and returns the keys it updates.
+
+    The parameter is named ``state`` to match LangGraph's node protocol.
+    """
+
+    def __call__(self, state: AssessmentState) -> Awaitable[dict[str, Any]]: ...
+
+
+# Independent collectors run as parallel branches from START. Add new sources
+# (sanctions, registries, news) here; they must only write reducer-backed or
+# collector-specific state keys.
+COLLECTORS: dict[str, Node] = {
+    "collect_corporate": collect_corporate,
+    "collect_esg": collect_esg,
+}
+
+# Nodes that run after the collectors have joined, in order
+ANALYSIS_NODES = ("screen_watchlists", "process_data", "generate_output")
+
+
+def timed_node(name: str, fn: Node) -> Node:
+    """Wrap a graph node so its wall-clock time is recorded in node_timings.
+
+    Start and completion are also published as progress events.
+    """
+
+    async def wrapper(state: AssessmentState) -> dict[str, Any]:
+        publisher = event_publisher(state)
+        if publisher is not None:
+            await publisher.emit("node_started", node=name)
+        started_at = datetime.now().isoformat()
+        start = time.perf_counter()
+        update = await fn(state)
+        timing = {
+            "started_at": started_at,
+            "duration_ms": round((time.perf_counter() - start) * 1000),
+        }
+        if publisher is not None:
+            await publisher.emit(
+                "node_completed",
+                node=name,
+                duration_ms=timing["duration_ms"],
+                errors=update.get("errors", []),
+            )
+        return {**update, "node_timings": {name: timing}}
+
+    return wrapper
+
+
+def critical_path(node_timings: dict[str, dict[str, Any]]) -> tuple[list[str], int]:
+    """Return the slowest path through the graph and its total duration (ms)."""
+    collectors = [name for name in COLLECTORS if name in node_timings]
+    path = []
+    if collectors:
+        path.append(max(collectors, key=lambda n: node_timings[n]["duration_ms"]))
+    path += [name for name in ANALYSIS_NODES if name in node_timings]
+    return path, sum(node_timings[name]["duration_ms"] for name in path)
+
+
+def build_graph(
+    checkpointer: BaseCheckpointSaver[str] | None = None,
+) -> AssessmentGraph:
+    """Build the assessment workflow graph.
+
+    Flow: START -> collectors (parallel) -> screen_watchlists -> process_data
+    -> generate_output -> END. screen_watchlists runs once every collector
+    branch has finished.
+    """
+    builder: StateGraph[AssessmentState, None, AssessmentState, AssessmentState]
+    builder = StateGraph(AssessmentState)
+
+    # Fan out: every collector starts from START
+    for name, collector in COLLECTORS.items():
+        builder.add_node(name, timed_node(name, collector))
+        builder.add_edge(START, name)
+
+    builder.add_node(
+        "screen_watchlists", timed_node("screen_watchlists", screen_watchlists)
+    )
+    builder.add_node("process_data", timed_node("process_data", process_data))
+    builder.add_node("generate_output", timed_node("generate_output", generate_output))
+
+    # Join: wait for all collectors before analysis
+    builder.add_edge(list(COLLECTORS), "screen_watchlists")
+    builder.add_edge("screen_watchlists", "process_data")
+    builder.add_edge("process_data", "generate_output")
+    builder.add_edge("generate_output", END)
+
+    return builder.compile(checkpointer=checkpointer)
+
+
+@cache
+def get_graph(checkpointer: BaseCheckpointSaver[str] | None = None) -> AssessmentGraph:
+    """Return the compiled workflow graph, built once per checkpointer."""
+    return build_graph(checkpointer)
+
+
+async def run_workflow(
+    supplier_url: str,
+    assessment_id: str = "",
+    checkpointer: BaseCheckpointSaver[str] | None = None,
+) -> AssessmentState:
+    """Run the assessment workflow for one supplier website.
+
+    Node progress is published for ``assessment_id`` when given; terminal
+    completed/failed events are left to the caller, which knows whether a
+    failed run will be retried.
+
+    With a checkpointer, state is saved after every step under the
+    assessment id. Running the same assessment again resumes an unfinished
+    run from its last completed node (tasks that finished in the failed
+    step are not repeated) and returns a finished run's saved state.
+
+    Args:
+        supplier_url: Supplier website to assess.
+        assessment_id: Assessment whose event channel receives progress.
+        checkpointer: Checkpoint store; requires ``assessment_id``.
+
+    Returns:
+        The final workflow state.
+    """
+    if checkpointer is None or not assessment_id:
+        graph, config = get_graph(), None
+    else:
+        graph = get_graph(checkpointer)
+        config = RunnableConfig(configurable={"thread_id": assessment_id})
+        snapshot = await graph.aget_state(config)
+        if snapshot.next:
+            logger.info(
+                "workflow_resumed", assessment_id=assessment_id, next=snapshot.next
+            )
+            return cast(AssessmentState, await graph.ainvoke(None, config))
+        if snapshot.values:
+            return cast(AssessmentState, snapshot.values)
+    state = await graph.ainvoke(initial_state(supplier_url, assessment_id), config)
+    return cast(AssessmentState, state)
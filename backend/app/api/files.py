@@ -0,0 +1,100 @@
+"""Streaming responses for files in object storage.
+
+Endpoints that serve stored files (data source uploads, reports) return
+``object_response``: the object is piped to the client chunk by chunk as
+it is read from storage, and a ``Range`` header is answered with a 206
+partial response, so downloads can be resumed and large files are never
+buffered whole in the API process.
+"""
+
+import re
+
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.core.storage import iter_file, stat_file
+
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Resolve a single-range ``Range`` header against a file size.
+
+    Args:
+        header: ``Range`` header value, e.g. ``bytes=0-1023`` or ``bytes=-500``.
+        size: File size in bytes.
+
+    Returns:
+        The ``(start, end)`` byte range with ``end`` exclusive, or None if
+        the header is not a single byte range and should be ignored.
+
+    Raises:
+        HTTPException: 416 if the range lies outside the file.
+    """
+    match = _RANGE.fullmatch(header.strip())
+    if match is None or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if not first:
+        start, end = max(size - int(last), 0), size
+    else:
+        start = int(first)
+        end = min(int(last) + 1, size) if last else size
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+async def object_response(
+    key: str,
+    range_header: str | None = None,
+    filename: str | None = None,
+    bucket_name: str | None = None,
+) -> StreamingResponse:
+    """Build a response streaming a stored file, or a range of it.
+
+    Args:
+        key: Object key (path) in the bucket.
+        range_header: The request's ``Range`` header, if any.
+        filename: Download file name for ``Content-Disposition``.
+        bucket_name: Source bucket (defaults to MINIO_BUCKET_NAME).
+
+    Returns:
+        A 200 response with the whole file, or 206 with the requested range.
+
+    Raises:
+        HTTPException: 404 if the file does not exist, 416 for a range
+            outside it.
+    """
+    info = await stat_file(key, bucket_name)
+    if info is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
+        )
+    size = info["size"]
+    headers = {"Accept-Ranges": "bytes", "ETag": info["etag"]}
+    if filename:
+        quoted = filename.replace('"', "")
+        headers["Content-Disposition"] = f'attachment; filename="{quoted}"'
+
+    byte_range = parse_range(range_header, size) if range_header else None
+    if byte_range is None:
+        start, end, status_code = 0, size, status.HTTP_200_OK
+    else:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+    headers["Content-Length"] = str(end - start)
+
+    # An empty file has no range to request
+    body = iter_file(key, bucket_name, start, end) if size else iter(())
+    return StreamingResponse(
+        body,
+        status_code=status_code,
+        media_type=info["content_type"],
+        headers=headers,
+    )
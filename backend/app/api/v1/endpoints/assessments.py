@@ -0,0 +1,203 @@
+"""Assessment endpoints."""
+
+import asyncio
+import json
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from typing import Any
+
+from fastapi import APIRouter, Header, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.events import event_broker
+from app.schemas.assessment import (
+    AssessmentCreate,
+    AssessmentQueued,
+    BulkBatchProgress,
+)
+from app.schemas.base import SuccessResponse
+from app.services.bulk_assessment_service import (
+    get_batch_progress,
+    submit_bulk_batch,
+)
+from app.services.supplier_import import (
+    SupplierImportError,
+    format_for_content_type,
+    parse_suppliers,
+)
+from app.workers.queue import JobPriority, enqueue_assessment
+
+router = APIRouter()
+
+
+@router.post(
+    "",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=SuccessResponse[AssessmentQueued],
+)
+async def create_assessment(
+    payload: AssessmentCreate, request: Request
+) -> SuccessResponse[AssessmentQueued]:
+    """Queue an assessment of a supplier website.
+
+    The workflow runs on an ARQ worker; the response returns as soon as the
+    job is queued. Progress can be followed on the events stream.
+
+    Args:
+        payload: Supplier URL and queue priority.
+        request: Incoming request, used to build the events URL.
+
+    Returns:
+        The new assessment id and its events URL.
+    """
+    assessment_id = await enqueue_assessment(
+        str(payload.supplier_url), priority=payload.priority
+    )
+    events_url = request.url_for(
+        "stream_assessment_events", assessment_id=assessment_id
+    )
+    return SuccessResponse(
+        data=AssessmentQueued(assessment_id=assessment_id, events_url=events_url.path)
+    )
+
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=SuccessResponse[BulkBatchProgress],
+)
+async def create_bulk_assessment(
+    request: Request,
+    content_type: str = Header(default=""),
+    priority: JobPriority = JobPriority.BULK,
+) -> SuccessResponse[BulkBatchProgress]:
+    """Queue assessments for an uploaded supplier list.
+
+    The request body is a CSV file with a header row, NDJSON, or a JSON
+    array of objects, selected by ``Content-Type``. It is parsed as it
+    streams in; suppliers are deduplicated by domain and queued in batches.
+
+    Args:
+        request: Incoming request, whose body is the supplier list.
+        content_type: ``text/csv``, ``application/x-ndjson`` or
+            ``application/json``.
+        priority: Worker pool to run the assessments on.
+
+    Returns:
+        The batch's counters once every supplier has been queued.
+
+    Raises:
+        HTTPException: 415 for an unsupported content type, 400 if the
+            upload is malformed or too large.
+    """
+    import_format = format_for_content_type(content_type)
+    if import_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Upload a CSV, NDJSON or JSON array supplier list",
+        )
+    try:
+        progress = await submit_bulk_batch(
+            parse_suppliers(request.stream(), import_format), priority
+        )
+    except SupplierImportError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return SuccessResponse(data=BulkBatchProgress(**progress))
+
+
+@router.get("/bulk/{batch_id}", response_model=SuccessResponse[BulkBatchProgress])
+async def get_bulk_assessment(
+    batch_id: uuid.UUID,
+) -> SuccessResponse[BulkBatchProgress]:
+    """Return the aggregate progress of a bulk upload.
+
+    Args:
+        batch_id: Batch returned by the upload.
+
+    Returns:
+        Row, queue and outcome counters of the batch.
+
+    Raises:
+        HTTPException: 404 if the batch is unknown or has expired.
+    """
+    progress = await get_batch_progress(str(batch_id))
+    if progress is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Batch not found"
+        )
+    return SuccessResponse(data=BulkBatchProgress(**progress))
+
+
+@router.get("/{assessment_id}/events")
+async def stream_assessment_events(
+    assessment_id: uuid.UUID,
+    request: Request,
+    last_event_id: str | None = Header(default=None),
+) -> StreamingResponse:
+    """Stream an assessment's progress as Server-Sent Events.
+
+    Node progress events are replayed from the start (or after the
+    ``Last-Event-ID`` a reconnecting client sends), then relayed live along
+    with streamed LLM tokens until the assessment completes or fails. The
+    stream is fed by the process-wide event broker and holds no database or
+    Redis connection of its own.
+
+    Args:
+        assessment_id: Assessment to follow.
+        request: Incoming request, used to detect client disconnects.
+        last_event_id: Sequence number of the last event the client received.
+
+    Returns:
+        A ``text/event-stream`` response.
+    """
+    after_seq = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+    return StreamingResponse(
+        _event_stream(str(assessment_id), after_seq, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _event_stream(
+    assessment_id: str, after_seq: int, request: Request
+) -> AsyncIterator[str]:
+    """Format broker events as SSE frames, with keep-alives while idle."""
+    events = event_broker.subscribe(assessment_id, after_seq)
+    pending: asyncio.Future[dict[str, Any]] | None = None
+    try:
+        # Send something straight away so proxies and clients see the stream open
+        yield ": connected\n\n"
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(events))
+            done, _ = await asyncio.wait(
+                {pending}, timeout=settings.SSE_HEARTBEAT_SECONDS
+            )
+            if not done:
+                if await request.is_disconnected():
+                    return
+                yield ": keep-alive\n\n"
+                continue
+            finished, pending = pending, None
+            try:
+                event = finished.result()
+            except StopAsyncIteration:
+                return
+            yield _format_sse(event)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            with suppress(asyncio.CancelledError, StopAsyncIteration):
+                await pending
+        await events.aclose()
+
+
+def _format_sse(event: dict[str, Any]) -> str:
+    lines = []
+    if "seq" in event:
+        lines.append(f"id: {event['seq']}")
+    lines.append(f"event: {event['type']}")
+    lines.append(f"data: {json.dumps(event)}")
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,44 @@
+"""Evidence endpoints."""
+
+from dataclasses import asdict
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_read_db
+from app.schemas.base import SuccessResponse
+from app.schemas.evidence import EvidenceSearch, EvidenceSearchMatch
+from app.services.evidence_search import search_evidence
+
+router = APIRouter()
+
+
+@router.get("/search", response_model=SuccessResponse[list[EvidenceSearchMatch]])
+async def search(
+    payload: Annotated[EvidenceSearch, Query()],
+    db: AsyncSession = Depends(get_read_db),
+) -> SuccessResponse[list[EvidenceSearchMatch]]:
+    """Find the evidence chunks most similar to a query.
+
+    A GET, so searches are served by read replicas and do not pin the
+    client to the primary.
+
+    Args:
+        payload: Query text and filters, as query parameters.
+        db: Read-only database session.
+
+    Returns:
+        Matching chunks, most similar first.
+    """
+    matches = await search_evidence(
+        db,
+        payload.query,
+        supplier_domain=payload.supplier_domain,
+        source_types=payload.source_types,
+        collected_after=payload.collected_after,
+        limit=payload.limit,
+    )
+    return SuccessResponse(
+        data=[EvidenceSearchMatch(**asdict(match)) for match in matches]
+    )
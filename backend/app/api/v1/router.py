@@ -2,7 +2,11 @@
 
 from fastapi import APIRouter
 
+from app.api.v1.endpoints import assessments, evidence
+
 router = APIRouter()
+router.include_router(assessments.router, prefix="/assessments", tags=["assessments"])
+router.include_router(evidence.router, prefix="/evidence", tags=["evidence"])
 
 # Endpoint modules will be included here as they are implemented
 # Example:
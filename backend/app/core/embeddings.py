@@ -0,0 +1,148 @@
+"""Batched text embeddings with content-hash deduplication.
+
+Embedding providers charge per token but are bound by round trips: one
+call with 256 texts costs about the same wall time as a call with one.
+``BatchingEmbedder`` collects texts from every concurrent caller for up to
+EMBEDDING_BATCH_WAIT_MS (or until EMBEDDING_BATCH_SIZE texts are waiting)
+and sends them as one provider call under the provider's rate limiter.
+Identical texts are embedded once: callers asking for a text already in
+flight await the same result.
+
+Usage:
+    vectors = await embedder.embed([chunk.content for chunk in chunks])
+"""
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable, Sequence
+
+from app.core.config import settings
+from app.core.llm import get_embeddings, get_limiter
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+Vector = list[float]
+EmbedBatch = Callable[[list[str]], Awaitable[list[Vector]]]
+
+# Rough characters-per-token ratio used to reserve rate-limit budget
+_CHARS_PER_TOKEN = 4
+
+
+def text_hash(text: str) -> str:
+    """Return the SHA-256 of a text, the key embeddings are deduplicated by."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+async def _provider_embed(texts: list[str]) -> list[Vector]:
+    """Embed one batch with the configured provider under its rate limiter."""
+    limiter = get_limiter(settings.EMBEDDING_PROVIDER)
+    tokens = sum(len(text) for text in texts) // _CHARS_PER_TOKEN
+    async with limiter.slot(tokens):
+        return await get_embeddings().aembed_documents(texts)
+
+
+class BatchingEmbedder:
+    """Coalesce embedding requests into large, deduplicated provider calls."""
+
+    def __init__(
+        self,
+        embed_batch: EmbedBatch = _provider_embed,
+        *,
+        batch_size: int | None = None,
+        max_wait_ms: float | None = None,
+    ) -> None:
+        self._embed_batch = embed_batch
+        self.batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+        self.max_wait_ms = (
+            max_wait_ms if max_wait_ms is not None else settings.EMBEDDING_BATCH_WAIT_MS
+        )
+        # Texts waiting for the next provider call, by hash
+        self._queued: dict[str, str] = {}
+        # Results of queued and in-flight texts, by hash
+        self._futures: dict[str, asyncio.Future[Vector]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._calls = 0
+        self._texts = 0
+        self._deduplicated = 0
+
+    async def embed(self, texts: Sequence[str]) -> list[Vector]:
+        """Return the embedding of each text, in order.
+
+        Raises:
+            Exception: Whatever the provider raised for a batch containing
+                one of the texts.
+        """
+        futures = [self._submit(text) for text in texts]
+        vectors: list[Vector] = []
+        for result in await asyncio.gather(*futures, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
+            vectors.append(result)
+        return vectors
+
+    def stats(self) -> dict[str, int]:
+        """Return call counters for logging and health checks."""
+        return {
+            "provider_calls": self._calls,
+            "texts_embedded": self._texts,
+            "deduplicated": self._deduplicated,
+            "queued": len(self._queued),
+        }
+
+    def _submit(self, text: str) -> asyncio.Future[Vector]:
+        key = text_hash(text)
+        future = self._futures.get(key)
+        if future is not None:
+            self._deduplicated += 1
+            return future
+        future = asyncio.get_running_loop().create_future()
+        self._futures[key] = future
+        self._queued[key] = text
+        if len(self._queued) >= self.batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.max_wait_ms / 1000, self._dispatch
+            )
+        return future
+
+    def _dispatch(self) -> None:
+        """Hand everything queued to provider calls of up to ``batch_size``."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        queued, self._queued = list(self._queued.items()), {}
+        for start in range(0, len(queued), self.batch_size):
+            task = asyncio.create_task(
+                self._run(queued[start : start + self.batch_size])
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, str]]) -> None:
+        try:
+            vectors = await self._embed_batch([text for _, text in batch])
+            if len(vectors) != len(batch):
+                raise ValueError(
+                    f"Embedding provider returned {len(vectors)} vectors "
+                    f"for {len(batch)} texts"
+                )
+        except Exception as e:
+            logger.warning("embedding_batch_failed", texts=len(batch), error=str(e))
+            for key, _ in batch:
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self._calls += 1
+        self._texts += len(batch)
+        for (key, _), vector in zip(batch, vectors):
+            future = self._futures.pop(key)
+            if not future.done():
+                future.set_result(vector)
+
+
+# Global embedder instance
+embedder = BatchingEmbedder()
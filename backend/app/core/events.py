@@ -0,0 +1,244 @@
+"""Assessment progress events over Redis pub/sub.
+
+Workflow nodes publish progress events and streamed LLM tokens to a
+per-assessment channel (``assessment:{id}:events``). Progress events also
+carry a sequence number and are appended to a short capped history list, so
+a client that connects (or reconnects) late can replay what it missed.
+
+On the API side a single ``EventBroker`` per process holds one pattern
+subscription for all assessments and fans messages out to in-memory queues,
+so an open SSE stream costs neither a database nor a Redis connection.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncGenerator
+from datetime import datetime, timezone
+from typing import Any
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import redis_pool
+
+logger = get_logger(__name__)
+
+CHANNEL_PATTERN = "assessment:*:events"
+# Events after which no more output is expected for an assessment
+TERMINAL_EVENTS = {"completed", "failed"}
+
+_HISTORY_LIMIT = 500
+# Queued in place of a slow listener's backlog: replay from the history
+_RESYNC: dict[str, Any] = {"type": "resync"}
+
+
+def channel_name(assessment_id: str) -> str:
+    return f"assessment:{assessment_id}:events"
+
+
+def _history_key(assessment_id: str) -> str:
+    return f"assessment:{assessment_id}:history"
+
+
+def _seq_key(assessment_id: str) -> str:
+    return f"assessment:{assessment_id}:seq"
+
+
+class EventPublisher:
+    """Publish events for one assessment.
+
+    Tokens are coalesced and flushed every ``flush_interval`` seconds or
+    ``flush_chars`` characters so a fast stream doesn't cost one Redis
+    round trip per token. Publishing never raises; failures are logged.
+    """
+
+    def __init__(
+        self,
+        assessment_id: str,
+        flush_interval: float = 0.1,
+        flush_chars: int = 200,
+    ) -> None:
+        self.assessment_id = assessment_id
+        self.flush_interval = flush_interval
+        self.flush_chars = flush_chars
+        self._buffer: list[str] = []
+        self._buffered_chars = 0
+        self._node = ""
+        self._last_flush = time.monotonic()
+
+    async def emit(self, event_type: str, **data: Any) -> None:
+        """Publish a progress event and append it to the replay history."""
+        await self.flush()
+        client = redis.Redis(connection_pool=redis_pool)
+        try:
+            seq = await client.incr(_seq_key(self.assessment_id))
+            payload = json.dumps(self._event(event_type, seq=seq, **data))
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.rpush(_history_key(self.assessment_id), payload)
+                pipe.ltrim(_history_key(self.assessment_id), -_HISTORY_LIMIT, -1)
+                for key in (
+                    _history_key(self.assessment_id),
+                    _seq_key(self.assessment_id),
+                ):
+                    pipe.expire(key, settings.EVENT_HISTORY_TTL_SECONDS)
+                pipe.publish(channel_name(self.assessment_id), payload)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("event_publish_failed", event_type=event_type, error=str(e))
+        finally:
+            await client.aclose()
+
+    async def token(self, text: str, node: str) -> None:
+        """Buffer a streamed LLM token, flushing when the buffer is due."""
+        self._buffer.append(text)
+        self._buffered_chars += len(text)
+        self._node = node
+        due = time.monotonic() - self._last_flush >= self.flush_interval
+        if due or self._buffered_chars >= self.flush_chars:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Publish buffered tokens (live only, not kept in history)."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        text, self._buffer, self._buffered_chars = "".join(self._buffer), [], 0
+        payload = json.dumps(self._event("token", node=self._node, text=text))
+        client = redis.Redis(connection_pool=redis_pool)
+        try:
+            await client.publish(channel_name(self.assessment_id), payload)
+        except Exception as e:
+            logger.warning("event_publish_failed", event_type="token", error=str(e))
+        finally:
+            await client.aclose()
+
+    def _event(self, event_type: str, **data: Any) -> dict[str, Any]:
+        return {
+            "type": event_type,
+            "assessment_id": self.assessment_id,
+            "ts": datetime.now(timezone.utc).isoformat(),
+            **data,
+        }
+
+
+class EventBroker:
+    """Process-wide subscriber that fans assessment events out to listeners."""
+
+    def __init__(self) -> None:
+        self._listeners: dict[str, set[asyncio.Queue[dict[str, Any]]]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def subscribe(
+        self, assessment_id: str, after_seq: int = 0
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield an assessment's events: history after ``after_seq``, then live.
+
+        Stops after a terminal event.
+        """
+        self._ensure_running()
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(
+            maxsize=settings.EVENT_QUEUE_SIZE
+        )
+        # Register before reading history so nothing falls in between
+        self._listeners.setdefault(assessment_id, set()).add(queue)
+        try:
+            last_seq = after_seq
+            replay = True
+            while True:
+                if replay:
+                    events = await _read_history(assessment_id)
+                    replay = False
+                else:
+                    event = await queue.get()
+                    if event is _RESYNC:
+                        replay = True
+                        continue
+                    events = [event]
+                for event in events:
+                    seq = event.get("seq")
+                    if seq is not None:
+                        if seq <= last_seq:
+                            continue  # already replayed from history
+                        last_seq = seq
+                    yield event
+                    if event["type"] in TERMINAL_EVENTS:
+                        return
+        finally:
+            listeners = self._listeners.get(assessment_id, set())
+            listeners.discard(queue)
+            if not listeners:
+                self._listeners.pop(assessment_id, None)
+
+    async def close(self) -> None:
+        """Stop the background subscriber."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Receive events for every assessment, reconnecting on errors."""
+        backoff = 0.5
+        while True:
+            client = redis.Redis(connection_pool=redis_pool)
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(CHANNEL_PATTERN)
+                backoff = 0.5
+                async for message in pubsub.listen():
+                    if message.get("type") == "pmessage":
+                        self._dispatch(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("event_broker_disconnected", error=str(e))
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 10)
+            finally:
+                await pubsub.aclose()  # type: ignore[no-untyped-call]
+                await client.aclose()
+
+    def _dispatch(self, raw: str) -> None:
+        try:
+            event = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+        for queue in self._listeners.get(event.get("assessment_id", ""), ()):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow client: tokens are cosmetic and dropped. Progress
+                # events are all in the history, so rather than evicting
+                # one, drop the backlog and let the stream replay from there
+                if event["type"] != "token":
+                    while not queue.empty():
+                        queue.get_nowait()
+                    queue.put_nowait(_RESYNC)
+
+
+async def _read_history(assessment_id: str) -> list[dict[str, Any]]:
+    client = redis.Redis(connection_pool=redis_pool)
+    try:
+        # redis-py annotates list commands as returning sync | async results
+        raw_events = await client.lrange(  # type: ignore[misc]
+            _history_key(assessment_id), 0, -1
+        )
+    except Exception as e:
+        logger.warning("event_history_unavailable", error=str(e))
+        return []
+    finally:
+        await client.aclose()
+    return [json.loads(raw) for raw in raw_events]
+
+
+# Process-wide broker used by the SSE endpoint
+event_broker = EventBroker()
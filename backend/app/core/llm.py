@@ -0,0 +1,389 @@
+"""LLM provider registry with shared clients and per-provider rate limits.
+
+Chat model clients are built once per (provider, model, parameters) and
+reused by every agent node and worker. OpenAI-compatible providers share a
+single pooled HTTP client. Each provider gets a limiter that caps concurrent
+calls and enforces a token-per-minute budget, so bursts of assessments queue
+locally instead of being rejected with 429s. Deterministic calls are served
+from the LLM response cache (app.core.llm_cache) when possible.
+
+Usage:
+    llm = get_llm()
+    response = await invoke_llm(llm, [HumanMessage(content=prompt)])
+
+    # or, forwarding tokens as they arrive
+    response = await stream_llm(llm, messages, on_token=publish)
+"""
+
+import asyncio
+import hashlib
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
+from typing import Any, cast
+
+import httpx
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk, BaseMessage
+
+from app.core.config import settings
+from app.core.llm_cache import cache_key, is_deterministic, llm_cache, model_name
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Default endpoints for OpenAI-compatible providers
+_OPENAI_COMPATIBLE_BASE_URLS = {
+    "openai": None,
+    "openrouter": "https://openrouter.ai/api/v1",
+}
+# Rough characters-per-token ratio used to estimate prompt size up front
+_CHARS_PER_TOKEN = 4
+
+
+class TokenBucket:
+    """Token-per-minute budget that makes callers wait for capacity.
+
+    Waiters are served in arrival order; a value of 0 disables the limit.
+    """
+
+    def __init__(self, tokens_per_minute: int) -> None:
+        self.capacity = tokens_per_minute
+        self.tokens = float(tokens_per_minute)
+        self._rate = tokens_per_minute / 60
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until ``tokens`` are available, then consume them."""
+        if self.capacity <= 0:
+            return
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self._rate)
+
+    def adjust(self, tokens: int) -> None:
+        """Return unused tokens (positive) or charge an overrun (negative)."""
+        if self.capacity <= 0:
+            return
+        self._refill()
+        self.tokens = min(float(self.capacity), self.tokens + tokens)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            float(self.capacity), self.tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+
+class ProviderLimiter:
+    """Concurrency cap plus token-per-minute budget for one provider."""
+
+    def __init__(self, max_concurrency: int, tokens_per_minute: int) -> None:
+        self.semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self.bucket = TokenBucket(tokens_per_minute)
+        self.calls = 0
+        self.waited_seconds = 0.0
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int) -> AsyncIterator[None]:
+        """Hold a call slot with ``estimated_tokens`` reserved from the budget."""
+        started = time.monotonic()
+        async with self.semaphore:
+            await self.bucket.acquire(estimated_tokens)
+            self.waited_seconds += time.monotonic() - started
+            self.calls += 1
+            yield
+
+
+_clients: dict[tuple[Any, ...], BaseChatModel] = {}
+_embedding_clients: dict[tuple[Any, ...], Embeddings] = {}
+_limiters: dict[str, ProviderLimiter] = {}
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_llm(
+    provider: str | None = None,
+    model: str | None = None,
+    *,
+    api_key: str | None = None,
+    base_url: str | None = None,
+    temperature: float = 0,
+    max_tokens: int = 4096,
+) -> BaseChatModel:
+    """Return the shared chat model for a provider/model/parameter set.
+
+    Unset arguments fall back to LLM_PROVIDER, LLM_MODEL, LLM_API_KEY and
+    LLM_BASE_URL. ``temperature`` defaults to 0 for deterministic output
+    (NFR11).
+
+    Raises:
+        ValueError: If the provider is not supported.
+    """
+    provider = (provider or settings.LLM_PROVIDER).lower()
+    model = model or settings.LLM_MODEL
+    api_key = api_key or settings.LLM_API_KEY
+    base_url = base_url or settings.LLM_BASE_URL or None
+
+    key = (
+        provider,
+        model,
+        base_url,
+        temperature,
+        max_tokens,
+        hashlib.sha256(api_key.encode()).hexdigest(),
+    )
+    llm = _clients.get(key)
+    if llm is None:
+        llm = _build_llm(provider, model, api_key, base_url, temperature, max_tokens)
+        _clients[key] = llm
+        logger.info("llm_client_created", provider=provider, model=model)
+    return llm
+
+
+def get_embeddings(
+    provider: str | None = None,
+    model: str | None = None,
+    *,
+    dimensions: int | None = None,
+) -> Embeddings:
+    """Return the shared embeddings client for a provider/model.
+
+    Unset arguments fall back to EMBEDDING_PROVIDER, EMBEDDING_MODEL and
+    EMBEDDING_DIMENSIONS; the API key and endpoint are the LLM ones.
+
+    Raises:
+        ValueError: If the provider has no embeddings support.
+    """
+    provider = (provider or settings.EMBEDDING_PROVIDER).lower()
+    model = model or settings.EMBEDDING_MODEL
+    dimensions = dimensions or settings.EMBEDDING_DIMENSIONS
+
+    key = (provider, model, dimensions)
+    client = _embedding_clients.get(key)
+    if client is None:
+        client = _build_embeddings(provider, model, dimensions)
+        _embedding_clients[key] = client
+        logger.info("embeddings_client_created", provider=provider, model=model)
+    return client
+
+
+def get_limiter(provider: str | None = None) -> ProviderLimiter:
+    """Return the rate limiter shared by all calls to a provider."""
+    provider = (provider or settings.LLM_PROVIDER).lower()
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        limiter = ProviderLimiter(
+            max_concurrency=settings.LLM_MAX_CONCURRENCY,
+            tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+        )
+        _limiters[provider] = limiter
+    return limiter
+
+
+def provider_of(llm: BaseChatModel) -> str:
+    """Return the registry provider name a shared client was built for."""
+    for key, client in _clients.items():
+        if client is llm:
+            return str(key[0])
+    return settings.LLM_PROVIDER.lower()
+
+
+def estimate_tokens(messages: Sequence[BaseMessage], max_tokens: int) -> int:
+    """Estimate prompt plus completion tokens for budget reservation."""
+    prompt_chars = sum(len(str(message.content)) for message in messages)
+    return prompt_chars // _CHARS_PER_TOKEN + max_tokens
+
+
+async def invoke_llm(
+    llm: BaseChatModel,
+    messages: Sequence[BaseMessage],
+    *,
+    cache: bool | None = None,
+) -> Any:
+    """Call a shared client under its provider's concurrency and TPM limits.
+
+    Responses go through the LLM response cache. ``cache=None`` caches
+    deterministic (temperature 0) calls when LLM_CACHE_ENABLED is set,
+    ``cache=True`` forces caching and ``cache=False`` bypasses the lookup
+    (the fresh response still refreshes the cache).
+
+    The rate-limit reservation is reconciled with the provider-reported
+    usage once the response arrives.
+    """
+    key, cached = await _cache_lookup(llm, messages, cache)
+    if cached is not None:
+        return cached
+
+    limiter = get_limiter(provider_of(llm))
+    reserved = estimate_tokens(messages, getattr(llm, "max_tokens", None) or 0)
+    started = time.perf_counter()
+    async with limiter.slot(reserved):
+        response = await llm.ainvoke(list(messages))
+    await _record_response(llm, limiter, reserved, started, key, response)
+    return response
+
+
+async def stream_llm(
+    llm: BaseChatModel,
+    messages: Sequence[BaseMessage],
+    on_token: Callable[[str], Awaitable[None]],
+    *,
+    cache: bool | None = None,
+) -> BaseMessage:
+    """Like ``invoke_llm``, but pass text chunks to ``on_token`` as they arrive.
+
+    A cached response is passed to ``on_token`` in one piece. The rate-limit
+    slot is held until the stream ends.
+
+    Returns:
+        The complete response message, as ``invoke_llm`` would.
+    """
+    key, cached = await _cache_lookup(llm, messages, cache)
+    if cached is not None:
+        if cached.text:
+            await on_token(cached.text)
+        return cached
+
+    limiter = get_limiter(provider_of(llm))
+    reserved = estimate_tokens(messages, getattr(llm, "max_tokens", None) or 0)
+    started = time.perf_counter()
+    response: AIMessageChunk | None = None
+    async with limiter.slot(reserved):
+        async for chunk in llm.astream(list(messages)):
+            response = chunk if response is None else response + chunk
+            if chunk.text:
+                await on_token(chunk.text)
+    if response is None:
+        raise ValueError("LLM stream returned no output")
+    await _record_response(llm, limiter, reserved, started, key, response)
+    return response
+
+
+async def _cache_lookup(
+    llm: BaseChatModel, messages: Sequence[BaseMessage], cache: bool | None
+) -> tuple[str, BaseMessage | None]:
+    """Apply the cache policy; return (write key or "", cached response)."""
+    enabled = settings.LLM_CACHE_ENABLED
+    read_cache = enabled and (
+        cache is True or (cache is None and is_deterministic(llm))
+    )
+    write_cache = read_cache or (enabled and cache is False and is_deterministic(llm))
+    key = cache_key(llm, messages) if write_cache else ""
+    if read_cache:
+        return key, await llm_cache.get(key)
+    if cache is False:
+        llm_cache.record_bypass()
+    return key, None
+
+
+async def _record_response(
+    llm: BaseChatModel,
+    limiter: ProviderLimiter,
+    reserved: int,
+    started: float,
+    key: str,
+    response: BaseMessage,
+) -> None:
+    """Reconcile the token reservation and store the response if cacheable."""
+    latency_ms = round((time.perf_counter() - started) * 1000)
+    usage = getattr(response, "usage_metadata", None) or {}
+    if usage.get("total_tokens"):
+        limiter.bucket.adjust(reserved - usage["total_tokens"])
+    if key:
+        await llm_cache.set(key, model_name(llm), response, latency_ms)
+
+
+async def close_llm_clients() -> None:
+    """Close the shared HTTP pool and drop cached clients and limiters."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    _clients.clear()
+    _embedding_clients.clear()
+    _limiters.clear()
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+            ),
+        )
+    return _http_client
+
+
+def _build_llm(
+    provider: str,
+    model: str,
+    api_key: str,
+    base_url: str | None,
+    temperature: float,
+    max_tokens: int,
+) -> BaseChatModel:
+    common: dict[str, Any] = {
+        "model": model,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    if api_key:
+        common["api_key"] = api_key
+
+    match provider:
+        case "openai" | "openrouter":
+            from langchain_openai import ChatOpenAI
+
+            return ChatOpenAI(
+                base_url=base_url or _OPENAI_COMPATIBLE_BASE_URLS[provider],
+                http_async_client=_shared_http_client(),
+                **common,
+            )
+        case "anthropic":
+            from langchain_anthropic import ChatAnthropic
+
+            # ChatAnthropic keeps its own pooled client per (cached) instance
+            if base_url:
+                common["base_url"] = base_url
+            return ChatAnthropic(**common)
+        case "google":
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
+            return cast(BaseChatModel, ChatGoogleGenerativeAI(**common))
+        case _:
+            raise ValueError(f"Unknown LLM provider: {provider}")
+
+
+def _build_embeddings(provider: str, model: str, dimensions: int) -> Embeddings:
+    common: dict[str, Any] = {"model": model}
+    if settings.LLM_API_KEY:
+        common["api_key"] = settings.LLM_API_KEY
+
+    match provider:
+        case "openai" | "openrouter":
+            from langchain_openai import OpenAIEmbeddings
+
+            return OpenAIEmbeddings(
+                base_url=settings.LLM_BASE_URL
+                or _OPENAI_COMPATIBLE_BASE_URLS[provider],
+                http_async_client=_shared_http_client(),
+                dimensions=dimensions,
+                **common,
+            )
+        case "google":
+            from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+            return cast(Embeddings, GoogleGenerativeAIEmbeddings(**common))
+        case _:
+            raise ValueError(f"No embeddings support for provider: {provider}")
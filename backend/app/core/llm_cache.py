@@ -0,0 +1,232 @@
+"""Content-addressed cache for LLM responses.
+
+Responses are keyed by a SHA-256 of the model, its sampling parameters and
+the whitespace-normalized prompt, so a retried assessment or a second user
+assessing the same supplier gets the earlier answer without another call.
+
+Entries live in Redis with a TTL, and the Redis tier is bounded to
+LLM_CACHE_MAX_ENTRIES by evicting the least recently used keys. With
+LLM_CACHE_DB_ENABLED a Postgres tier keeps entries for longer and refills
+Redis on a hit. Only deterministic (``temperature=0``) calls are cached
+unless a caller opts in explicitly.
+"""
+
+import hashlib
+import json
+import time
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+
+import redis.asyncio as redis
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import (
+    BaseMessage,
+    message_to_dict,
+    messages_from_dict,
+)
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import redis_pool
+from app.db.session import async_session_maker
+from app.models.llm_cache import LLMCacheEntry
+
+logger = get_logger(__name__)
+
+_KEY_PREFIX = "llm_cache:"
+_INDEX_KEY = "llm_cache:lru"
+_PARAM_FIELDS = ("temperature", "max_tokens", "top_p", "stop", "seed")
+
+
+def model_name(llm: BaseChatModel) -> str:
+    """Return the model identifier of a chat model client."""
+    return str(
+        getattr(llm, "model_name", None) or getattr(llm, "model", None) or "unknown"
+    )
+
+
+def is_deterministic(llm: BaseChatModel) -> bool:
+    """Return True if the client samples with temperature 0."""
+    return getattr(llm, "temperature", None) == 0
+
+
+def cache_key(llm: BaseChatModel, messages: Sequence[BaseMessage]) -> str:
+    """Hash (provider class, model, parameters, normalized prompt)."""
+    payload = {
+        "client": type(llm).__name__,
+        "base_url": str(getattr(llm, "openai_api_base", None) or ""),
+        "model": model_name(llm),
+        "params": {field: getattr(llm, field, None) for field in _PARAM_FIELDS},
+        "messages": [
+            [message.type, " ".join(str(message.content).split())]
+            for message in messages
+        ],
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class LLMResponseCache:
+    """Redis (+ optional Postgres) cache of LLM responses."""
+
+    def __init__(
+        self,
+        ttl_seconds: int,
+        max_entries: int,
+        db_enabled: bool,
+        db_ttl_days: int,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.db_enabled = db_enabled
+        self.db_ttl_days = db_ttl_days
+        self._counters = {
+            "redis_hits": 0,
+            "db_hits": 0,
+            "misses": 0,
+            "bypassed": 0,
+            "latency_saved_ms": 0,
+        }
+
+    async def get(self, key: str) -> BaseMessage | None:
+        """Return the cached response for a key, checking Redis then Postgres."""
+        entry = await self._redis_get(key)
+        if entry is not None:
+            self._counters["redis_hits"] += 1
+        elif self.db_enabled:
+            entry = await self._db_get(key)
+            if entry is not None:
+                self._counters["db_hits"] += 1
+                await self._redis_set(key, entry)
+
+        if entry is None:
+            self._counters["misses"] += 1
+            return None
+        self._counters["latency_saved_ms"] += entry.get("latency_ms", 0)
+        return messages_from_dict([entry["message"]])[0]
+
+    async def set(
+        self,
+        key: str,
+        model: str,
+        message: BaseMessage,
+        latency_ms: int,
+    ) -> None:
+        """Store a response in every enabled tier."""
+        entry = {
+            "model": model,
+            "message": message_to_dict(message),
+            "latency_ms": latency_ms,
+        }
+        await self._redis_set(key, entry)
+        if self.db_enabled:
+            await self._db_set(key, entry)
+
+    def record_bypass(self) -> None:
+        self._counters["bypassed"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and total latency saved by hits."""
+        hits = self._counters["redis_hits"] + self._counters["db_hits"]
+        lookups = hits + self._counters["misses"]
+        return {
+            **self._counters,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+    async def purge_expired(self) -> int:
+        """Delete expired Postgres entries. Returns the number removed."""
+        async with async_session_maker() as session:
+            result = await session.execute(
+                delete(LLMCacheEntry).where(
+                    LLMCacheEntry.expires_at < datetime.now(timezone.utc)
+                )
+            )
+            await session.commit()
+        return result.rowcount or 0
+
+    async def _redis_get(self, key: str) -> dict[str, Any] | None:
+        client = redis.Redis(connection_pool=redis_pool)
+        try:
+            raw = await client.get(f"{_KEY_PREFIX}{key}")
+            if raw is None:
+                return None
+            await client.zadd(_INDEX_KEY, {key: time.time()})
+            return cast(dict[str, Any], json.loads(raw))
+        except Exception as e:
+            logger.warning("llm_cache_redis_unavailable", error=str(e))
+            return None
+        finally:
+            await client.aclose()
+
+    async def _redis_set(self, key: str, entry: dict[str, Any]) -> None:
+        client = redis.Redis(connection_pool=redis_pool)
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.set(f"{_KEY_PREFIX}{key}", json.dumps(entry), ex=self.ttl_seconds)
+                pipe.zadd(_INDEX_KEY, {key: time.time()})
+                pipe.zcard(_INDEX_KEY)
+                *_, size = await pipe.execute()
+            if self.max_entries > 0 and size > self.max_entries:
+                await self._evict(client, size - self.max_entries)
+        except Exception as e:
+            logger.warning("llm_cache_redis_unavailable", error=str(e))
+        finally:
+            await client.aclose()
+
+    async def _evict(self, client: redis.Redis, count: int) -> None:
+        """Drop the ``count`` least recently used entries."""
+        evicted = await client.zpopmin(_INDEX_KEY, count)
+        if evicted:
+            await client.delete(*(f"{_KEY_PREFIX}{key}" for key, _ in evicted))
+
+    async def _db_get(self, key: str) -> dict[str, Any] | None:
+        try:
+            async with async_session_maker() as session:
+                row = await session.scalar(
+                    select(LLMCacheEntry).where(
+                        LLMCacheEntry.cache_key == key,
+                        LLMCacheEntry.expires_at > datetime.now(timezone.utc),
+                    )
+                )
+        except Exception as e:
+            logger.warning("llm_cache_db_unavailable", error=str(e))
+            return None
+        if row is None:
+            return None
+        return {
+            "model": row.model,
+            "message": row.response,
+            "latency_ms": row.latency_ms,
+        }
+
+    async def _db_set(self, key: str, entry: dict[str, Any]) -> None:
+        expires_at = datetime.now(timezone.utc) + timedelta(days=self.db_ttl_days)
+        values = {
+            "model": entry["model"],
+            "response": entry["message"],
+            "latency_ms": entry["latency_ms"],
+            "expires_at": expires_at,
+        }
+        statement = insert(LLMCacheEntry).values(cache_key=key, **values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[LLMCacheEntry.cache_key], set_=values
+        )
+        try:
+            async with async_session_maker() as session:
+                await session.execute(statement)
+                await session.commit()
+        except Exception as e:
+            logger.warning("llm_cache_db_unavailable", error=str(e))
+
+
+# Process-wide cache used by invoke_llm
+llm_cache = LLMResponseCache(
+    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    db_enabled=settings.LLM_CACHE_DB_ENABLED,
+    db_ttl_days=settings.LLM_CACHE_DB_TTL_DAYS,
+)
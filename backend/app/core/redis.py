@@ -3,17 +3,30 @@
 from collections.abc import AsyncGenerator
 
 import redis.asyncio as redis
+from arq.connections import ArqRedis
 from redis.asyncio import Redis
 
 from app.core.config import settings
 
-# Create connection pool for efficient connection reuse
-redis_pool = redis.ConnectionPool.from_url(
+# Shared pool for caches, events and other short commands. Callers wait for a
+# free connection rather than failing with "Too many connections", which
+# every caller would otherwise swallow as a cache miss or a dropped event.
+redis_pool = redis.BlockingConnectionPool.from_url(
     settings.REDIS_URL,
     decode_responses=True,
-    max_connections=10,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
 )
 
+# Job queue pool. ARQ stores pickled job payloads, so responses must stay
+# bytes; callers wait for a free connection rather than failing under load.
+queue_pool = redis.BlockingConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_QUEUE_MAX_CONNECTIONS,
+)
+
+# ARQ client shared by job producers (API) and workers
+job_queue = ArqRedis(queue_pool)
+
 
 async def get_redis() -> AsyncGenerator[Redis, None]:
     """Dependency for getting async Redis client.
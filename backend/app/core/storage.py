@@ -1,34 +1,114 @@
-"""MinIO/S3-compatible storage configuration and client management."""
+"""MinIO/S3-compatible storage configuration and client management.
 
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
-from typing import BinaryIO
+Each process holds one long-lived S3 client (``storage_client``), opened
+on first use or at startup and closed at shutdown, so operations share
+its connection pool (STORAGE_MAX_CONNECTIONS) rather than building a
+client and pool per call. Presigned URLs are signed locally, without a
+client.
+
+Objects can be large (data source uploads, generated reports), so
+transfers are streamed: downloads are read in STORAGE_CHUNK_SIZE chunks
+(``iter_file``, ``read_range``, ``download_to_path``), and uploads larger
+than STORAGE_MULTIPART_THRESHOLD are sent as a multipart upload with
+STORAGE_MULTIPART_CONCURRENCY parts in flight, so at most a few parts are
+held in memory at once.
+"""
+
+import asyncio
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+)
+from contextlib import AsyncExitStack, asynccontextmanager
+from pathlib import Path
+from typing import Any, BinaryIO
+from urllib.parse import quote
 
 import aioboto3
+from aiobotocore.config import AioConfig
+from botocore.auth import S3SigV4QueryAuth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
 from botocore.exceptions import ClientError
 
 from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+UploadData = bytes | BinaryIO | AsyncIterable[bytes]
+
+_REGION = "us-east-1"  # MinIO requires a region, value doesn't matter
+_DELETE_BATCH_SIZE = 1000  # keys per DeleteObjects request (S3 limit)
+_PRESIGN_METHODS = {"get_object": "GET", "put_object": "PUT"}
+
+
+class StorageClient:
+    """One S3 client per process, shared by every storage operation."""
 
-# Create session for S3 client creation
-_session = aioboto3.Session()
+    def __init__(self) -> None:
+        self._session = aioboto3.Session()
+        self._client: Any = None
+        self._stack: AsyncExitStack | None = None
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Open the shared client; later calls do nothing."""
+        async with self._lock:
+            if self._client is not None:
+                return
+            stack = AsyncExitStack()
+            self._client = await stack.enter_async_context(
+                self._session.client(
+                    "s3",
+                    endpoint_url=settings.MINIO_URL,
+                    aws_access_key_id=settings.MINIO_ACCESS_KEY,
+                    aws_secret_access_key=settings.MINIO_SECRET_KEY,
+                    region_name=_REGION,
+                    config=AioConfig(
+                        max_pool_connections=settings.STORAGE_MAX_CONNECTIONS,
+                        connect_timeout=settings.STORAGE_CONNECT_TIMEOUT_SECONDS,
+                        read_timeout=settings.STORAGE_READ_TIMEOUT_SECONDS,
+                        retries={"max_attempts": 3, "mode": "standard"},
+                        s3={"addressing_style": "path"},
+                    ),
+                )
+            )
+            self._stack = stack
+            logger.info("storage_client_opened", endpoint=settings.MINIO_URL)
+
+    async def client(self) -> Any:
+        """Return the shared client, opening it if needed."""
+        if self._client is None:
+            await self.start()
+        return self._client
+
+    async def close(self) -> None:
+        """Close the client and its connection pool."""
+        async with self._lock:
+            if self._stack is not None:
+                await self._stack.aclose()
+            self._client = None
+            self._stack = None
+
+
+# Global storage client instance
+storage_client = StorageClient()
 
 
 @asynccontextmanager
 async def get_s3_client() -> AsyncGenerator:
-    """Get async S3 client for MinIO operations.
+    """Get the shared async S3 client for MinIO operations.
+
+    The client stays open when the block exits.
 
     Usage:
         async with get_s3_client() as client:
             await client.put_object(...)
     """
-    async with _session.client(
-        "s3",
-        endpoint_url=settings.MINIO_URL,
-        aws_access_key_id=settings.MINIO_ACCESS_KEY,
-        aws_secret_access_key=settings.MINIO_SECRET_KEY,
-        region_name="us-east-1",  # MinIO requires a region, value doesn't matter
-    ) as client:
-        yield client
+    yield await storage_client.client()
 
 
 async def ensure_bucket_exists(bucket_name: str | None = None) -> None:
@@ -41,16 +121,45 @@ async def ensure_bucket_exists(bucket_name: str | None = None) -> None:
             await client.create_bucket(Bucket=bucket)
 
 
+async def _chunks(data: UploadData) -> AsyncIterator[bytes]:
+    if isinstance(data, bytes):
+        yield data
+    elif isinstance(data, AsyncIterable):
+        async for chunk in data:
+            yield chunk
+    else:
+        while chunk := await asyncio.to_thread(
+            data.read, settings.STORAGE_MULTIPART_PART_SIZE
+        ):
+            yield chunk
+
+
+async def _blocks(data: UploadData, size: int) -> AsyncIterator[bytes]:
+    """Yield ``data`` in blocks of exactly ``size`` bytes, but the last."""
+    buffer = bytearray()
+    async for chunk in _chunks(data):
+        buffer += chunk
+        while len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+    if buffer:
+        yield bytes(buffer)
+
+
 async def upload_file(
-    data: bytes | BinaryIO,
+    data: UploadData,
     key: str,
     bucket_name: str | None = None,
     content_type: str = "application/octet-stream",
 ) -> str:
     """Upload a file to MinIO storage.
 
+    Files up to STORAGE_MULTIPART_THRESHOLD bytes are sent with a single
+    ``put_object``; larger ones as a multipart upload, read part by part.
+
     Args:
-        data: File content as bytes or file-like object
+        data: File content as bytes, a file-like object or an async
+            iterable of byte chunks (e.g. a request body stream)
         key: Object key (path) in the bucket
         bucket_name: Target bucket (defaults to MINIO_BUCKET_NAME)
         content_type: MIME type of the file
@@ -59,21 +168,149 @@ async def upload_file(
         The object key of the uploaded file
     """
     bucket = bucket_name or settings.MINIO_BUCKET_NAME
+    blocks = _blocks(data, settings.STORAGE_MULTIPART_PART_SIZE)
+    head: list[bytes] = []
+    size = 0
+    async for block in blocks:
+        head.append(block)
+        size += len(block)
+        if size > settings.STORAGE_MULTIPART_THRESHOLD:
+            break
+    else:
+        async with get_s3_client() as client:
+            await client.put_object(
+                Bucket=bucket,
+                Key=key,
+                Body=b"".join(head),
+                ContentType=content_type,
+            )
+        return key
+
+    async def parts() -> AsyncIterator[bytes]:
+        for block in head:
+            yield block
+        async for block in blocks:
+            yield block
+
+    await _multipart_upload(parts(), key, bucket, content_type)
+    return key
+
+
+async def _multipart_upload(
+    parts: AsyncIterator[bytes], key: str, bucket: str, content_type: str
+) -> None:
+    """Upload parts in parallel, aborting the upload if any part fails."""
     async with get_s3_client() as client:
-        await client.put_object(
-            Bucket=bucket,
-            Key=key,
-            Body=data,
-            ContentType=content_type,
+        upload = await client.create_multipart_upload(
+            Bucket=bucket, Key=key, ContentType=content_type
         )
-    return key
+        upload_id = upload["UploadId"]
+
+        async def upload_part(number: int, body: bytes) -> dict[str, Any]:
+            response = await client.upload_part(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=body,
+            )
+            return {"PartNumber": number, "ETag": response["ETag"]}
+
+        completed: list[dict[str, Any]] = []
+        pending: set[asyncio.Task[dict[str, Any]]] = set()
+        try:
+            number = 0
+            async for body in parts:
+                if len(pending) >= settings.STORAGE_MULTIPART_CONCURRENCY:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    completed += [task.result() for task in done]
+                number += 1
+                pending.add(asyncio.create_task(upload_part(number, body)))
+            completed += await asyncio.gather(*pending)
+            await client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": sorted(completed, key=lambda part: part["PartNumber"])
+                },
+            )
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            try:
+                await client.abort_multipart_upload(
+                    Bucket=bucket, Key=key, UploadId=upload_id
+                )
+            except Exception as e:
+                logger.warning("multipart_abort_failed", key=key, error=str(e))
+            raise
+    logger.info("multipart_upload_completed", key=key, parts=number)
+
+
+def _not_found(error: ClientError) -> bool:
+    return error.response.get("Error", {}).get("Code") in ("404", "NoSuchKey")
+
+
+def _range_header(start: int, end: int | None) -> str:
+    if start < 0:
+        return f"bytes={start}"
+    return f"bytes={start}-{'' if end is None else end - 1}"
+
+
+async def iter_file(
+    key: str,
+    bucket_name: str | None = None,
+    start: int = 0,
+    end: int | None = None,
+    chunk_size: int | None = None,
+) -> AsyncIterator[bytes]:
+    """Stream a file, or a byte range of it, from MinIO storage in chunks.
+
+    Args:
+        key: Object key (path) in the bucket
+        bucket_name: Source bucket (defaults to MINIO_BUCKET_NAME)
+        start: First byte to read; negative to read the last ``-start``
+            bytes
+        end: Byte to stop before (defaults to the end of the file)
+        chunk_size: Chunk size in bytes (defaults to STORAGE_CHUNK_SIZE)
+
+    Yields:
+        Chunks of the file content
+    """
+    bucket = bucket_name or settings.MINIO_BUCKET_NAME
+    params = {"Bucket": bucket, "Key": key}
+    if start or end is not None:
+        params["Range"] = _range_header(start, end)
+    async with get_s3_client() as client:
+        response = await client.get_object(**params)
+        async with response["Body"] as stream:
+            async for chunk in stream.iter_chunks(
+                chunk_size or settings.STORAGE_CHUNK_SIZE
+            ):
+                yield chunk
+
+
+async def read_range(
+    key: str,
+    start: int,
+    end: int | None = None,
+    bucket_name: str | None = None,
+) -> bytes:
+    """Read a byte range of a file (see ``iter_file`` for the arguments)."""
+    return b"".join([chunk async for chunk in iter_file(key, bucket_name, start, end)])
 
 
 async def download_file(
     key: str,
     bucket_name: str | None = None,
 ) -> bytes:
-    """Download a file from MinIO storage.
+    """Download a whole file from MinIO storage into memory.
+
+    Use ``iter_file`` or ``download_to_path`` for files that may be large.
 
     Args:
         key: Object key (path) in the bucket
@@ -82,11 +319,55 @@ async def download_file(
     Returns:
         File content as bytes
     """
+    return b"".join([chunk async for chunk in iter_file(key, bucket_name)])
+
+
+async def download_to_path(
+    key: str,
+    path: str | Path,
+    bucket_name: str | None = None,
+) -> int:
+    """Stream a file from MinIO storage to a local path.
+
+    Args:
+        key: Object key (path) in the bucket
+        path: Local file to write
+        bucket_name: Source bucket (defaults to MINIO_BUCKET_NAME)
+
+    Returns:
+        Number of bytes written
+    """
+    size = 0
+    with open(path, "wb") as f:
+        async for chunk in iter_file(key, bucket_name):
+            await asyncio.to_thread(f.write, chunk)
+            size += len(chunk)
+    return size
+
+
+async def stat_file(
+    key: str,
+    bucket_name: str | None = None,
+) -> dict[str, Any] | None:
+    """Return a file's size, content type and ETag, or None if it is missing.
+
+    Args:
+        key: Object key (path) in the bucket
+        bucket_name: Source bucket (defaults to MINIO_BUCKET_NAME)
+    """
     bucket = bucket_name or settings.MINIO_BUCKET_NAME
     async with get_s3_client() as client:
-        response = await client.get_object(Bucket=bucket, Key=key)
-        async with response["Body"] as stream:
-            return await stream.read()
+        try:
+            response = await client.head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if _not_found(e):
+                return None
+            raise
+    return {
+        "size": response["ContentLength"],
+        "content_type": response.get("ContentType", "application/octet-stream"),
+        "etag": response.get("ETag", ""),
+    }
 
 
 async def delete_file(
@@ -104,7 +385,7 @@ async def delete_file(
         await client.delete_object(Bucket=bucket, Key=key)
 
 
-async def get_presigned_url(
+def get_presigned_url(
     key: str,
     bucket_name: str | None = None,
     expires_in: int = 3600,
@@ -112,6 +393,9 @@ async def get_presigned_url(
 ) -> str:
     """Generate a presigned URL for temporary access to a file.
 
+    The URL is signed locally (SigV4 query authentication, path-style),
+    the same way the S3 client signs one, without a client or a request.
+
     Args:
         key: Object key (path) in the bucket
         bucket_name: Target bucket (defaults to MINIO_BUCKET_NAME)
@@ -120,15 +404,81 @@ async def get_presigned_url(
 
     Returns:
         Presigned URL string
+
+    Raises:
+        ValueError: If the operation is not supported.
+    """
+    method = _PRESIGN_METHODS.get(operation)
+    if method is None:
+        raise ValueError(f"Cannot presign {operation}")
+    bucket = bucket_name or settings.MINIO_BUCKET_NAME
+    url = f"{settings.MINIO_URL.rstrip('/')}/{bucket}/{quote(key, safe='/~')}"
+    request = AWSRequest(method=method, url=url)
+    credentials = Credentials(settings.MINIO_ACCESS_KEY, settings.MINIO_SECRET_KEY)
+    S3SigV4QueryAuth(credentials, "s3", _REGION, expires=expires_in).add_auth(request)
+    return request.url
+
+
+async def delete_files(
+    keys: Iterable[str],
+    bucket_name: str | None = None,
+) -> list[str]:
+    """Delete many files from MinIO storage, 1000 per request.
+
+    Args:
+        keys: Object keys (paths) in the bucket
+        bucket_name: Target bucket (defaults to MINIO_BUCKET_NAME)
+
+    Returns:
+        Keys that could not be deleted (missing keys count as deleted)
     """
     bucket = bucket_name or settings.MINIO_BUCKET_NAME
+    keys = list(keys)
+    failed: list[str] = []
     async with get_s3_client() as client:
-        url = await client.generate_presigned_url(
-            ClientMethod=operation,
-            Params={"Bucket": bucket, "Key": key},
-            ExpiresIn=expires_in,
-        )
-    return url
+        for start in range(0, len(keys), _DELETE_BATCH_SIZE):
+            batch = keys[start : start + _DELETE_BATCH_SIZE]
+            response = await client.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            for error in response.get("Errors", []):
+                failed.append(error["Key"])
+                logger.warning(
+                    "storage_delete_failed", key=error["Key"], code=error.get("Code")
+                )
+    return failed
+
+
+async def download_files(
+    keys: Iterable[str],
+    bucket_name: str | None = None,
+    concurrency: int | None = None,
+) -> dict[str, bytes | None]:
+    """Download many small files concurrently.
+
+    Args:
+        keys: Object keys (paths) in the bucket
+        bucket_name: Source bucket (defaults to MINIO_BUCKET_NAME)
+        concurrency: Downloads in flight at once (defaults to
+            STORAGE_MAX_CONNECTIONS)
+
+    Returns:
+        Content of each key, or None for keys that do not exist
+    """
+    limit = asyncio.Semaphore(concurrency or settings.STORAGE_MAX_CONNECTIONS)
+
+    async def download(key: str) -> bytes | None:
+        async with limit:
+            try:
+                return await download_file(key, bucket_name)
+            except ClientError as e:
+                if _not_found(e):
+                    return None
+                raise
+
+    keys = list(dict.fromkeys(keys))
+    return dict(zip(keys, await asyncio.gather(*(download(key) for key in keys))))
 
 
 async def check_storage_health() -> bool:
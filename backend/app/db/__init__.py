@@ -1,5 +1,23 @@
 """Database module exports."""
 
-from app.db.session import async_session_maker, engine, get_db, init_db
+from app.db.session import (
+    EngineRole,
+    async_session_maker,
+    close_db,
+    create_engine,
+    engine,
+    get_db,
+    init_db,
+    pool_stats,
+)
 
-__all__ = ["async_session_maker", "engine", "get_db", "init_db"]
+__all__ = [
+    "EngineRole",
+    "async_session_maker",
+    "close_db",
+    "create_engine",
+    "engine",
+    "get_db",
+    "init_db",
+    "pool_stats",
+]
@@ -0,0 +1,178 @@
+"""Keyset (cursor) pagination for list queries.
+
+Pages list live (not soft-deleted) rows ordered by ``(created_at, id)`` and
+continue from the last row of the previous page with a row comparison,
+which the partial live-row index every ``BaseModel`` table has on those
+columns serves directly: page 10,000 costs the same as page 1. Totals are
+opt-in (see ``TotalMode``). Planner estimates cost one EXPLAIN. Exact
+counts are cached in Redis for PAGINATION_COUNT_CACHE_SECONDS, so a client
+paging through a list doesn't trigger a full count on every page.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+import redis.asyncio as redis
+from sqlalchemy import Select, func, literal, select, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import redis_pool
+from app.models.base import BaseModel
+from app.schemas.base import (
+    CursorParams,
+    Meta,
+    TotalMode,
+    decode_cursor,
+    encode_cursor,
+)
+
+logger = get_logger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_COUNT_KEY_PREFIX = "page_count:"
+
+
+@dataclass
+class KeysetPage(Generic[ModelT]):
+    """One page of a keyset-paginated query."""
+
+    items: list[ModelT]
+    limit: int
+    next_cursor: str | None = None
+    total: int | None = None
+    total_is_estimate: bool | None = None
+
+    @property
+    def has_more(self) -> bool:
+        """Return True if another page follows."""
+        return self.next_cursor is not None
+
+    def meta(self, request_id: str | None = None) -> Meta:
+        """Build the response ``Meta`` for this page."""
+        return Meta(
+            request_id=request_id,
+            total=self.total,
+            limit=self.limit,
+            total_is_estimate=self.total_is_estimate,
+            next_cursor=self.next_cursor,
+            has_more=self.has_more,
+        )
+
+
+def keyset_select(
+    stmt: Select[tuple[ModelT]],
+    model: type[ModelT],
+    params: CursorParams,
+) -> Select[tuple[ModelT]]:
+    """Apply the cursor position, ordering and limit to a list query.
+
+    One extra row is fetched to tell whether another page follows.
+
+    Args:
+        stmt: Filtered ``select(model)`` without ORDER BY or LIMIT.
+        model: Model being listed.
+        params: Cursor parameters from the request.
+
+    Returns:
+        The statement for one page.
+    """
+    key = tuple_(model.created_at, model.id)
+    stmt = _live(stmt, model)
+    if params.cursor:
+        position = tuple_(*(literal(value) for value in decode_cursor(params.cursor)))
+        stmt = stmt.where(key > position if params.ascending else key < position)
+    if params.ascending:
+        order = (model.created_at.asc(), model.id.asc())
+    else:
+        order = (model.created_at.desc(), model.id.desc())
+    return stmt.order_by(*order).limit(params.limit + 1)
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select[tuple[ModelT]],
+    model: type[ModelT],
+    params: CursorParams,
+) -> KeysetPage[ModelT]:
+    """Run one page of a list query.
+
+    Args:
+        session: Database session (``get_read_db`` for list endpoints).
+        stmt: Filtered ``select(model)`` without ORDER BY or LIMIT.
+        model: Model being listed.
+        params: Cursor parameters from the request.
+
+    Returns:
+        The page's items, the cursor of the next page and, if requested,
+        the total.
+
+    Usage:
+        page = await paginate(db, select(Report).where(...), Report, params)
+        return SuccessResponse(data=page.items, meta=page.meta())
+    """
+    result = await session.execute(keyset_select(stmt, model, params))
+    rows = list(result.scalars().all())
+    page = KeysetPage(items=rows[: params.limit], limit=params.limit)
+    if len(rows) > params.limit:
+        last = page.items[-1]
+        page.next_cursor = encode_cursor(last.created_at, last.id)
+
+    if params.total == TotalMode.ESTIMATE:
+        page.total = await estimate_count(session, _live(stmt, model))
+        page.total_is_estimate = True
+    elif params.total == TotalMode.EXACT:
+        page.total = await cached_count(session, _live(stmt, model))
+        page.total_is_estimate = False
+    return page
+
+
+async def estimate_count(session: AsyncSession, stmt: Select[Any]) -> int:
+    """Return the planner's row estimate for a query without running it."""
+    conn = await session.connection()
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {_literal_sql(stmt)}")
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def cached_count(session: AsyncSession, stmt: Select[Any]) -> int:
+    """Return ``COUNT(*)`` of a query, cached in Redis for a short while."""
+    key = _COUNT_KEY_PREFIX + hashlib.sha256(_literal_sql(stmt).encode()).hexdigest()
+    client = redis.Redis(connection_pool=redis_pool)
+    try:
+        try:
+            cached = await client.get(key)
+            if cached is not None:
+                return int(cached)
+        except Exception as e:
+            logger.warning("page_count_cache_unavailable", error=str(e))
+
+        count_stmt = select(func.count()).select_from(
+            stmt.order_by(None).limit(None).subquery()
+        )
+        total = int((await session.execute(count_stmt)).scalar_one())
+        try:
+            await client.set(key, total, ex=settings.PAGINATION_COUNT_CACHE_SECONDS)
+        except Exception as e:
+            logger.warning("page_count_cache_unavailable", error=str(e))
+        return total
+    finally:
+        await client.aclose()
+
+
+def _live(stmt: Select[tuple[ModelT]], model: type[ModelT]) -> Select[tuple[ModelT]]:
+    # Matches the predicate of the live-row index
+    return stmt.where(model.deleted_at.is_(None))
+
+
+def _literal_sql(stmt: Select[Any]) -> str:
+    """Render a statement as PostgreSQL SQL with its parameters inlined."""
+    dialect = postgresql.dialect()  # type: ignore[no-untyped-call]
+    return str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
@@ -1,25 +1,197 @@
-"""Async database session configuration."""
+"""Async database engine and session configuration.
 
+This is the only place engines are created. Pool sizing, recycling,
+checkout timeout and the asyncpg prepared statement cache come from
+Settings, with separate pool sizes per engine role:
+
+- ``api``: the FastAPI process, many short request-scoped sessions.
+- ``worker``: ARQ workers, a few long-running assessments per process.
+- ``migration``: Alembic, no pooling.
+
+The process-wide ``engine`` uses DB_ENGINE_ROLE, which the worker services
+set to ``worker``. Pooled engines record checkout wait times, overflow
+connections and checkout timeouts; see ``pool_stats()``.
+
+With DATABASE_READ_URLS set, ``get_read_db`` serves read-only endpoints
+from replicas (see ``ReadReplicaRouter``), while ``get_db`` always uses the
+primary.
+"""
+
+import asyncio
+import time
+import weakref
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request, Response
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, NullPool
 
 from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.soft_delete import LiveRowSession
 
-# Create async engine with connection pooling
-# Using NullPool for testing, use default pool in production
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_size=20,
-    max_overflow=10,
-    pool_pre_ping=True,
-)
+logger = get_logger(__name__)
+
+
+class EngineRole(StrEnum):
+    """Which kind of process an engine's pool is sized for."""
+
+    API = "api"
+    WORKER = "worker"
+    MIGRATION = "migration"
+
+
+class PoolMetrics:
+    """Checkout counters of one connection pool."""
+
+    def __init__(self, role: str, slow_checkout_ms: float, name: str = "") -> None:
+        self.role = role
+        self.name = name or role
+        self.slow_checkout_ms = slow_checkout_ms
+        self.checkouts = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.overflow_opened = 0
+
+    def record_checkout(self, wait_ms: float, overflow_opened: bool) -> None:
+        """Count one successful checkout and how long it waited."""
+        self.checkouts += 1
+        self.wait_ms_total += wait_ms
+        self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+        if overflow_opened:
+            self.overflow_opened += 1
+        if wait_ms >= self.slow_checkout_ms:
+            self.slow_checkouts += 1
+            logger.warning(
+                "db_pool_checkout_slow", pool=self.name, wait_ms=round(wait_ms, 1)
+            )
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records checkout metrics."""
+
+    metrics: PoolMetrics
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        overflow_before = self._overflow
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            logger.error("db_pool_checkout_timeout", pool=self.metrics.name)
+            raise
+        self.metrics.record_checkout(
+            (time.perf_counter() - started) * 1000,
+            overflow_opened=self._overflow > max(overflow_before, 0),
+        )
+        return entry
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        assert isinstance(pool, InstrumentedQueuePool)
+        pool.metrics = self.metrics
+        return pool
+
+
+# Pooled engines alive in this process, for pool_stats()
+_engines: weakref.WeakSet[AsyncEngine] = weakref.WeakSet()
+
+
+def create_engine(
+    role: EngineRole | str = EngineRole.API,
+    url: str | None = None,
+    name: str = "",
+) -> AsyncEngine:
+    """Create an async engine with the pool settings of ``role``.
+
+    Args:
+        role: Engine role; ``worker`` uses the DB_WORKER_* pool sizes and
+            ``migration`` opens a connection per use.
+        url: Database URL; defaults to DATABASE_URL (the primary).
+        name: Pool name in metrics and logs; defaults to the role.
+
+    Returns:
+        A new engine. Pooled engines are included in ``pool_stats()``.
+    """
+    role = EngineRole(role)
+    url = url or settings.DATABASE_URL
+    connect_args = {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    if role == EngineRole.MIGRATION:
+        return create_async_engine(url, poolclass=NullPool, connect_args=connect_args)
+
+    if role == EngineRole.WORKER:
+        pool_size, max_overflow = (
+            settings.DB_WORKER_POOL_SIZE,
+            settings.DB_WORKER_MAX_OVERFLOW,
+        )
+    else:
+        pool_size, max_overflow = settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+    new_engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=True,
+        connect_args=connect_args,
+    )
+    pool = new_engine.sync_engine.pool
+    assert isinstance(pool, InstrumentedQueuePool)
+    pool.metrics = PoolMetrics(role, settings.DB_POOL_SLOW_CHECKOUT_MS, name)
+    _engines.add(new_engine)
+    return new_engine
+
+
+def pool_stats() -> list[dict[str, Any]]:
+    """Return the pool gauges and checkout counters of every pooled engine."""
+    stats = []
+    for pooled in _engines:
+        pool = pooled.sync_engine.pool
+        if not isinstance(pool, InstrumentedQueuePool):
+            continue
+        metrics = pool.metrics
+        stats.append(
+            {
+                "name": metrics.name,
+                "role": metrics.role,
+                "size": pool.size(),
+                "idle": pool.checkedin(),
+                "in_use": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+                "checkouts": metrics.checkouts,
+                "wait_ms_avg": round(
+                    metrics.wait_ms_total / max(metrics.checkouts, 1), 2
+                ),
+                "wait_ms_max": round(metrics.wait_ms_max, 2),
+                "slow_checkouts": metrics.slow_checkouts,
+                "timeouts": metrics.timeouts,
+                "overflow_opened": metrics.overflow_opened,
+            }
+        )
+    return stats
+
+
+# Process-wide engine and session factory
+engine = create_engine(settings.DB_ENGINE_ROLE)
 
-# Create async session factory
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=LiveRowSession,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
@@ -49,6 +221,240 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Seconds a replica is behind the primary; 0 when it has replayed all WAL it
+# received (an idle primary would otherwise look ever more lagged), and 0 on
+# a server that is not a standby.
+_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()"
+    " THEN 0 ELSE COALESCE("
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+# Cookie marking a client that just wrote; its reads stay on the primary
+PRIMARY_PIN_COOKIE = "db_primary_until"
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass
+class _Replica:
+    name: str
+    engine: AsyncEngine
+    session_maker: async_sessionmaker[AsyncSession]
+    healthy: bool = True
+    lag_seconds: float = 0.0
+    checked_at: float = 0.0
+    served: int = 0
+    failures: int = 0
+    check_task: asyncio.Task[None] | None = field(default=None, repr=False)
+
+    def in_use(self) -> int:
+        pool = self.engine.sync_engine.pool
+        return pool.checkedout() if isinstance(pool, InstrumentedQueuePool) else 0
+
+
+class ReadReplicaRouter:
+    """Route read-only sessions to the least busy healthy replica.
+
+    Each replica's replication lag is checked in the background at most
+    every ``check_interval_seconds``. Replicas lagging more than
+    ``max_lag_seconds`` or failing to connect are skipped until a later
+    check succeeds; with no usable replica, reads fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+        role: EngineRole | str = EngineRole.API,
+    ) -> None:
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.replicas: list[_Replica] = []
+        for index, url in enumerate(urls):
+            replica_engine = create_engine(role, url, name=f"replica-{index}")
+            self.replicas.append(
+                _Replica(
+                    name=f"replica-{index}",
+                    engine=replica_engine,
+                    session_maker=async_sessionmaker(
+                        replica_engine,
+                        class_=AsyncSession,
+                        sync_session_class=LiveRowSession,
+                        expire_on_commit=False,
+                        autoflush=False,
+                    ),
+                )
+            )
+        self._primary_reads = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if any replica is configured."""
+        return bool(self.replicas)
+
+    async def session(self) -> AsyncSession | None:
+        """Open a session on the least busy healthy replica.
+
+        Returns:
+            A session with a connection already checked out, or None if no
+            replica is usable and the caller should read from the primary.
+        """
+        now = time.monotonic()
+        for replica in self.replicas:
+            if now - replica.checked_at >= self.check_interval_seconds:
+                self._schedule_check(replica)
+
+        candidates = sorted(
+            (replica for replica in self.replicas if replica.healthy),
+            key=lambda replica: (replica.in_use(), replica.served),
+        )
+        for replica in candidates:
+            session = replica.session_maker()
+            try:
+                await session.connection()
+            except (exc.SQLAlchemyError, OSError) as e:
+                await session.close()
+                self._mark_failed(replica, str(e))
+                continue
+            replica.served += 1
+            return session
+        self._primary_reads += 1
+        return None
+
+    async def check(self, replica: _Replica) -> None:
+        """Measure a replica's lag and update whether it may serve reads."""
+        try:
+            async with asyncio.timeout(self.check_interval_seconds):
+                async with replica.engine.connect() as conn:
+                    lag = float((await conn.execute(_LAG_QUERY)).scalar_one())
+        except Exception as e:
+            self._mark_failed(replica, str(e) or type(e).__name__)
+            return
+        replica.lag_seconds = lag
+        healthy = lag <= self.max_lag_seconds
+        if healthy != replica.healthy:
+            log = logger.info if healthy else logger.warning
+            log(
+                "db_replica_available" if healthy else "db_replica_lagging",
+                replica=replica.name,
+                lag_seconds=round(lag, 2),
+            )
+        replica.healthy = healthy
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Return per-replica health and routing counters."""
+        if not self.replicas:
+            return []
+        return [
+            {
+                "name": replica.name,
+                "healthy": replica.healthy,
+                "lag_seconds": round(replica.lag_seconds, 2),
+                "in_use": replica.in_use(),
+                "served": replica.served,
+                "failures": replica.failures,
+            }
+            for replica in self.replicas
+        ] + [{"name": "primary-fallback", "served": self._primary_reads}]
+
+    async def close(self) -> None:
+        """Stop health checks and close every replica connection."""
+        for replica in self.replicas:
+            if replica.check_task is not None:
+                replica.check_task.cancel()
+            await replica.engine.dispose()
+
+    def _schedule_check(self, replica: _Replica) -> None:
+        if replica.check_task is not None and not replica.check_task.done():
+            return
+        replica.checked_at = time.monotonic()
+        replica.check_task = asyncio.create_task(self.check(replica))
+
+    def _mark_failed(self, replica: _Replica, error: str) -> None:
+        replica.failures += 1
+        replica.checked_at = time.monotonic()
+        if replica.healthy:
+            logger.warning("db_replica_unavailable", replica=replica.name, error=error)
+        replica.healthy = False
+
+
+read_router = ReadReplicaRouter(
+    settings.read_database_urls,
+    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.DB_REPLICA_CHECK_INTERVAL_SECONDS,
+    role=settings.DB_ENGINE_ROLE,
+)
+
+
+def is_pinned_to_primary(request: Request) -> bool:
+    """Return True if this request's reads must see the primary's data.
+
+    That is the case for mutating requests, for requests that called
+    ``pin_to_primary``, and for clients that wrote within the last
+    DB_READ_PIN_SECONDS.
+    """
+    if request.method not in _SAFE_METHODS:
+        return True
+    if getattr(request.state, "db_primary", False):
+        return True
+    try:
+        pinned_until = float(request.cookies.get(PRIMARY_PIN_COOKIE, 0))
+    except ValueError:
+        return False
+    return pinned_until > time.time()
+
+
+def pin_to_primary(request: Request) -> None:
+    """Send this request's later reads, and the client's next ones, to the primary."""
+    request.state.db_primary = True
+
+
+def set_primary_pin(request: Request, response: Response) -> None:
+    """Pin the client to the primary for a while after a successful write.
+
+    Called by middleware once the response is ready, so replicas have time
+    to catch up before the client's reads go back to them.
+    """
+    if not read_router.enabled or response.status_code >= 400:
+        return
+    if request.method in _SAFE_METHODS and not getattr(
+        request.state, "db_primary", False
+    ):
+        return
+    response.set_cookie(
+        PRIMARY_PIN_COOKIE,
+        str(time.time() + settings.DB_READ_PIN_SECONDS),
+        max_age=int(settings.DB_READ_PIN_SECONDS) + 1,
+        httponly=True,
+        samesite="lax",
+    )
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency for read-only database sessions.
+
+    Served by a read replica when one is configured and healthy and the
+    request is not pinned to the primary (see ``is_pinned_to_primary``);
+    otherwise by the primary. Nothing is committed.
+
+    Yields:
+        AsyncSession: A session for SELECT queries only.
+
+    Usage:
+        @app.get("/reports")
+        async def list_reports(db: AsyncSession = Depends(get_read_db)):
+            ...
+    """
+    session = None
+    if read_router.enabled and not is_pinned_to_primary(request):
+        session = await read_router.session()
+    if session is None:
+        session = async_session_maker()
+    async with session:
+        yield session
+
+
 async def init_db() -> None:
     """Initialize database connection.
 
@@ -57,3 +463,9 @@ async def init_db() -> None:
     async with engine.begin() as conn:
         # Just test the connection
         await conn.run_sync(lambda _: None)
+
+
+async def close_db() -> None:
+    """Close every pooled connection of the primary and replica engines."""
+    await read_router.close()
+    await engine.dispose()
@@ -0,0 +1,152 @@
+"""Soft-delete aware query layer.
+
+Sessions from ``async_session_maker`` (and the read replica session
+makers) use ``LiveRowSession``, which adds ``deleted_at IS NULL`` to every
+ORM SELECT of a ``BaseModel`` table, including relationship and eager
+loads. Queries therefore never see soft-deleted rows unless they opt out:
+
+    await session.execute(include_deleted(select(Report)))
+    await session.execute(stmt, execution_options={INCLUDE_DELETED: True})
+
+Deleting and restoring run as one set-based UPDATE each (no objects are
+loaded), and ``purge_deleted`` hard-deletes rows soft-deleted before a
+cutoff in bounded batches, so no single transaction locks a large table.
+"""
+
+from datetime import datetime
+from typing import TypeVar
+
+from sqlalchemy import ColumnElement, Executable, delete, event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from app.core.logging import get_logger
+from app.models.base import Base, BaseModel
+
+logger = get_logger(__name__)
+
+# Execution option that disables the live-row filter for one statement
+INCLUDE_DELETED = "include_deleted"
+
+ExecutableT = TypeVar("ExecutableT", bound=Executable)
+
+
+class LiveRowSession(Session):
+    """ORM session that hides soft-deleted rows from SELECTs."""
+
+
+@event.listens_for(LiveRowSession, "do_orm_execute")
+def _filter_deleted(state: ORMExecuteState) -> None:
+    if not state.is_select or state.execution_options.get(INCLUDE_DELETED, False):
+        return
+    state.statement = state.statement.options(
+        with_loader_criteria(
+            BaseModel,
+            lambda cls: cls.deleted_at.is_(None),
+            include_aliases=True,
+        )
+    )
+
+
+def include_deleted(stmt: ExecutableT) -> ExecutableT:
+    """Return ``stmt`` with soft-deleted rows included in its results."""
+    return stmt.execution_options(**{INCLUDE_DELETED: True})
+
+
+async def soft_delete(
+    session: AsyncSession, model: type[BaseModel], *criteria: ColumnElement[bool]
+) -> int:
+    """Soft-delete the live rows of ``model`` matching ``criteria``.
+
+    Args:
+        session: Session whose transaction the UPDATE joins.
+        model: BaseModel subclass.
+        *criteria: WHERE clauses, e.g. ``Evidence.assessment_id == id``.
+
+    Returns:
+        Number of rows soft-deleted.
+    """
+    stmt = (
+        update(model)
+        .where(*criteria, model.deleted_at.is_(None))
+        .values(deleted_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    return (await session.execute(stmt)).rowcount
+
+
+async def restore(
+    session: AsyncSession, model: type[BaseModel], *criteria: ColumnElement[bool]
+) -> int:
+    """Restore the soft-deleted rows of ``model`` matching ``criteria``.
+
+    Args:
+        session: Session whose transaction the UPDATE joins.
+        model: BaseModel subclass.
+        *criteria: WHERE clauses.
+
+    Returns:
+        Number of rows restored.
+    """
+    stmt = (
+        update(model)
+        .where(*criteria, model.deleted_at.is_not(None))
+        .values(deleted_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    return (await session.execute(stmt)).rowcount
+
+
+def soft_delete_models() -> list[type[BaseModel]]:
+    """Return every mapped BaseModel table."""
+    return [
+        mapper.class_
+        for mapper in Base.registry.mappers
+        if issubclass(mapper.class_, BaseModel)
+    ]
+
+
+async def purge_deleted(
+    session_maker: async_sessionmaker[AsyncSession],
+    model: type[BaseModel],
+    cutoff: datetime,
+    batch_size: int,
+) -> int:
+    """Hard-delete rows of ``model`` soft-deleted before ``cutoff``.
+
+    Each batch of up to ``batch_size`` rows is deleted in its own
+    transaction; rows locked by another transaction are skipped until a
+    later run.
+
+    Args:
+        session_maker: Session factory for the batch transactions.
+        model: BaseModel subclass.
+        cutoff: Rows soft-deleted before this time are removed.
+        batch_size: Rows per DELETE.
+
+    Returns:
+        Number of rows removed.
+    """
+    batch = (
+        select(model.id)
+        .where(model.deleted_at < cutoff)
+        .order_by(model.deleted_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    stmt = (
+        delete(model)
+        .where(model.id.in_(batch.scalar_subquery()))
+        .execution_options(synchronize_session=False)
+    )
+    removed = 0
+    while True:
+        async with session_maker() as session:
+            deleted = (await session.execute(stmt)).rowcount
+            await session.commit()
+        removed += deleted
+        if deleted < batch_size:
+            break
+    if removed:
+        logger.info("soft_deleted_rows_purged", table=model.__tablename__, rows=removed)
+    return removed
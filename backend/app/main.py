@@ -2,18 +2,25 @@
 
 import uuid
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Awaitable, Callable
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.agents.tools.browser_pool import browser_pool
+from app.agents.tools.http_fetcher import tiered_fetcher
 from app.api.v1.router import router as api_v1_router
+from app.core.events import event_broker
+from app.core.llm import close_llm_clients
 from app.core.logging import (
     clear_request_id,
     configure_logging,
     get_logger,
     set_request_id,
 )
+from app.core.redis import job_queue
+from app.core.storage import storage_client
+from app.db.session import close_db, pool_stats, read_router, set_primary_pin
 
 
 @asynccontextmanager
@@ -23,9 +30,17 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     configure_logging()
     logger = get_logger(__name__)
     logger.info("Starting SME Supply Chain Risk Analysis API")
+    await storage_client.start()
     yield
     # Shutdown
     logger.info("Shutting down SME Supply Chain Risk Analysis API")
+    await event_broker.close()
+    await tiered_fetcher.close()
+    await browser_pool.close()
+    await close_llm_clients()
+    await storage_client.close()
+    await job_queue.aclose(close_connection_pool=True)
+    await close_db()
 
 
 app = FastAPI(
@@ -56,6 +71,7 @@ async def request_id_middleware(
     set_request_id(request_id)
     response = await call_next(request)
     response.headers["X-Request-ID"] = request_id
+    set_primary_pin(request, response)
     clear_request_id()
     return response
 
@@ -70,5 +86,17 @@ async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/health/db-pool", tags=["health"])
+async def db_pool_metrics() -> dict[str, Any]:
+    """Database connection pool metrics.
+
+    Returns:
+        dict with per-engine pool gauges (size, in use, overflow), checkout
+        counters (wait times, slow checkouts, timeouts) and read replica
+        health and routing counters.
+    """
+    return {"pools": pool_stats(), "replicas": read_router.stats()}
+
+
 # Mount API v1 router
 app.include_router(api_v1_router, prefix="/api/v1")
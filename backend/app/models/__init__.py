@@ -0,0 +1,26 @@
+"""SQLAlchemy models.
+
+Importing this package registers every table on ``Base.metadata`` (used by
+Alembic autogenerate).
+"""
+
+from app.models.base import Base, BaseModel
+from app.models.checkpoint import (
+    WorkflowCheckpoint,
+    WorkflowCheckpointBlob,
+    WorkflowCheckpointWrite,
+)
+from app.models.evidence import Evidence
+from app.models.evidence_embedding import EvidenceEmbedding
+from app.models.llm_cache import LLMCacheEntry
+
+__all__ = [
+    "Base",
+    "BaseModel",
+    "Evidence",
+    "EvidenceEmbedding",
+    "LLMCacheEntry",
+    "WorkflowCheckpoint",
+    "WorkflowCheckpointBlob",
+    "WorkflowCheckpointWrite",
+]
@@ -1,11 +1,42 @@
 """Base SQLAlchemy model with common fields."""
 
+import secrets
+import threading
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
+
+_uuid7_lock = threading.Lock()
+_uuid7_last_ms = 0
+_uuid7_seq = 0
+
+
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds, so new rows are
+    appended to the right edge of the primary key B-tree instead of landing
+    on random pages. The next 12 bits count up within a millisecond (from a
+    random start), so ids generated by one process are strictly increasing.
+    """
+    global _uuid7_last_ms, _uuid7_seq
+    with _uuid7_lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _uuid7_last_ms:
+            _uuid7_last_ms, _uuid7_seq = ms, secrets.randbits(11)
+        else:
+            _uuid7_seq += 1
+            if _uuid7_seq > 0xFFF:
+                # Counter exhausted: borrow the next millisecond
+                _uuid7_last_ms, _uuid7_seq = _uuid7_last_ms + 1, secrets.randbits(11)
+        ms, seq = _uuid7_last_ms, _uuid7_seq
+    value = (ms & 0xFFFF_FFFF_FFFF) << 80 | 0x7 << 76 | seq << 64
+    value |= 0b10 << 62 | secrets.randbits(62)
+    return uuid.UUID(int=value)
 
 
 class Base(DeclarativeBase):
@@ -18,19 +49,28 @@ class BaseModel(Base):
     """Abstract base model with common fields for all entities.
 
     Includes:
-    - id: UUID primary key
+    - id: UUID primary key (UUIDv7, time-ordered)
     - created_at: Timestamp of creation
     - updated_at: Timestamp of last update
     - deleted_at: Soft delete timestamp (null if not deleted)
+
+    Besides the primary key, tables get two partial indexes (see
+    ``base_indexes``): ``(created_at, id)`` over live rows for keyset
+    pagination, and ``deleted_at`` over soft-deleted rows for purges.
+    Subclasses that set their own ``__table_args__`` should include
+    ``*base_indexes(cls.__tablename__)``.
     """
 
     __abstract__ = True
 
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple[Index, ...]:
+        return base_indexes(cls.__tablename__)
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True,
+        default=uuid7,
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -47,7 +87,6 @@ class BaseModel(Base):
         DateTime(timezone=True),
         nullable=True,
         default=None,
-        index=True,
     )
 
     @property
@@ -56,5 +95,35 @@ class BaseModel(Base):
         return self.deleted_at is not None
 
     def soft_delete(self) -> None:
-        """Mark the record as soft deleted."""
-        self.deleted_at = datetime.now()
+        """Mark the record as soft deleted.
+
+        To delete many rows, use ``app.db.soft_delete.soft_delete`` instead
+        of loading them.
+        """
+        self.deleted_at = datetime.now(timezone.utc)
+
+    def restore(self) -> None:
+        """Undo a soft delete."""
+        self.deleted_at = None
+
+
+def base_indexes(tablename: str) -> tuple[Index, ...]:
+    """Return the secondary indexes every BaseModel table has.
+
+    Almost every row is live, so a full index on ``deleted_at`` would be all
+    NULLs; the live-row index serves listings (which filter
+    ``deleted_at IS NULL``) and the deleted-row index stays tiny.
+    """
+    return (
+        Index(
+            f"ix_{tablename}_live_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            f"ix_{tablename}_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
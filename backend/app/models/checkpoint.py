@@ -0,0 +1,74 @@
+"""LangGraph workflow checkpoints (durable assessment state).
+
+A checkpoint row holds the graph bookkeeping for one step; channel values
+are stored once per channel version in the blobs table, so a step that only
+changes a small channel does not rewrite large ones. Pending writes of
+tasks that finished within a failed step are kept so only the failed tasks
+re-run on resume.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Integer, LargeBinary, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class WorkflowCheckpoint(Base):
+    """Graph state bookkeeping after one workflow step."""
+
+    __tablename__ = "workflow_checkpoints"
+
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    checkpoint_ns: Mapped[str] = mapped_column(
+        String(255), primary_key=True, default=""
+    )
+    checkpoint_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    parent_checkpoint_id: Mapped[str | None] = mapped_column(String(64))
+    # Serialized checkpoint without channel values (see blobs)
+    type: Mapped[str] = mapped_column(String(64), nullable=False)
+    checkpoint: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    # Kept as JSON so pruning can find blobs no longer referenced
+    channel_versions: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    metadata_: Mapped[dict[str, Any]] = mapped_column(
+        "metadata", JSONB, nullable=False, default=dict
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
+
+
+class WorkflowCheckpointBlob(Base):
+    """One version of one state channel's value."""
+
+    __tablename__ = "workflow_checkpoint_blobs"
+
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    checkpoint_ns: Mapped[str] = mapped_column(
+        String(255), primary_key=True, default=""
+    )
+    channel: Mapped[str] = mapped_column(String(255), primary_key=True)
+    version: Mapped[str] = mapped_column(String(64), primary_key=True)
+    type: Mapped[str] = mapped_column(String(64), nullable=False)
+    blob: Mapped[bytes | None] = mapped_column(LargeBinary)
+
+
+class WorkflowCheckpointWrite(Base):
+    """A channel write from a task, pending until its step completes."""
+
+    __tablename__ = "workflow_checkpoint_writes"
+
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    checkpoint_ns: Mapped[str] = mapped_column(
+        String(255), primary_key=True, default=""
+    )
+    checkpoint_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    task_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    idx: Mapped[int] = mapped_column(Integer, primary_key=True)
+    channel: Mapped[str] = mapped_column(String(255), nullable=False)
+    task_path: Mapped[str] = mapped_column(String(1024), nullable=False, default="")
+    type: Mapped[str] = mapped_column(String(64), nullable=False)
+    blob: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
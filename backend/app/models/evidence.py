@@ -0,0 +1,55 @@
+"""Evidence records collected and analyzed during an assessment."""
+
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Float, Index, String, Text, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+
+from app.models.base import BaseModel, base_indexes
+
+
+class Evidence(BaseModel):
+    """One piece of evidence (a page, record or document excerpt) with its source.
+
+    ``content_hash`` (SHA-256 of the normalized content) makes evidence
+    idempotent per assessment: re-collecting the same content, e.g. when a
+    retried assessment resumes, maps to the existing row.
+    """
+
+    __tablename__ = "evidence"
+
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple[Any, ...]:
+        return (
+            *base_indexes(cls.__tablename__),
+            UniqueConstraint(
+                "assessment_id", "content_hash", name="uq_evidence_assessment_content"
+            ),
+            Index(
+                "ix_evidence_supplier_domain",
+                "supplier_domain",
+                postgresql_where=text("deleted_at IS NULL"),
+            ),
+        )
+
+    assessment_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    supplier_domain: Mapped[str] = mapped_column(String(255), nullable=False)
+    source_url: Mapped[str] = mapped_column(Text, nullable=False)
+    # sanctions | registry | esg | news | website | file
+    source_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    collector_tool: Mapped[str] = mapped_column(String(64), nullable=False)
+    collected_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    reliability: Mapped[str | None] = mapped_column(String(16))  # high | medium | low
+    recency: Mapped[str | None] = mapped_column(String(16))  # current ... stale
+    relevance_score: Mapped[float | None] = mapped_column(Float)  # 0.0 - 1.0
+    risk_categories: Mapped[list[str]] = mapped_column(
+        JSONB, nullable=False, default=list, server_default=text("'[]'::jsonb")
+    )
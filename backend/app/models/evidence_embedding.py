@@ -0,0 +1,76 @@
+"""Vector embeddings of evidence chunks for similarity search (pgvector)."""
+
+import uuid
+from datetime import datetime
+from typing import Any
+
+from pgvector.sqlalchemy import HALFVEC
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column
+
+from app.core.config import settings
+from app.models.base import BaseModel, base_indexes
+
+
+class EvidenceEmbedding(BaseModel):
+    """Embedding of one chunk of an evidence record.
+
+    Supplier, source type and collection time are copied from the evidence
+    so filtered searches don't join. Vectors are stored as half precision:
+    the HNSW index is half the size (so far more of it stays in memory) for
+    a negligible loss in recall.
+    """
+
+    __tablename__ = "evidence_embeddings"
+
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple[Any, ...]:
+        return (
+            *base_indexes(cls.__tablename__),
+            UniqueConstraint(
+                "evidence_id", "chunk_index", name="uq_evidence_embeddings_chunk"
+            ),
+            Index("ix_evidence_embeddings_content_hash", "content_hash"),
+            Index(
+                "ix_evidence_embeddings_supplier",
+                "supplier_domain",
+                "collected_at",
+                postgresql_where=text("deleted_at IS NULL"),
+            ),
+            Index(
+                "ix_evidence_embeddings_hnsw",
+                "embedding",
+                postgresql_using="hnsw",
+                postgresql_with={"m": 16, "ef_construction": 64},
+                postgresql_ops={"embedding": "halfvec_cosine_ops"},
+            ),
+        )
+
+    evidence_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("evidence.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    chunk_index: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    supplier_domain: Mapped[str] = mapped_column(String(255), nullable=False)
+    source_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    collected_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    embedding_model: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Must match the column created by the migration
+    embedding: Mapped[Any] = mapped_column(
+        HALFVEC(settings.EMBEDDING_DIMENSIONS), nullable=False
+    )
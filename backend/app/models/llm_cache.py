@@ -0,0 +1,24 @@
+"""Long-lived LLM response cache entries (Postgres tier of the LLM cache)."""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class LLMCacheEntry(BaseModel):
+    """A cached LLM response keyed by a hash of model, parameters and prompt."""
+
+    __tablename__ = "llm_cache_entries"
+
+    cache_key: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    model: Mapped[str] = mapped_column(String(255), nullable=False)
+    response: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    latency_ms: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
@@ -0,0 +1,36 @@
+"""Assessment request and response schemas."""
+
+from pydantic import BaseModel, Field, HttpUrl
+
+from app.workers.queue import JobPriority
+
+
+class AssessmentCreate(BaseModel):
+    """Request to assess a supplier website."""
+
+    supplier_url: HttpUrl = Field(..., description="Supplier website to assess")
+    priority: JobPriority = Field(
+        default=JobPriority.INTERACTIVE,
+        description="Worker pool to run on (interactive or bulk)",
+    )
+
+
+class AssessmentQueued(BaseModel):
+    """A queued assessment and where to follow its progress."""
+
+    assessment_id: str = Field(..., description="Assessment identifier")
+    events_url: str = Field(..., description="SSE stream of progress events")
+
+
+class BulkBatchProgress(BaseModel):
+    """Aggregate progress of a bulk supplier upload."""
+
+    batch_id: str = Field(..., description="Batch identifier")
+    total: int = Field(..., description="Rows read from the upload")
+    duplicates: int = Field(..., description="Rows skipped as a repeated domain")
+    invalid: int = Field(..., description="Rows without a usable website")
+    queued: int = Field(..., description="Assessments queued")
+    completed: int = Field(..., description="Assessments completed")
+    failed: int = Field(..., description="Assessments failed after all retries")
+    status: str = Field(..., description="queueing, queued, finished or aborted")
+    error: str = Field(default="", description="Why the upload was aborted")
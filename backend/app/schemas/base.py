@@ -1,8 +1,14 @@
 """Base Pydantic schemas for API response envelopes."""
 
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from enum import StrEnum
 from typing import Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 T = TypeVar("T")
 
@@ -26,6 +32,18 @@ class Meta(BaseModel):
         default=None,
         description="Number of items skipped",
     )
+    total_is_estimate: bool | None = Field(
+        default=None,
+        description="True if total is the query planner's row estimate",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Cursor for the next page (cursor-paginated responses)",
+    )
+    has_more: bool | None = Field(
+        default=None,
+        description="Whether another page follows (cursor-paginated responses)",
+    )
 
 
 class SuccessResponse(BaseModel, Generic[T]):
@@ -95,7 +113,70 @@ class HealthResponse(BaseModel):
 
 
 class PaginationParams(BaseModel):
-    """Pagination query parameters."""
+    """Offset pagination query parameters.
+
+    Deep offsets make the database scan and discard every skipped row; use
+    CursorParams for lists that can grow large.
+    """
 
     limit: int = Field(default=20, ge=1, le=100, description="Items per page")
     offset: int = Field(default=0, ge=0, description="Items to skip")
+
+
+class TotalMode(StrEnum):
+    """How a cursor-paginated response reports its total."""
+
+    NONE = "none"  # no count query
+    ESTIMATE = "estimate"  # planner row estimate, no scan
+    EXACT = "exact"  # COUNT(*), cached briefly
+
+
+class CursorParams(BaseModel):
+    """Cursor (keyset) pagination query parameters.
+
+    Items are ordered by ``(created_at, id)``, newest first unless
+    ``ascending`` is set. Pass the previous response's ``meta.next_cursor``
+    to get the following page; every page costs the same regardless of
+    depth.
+
+    Usage:
+        @router.get("/reports")
+        async def list_reports(params: Annotated[CursorParams, Query()]):
+            ...
+    """
+
+    limit: int = Field(default=20, ge=1, le=100, description="Items per page")
+    cursor: str | None = Field(
+        default=None, description="Opaque cursor from meta.next_cursor"
+    )
+    ascending: bool = Field(default=False, description="Oldest first")
+    total: TotalMode = Field(
+        default=TotalMode.NONE, description="Include a total: none, estimate, exact"
+    )
+
+    @field_validator("cursor")
+    @classmethod
+    def _check_cursor(cls, value: str | None) -> str | None:
+        if value:
+            decode_cursor(value)
+        return value
+
+
+def encode_cursor(created_at: datetime, id: uuid.UUID) -> str:
+    """Encode a ``(created_at, id)`` position as an opaque cursor."""
+    raw = json.dumps([created_at.isoformat(), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor made by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(raw)
+        return datetime.fromisoformat(created_at), uuid.UUID(id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
@@ -0,0 +1,36 @@
+"""Evidence search request and response schemas."""
+
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class EvidenceSearch(BaseModel):
+    """Similarity search over collected evidence."""
+
+    query: str = Field(
+        ..., min_length=1, max_length=2000, description="Text to find evidence for"
+    )
+    supplier_domain: str | None = Field(
+        default=None, description="Only search this supplier's evidence"
+    )
+    source_types: list[str] = Field(
+        default_factory=list, description="Only search these source types"
+    )
+    collected_after: datetime | None = Field(
+        default=None, description="Only search evidence collected after this time"
+    )
+    limit: int = Field(default=10, ge=1, le=50, description="Maximum matches")
+
+
+class EvidenceSearchMatch(BaseModel):
+    """An evidence chunk similar to the search query."""
+
+    evidence_id: uuid.UUID = Field(..., description="Evidence record")
+    chunk_index: int = Field(..., description="Chunk within the evidence")
+    supplier_domain: str = Field(..., description="Supplier the evidence is about")
+    source_type: str = Field(..., description="Kind of source")
+    collected_at: datetime = Field(..., description="When the evidence was collected")
+    content: str = Field(..., description="Chunk text")
+    score: float = Field(..., description="Cosine similarity to the query")
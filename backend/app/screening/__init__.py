@@ -0,0 +1,23 @@
+"""Sanctions, debarment and watchlist screening exports."""
+
+from app.screening.engine import ScreeningEngine, WatchlistDelta, screening_engine
+from app.screening.index import (
+    ScreeningIndex,
+    ScreeningMatch,
+    WatchlistEntry,
+    best_matches,
+    entry_key,
+)
+from app.screening.normalize import normalize_name
+
+__all__ = [
+    "ScreeningEngine",
+    "ScreeningIndex",
+    "ScreeningMatch",
+    "WatchlistDelta",
+    "WatchlistEntry",
+    "best_matches",
+    "entry_key",
+    "normalize_name",
+    "screening_engine",
+]
@@ -0,0 +1,453 @@
+"""Watchlist loading and the process-wide screening engine.
+
+Lists are read from SCREENING_LIST_DIR and/or the storage bucket under
+SCREENING_LIST_PREFIX, one file per list (the file name, without
+extension, is the list name). Upstream feeds (OFAC SDN, UN, EU and UK
+consolidated lists, World Bank debarment, Interpol notices) are converted
+to one of two layouts first:
+
+- CSV with a header row: ``id,name,aliases,type,countries,programs``, the
+  multi-valued columns separated by ``;``;
+- NDJSON with the same keys, multi-valued keys as JSON arrays.
+
+Lists are refreshed incrementally. A list whose version (content digest,
+or ETag in the bucket) changed is parsed and compared with the entries
+currently loaded for it; entries are compared by value (the entity hash
+of all their fields), so an edited entry is a removal plus an addition.
+Removals are applied to the main index without rebuilding it, additions
+go to a small overlay index, and the overlay is merged into a rebuilt
+main index once it exceeds SCREENING_OVERLAY_MAX_ENTRIES (the first list
+loaded builds the main index directly).
+
+Usage:
+    await screening_engine.refresh()
+    matches = await screening_engine.screen("Acme Trading LLC")
+"""
+
+import asyncio
+import csv
+import hashlib
+import json
+import tempfile
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.storage import download_to_path, get_s3_client
+from app.screening.index import (
+    ScreeningIndex,
+    ScreeningMatch,
+    WatchlistEntry,
+    best_matches,
+)
+from app.screening.store import IndexStore
+
+logger = get_logger(__name__)
+
+LIST_SUFFIXES = (".csv", ".ndjson", ".jsonl")
+
+# Main index and overlay of entries added since it was built
+Layers = tuple[ScreeningIndex, ScreeningIndex]
+
+
+@dataclass(frozen=True, slots=True)
+class ListSource:
+    """One version of a list file, locally or in the storage bucket."""
+
+    name: str
+    location: str  # file path or object key
+    version: str
+    in_bucket: bool = False
+
+
+@dataclass(slots=True)
+class WatchlistDelta:
+    """Entries added to and removed from one list by a refresh."""
+
+    list_name: str
+    previous_version: str | None
+    version: str
+    added: list[WatchlistEntry] = field(default_factory=list)
+    removed: list[WatchlistEntry] = field(default_factory=list)
+
+
+def _values(value: Any) -> tuple[str, ...]:
+    if not value:
+        return ()
+    if isinstance(value, str):
+        value = value.split(";")
+    return tuple(v.strip() for v in value if v and v.strip())
+
+
+def _entry(list_name: str, record: dict[str, Any]) -> WatchlistEntry | None:
+    name = (record.get("name") or "").strip()
+    if not name:
+        return None
+    return WatchlistEntry(
+        list_name=list_name,
+        entry_id=str(record.get("id") or ""),
+        name=name,
+        aliases=_values(record.get("aliases")),
+        entity_type=(record.get("type") or "").strip().lower(),
+        countries=_values(record.get("countries")),
+        programs=_values(record.get("programs")),
+    )
+
+
+def parse_watchlist(
+    list_name: str, suffix: str, lines: Iterable[str]
+) -> Iterator[WatchlistEntry]:
+    """Yield the entries of a list file's lines; rows without a name are skipped.
+
+    Raises:
+        ValueError: If the file type is not supported.
+    """
+    if suffix == ".csv":
+        records: Iterator[dict[str, Any]] = csv.DictReader(lines)
+    elif suffix in (".ndjson", ".jsonl"):
+        records = (json.loads(line) for line in lines if line.strip())
+    else:
+        raise ValueError(f"Unsupported watchlist file: {list_name}{suffix}")
+    for record in records:
+        entry = _entry(list_name, record)
+        if entry is not None:
+            yield entry
+
+
+def read_watchlist(path: Path) -> Iterator[WatchlistEntry]:
+    """Yield the entries of one local list file (see ``parse_watchlist``)."""
+    with path.open(encoding="utf-8", newline="") as f:
+        yield from parse_watchlist(path.stem, path.suffix, f)
+
+
+def list_files(list_dir: str | Path) -> list[Path]:
+    """Return the watchlist files in a directory, sorted by name."""
+    return sorted(p for p in Path(list_dir).iterdir() if p.suffix in LIST_SUFFIXES)
+
+
+def _file_digest(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()[:32]
+
+
+def local_sources(list_dir: str | Path) -> list[ListSource]:
+    """Return the list files in a directory with their content digests."""
+    return [
+        ListSource(path.stem, str(path), _file_digest(path))
+        for path in list_files(list_dir)
+    ]
+
+
+async def bucket_sources(prefix: str) -> list[ListSource]:
+    """Return the list objects under ``prefix`` in the storage bucket."""
+    sources = []
+    async with get_s3_client() as client:
+        paginator = client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(
+            Bucket=settings.MINIO_BUCKET_NAME, Prefix=prefix
+        ):
+            for item in page.get("Contents", []):
+                path = PurePosixPath(item["Key"])
+                if path.suffix in LIST_SUFFIXES:
+                    sources.append(
+                        ListSource(
+                            path.stem, item["Key"], item["ETag"].strip('"'), True
+                        )
+                    )
+    return sorted(sources, key=lambda source: source.name)
+
+
+async def configured_sources() -> list[ListSource]:
+    """Return the lists in SCREENING_LIST_DIR and under SCREENING_LIST_PREFIX.
+
+    Raises:
+        ValueError: If two sources have the same list name.
+    """
+    sources = []
+    if settings.SCREENING_LIST_DIR:
+        sources += await asyncio.to_thread(local_sources, settings.SCREENING_LIST_DIR)
+    if settings.SCREENING_LIST_PREFIX:
+        sources += await bucket_sources(settings.SCREENING_LIST_PREFIX)
+    names = [source.name for source in sources]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate watchlist names: {', '.join(sorted(duplicates))}")
+    return sources
+
+
+async def read_source(source: ListSource) -> list[WatchlistEntry]:
+    """Read and parse every entry of a list source."""
+    if not source.in_bucket:
+        return await asyncio.to_thread(
+            lambda: list(read_watchlist(Path(source.location)))
+        )
+    # Stream the object to a temporary file rather than holding it in memory
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / PurePosixPath(source.location).name
+        await download_to_path(source.location, path)
+        return await asyncio.to_thread(lambda: list(read_watchlist(path)))
+
+
+def screen_layers(
+    layers: Layers,
+    name: str,
+    *,
+    threshold: float | None = None,
+    limit: int = 10,
+) -> list[ScreeningMatch]:
+    """Screen a name against the main index and the overlay."""
+    return best_matches(
+        (layer.screen(name, threshold=threshold, limit=limit) for layer in layers),
+        limit,
+    )
+
+
+def apply_delta(
+    layers: Layers, list_name: str, entries: list[WatchlistEntry]
+) -> tuple[Layers, list[WatchlistEntry], list[WatchlistEntry]]:
+    """Replace the entries of one list in the layers.
+
+    The returned layers share the unchanged main-index arrays; the
+    arguments are not modified.
+
+    Args:
+        layers: Current main index and overlay.
+        list_name: List being replaced.
+        entries: The list's new entries.
+
+    Returns:
+        Tuple of the new layers, the added entries and the removed entries.
+    """
+    main, overlay = layers
+    in_main = main.live_entries(list_name)
+    in_overlay = overlay.live_entries(list_name)
+    new = dict.fromkeys(entries)
+    added = [entry for entry in new if entry not in in_main and entry not in in_overlay]
+    removed = [entry for entry in (*in_main, *in_overlay) if entry not in new]
+    if not added and not removed:
+        return layers, [], []
+
+    overlay_entries = [
+        entry
+        for entry in overlay.live_entries()
+        if entry.list_name != list_name or entry in new
+    ] + added
+    removed_from_main = [
+        number for entry, number in in_main.items() if entry not in new
+    ]
+    max_entries = settings.SCREENING_OVERLAY_MAX_ENTRIES
+    if (
+        not main.entries
+        or len(overlay_entries) > max_entries
+        or len(main.removed) + len(removed_from_main) > max_entries
+    ):
+        live = [
+            entry
+            for entry in main.live_entries()
+            if entry.list_name != list_name or entry in new
+        ]
+        layers = (ScreeningIndex.build(live + overlay_entries), ScreeningIndex())
+    else:
+        layers = (
+            main.without(removed_from_main),
+            ScreeningIndex.build(overlay_entries),
+        )
+    return layers, added, removed
+
+
+class ScreeningEngine:
+    """Holds the current screening index for the process.
+
+    The main index and overlay are replaced together, as one tuple, by
+    reference assignment: screening reads whichever pair is current when it
+    starts and never sees a half-applied refresh.
+
+    With an index directory (SCREENING_INDEX_DIR) the layers are memory-
+    mapped from the files it names (see ``app.screening.store``), so every
+    process on the host shares them. A refresh takes the directory lock,
+    first opens whatever another process published, and publishes its own
+    changes for the others to open.
+    """
+
+    def __init__(self, index_dir: str | None = None) -> None:
+        self.layers: Layers = (ScreeningIndex(), ScreeningIndex())
+        # Version of each loaded list
+        self.versions: dict[str, str] = {}
+        self.loaded_at: float | None = None
+        self.store = IndexStore(index_dir) if index_dir else None
+        self.manifest: dict[str, Any] | None = None
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Return True once lists have been loaded."""
+        return self.loaded_at is not None
+
+    def __len__(self) -> int:
+        return sum(len(layer) for layer in self.layers)
+
+    async def load(self, list_dir: str | None = None) -> list[WatchlistDelta]:
+        """Load (or refresh from) the lists in a local directory.
+
+        Args:
+            list_dir: Directory of list files; defaults to SCREENING_LIST_DIR.
+
+        Returns:
+            The changes to each list (see ``refresh``).
+        """
+        list_dir = list_dir or settings.SCREENING_LIST_DIR
+        return await self.refresh(await asyncio.to_thread(local_sources, list_dir))
+
+    async def refresh(
+        self, sources: list[ListSource] | None = None
+    ) -> list[WatchlistDelta]:
+        """Bring the loaded lists up to date with their sources.
+
+        Only lists whose version changed are read. Lists no longer present
+        in ``sources`` are removed.
+
+        Args:
+            sources: Current list versions; defaults to ``configured_sources``.
+
+        Returns:
+            One delta per list this process changed; changes another process
+            published first are opened but not returned.
+        """
+        async with self._refresh_lock:
+            if sources is None:
+                sources = await configured_sources()
+            if self.store is None:
+                return await self._apply(sources)
+            async with self.store.lock():
+                await self.sync()
+                deltas = await self._apply(sources)
+                if deltas:
+                    await asyncio.to_thread(self._publish, self.store)
+            return deltas
+
+    async def sync(self) -> bool:
+        """Open the layers published in the index directory, if newer.
+
+        Returns:
+            True if a newer published state was opened.
+        """
+        if self.store is None:
+            return False
+        manifest = await asyncio.to_thread(self.store.manifest)
+        if manifest is None or (
+            self.manifest is not None and manifest["id"] == self.manifest["id"]
+        ):
+            return False
+        self.layers = await asyncio.to_thread(self.store.open, manifest)
+        self.versions = dict(manifest["versions"])
+        self.manifest = manifest
+        self.loaded_at = time.time()
+        logger.info(
+            "screening_index_opened", manifest=manifest["id"], entries=len(self)
+        )
+        return True
+
+    async def _apply(self, sources: list[ListSource]) -> list[WatchlistDelta]:
+        """Apply the changed sources to the layers of this process."""
+        started = time.perf_counter()
+        changed = [
+            source
+            for source in sources
+            if self.versions.get(source.name) != source.version
+        ]
+        dropped = set(self.versions).difference(s.name for s in sources)
+
+        deltas = []
+        layers = self.layers
+        for source in changed:
+            entries = await read_source(source)
+            layers, added, removed = await asyncio.to_thread(
+                apply_delta, layers, source.name, entries
+            )
+            deltas.append(
+                WatchlistDelta(
+                    source.name,
+                    self.versions.get(source.name),
+                    source.version,
+                    added,
+                    removed,
+                )
+            )
+        for list_name in sorted(dropped):
+            layers, _, removed = await asyncio.to_thread(
+                apply_delta, layers, list_name, []
+            )
+            deltas.append(
+                WatchlistDelta(list_name, self.versions[list_name], "", [], removed)
+            )
+
+        self.layers = layers
+        for delta in deltas:
+            if delta.version:
+                self.versions[delta.list_name] = delta.version
+            else:
+                del self.versions[delta.list_name]
+        self.loaded_at = time.time()
+
+        if deltas:
+            main, overlay = layers
+            logger.info(
+                "watchlists_refreshed",
+                refresh_ms=round((time.perf_counter() - started) * 1000),
+                lists={
+                    d.list_name: {"added": len(d.added), "removed": len(d.removed)}
+                    for d in deltas
+                },
+                overlay_entries=len(overlay),
+                **main.stats(),
+            )
+        return deltas
+
+    def _publish(self, store: IndexStore) -> None:
+        """Write the layers to the index directory and map them back."""
+        main, overlay = self.layers
+        published = self.manifest["main"] if self.manifest else None
+        manifest = store.publish(
+            main,
+            overlay,
+            self.versions,
+            previous=self.manifest,
+            main_file=published if main.file == published else None,
+        )
+        # Swap the private in-memory copies for the shared mappings
+        self.layers = store.open(manifest)
+        self.manifest = manifest
+
+    async def screen(
+        self, name: str, *, threshold: float | None = None, limit: int = 10
+    ) -> list[ScreeningMatch]:
+        """Screen one name against the current index (see ``ScreeningIndex``)."""
+        return screen_layers(self.layers, name, threshold=threshold, limit=limit)
+
+    async def screen_many(
+        self,
+        names: Sequence[str],
+        *,
+        threshold: float | None = None,
+        limit: int = 10,
+    ) -> list[list[ScreeningMatch]]:
+        """Screen a batch of names in a worker thread."""
+        layers = self.layers
+
+        def screen_batch() -> list[list[ScreeningMatch]]:
+            main, overlay = layers
+            results = main.screen_many(names, threshold=threshold, limit=limit)
+            if not len(overlay):
+                return results
+            extra = overlay.screen_many(names, threshold=threshold, limit=limit)
+            return [best_matches(pair, limit) for pair in zip(results, extra)]
+
+        return await asyncio.to_thread(screen_batch)
+
+
+# Global screening engine instance
+screening_engine = ScreeningEngine(settings.SCREENING_INDEX_DIR or None)
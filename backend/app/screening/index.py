@@ -0,0 +1,404 @@
+"""Watchlist index with blocking and vectorized fuzzy scoring.
+
+Every list entry contributes one row per name variant (primary name and
+aliases), normalized by ``normalize_name``. Rows are reachable through an
+inverted index from blocking keys (``block_keys``) held in flat NumPy
+arrays: sorted key hashes, offsets and a postings array of row numbers.
+Names and entries are kept in offset-addressed tables (``tables``), so
+the whole index is a handful of flat buffers that can be written to disk
+and memory-mapped (``store``).
+
+Screening a name:
+
+1. look up the postings of its blocking keys; keys shared by more than
+   SCREENING_MAX_BLOCK_SIZE rows (very common name tokens) are skipped
+   when the name has rarer keys;
+2. rank candidate rows by how many keys they share with the name and keep
+   the best SCREENING_MAX_CANDIDATES;
+3. score the candidates in one RapidFuzz ``cdist`` call per scorer and
+   combine the scores with NumPy; rows at or above the threshold match.
+   Token-sorted and space-free forms of every name are precomputed, so the
+   two main scorers are plain ``ratio`` calls.
+
+The score is the token-sort ratio (order-insensitive edit similarity).
+Two variants are used when they score higher: 0.9 x the token-set ratio
+for multi-word names, so a list name with an extra middle name still
+scores high while a single-word overlap ("Ivanov" against "Sergei
+Ivanov") does not; and 0.95 x the ratio with spaces removed, for names
+split or joined differently ("Al Rashid" / "Alrashid").
+"""
+
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from app.core.config import settings
+from app.screening.normalize import block_keys, normalize_name
+from app.screening.tables import StringTable
+
+# Token-sort scores below this skip the (slower) token-set comparison
+_TOKEN_SET_MIN_SCORE = 50
+
+
+def _sort_tokens(name: str) -> str:
+    return " ".join(sorted(name.split()))
+
+
+@dataclass(frozen=True, slots=True)
+class WatchlistEntry:
+    """One listed person, organization or vessel."""
+
+    list_name: str
+    entry_id: str
+    name: str
+    aliases: tuple[str, ...] = ()
+    entity_type: str = ""
+    countries: tuple[str, ...] = ()
+    programs: tuple[str, ...] = ()
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Return the primary name followed by the aliases."""
+        return (self.name, *self.aliases)
+
+
+@dataclass(frozen=True, slots=True)
+class ScreeningMatch:
+    """A list entry whose name (or alias) matched a screened name."""
+
+    entry: WatchlistEntry
+    matched_name: str
+    score: float
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the match as plain data (for workflow state and Redis)."""
+        entry = self.entry
+        return {
+            "key": entry_key(entry),
+            "list": entry.list_name,
+            "entry_id": entry.entry_id,
+            "name": entry.name,
+            "matched_name": self.matched_name,
+            "score": self.score,
+            "type": entry.entity_type,
+            "countries": list(entry.countries),
+            "programs": list(entry.programs),
+        }
+
+
+def entry_key(entry: WatchlistEntry) -> str:
+    """Return the stable identity of a list entry across list versions."""
+    return f"{entry.list_name}:{entry.entry_id or entry.name}"
+
+
+def best_matches(
+    results: Iterable[Iterable[ScreeningMatch]], limit: int | None = None
+) -> list[ScreeningMatch]:
+    """Merge match lists, keeping each entry's best match, best first."""
+    best: dict[WatchlistEntry, ScreeningMatch] = {}
+    for match in (match for matches in results for match in matches):
+        if match.entry not in best or match.score > best[match.entry].score:
+            best[match.entry] = match
+    return sorted(best.values(), key=lambda m: -m.score)[:limit]
+
+
+class EntryTable(Sequence[WatchlistEntry]):
+    """Immutable sequence of list entries, decoded when read.
+
+    Each entry is stored as a compact JSON record; the list it belongs to
+    is a separate small array, so one list's entries can be found without
+    decoding the others.
+    """
+
+    __slots__ = ("list_names", "entry_list", "records")
+
+    def __init__(
+        self, list_names: Sequence[str], entry_list: np.ndarray, records: StringTable
+    ) -> None:
+        self.list_names = tuple(list_names)
+        self.entry_list = entry_list
+        self.records = records
+
+    @classmethod
+    def build(cls, entries: Sequence[WatchlistEntry]) -> "EntryTable":
+        """Encode entries into a new table."""
+        list_names = list(dict.fromkeys(entry.list_name for entry in entries))
+        numbers = {name: number for number, name in enumerate(list_names)}
+        entry_list = np.fromiter(
+            (numbers[entry.list_name] for entry in entries), np.uint16, len(entries)
+        )
+        records = StringTable.build(
+            json.dumps(
+                [
+                    entry.entry_id,
+                    entry.name,
+                    entry.aliases,
+                    entry.entity_type,
+                    entry.countries,
+                    entry.programs,
+                ],
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            for entry in entries
+        )
+        return cls(list_names, entry_list, records)
+
+    def __len__(self) -> int:
+        return len(self.entry_list)
+
+    def __getitem__(self, number: int) -> WatchlistEntry:  # type: ignore[override]
+        entry_id, name, aliases, entity_type, countries, programs = json.loads(
+            self.records[number]
+        )
+        return WatchlistEntry(
+            list_name=self.list_names[self.entry_list[number]],
+            entry_id=entry_id,
+            name=name,
+            aliases=tuple(aliases),
+            entity_type=entity_type,
+            countries=tuple(countries),
+            programs=tuple(programs),
+        )
+
+    def __iter__(self) -> Iterator[WatchlistEntry]:
+        return (self[number] for number in range(len(self)))
+
+    def numbers(self, list_name: str) -> np.ndarray:
+        """Return the entry numbers of one list."""
+        if list_name not in self.list_names:
+            return np.empty(0, np.int64)
+        return np.flatnonzero(self.entry_list == self.list_names.index(list_name))
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the records and list array."""
+        return self.records.nbytes + self.entry_list.nbytes
+
+
+@dataclass
+class ScreeningIndex:
+    """Immutable, searchable view of one or more watchlists.
+
+    Entries are removed without rebuilding by ``without``, which returns a
+    copy sharing the arrays and skipping the removed entries' rows.
+    """
+
+    entries: EntryTable = field(default_factory=lambda: EntryTable.build([]))
+    # One row per name variant: normalized with tokens sorted, and without spaces
+    sorted_names: StringTable = field(default_factory=lambda: StringTable.build([]))
+    compact_names: StringTable = field(default_factory=lambda: StringTable.build([]))
+    row_entry: np.ndarray = field(default_factory=lambda: np.empty(0, np.int32))
+    row_variant: np.ndarray = field(default_factory=lambda: np.empty(0, np.uint16))
+    # Inverted index: postings[offsets[i]:offsets[i + 1]] are the rows of keys[i]
+    keys: np.ndarray = field(default_factory=lambda: np.empty(0, np.int64))
+    offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, np.int64))
+    postings: np.ndarray = field(default_factory=lambda: np.empty(0, np.int32))
+    # Entry numbers removed since the index was built
+    removed: frozenset[int] = frozenset()
+    # Name of the index file the arrays are mapped from, if any
+    file: str | None = None
+
+    @classmethod
+    def build(cls, entries: Iterable[WatchlistEntry]) -> "ScreeningIndex":
+        """Normalize the entries' names and build the blocking index."""
+        index_entries: list[WatchlistEntry] = []
+        names: list[str] = []
+        row_entry: list[int] = []
+        row_variant: list[int] = []
+        key_hashes: list[int] = []
+        key_rows: list[int] = []
+        for entry in entries:
+            entry_number = len(index_entries)
+            index_entries.append(entry)
+            seen: set[str] = set()
+            for variant, name in enumerate(entry.names):
+                normalized = normalize_name(name)
+                if not normalized or normalized in seen:
+                    continue
+                seen.add(normalized)
+                row = len(names)
+                names.append(normalized)
+                row_entry.append(entry_number)
+                row_variant.append(variant)
+                name_keys = block_keys(normalized)
+                key_hashes.extend(name_keys)
+                key_rows.extend([row] * len(name_keys))
+
+        all_keys = np.fromiter(key_hashes, np.int64, len(key_hashes))
+        order = np.argsort(all_keys, kind="stable")
+        sorted_keys = all_keys[order]
+        keys, starts = np.unique(sorted_keys, return_index=True)
+        return cls(
+            entries=EntryTable.build(index_entries),
+            sorted_names=StringTable.build(_sort_tokens(name) for name in names),
+            compact_names=StringTable.build(name.replace(" ", "") for name in names),
+            row_entry=np.asarray(row_entry, np.int32),
+            row_variant=np.asarray(row_variant, np.uint16),
+            keys=keys,
+            offsets=np.append(starts, len(sorted_keys)).astype(np.int64),
+            postings=np.asarray(key_rows, np.int32)[order],
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries) - len(self.removed)
+
+    def live_entries(self, list_name: str | None = None) -> dict[WatchlistEntry, int]:
+        """Return the entries that have not been removed, with their numbers.
+
+        Args:
+            list_name: Only return this list's entries.
+        """
+        numbers = (
+            range(len(self.entries))
+            if list_name is None
+            else self.entries.numbers(list_name).tolist()
+        )
+        return {
+            self.entries[number]: number
+            for number in numbers
+            if number not in self.removed
+        }
+
+    def without(self, numbers: Iterable[int]) -> "ScreeningIndex":
+        """Return a copy of the index, sharing its arrays, without some entries."""
+        removed = self.removed.union(numbers)
+        return self if removed == self.removed else replace(self, removed=removed)
+
+    def stats(self) -> dict[str, int]:
+        """Return size counters for logging and health checks."""
+        return {
+            "entries": len(self),
+            "names": len(self.row_entry),
+            "keys": len(self.keys),
+            "postings": len(self.postings),
+            "array_bytes": sum(
+                array.nbytes
+                for array in (
+                    self.entries,
+                    self.sorted_names,
+                    self.compact_names,
+                    self.row_entry,
+                    self.row_variant,
+                    self.keys,
+                    self.offsets,
+                    self.postings,
+                )
+            ),
+        }
+
+    def screen(
+        self,
+        name: str,
+        *,
+        threshold: float | None = None,
+        limit: int = 10,
+    ) -> list[ScreeningMatch]:
+        """Return the list entries matching ``name``, best first.
+
+        Args:
+            name: Person or organization name, in any supported script.
+            threshold: Minimum score (0-100); defaults to
+                SCREENING_MATCH_THRESHOLD.
+            limit: Maximum number of entries returned.
+
+        Returns:
+            At most one match per entry (its best-scoring name variant).
+        """
+        threshold = (
+            settings.SCREENING_MATCH_THRESHOLD if threshold is None else threshold
+        )
+        query = normalize_name(name)
+        rows = self._candidates(query)
+        if not len(rows):
+            return []
+
+        # Token-sort ratio == plain ratio of the token-sorted names; the
+        # token-set ratio ignores order, so it can use them too. Normalized
+        # names are ASCII, so they are compared as bytes.
+        sorted_names = self.sorted_names.take_bytes(rows)
+        scores = process.cdist(
+            [_sort_tokens(query).encode()], sorted_names, scorer=fuzz.ratio
+        )[0]
+        compact_scores = process.cdist(
+            [query.replace(" ", "").encode()],
+            self.compact_names.take_bytes(rows),
+            scorer=fuzz.ratio,
+        )[0]
+        scores = np.maximum(scores, 0.95 * compact_scores)
+        if " " in query:
+            close = np.flatnonzero(scores >= _TOKEN_SET_MIN_SCORE)
+            if len(close):
+                set_scores = process.cdist(
+                    [query.encode()],
+                    sorted_names[close],
+                    scorer=fuzz.token_set_ratio,
+                )[0]
+                scores[close] = np.maximum(scores[close], 0.9 * set_scores)
+        hits = np.flatnonzero(scores >= threshold)
+        hits = hits[np.argsort(-scores[hits], kind="stable")]
+
+        matches: list[ScreeningMatch] = []
+        seen_entries: set[int] = set()
+        for hit in hits:
+            row = rows[hit]
+            entry_number = int(self.row_entry[row])
+            if entry_number in seen_entries or entry_number in self.removed:
+                continue
+            seen_entries.add(entry_number)
+            entry = self.entries[entry_number]
+            matches.append(
+                ScreeningMatch(
+                    entry=entry,
+                    matched_name=entry.names[self.row_variant[row]],
+                    score=round(float(scores[hit]), 1),
+                )
+            )
+            if len(matches) == limit:
+                break
+        return matches
+
+    def screen_many(
+        self,
+        names: Sequence[str],
+        *,
+        threshold: float | None = None,
+        limit: int = 10,
+    ) -> list[list[ScreeningMatch]]:
+        """Screen a batch of names; returns one match list per name.
+
+        Names that normalize the same way are screened once.
+        """
+        results: dict[str, list[ScreeningMatch]] = {}
+        for name in names:
+            query = normalize_name(name)
+            if query not in results:
+                results[query] = self.screen(query, threshold=threshold, limit=limit)
+        return [results[normalize_name(name)] for name in names]
+
+    def _candidates(self, query: str) -> np.ndarray:
+        """Return candidate rows for a normalized name, most shared keys first."""
+        blocks = []
+        for key in block_keys(query):
+            position = np.searchsorted(self.keys, key)
+            if position < len(self.keys) and self.keys[position] == key:
+                start, stop = self.offsets[position], self.offsets[position + 1]
+                blocks.append(self.postings[start:stop])
+        if not blocks:
+            return np.empty(0, np.int32)
+        selective = [b for b in blocks if len(b) <= settings.SCREENING_MAX_BLOCK_SIZE]
+        if selective:
+            blocks = selective
+        else:
+            blocks = [min(blocks, key=len)[: settings.SCREENING_MAX_BLOCK_SIZE]]
+
+        rows, shared = np.unique(np.concatenate(blocks), return_counts=True)
+        max_candidates = settings.SCREENING_MAX_CANDIDATES
+        if len(rows) > max_candidates:
+            best = np.argpartition(-shared, max_candidates)[:max_candidates]
+            rows = rows[best]
+        return rows
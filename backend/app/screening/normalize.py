@@ -0,0 +1,110 @@
+"""Name normalization and blocking keys for watchlist screening.
+
+Names from sanctions and debarment lists and from supplier websites differ
+in script, diacritics, punctuation, word order and legal form. Both sides
+are normalized the same way before comparison:
+
+- Cyrillic and Greek letters are transliterated and Latin diacritics
+  stripped, so "Ivanov", "Иванов" and "Ívanov" all become "ivanov";
+- punctuation is removed and legal forms ("Ltd", "GmbH", "OOO") dropped.
+
+Blocking keys decide which list names a query is compared with: a phonetic
+code per name token (a Soundex-style consonant skeleton without the length
+cap), so spelling variants such as Mohammed / Muhammad / Mohamed share a
+key, plus the token itself.
+"""
+
+import hashlib
+import re
+import unicodedata
+from functools import lru_cache
+
+_TRANSLITERATION = str.maketrans(
+    {
+        # Cyrillic (Russian, Ukrainian, Belarusian)
+        "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ж": "zh",
+        "з": "z", "и": "i", "й": "i", "к": "k", "л": "l", "м": "m", "н": "n",
+        "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f",
+        "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "shch", "ъ": "",
+        "ы": "y", "ь": "", "э": "e", "ю": "yu", "я": "ya", "і": "i", "ї": "i",
+        "є": "ye", "ґ": "g", "ў": "u",
+        # Greek
+        "α": "a", "β": "v", "γ": "g", "δ": "d", "ε": "e", "ζ": "z", "η": "i",
+        "θ": "th", "ι": "i", "κ": "k", "λ": "l", "μ": "m", "ν": "n", "ξ": "x",
+        "ο": "o", "π": "p", "ρ": "r", "σ": "s", "ς": "s", "τ": "t", "υ": "y",
+        "φ": "f", "χ": "ch", "ψ": "ps", "ω": "o",
+        # Latin letters that don't decompose into base + diacritic
+        "ß": "ss", "æ": "ae", "ø": "o", "đ": "d", "ł": "l", "þ": "th",
+        "œ": "oe", "ı": "i", "ð": "d",
+    }
+)  # fmt: skip
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+LEGAL_FORMS = frozenset(
+    """
+    ag as bhd bv co company corp corporation cv gmbh inc incorporated jsc kg
+    limited llc llp lp ltd nv oao ooo pao pjsc plc pte pty sa sarl sas spa
+    srl the zao
+    """.split()
+)
+
+# Soundex consonant classes; vowels and h, w, y are dropped
+_CONSONANT_CLASSES = str.maketrans(
+    "bfpvcgjkqsxzdtlmnr", "111122222222334556", "aeiouyhw"
+)
+_FIRST_LETTER = {"c": "k", "q": "k", "z": "s", "y": "a"} | dict.fromkeys("eiou", "a")
+
+
+def normalize_name(name: str) -> str:
+    """Return the comparable form of a name: ASCII lowercase words.
+
+    Legal forms are dropped unless nothing else is left.
+    """
+    text = unicodedata.normalize("NFKD", name.casefold()).translate(_TRANSLITERATION)
+    # Dots are removed rather than split on, so "S.A." matches "SA"
+    text = text.encode("ascii", "ignore").decode().replace(".", "")
+    tokens = _NON_ALNUM_RE.sub(" ", text).split()
+    meaningful = [token for token in tokens if token not in LEGAL_FORMS]
+    return " ".join(meaningful or tokens)
+
+
+def phonetic_key(token: str) -> str:
+    """Return the phonetic code of one normalized name token."""
+    if not token.isalpha():
+        return token
+    token = token.replace("ph", "f")
+    first = _FIRST_LETTER.get(token[0], token[0])
+    code = [first]
+    previous = token[0].translate(_CONSONANT_CLASSES)
+    for digit in token[1:].translate(_CONSONANT_CLASSES):
+        if digit != previous:
+            code.append(digit)
+        previous = digit
+    return "".join(code)
+
+
+def _key(text: str) -> int:
+    # BLAKE2 rather than hash(): keys must be the same in every process
+    digest = hashlib.blake2b(text.encode(), digest_size=8).digest()
+    return int.from_bytes(digest) >> 1  # fits int64
+
+
+@lru_cache(maxsize=1 << 17)
+def token_block_keys(token: str) -> tuple[int, ...]:
+    """Return the blocking keys of one token as stable 64-bit integers.
+
+    A token has a phonetic key, shared with its spelling variants, and an
+    exact key ("=" + token), so list names spelled exactly like the query
+    rank above names that only sound alike. Keys are hashed so the index
+    stores them in a flat integer array.
+    """
+    return _key(phonetic_key(token)), _key("=" + token)
+
+
+def block_keys(normalized_name: str) -> list[int]:
+    """Return the distinct blocking keys of a normalized name."""
+    keys = {}
+    for token in normalized_name.split():
+        if len(token) > 1:
+            keys.update(dict.fromkeys(token_block_keys(token)))
+    return list(keys)
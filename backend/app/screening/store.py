@@ -0,0 +1,248 @@
+"""On-disk screening indexes shared by every process through mmap.
+
+A built ``ScreeningIndex`` is written once to a single binary file and
+memory-mapped read-only by each API and worker process, so N processes
+share one copy of it through the page cache and opening an index costs an
+mmap rather than a rebuild.
+
+File layout (format 1, little-endian):
+
+- 8-byte magic ``SCRNIDX1`` and the header length as a uint64;
+- a JSON header: format version, list names and, for each array, its
+  dtype, length and byte offset in the file;
+- the arrays, each aligned to 64 bytes: the index arrays (row, key,
+  offset and postings arrays) and the blobs and offsets of the name and
+  entry tables.
+
+A directory of index files (SCREENING_INDEX_DIR) is described by
+``current.json``: the main index file, the overlay file, the main-index
+entries removed since it was built and the version of each list. Files
+are immutable and written under a temporary name first; a new state is
+published by atomically renaming a new manifest over ``current.json``.
+Processes that still map the previous files keep using them until they
+open the new manifest, and unlinked files stay readable while mapped.
+"""
+
+import asyncio
+import fcntl
+import json
+import mmap
+import os
+import struct
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from io import TextIOWrapper
+from pathlib import Path
+from typing import Any, cast
+
+import numpy as np
+
+from app.core.logging import get_logger
+from app.screening.index import EntryTable, ScreeningIndex
+from app.screening.tables import StringTable
+
+logger = get_logger(__name__)
+
+MAGIC = b"SCRNIDX1"
+FORMAT_VERSION = 1
+_PREAMBLE = struct.Struct("<8sQ")
+_ALIGN = 64
+MANIFEST = "current.json"
+_LOCK = ".lock"
+
+
+def _arrays(index: ScreeningIndex) -> dict[str, np.ndarray]:
+    entries = index.entries
+    return {
+        "row_entry": index.row_entry,
+        "row_variant": index.row_variant,
+        "keys": index.keys,
+        "offsets": index.offsets,
+        "postings": index.postings,
+        "entry_list": entries.entry_list,
+        "entry_records.data": entries.records.blob(),
+        "entry_records.offsets": entries.records.offsets,
+        "sorted_names.data": index.sorted_names.blob(),
+        "sorted_names.offsets": index.sorted_names.offsets,
+        "compact_names.data": index.compact_names.blob(),
+        "compact_names.offsets": index.compact_names.offsets,
+    }
+
+
+def _aligned(position: int) -> int:
+    return -(-position // _ALIGN) * _ALIGN
+
+
+def write_index(index: ScreeningIndex, path: Path) -> None:
+    """Write an index to ``path`` (removed entries are not recorded)."""
+    arrays = {name: np.ascontiguousarray(a) for name, a in _arrays(index).items()}
+    header: dict[str, Any] = {
+        "format": FORMAT_VERSION,
+        "lists": list(index.entries.list_names),
+        "arrays": {},
+    }
+    # Array offsets depend on the header size, and the header holds them:
+    # reserve room for the header and grow it until the encoding fits
+    header_size = 0
+    while True:
+        position = _aligned(_PREAMBLE.size + header_size)
+        for name, array in arrays.items():
+            header["arrays"][name] = [array.dtype.str, len(array), position]
+            position = _aligned(position + array.nbytes)
+        encoded = json.dumps(header).encode()
+        if len(encoded) <= header_size:
+            break
+        header_size = _aligned(len(encoded) + _ALIGN)
+
+    with path.open("wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, header_size))
+        f.write(encoded.ljust(header_size))
+        for name, array in arrays.items():
+            f.seek(header["arrays"][name][2])
+            f.write(array.tobytes())
+        f.truncate(position)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def open_index(path: Path) -> ScreeningIndex:
+    """Memory-map an index file read-only.
+
+    Raises:
+        ValueError: If the file is not an index of a supported format.
+    """
+    with path.open("rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, header_size = _PREAMBLE.unpack_from(mapping)
+    if magic != MAGIC:
+        raise ValueError(f"Not a screening index: {path}")
+    header = json.loads(mapping[_PREAMBLE.size : _PREAMBLE.size + header_size])
+    if header["format"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported index format {header['format']}: {path}")
+
+    arrays = {
+        name: np.frombuffer(mapping, np.dtype(dtype), count, offset)
+        for name, (dtype, count, offset) in header["arrays"].items()
+    }
+
+    def table(name: str) -> StringTable:
+        start = header["arrays"][f"{name}.data"][2]
+        return StringTable(mapping, arrays[f"{name}.offsets"], start)
+
+    return ScreeningIndex(
+        file=path.name,
+        entries=EntryTable(
+            header["lists"], arrays["entry_list"], table("entry_records")
+        ),
+        sorted_names=table("sorted_names"),
+        compact_names=table("compact_names"),
+        row_entry=arrays["row_entry"],
+        row_variant=arrays["row_variant"],
+        keys=arrays["keys"],
+        offsets=arrays["offsets"],
+        postings=arrays["postings"],
+    )
+
+
+class IndexStore:
+    """Directory of index files and the manifest naming the current ones."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    @asynccontextmanager
+    async def lock(self) -> AsyncIterator[None]:
+        """Hold the directory's exclusive lock, waiting for it off the loop.
+
+        Refreshes take it so one process per host rebuilds at a time; the
+        others then find the new state in the manifest.
+        """
+        f = await asyncio.to_thread(self._acquire)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+            f.close()
+
+    def _acquire(self) -> TextIOWrapper:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        f = (self.directory / _LOCK).open("a")
+        fcntl.flock(f, fcntl.LOCK_EX)
+        return f
+
+    def manifest(self) -> dict[str, Any] | None:
+        """Return the current manifest, or None if nothing was published."""
+        try:
+            return cast(
+                dict[str, Any], json.loads((self.directory / MANIFEST).read_text())
+            )
+        except FileNotFoundError:
+            return None
+
+    def open(self, manifest: dict[str, Any]) -> tuple[ScreeningIndex, ScreeningIndex]:
+        """Map the main index and overlay named by a manifest."""
+        main = open_index(self.directory / manifest["main"])
+        main = main.without(manifest["removed"])
+        overlay = (
+            open_index(self.directory / manifest["overlay"])
+            if manifest["overlay"]
+            else ScreeningIndex()
+        )
+        return main, overlay
+
+    def publish(
+        self,
+        main: ScreeningIndex,
+        overlay: ScreeningIndex,
+        versions: dict[str, str],
+        previous: dict[str, Any] | None,
+        main_file: str | None,
+    ) -> dict[str, Any]:
+        """Write new index files as needed and make them current.
+
+        Args:
+            main: Main index.
+            overlay: Overlay index.
+            versions: Version of each list in the indexes.
+            previous: Manifest being replaced, if any.
+            main_file: Existing file of ``main`` (without its removals), or
+                None to write it.
+
+        Returns:
+            The new manifest.
+        """
+        manifest = {
+            "id": uuid.uuid4().hex,
+            "format": FORMAT_VERSION,
+            "main": main_file or self._write(main),
+            "overlay": self._write(overlay) if len(overlay.entries) else None,
+            "removed": sorted(main.removed),
+            "versions": versions,
+        }
+        temporary = self.directory / f".{manifest['id']}.json"
+        temporary.write_text(json.dumps(manifest))
+        os.replace(temporary, self.directory / MANIFEST)
+        self._remove_unused(manifest, previous)
+        return manifest
+
+    def _write(self, index: ScreeningIndex) -> str:
+        name = f"index-{uuid.uuid4().hex}.bin"
+        temporary = self.directory / f".{name}"
+        write_index(index, temporary)
+        os.replace(temporary, self.directory / name)
+        return name
+
+    def _remove_unused(
+        self, manifest: dict[str, Any], previous: dict[str, Any] | None
+    ) -> None:
+        # Keep the previous generation for processes still opening it
+        keep = {
+            m[key] for m in (manifest, previous) if m for key in ("main", "overlay")
+        }
+        for path in self.directory.glob("index-*.bin"):
+            if path.name not in keep:
+                try:
+                    path.unlink()
+                except OSError as e:
+                    logger.warning("screening_index_cleanup_failed", error=str(e))
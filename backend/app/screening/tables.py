@@ -0,0 +1,72 @@
+"""Offset-addressed string tables for the screening index.
+
+A table is one UTF-8 blob plus an array of offsets: string ``i`` is
+``data[offsets[i]:offsets[i + 1]]``. This takes a fraction of the memory
+of Python string objects, and the same layout works for an index built in
+memory and one memory-mapped from disk (``app.screening.store``), where
+``data`` is the mapping itself and strings are read from it only when
+needed.
+"""
+
+import mmap
+from collections.abc import Iterable
+from typing import cast
+
+import numpy as np
+
+
+class StringTable:
+    """Immutable sequence of strings stored as a blob and offsets."""
+
+    __slots__ = ("data", "offsets", "start")
+
+    def __init__(self, data: bytes | mmap.mmap, offsets: np.ndarray, start: int = 0):
+        self.data = data
+        self.offsets = offsets
+        # Position of the table's first byte in ``data``
+        self.start = start
+
+    @classmethod
+    def build(cls, strings: Iterable[str]) -> "StringTable":
+        """Encode strings into a new table."""
+        encoded = [string.encode() for string in strings]
+        offsets = np.zeros(len(encoded) + 1, np.int64)
+        np.cumsum([len(item) for item in encoded], out=offsets[1:])
+        return cls(b"".join(encoded), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, number: int) -> str:
+        start = self.start + int(self.offsets[number])
+        stop = self.start + int(self.offsets[number + 1])
+        return self.data[start:stop].decode()
+
+    def take_bytes(self, numbers: np.ndarray) -> np.ndarray:
+        """Return the encoded strings at ``numbers`` as a fixed-width array.
+
+        The bytes are gathered with NumPy into an ``S<width>`` array (width
+        of the longest string taken; shorter ones are NUL-padded, which
+        ``bytes_`` strips), instead of slicing one Python object per string.
+        RapidFuzz scores ASCII bytes like the equivalent strings.
+        """
+        if not len(numbers):
+            return np.empty(0, "S1")
+        starts = self.offsets[numbers] + self.start
+        lengths = self.offsets[numbers + 1] + self.start - starts
+        width = max(int(lengths.max()), 1)
+        data = np.frombuffer(self.data, np.uint8)
+        columns = np.arange(width)
+        positions = np.minimum(starts[:, None] + columns, len(data) - 1)
+        chars = data[positions]
+        chars[columns >= lengths[:, None]] = 0
+        return cast(np.ndarray, chars.view(f"S{width}").ravel())
+
+    def blob(self) -> np.ndarray:
+        """Return the table's bytes as a uint8 array (for writing to disk)."""
+        return np.frombuffer(self.data, np.uint8, int(self.offsets[-1]), self.start)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the blob and offsets."""
+        return int(self.offsets[-1]) + self.offsets.nbytes
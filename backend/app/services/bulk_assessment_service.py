@@ -0,0 +1,189 @@
+"""Bulk supplier assessments.
+
+An uploaded supplier list is consumed row by row as it is parsed. Rows are
+deduplicated by normalized domain and queued on the bulk worker pool in
+batches of BULK_ENQUEUE_BATCH_SIZE, so a list of thousands of suppliers
+never sits in memory and the queue fills while the upload is still arriving.
+
+Each batch has aggregate counters in a Redis hash (``bulk_batch:{id}``):
+rows seen, duplicates, invalid rows and queued jobs are written by the
+upload, and completed/failed are incremented by the workers as each
+assessment reaches its final outcome.
+"""
+
+import asyncio
+import uuid
+from collections.abc import AsyncIterator
+from enum import StrEnum
+from typing import Any
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import redis_pool
+from app.services.supplier_import import SupplierImportError, SupplierRow
+from app.workers.queue import JobPriority, enqueue_assessment
+
+logger = get_logger(__name__)
+
+_KEY_PREFIX = "bulk_batch:"
+COUNTERS = ("total", "duplicates", "invalid", "queued", "completed", "failed")
+# Count an outcome only while the batch hash exists: once it has expired,
+# HINCRBY would recreate it without a TTL
+_RECORD_OUTCOME = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('HINCRBY', KEYS[1], ARGV[1], 1)
+end
+return nil
+"""
+
+
+class BatchStatus(StrEnum):
+    """Lifecycle of a bulk batch."""
+
+    QUEUEING = "queueing"  # upload still being read
+    QUEUED = "queued"  # every row queued; assessments running
+    FINISHED = "finished"  # every queued assessment completed or failed
+    ABORTED = "aborted"  # upload rejected part-way; queued rows still run
+
+
+def batch_key(batch_id: str) -> str:
+    """Return the Redis key of a batch's progress hash."""
+    return f"{_KEY_PREFIX}{batch_id}"
+
+
+async def submit_bulk_batch(
+    rows: AsyncIterator[SupplierRow],
+    priority: JobPriority = JobPriority.BULK,
+    batch_id: str | None = None,
+) -> dict[str, Any]:
+    """Queue an assessment for every distinct supplier domain in ``rows``.
+
+    Args:
+        rows: Parsed supplier rows, typically from ``parse_suppliers``.
+        priority: Worker pool to run the assessments on.
+        batch_id: Existing batch id; a new one is generated if None.
+
+    Returns:
+        The batch progress once every row has been queued.
+
+    Raises:
+        SupplierImportError: If the upload is malformed or has more than
+            BULK_MAX_ROWS distinct suppliers. Rows queued before the error
+            still run, and the batch is marked aborted.
+    """
+    batch_id = batch_id or str(uuid.uuid4())
+    counters = dict.fromkeys(("total", "duplicates", "invalid", "queued"), 0)
+    seen: set[str] = set()
+    pending: list[SupplierRow] = []
+
+    async def flush(status: BatchStatus, error: str = "") -> None:
+        if pending:
+            await asyncio.gather(
+                *(
+                    enqueue_assessment(row.url, priority=priority, batch_id=batch_id)
+                    for row in pending
+                )
+            )
+            counters["queued"] += len(pending)
+            pending.clear()
+        await _save_progress(batch_id, counters, status, error)
+
+    await _save_progress(batch_id, counters, BatchStatus.QUEUEING)
+    try:
+        async for row in rows:
+            new = row.domain is not None and row.domain not in seen
+            if new and len(seen) >= settings.BULK_MAX_ROWS:
+                raise SupplierImportError(
+                    f"Upload has more than {settings.BULK_MAX_ROWS} suppliers"
+                )
+            counters["total"] += 1
+            if row.domain is None:
+                counters["invalid"] += 1
+                continue
+            if not new:
+                counters["duplicates"] += 1
+                continue
+            seen.add(row.domain)
+            pending.append(row)
+            if len(pending) >= settings.BULK_ENQUEUE_BATCH_SIZE:
+                await flush(BatchStatus.QUEUEING)
+    except SupplierImportError as e:
+        # Rows accepted before the error are queued too, so whether a row
+        # runs does not depend on where an enqueue batch boundary fell
+        await flush(BatchStatus.ABORTED, str(e))
+        logger.warning(
+            "bulk_batch_aborted", batch_id=batch_id, error=str(e), **counters
+        )
+        raise
+
+    await flush(BatchStatus.QUEUED)
+    logger.info("bulk_batch_queued", batch_id=batch_id, **counters)
+    return await get_batch_progress(batch_id) or _progress(batch_id, counters)
+
+
+async def get_batch_progress(batch_id: str) -> dict[str, Any] | None:
+    """Return a batch's counters and status, or None if it is unknown."""
+    client = redis.Redis(connection_pool=redis_pool)
+    try:
+        # redis-py annotates hash commands as returning sync | async results
+        raw = await client.hgetall(batch_key(batch_id))  # type: ignore[misc]
+    except Exception as e:
+        logger.warning("bulk_batch_redis_unavailable", error=str(e))
+        return None
+    finally:
+        await client.aclose()
+    if not raw:
+        return None
+    return _progress(
+        batch_id,
+        {name: int(raw.get(name, 0)) for name in COUNTERS},
+        raw.get("status", BatchStatus.QUEUEING),
+        raw.get("error", ""),
+    )
+
+
+async def record_batch_outcome(batch_id: str, outcome: str) -> None:
+    """Count the final outcome ("completed" or "failed") of a batch job.
+
+    Outcomes of batches whose progress has already expired are dropped.
+    """
+    client = redis.Redis(connection_pool=redis_pool)
+    try:
+        await client.eval(  # type: ignore[misc]
+            _RECORD_OUTCOME, 1, batch_key(batch_id), outcome
+        )
+    except Exception as e:
+        logger.warning("bulk_batch_redis_unavailable", error=str(e))
+    finally:
+        await client.aclose()
+
+
+async def _save_progress(
+    batch_id: str, counters: dict[str, int], status: BatchStatus, error: str = ""
+) -> None:
+    client = redis.Redis(connection_pool=redis_pool)
+    try:
+        key = batch_key(batch_id)
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={**counters, "status": status, "error": error})
+            pipe.expire(key, settings.BULK_BATCH_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning("bulk_batch_redis_unavailable", error=str(e))
+    finally:
+        await client.aclose()
+
+
+def _progress(
+    batch_id: str,
+    counters: dict[str, int],
+    status: str = BatchStatus.QUEUED,
+    error: str = "",
+) -> dict[str, Any]:
+    progress = {name: counters.get(name, 0) for name in COUNTERS}
+    done = progress["completed"] + progress["failed"]
+    if status == BatchStatus.QUEUED and done >= progress["queued"]:
+        status = BatchStatus.FINISHED
+    return {"batch_id": batch_id, **progress, "status": status, "error": error}
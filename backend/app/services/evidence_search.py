@@ -0,0 +1,265 @@
+"""Evidence embedding and similarity search.
+
+``embed_evidence`` splits stored evidence into paragraphs, drops those
+already seen (repeated boilerplate, or text from the supplier's earlier
+assessments when given their history, see ``app.agents.tools.text_dedup``),
+packs the rest into chunks, embeds them through the batching embedder and
+stores the vectors in ``evidence_embeddings``. Chunks whose text was
+embedded before (same content hash and model) reuse the stored vector
+instead of calling the provider.
+
+``search_evidence`` returns the chunks closest to a query by cosine
+distance. Two plans cover the filter combinations:
+
+- Scoped to a supplier: the supplier's chunks (hundreds, not millions) are
+  read through the B-tree index and ranked exactly. An ANN index would
+  discard most of its candidates to the filter.
+- Across suppliers: the HNSW index is scanned with EMBEDDING_HNSW_EF_SEARCH
+  candidates; with a source type or recency filter, pgvector's iterative
+  scan keeps fetching candidates until enough rows pass the filter.
+"""
+
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import ColumnElement, Select, Table, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.agents.tools.text_dedup import TextDeduplicator, pack_chunks
+from app.core.config import settings
+from app.core.embeddings import BatchingEmbedder, embedder, text_hash
+from app.core.logging import get_logger
+from app.models.base import uuid7
+from app.models.evidence import Evidence
+from app.models.evidence_embedding import EvidenceEmbedding
+
+logger = get_logger(__name__)
+
+_table = cast(Table, EvidenceEmbedding.__table__)
+_ITERATIVE_SCAN_MODES = ("relaxed_order", "strict_order")
+
+
+@dataclass
+class EvidenceMatch:
+    """One evidence chunk returned by a similarity search."""
+
+    evidence_id: uuid.UUID
+    chunk_index: int
+    supplier_domain: str
+    source_type: str
+    collected_at: datetime
+    content: str
+    score: float  # cosine similarity, 1.0 = identical direction
+
+
+def evidence_chunks(content: str, dedup: TextDeduplicator) -> list[str]:
+    """Split evidence content into the novel chunks that are embedded."""
+    return pack_chunks(dedup.novel_paragraphs(content))
+
+
+async def embed_evidence(
+    session: AsyncSession,
+    evidence_ids: Sequence[uuid.UUID],
+    *,
+    dedup: TextDeduplicator | None = None,
+    embedder: BatchingEmbedder = embedder,
+) -> int:
+    """Embed evidence records that have no embeddings yet.
+
+    Runs in the caller's transaction; nothing is committed.
+
+    Args:
+        session: Database session.
+        evidence_ids: Evidence to embed; already embedded records are skipped.
+        dedup: Text already seen, e.g. ``load_supplier_history``; defaults
+            to deduplicating within these records only.
+        embedder: Embedder to use for new texts.
+
+    Returns:
+        Number of chunks stored.
+    """
+    dedup = dedup or TextDeduplicator()
+    embedded = select(EvidenceEmbedding.evidence_id).where(
+        EvidenceEmbedding.evidence_id.in_(evidence_ids)
+    )
+    result = await session.execute(
+        select(
+            Evidence.id,
+            Evidence.supplier_domain,
+            Evidence.source_type,
+            Evidence.collected_at,
+            Evidence.content,
+        ).where(Evidence.id.in_(list(set(evidence_ids))), Evidence.id.not_in(embedded))
+    )
+    rows: list[dict[str, Any]] = [
+        {
+            "id": uuid7(),
+            "evidence_id": evidence.id,
+            "chunk_index": index,
+            "supplier_domain": evidence.supplier_domain,
+            "source_type": evidence.source_type,
+            "collected_at": evidence.collected_at,
+            "content": chunk,
+            "content_hash": text_hash(chunk),
+            "embedding_model": settings.EMBEDDING_MODEL,
+        }
+        for evidence in result
+        for index, chunk in enumerate(evidence_chunks(evidence.content, dedup))
+    ]
+    if not rows:
+        logger.info("evidence_embedding_skipped", **dedup.stats())
+        return 0
+
+    vectors = await _stored_vectors(session, {row["content_hash"] for row in rows})
+    new_texts = {
+        row["content_hash"]: row["content"]
+        for row in rows
+        if row["content_hash"] not in vectors
+    }
+    if new_texts:
+        embedded_vectors = await embedder.embed(list(new_texts.values()))
+        vectors.update(zip(new_texts, embedded_vectors))
+
+    for row in rows:
+        row["embedding"] = vectors[row["content_hash"]]
+    # Keeps each statement under the asyncpg bind parameter limit
+    for start in range(0, len(rows), 1000):
+        await session.execute(
+            insert(_table)
+            .values(rows[start : start + 1000])
+            .on_conflict_do_nothing(constraint="uq_evidence_embeddings_chunk")
+        )
+    logger.info(
+        "evidence_embedded",
+        evidence=len({row["evidence_id"] for row in rows}),
+        chunks=len(rows),
+        reused=len(rows) - len(new_texts),
+        **dedup.stats(),
+    )
+    return len(rows)
+
+
+async def search_evidence(
+    session: AsyncSession,
+    query: str | Sequence[float],
+    *,
+    supplier_domain: str | None = None,
+    source_types: Sequence[str] = (),
+    collected_after: datetime | None = None,
+    limit: int = 10,
+    embedder: BatchingEmbedder = embedder,
+) -> list[EvidenceMatch]:
+    """Return the evidence chunks most similar to a query.
+
+    Args:
+        session: Database session (``get_read_db`` for endpoints).
+        query: Query text, or its embedding.
+        supplier_domain: Only search this supplier's evidence.
+        source_types: Only search these source types.
+        collected_after: Only search evidence collected after this time.
+        limit: Maximum number of matches.
+        embedder: Embedder for query text.
+
+    Returns:
+        Matches, most similar first.
+    """
+    if isinstance(query, str):
+        (vector,) = await embedder.embed([query])
+    else:
+        vector = list(query)
+
+    stmt = search_select(
+        vector,
+        supplier_domain=supplier_domain,
+        source_types=source_types,
+        collected_after=collected_after,
+        limit=limit,
+    )
+    if supplier_domain is None:
+        await session.execute(
+            text(f"SET LOCAL hnsw.ef_search = {int(settings.EMBEDDING_HNSW_EF_SEARCH)}")
+        )
+        mode = settings.EMBEDDING_HNSW_ITERATIVE_SCAN
+        if (source_types or collected_after) and mode in _ITERATIVE_SCAN_MODES:
+            await session.execute(text(f"SET LOCAL hnsw.iterative_scan = {mode}"))
+
+    result = await session.execute(stmt)
+    matches = [
+        EvidenceMatch(
+            evidence_id=row.evidence_id,
+            chunk_index=row.chunk_index,
+            supplier_domain=row.supplier_domain,
+            source_type=row.source_type,
+            collected_at=row.collected_at,
+            content=row.content,
+            score=1.0 - float(row.distance),
+        )
+        for row in result
+    ]
+    # A relaxed iterative scan may return rows slightly out of order
+    matches.sort(key=lambda match: match.score, reverse=True)
+    return matches
+
+
+def search_select(
+    vector: Sequence[float],
+    *,
+    supplier_domain: str | None = None,
+    source_types: Sequence[str] = (),
+    collected_after: datetime | None = None,
+    limit: int = 10,
+) -> Select[Any]:
+    """Build the similarity query for ``search_evidence``."""
+    columns = (
+        _table.c.evidence_id,
+        _table.c.chunk_index,
+        _table.c.supplier_domain,
+        _table.c.source_type,
+        _table.c.collected_at,
+        _table.c.content,
+    )
+    criteria: list[ColumnElement[bool]] = [_table.c.deleted_at.is_(None)]
+    if supplier_domain is not None:
+        criteria.append(_table.c.supplier_domain == supplier_domain)
+    if source_types:
+        criteria.append(_table.c.source_type.in_(source_types))
+    if collected_after is not None:
+        criteria.append(_table.c.collected_at > collected_after)
+
+    if supplier_domain is None:
+        distance = _table.c.embedding.cosine_distance(vector).label("distance")
+        return (
+            select(*columns, distance).where(*criteria).order_by(distance).limit(limit)
+        )
+
+    # Exact ranking of the supplier's chunks; MATERIALIZED keeps the planner
+    # from pushing the ORDER BY down to the HNSW index
+    candidates = (
+        select(*columns, _table.c.embedding)
+        .where(*criteria)
+        .cte("candidates")
+        .prefix_with("MATERIALIZED")
+    )
+    distance = candidates.c.embedding.cosine_distance(vector).label("distance")
+    return (
+        select(*(candidates.c[column.name] for column in columns), distance)
+        .order_by(distance)
+        .limit(limit)
+    )
+
+
+async def _stored_vectors(session: AsyncSession, hashes: set[str]) -> dict[str, Any]:
+    """Return stored embeddings of texts by content hash, for the current model."""
+    result = await session.execute(
+        select(_table.c.content_hash, _table.c.embedding)
+        .where(
+            _table.c.content_hash.in_(hashes),
+            _table.c.embedding_model == settings.EMBEDDING_MODEL,
+        )
+        .distinct(_table.c.content_hash)
+    )
+    return {row.content_hash: row.embedding for row in result}
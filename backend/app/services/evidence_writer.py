@@ -0,0 +1,390 @@
+"""Buffered bulk writer for evidence records.
+
+Assessments produce evidence in bursts of dozens to hundreds of rows, and
+bulk runs produce far more. Adding them one by one through the ORM costs a
+round trip and a flush per row; ``EvidenceWriter`` buffers rows and writes
+each batch with one statement:
+
+- ``copy`` (default): binary COPY into a per-connection temporary staging
+  table, then a single ``INSERT ... SELECT ... ON CONFLICT DO NOTHING``.
+- ``insert``: multi-row ``INSERT ... ON CONFLICT DO NOTHING``, chunked to
+  stay under the asyncpg bind parameter limit.
+
+Batches are written when EVIDENCE_BATCH_SIZE rows are buffered or the
+oldest buffered row is EVIDENCE_FLUSH_INTERVAL_SECONDS old, and on close.
+Evidence is unique per (assessment, content hash); a duplicate resolves to
+the id of the row already stored.
+
+Given a session, the writer joins its transaction (nothing is committed, a
+rollback discards the evidence) and the age trigger is checked on each
+``add``. Without one, every batch commits in its own session, a
+background timer flushes idle buffers, and a batch that fails to write
+stays buffered for the next flush.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any, cast
+from urllib.parse import urlsplit
+
+from sqlalchemy import Table, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.agents.state import AssessmentState
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.db.session import async_session_maker
+from app.models.base import uuid7
+from app.models.evidence import Evidence
+
+logger = get_logger(__name__)
+
+WRITE_METHODS = ("copy", "insert")
+
+_table = cast(Table, Evidence.__table__)
+# Columns written by the application; the rest come from table defaults
+_COLUMNS = (
+    "id",
+    "assessment_id",
+    "supplier_domain",
+    "source_url",
+    "source_type",
+    "title",
+    "content",
+    "content_hash",
+    "collector_tool",
+    "collected_at",
+    "reliability",
+    "recency",
+    "relevance_score",
+    "risk_categories",
+)
+_STAGING_TABLE = "evidence_staging"
+# asyncpg accepts at most 32767 bind parameters per statement
+_MAX_INSERT_ROWS = 32767 // len(_COLUMNS)
+
+_Key = tuple[uuid.UUID, str]
+
+
+def content_hash(content: str) -> str:
+    """Return the SHA-256 of whitespace-normalized content."""
+    return hashlib.sha256(" ".join(content.split()).encode()).hexdigest()
+
+
+class EvidenceWriter:
+    """Buffer evidence rows and write them in batches.
+
+    Usage:
+        async with EvidenceWriter(session) as writer:
+            for item in collected:
+                await writer.add(**item)
+        evidence_ids = writer.ids
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession | None = None,
+        *,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        method: str | None = None,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+    ) -> None:
+        self.session = session
+        self.session_maker = session_maker
+        self.batch_size = batch_size or settings.EVIDENCE_BATCH_SIZE
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else settings.EVIDENCE_FLUSH_INTERVAL_SECONDS
+        )
+        self.method = method or settings.EVIDENCE_WRITE_METHOD
+        if self.method not in WRITE_METHODS:
+            raise ValueError(f"Unknown evidence write method: {self.method}")
+        # Ids of every row added, in add order, once their batch is written
+        self.ids: list[uuid.UUID] = []
+        self._buffer: dict[_Key, dict[str, Any]] = {}
+        self._order: list[_Key] = []
+        self._oldest: float | None = None
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.Task[None] | None = None
+        self._rows_written = 0
+        self._duplicates = 0
+        self._batches = 0
+        self._write_ms = 0.0
+
+    async def __aenter__(self) -> "EvidenceWriter":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            await self.close()
+        else:
+            await self.discard()
+
+    async def add(self, **fields: Any) -> None:
+        """Buffer one evidence row, writing the batch if a trigger fires.
+
+        Args:
+            **fields: Evidence columns. ``assessment_id``, ``source_url``,
+                ``source_type``, ``content`` and ``collector_tool`` are
+                required; the supplier domain, content hash, collection time
+                and id are filled in when missing.
+        """
+        row = _prepare(fields)
+        key = (row["assessment_id"], row["content_hash"])
+        self._order.append(key)
+        if key not in self._buffer:
+            self._buffer[key] = row
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+            if self.session is None and self._timer is None and self.flush_interval:
+                self._timer = asyncio.create_task(self._flush_periodically())
+        if len(self._buffer) >= self.batch_size or self._due():
+            await self.flush()
+
+    async def add_many(self, rows: Iterable[dict[str, Any]]) -> None:
+        """Buffer several evidence rows."""
+        for fields in rows:
+            await self.add(**fields)
+
+    async def flush(self) -> list[uuid.UUID]:
+        """Write the buffered rows.
+
+        Returns:
+            Ids of the rows added since the previous flush, in add order.
+        """
+        async with self._lock:
+            if not self._order:
+                return []
+            buffer, order, oldest = self._buffer, self._order, self._oldest
+            self._buffer, self._order, self._oldest = {}, [], None
+
+            started = time.perf_counter()
+            if self.session is not None:
+                resolved = await self._write(self.session, list(buffer.values()))
+            else:
+                try:
+                    async with self.session_maker() as session:
+                        resolved = await self._write(session, list(buffer.values()))
+                        await session.commit()
+                except Exception:
+                    # Keep the batch, with any rows added meanwhile, for the
+                    # next flush instead of losing it
+                    self._buffer = {**self._buffer, **buffer}
+                    self._order = order + self._order
+                    self._oldest = oldest
+                    raise
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            ids = [resolved[key] for key in order]
+            self.ids.extend(ids)
+            self._batches += 1
+            self._write_ms += elapsed_ms
+            logger.debug(
+                "evidence_batch_written",
+                rows=len(buffer),
+                method=self.method,
+                write_ms=round(elapsed_ms, 1),
+            )
+            return ids
+
+    async def close(self) -> list[uuid.UUID]:
+        """Write anything still buffered and stop the flush timer.
+
+        Returns:
+            Ids of every row added, in add order.
+        """
+        self._stop_timer()
+        await self.flush()
+        return self.ids
+
+    async def discard(self) -> None:
+        """Drop buffered rows without writing them and stop the flush timer."""
+        self._stop_timer()
+        self._buffer, self._order, self._oldest = {}, [], None
+
+    def stats(self) -> dict[str, Any]:
+        """Return write counters for logging and benchmarks."""
+        return {
+            "method": self.method,
+            "rows_written": self._rows_written,
+            "duplicates": self._duplicates,
+            "batches": self._batches,
+            "write_ms": round(self._write_ms, 1),
+            "buffered": len(self._buffer),
+        }
+
+    def _due(self) -> bool:
+        return (
+            self._oldest is not None
+            and time.monotonic() - self._oldest >= self.flush_interval
+        )
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._due():
+                try:
+                    await self.flush()
+                except Exception as e:
+                    logger.error("evidence_flush_failed", error=str(e))
+
+    def _stop_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def _write(
+        self, session: AsyncSession, rows: list[dict[str, Any]]
+    ) -> dict[_Key, uuid.UUID]:
+        if self.method == "copy":
+            inserted = await self._copy(session, rows)
+        else:
+            inserted = {}
+            for start in range(0, len(rows), _MAX_INSERT_ROWS):
+                inserted.update(
+                    await self._insert(session, rows[start : start + _MAX_INSERT_ROWS])
+                )
+        self._rows_written += len(inserted)
+
+        missing = [
+            (row["assessment_id"], row["content_hash"])
+            for row in rows
+            if (row["assessment_id"], row["content_hash"]) not in inserted
+        ]
+        if missing:
+            self._duplicates += len(missing)
+            inserted.update(await self._existing_ids(session, missing))
+        return inserted
+
+    async def _insert(
+        self, session: AsyncSession, rows: list[dict[str, Any]]
+    ) -> dict[_Key, uuid.UUID]:
+        stmt = (
+            insert(_table)
+            .values(rows)
+            .on_conflict_do_nothing(constraint="uq_evidence_assessment_content")
+            .returning(_table.c.id, _table.c.assessment_id, _table.c.content_hash)
+        )
+        result = await session.execute(stmt)
+        return {(r.assessment_id, r.content_hash): r.id for r in result}
+
+    async def _copy(
+        self, session: AsyncSession, rows: list[dict[str, Any]]
+    ) -> dict[_Key, uuid.UUID]:
+        conn = await session.connection()
+        await conn.execute(
+            text(
+                f"CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} "
+                "(LIKE evidence INCLUDING DEFAULTS)"
+            )
+        )
+        raw = await conn.get_raw_connection()
+        assert raw.driver_connection is not None
+        await raw.driver_connection.copy_records_to_table(
+            _STAGING_TABLE,
+            records=[
+                tuple(
+                    json.dumps(row[c]) if c == "risk_categories" else row[c]
+                    for c in _COLUMNS
+                )
+                for row in rows
+            ],
+            columns=list(_COLUMNS),
+        )
+        columns = ", ".join(_COLUMNS)
+        result = await conn.execute(
+            text(
+                f"INSERT INTO evidence ({columns}) "
+                f"SELECT {columns} FROM {_STAGING_TABLE} "
+                "ON CONFLICT ON CONSTRAINT uq_evidence_assessment_content DO NOTHING "
+                "RETURNING id, assessment_id, content_hash"
+            )
+        )
+        inserted = {(r.assessment_id, r.content_hash): r.id for r in result}
+        await conn.execute(text(f"TRUNCATE {_STAGING_TABLE}"))
+        return inserted
+
+    async def _existing_ids(
+        self, session: AsyncSession, keys: list[_Key]
+    ) -> dict[_Key, uuid.UUID]:
+        stmt = select(_table.c.id, _table.c.assessment_id, _table.c.content_hash).where(
+            tuple_(_table.c.assessment_id, _table.c.content_hash).in_(keys)
+        )
+        result = await session.execute(stmt)
+        return {(r.assessment_id, r.content_hash): r.id for r in result}
+
+
+def _prepare(fields: dict[str, Any]) -> dict[str, Any]:
+    """Fill in derived columns and check the row has every required one."""
+    row = {column: fields.get(column) for column in _COLUMNS}
+    unknown = set(fields) - set(_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown evidence fields: {', '.join(sorted(unknown))}")
+    row["assessment_id"] = uuid.UUID(str(row["assessment_id"]))
+    row["id"] = row["id"] or uuid7()
+    row["title"] = row["title"] or ""
+    row["content_hash"] = row["content_hash"] or content_hash(row["content"] or "")
+    row["supplier_domain"] = row["supplier_domain"] or (
+        (urlsplit(row["source_url"] or "").hostname or "").removeprefix("www.")
+    )
+    row["collected_at"] = row["collected_at"] or datetime.now(timezone.utc)
+    row["risk_categories"] = list(row["risk_categories"] or [])
+    missing = [
+        column
+        for column in ("source_url", "source_type", "content", "collector_tool")
+        if not row[column]
+    ]
+    if missing:
+        raise ValueError(f"Evidence is missing: {', '.join(missing)}")
+    return row
+
+
+def collected_evidence(state: AssessmentState) -> list[dict[str, Any]]:
+    """Build evidence rows from the pages an assessment run collected."""
+    assessment_id = state.get("assessment_id")
+    if not assessment_id:
+        return []
+    rows = []
+    corporate = state.get("corporate_info") or {}
+    pages = (
+        ("main_page_content", corporate.get("website") or state["supplier_url"]),
+        ("about_page_content", corporate.get("about_page_url")),
+    )
+    for key, source_url in pages:
+        if corporate.get(key) and source_url:
+            rows.append(
+                {
+                    "assessment_id": assessment_id,
+                    "source_url": source_url,
+                    "source_type": "website",
+                    "title": corporate.get("title") or "",
+                    "content": corporate[key],
+                    "collector_tool": "collect_corporate",
+                }
+            )
+    for page in (state.get("esg_info") or {}).get("pages", []):
+        if page.get("content"):
+            rows.append(
+                {
+                    "assessment_id": assessment_id,
+                    "source_url": page["url"],
+                    "source_type": "esg",
+                    "title": page.get("title") or "",
+                    "content": page["content"],
+                    "collector_tool": "collect_esg",
+                }
+            )
+    supplier_domain = (urlsplit(state["supplier_url"]).hostname or "").removeprefix(
+        "www."
+    )
+    for row in rows:
+        row["supplier_domain"] = supplier_domain
+    return rows
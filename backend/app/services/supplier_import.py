@@ -0,0 +1,199 @@
+"""Streaming parsers for uploaded supplier lists.
+
+Supplier lists can hold thousands of rows, so they are parsed as the bytes
+arrive instead of being loaded whole. Supported formats are CSV (with a
+header row), NDJSON (one object per line) and a JSON array of objects. Each
+row needs a website in one of the ``URL_FIELDS`` columns; ``name`` and
+``country`` are optional.
+"""
+
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+from urllib.parse import urlsplit
+
+URL_FIELDS = ("url", "website", "supplier_url", "domain")
+# A JSON record that still doesn't parse after this many characters is broken
+_MAX_RECORD_CHARS = 64 * 1024
+
+
+class SupplierImportError(ValueError):
+    """Raised when an upload cannot be parsed any further."""
+
+
+class ImportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+    JSON = "json"
+
+
+_CONTENT_TYPES = {
+    "text/csv": ImportFormat.CSV,
+    "application/csv": ImportFormat.CSV,
+    "application/x-ndjson": ImportFormat.NDJSON,
+    "application/jsonl": ImportFormat.NDJSON,
+    "application/json": ImportFormat.JSON,
+}
+
+
+@dataclass(frozen=True)
+class SupplierRow:
+    """One supplier from an upload; ``domain`` is None if the row is invalid."""
+
+    url: str
+    domain: str | None
+    name: str = ""
+    country: str = ""
+
+
+def format_for_content_type(content_type: str) -> ImportFormat | None:
+    """Map a Content-Type header to an import format."""
+    return _CONTENT_TYPES.get(content_type.split(";")[0].strip().lower())
+
+
+def normalize_domain(url: str) -> str | None:
+    """Return the lowercase host of a URL without ``www.``, or None if invalid."""
+    url = url.strip()
+    if not url:
+        return None
+    if "://" not in url:
+        url = f"https://{url}"
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        return None
+    if not host or "." not in host:
+        return None
+    return host.removeprefix("www.")
+
+
+def to_row(record: dict[str, Any]) -> SupplierRow:
+    """Build a supplier row from a parsed record."""
+    fields = {str(k).strip().lower(): v for k, v in record.items() if k is not None}
+    url = next((str(fields[f]).strip() for f in URL_FIELDS if fields.get(f)), "")
+    if url and "://" not in url:
+        url = f"https://{url}"
+    return SupplierRow(
+        url=url,
+        domain=normalize_domain(url),
+        name=str(fields.get("name") or "").strip(),
+        country=str(fields.get("country") or "").strip(),
+    )
+
+
+async def parse_suppliers(
+    chunks: AsyncIterator[bytes], import_format: ImportFormat
+) -> AsyncIterator[SupplierRow]:
+    """Yield supplier rows from a byte stream as soon as each row is complete.
+
+    Raises:
+        SupplierImportError: If the stream is malformed beyond a single row.
+    """
+    parser = {
+        ImportFormat.CSV: _parse_csv,
+        ImportFormat.NDJSON: _parse_ndjson,
+        ImportFormat.JSON: _parse_json_array,
+    }[import_format]
+    async for record in parser(_iter_text(chunks)):
+        yield to_row(record)
+
+
+async def _iter_text(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode UTF-8 (with or without BOM) across chunk boundaries."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    try:
+        async for chunk in chunks:
+            if text := decoder.decode(chunk):
+                yield text
+        if text := decoder.decode(b"", final=True):
+            yield text
+    except UnicodeDecodeError as e:
+        raise SupplierImportError("Upload is not valid UTF-8") from e
+
+
+async def _iter_lines(texts: AsyncIterator[str]) -> AsyncIterator[str]:
+    buffer = ""
+    async for text in texts:
+        buffer += text
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def _parse_csv(texts: AsyncIterator[str]) -> AsyncIterator[dict[str, Any]]:
+    header: list[str] | None = None
+    record = ""
+    async for line in _iter_lines(texts):
+        record = f"{record}\n{line}" if record else line
+        # An odd number of quotes means a quoted field continues on the next line
+        if record.count('"') % 2:
+            continue
+        values, record = next(csv.reader([record]), []), ""
+        if not values or not any(v.strip() for v in values):
+            continue
+        if header is None:
+            header = [v.strip().lower() for v in values]
+            if not set(header) & set(URL_FIELDS):
+                raise SupplierImportError(
+                    f"CSV header needs one of the columns: {', '.join(URL_FIELDS)}"
+                )
+            continue
+        yield dict(zip(header, values))
+    if record:
+        raise SupplierImportError("CSV ends inside a quoted field")
+
+
+async def _parse_ndjson(texts: AsyncIterator[str]) -> AsyncIterator[dict[str, Any]]:
+    async for line in _iter_lines(texts):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            record = {}  # counted as an invalid row
+        yield record if isinstance(record, dict) else {}
+
+
+async def _parse_json_array(
+    texts: AsyncIterator[str],
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield the objects of a top-level JSON array without loading it whole."""
+    decoder = json.JSONDecoder()
+    buffer, pos, started, finished = "", 0, False, False
+    async for text in texts:
+        buffer = buffer[pos:] + text
+        pos = 0
+        while not finished:
+            pos = _skip_separators(buffer, pos)
+            if pos >= len(buffer):
+                break
+            if not started:
+                if buffer[pos] != "[":
+                    raise SupplierImportError("JSON upload must be an array")
+                started, pos = True, pos + 1
+                continue
+            if buffer[pos] == "]":
+                finished = True
+                break
+            try:
+                record, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if len(buffer) - pos > _MAX_RECORD_CHARS:
+                    raise SupplierImportError(f"Malformed JSON record: {e}") from e
+                break  # incomplete object; wait for more data
+            pos = end
+            yield record if isinstance(record, dict) else {}
+    if not finished:
+        raise SupplierImportError("JSON upload is truncated or malformed")
+
+
+def _skip_separators(buffer: str, pos: int) -> int:
+    while pos < len(buffer) and (buffer[pos].isspace() or buffer[pos] == ","):
+        pos += 1
+    return pos
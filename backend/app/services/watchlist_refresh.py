@@ -0,0 +1,185 @@
+"""Watchlist refresh and re-screening of affected suppliers.
+
+Every worker process refreshes its own in-memory screening index every
+SCREENING_REFRESH_INTERVAL_SECONDS (see ``ScreeningEngine.refresh``). When
+a list changes, only the suppliers the change can affect are re-screened,
+as ARQ jobs on the bulk queue:
+
+- suppliers whose last screening matched a removed (or edited) entry;
+- suppliers whose screened names match one of the added entries, found by
+  screening every recorded supplier name against an index of just the
+  added entries.
+
+Each supplier's last screening (names and matched entries) is recorded in
+the Redis hash ``screening:suppliers``. The last list version handled is
+kept in ``screening:list_version:{list}``; the process that moves it to a
+new version enqueues the re-screens, and the others skip them. If that
+process did not hold the previous version (it started after the change),
+it cannot compute the delta and re-screens every recorded supplier.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import Any
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.redis import redis_pool
+from app.screening import ScreeningIndex, WatchlistDelta, entry_key, screening_engine
+from app.workers.queue import enqueue_rescreen
+
+logger = get_logger(__name__)
+
+_SUPPLIERS_KEY = "screening:suppliers"
+_LIST_VERSION_PREFIX = "screening:list_version:"
+
+
+async def record_screening(
+    supplier_domain: str, supplier_url: str, screening: dict[str, Any]
+) -> None:
+    """Save a supplier's screening result for later re-screening.
+
+    Redis errors are logged.
+    """
+    record = {
+        "url": supplier_url,
+        "names": screening["names"],
+        "matches": [match["key"] for match in screening["matches"]],
+        "screened_at": datetime.now(timezone.utc).isoformat(),
+    }
+    client = redis.Redis(connection_pool=redis_pool)
+    try:
+        # redis-py annotates hash commands as returning sync | async results
+        await client.hset(  # type: ignore[misc]
+            _SUPPLIERS_KEY, supplier_domain, json.dumps(record)
+        )
+    except Exception as e:
+        logger.warning("screening_record_failed", error=str(e))
+    finally:
+        await client.aclose()
+
+
+async def screened_supplier(supplier_domain: str) -> dict[str, Any] | None:
+    """Return a supplier's recorded screening, or None if there is none."""
+    client = redis.Redis(connection_pool=redis_pool)
+    try:
+        raw = await client.hget(_SUPPLIERS_KEY, supplier_domain)  # type: ignore[misc]
+    finally:
+        await client.aclose()
+    return json.loads(raw) if raw else None
+
+
+async def screened_suppliers() -> dict[str, dict[str, Any]]:
+    """Return every recorded supplier screening, keyed by domain."""
+    client = redis.Redis(connection_pool=redis_pool)
+    try:
+        return {
+            domain: json.loads(raw)
+            async for domain, raw in client.hscan_iter(_SUPPLIERS_KEY, count=1000)
+        }
+    finally:
+        await client.aclose()
+
+
+async def claim_version(delta: WatchlistDelta) -> str | None | bool:
+    """Record ``delta.version`` as handled, returning the version it replaces.
+
+    Returns:
+        False if another process already handled this version, otherwise
+        the previously handled version (None if there was none).
+    """
+    client = redis.Redis(connection_pool=redis_pool)
+    try:
+        previous = await client.set(
+            _LIST_VERSION_PREFIX + delta.list_name, delta.version, get=True
+        )
+    finally:
+        await client.aclose()
+    return False if previous == delta.version else previous
+
+
+def affected_suppliers(
+    delta: WatchlistDelta, suppliers: dict[str, dict[str, Any]]
+) -> set[str]:
+    """Return the domains of suppliers whose screening ``delta`` may change."""
+    removed = {entry_key(entry) for entry in delta.removed}
+    affected = {
+        domain
+        for domain, record in suppliers.items()
+        if removed.intersection(record["matches"])
+    }
+    if delta.added:
+        added = ScreeningIndex.build(delta.added)
+        domains = [domain for domain in suppliers if domain not in affected]
+        names = [suppliers[domain]["names"] for domain in domains]
+        results = added.screen_many([name for group in names for name in group])
+        position = 0
+        for domain, group in zip(domains, names):
+            if any(results[position : position + len(group)]):
+                affected.add(domain)
+            position += len(group)
+    return affected
+
+
+async def rescreen_affected(deltas: list[WatchlistDelta]) -> int:
+    """Queue re-screening of the suppliers affected by list changes.
+
+    Args:
+        deltas: Changes from a refresh of the screening engine.
+
+    Returns:
+        Number of suppliers queued.
+    """
+    claimed = []
+    for delta in deltas:
+        previous = await claim_version(delta)
+        if previous is not False:
+            claimed.append((delta, previous))
+    if not claimed:
+        return 0
+
+    suppliers = await screened_suppliers()
+    affected: set[str] = set()
+    for delta, previous in claimed:
+        if delta.previous_version is None or previous != delta.previous_version:
+            affected.update(suppliers)
+        else:
+            affected |= await asyncio.to_thread(affected_suppliers, delta, suppliers)
+
+    versions = dict(screening_engine.versions)
+    for domain in sorted(affected):
+        await enqueue_rescreen(domain, versions)
+    logger.info(
+        "watchlist_rescreen_queued",
+        lists=[delta.list_name for delta, _ in claimed],
+        suppliers=len(affected),
+        recorded=len(suppliers),
+    )
+    return len(affected)
+
+
+async def refresh_watchlists() -> int:
+    """Refresh the screening engine and queue the affected re-screens.
+
+    Returns:
+        Number of suppliers queued for re-screening.
+    """
+    deltas = await screening_engine.refresh()
+    return await rescreen_affected(deltas) if deltas else 0
+
+
+async def refresh_loop() -> None:
+    """Refresh the watchlists every SCREENING_REFRESH_INTERVAL_SECONDS.
+
+    Runs until cancelled; failed refreshes are logged and retried at the
+    next interval.
+    """
+    while True:
+        await asyncio.sleep(settings.SCREENING_REFRESH_INTERVAL_SECONDS)
+        try:
+            await refresh_watchlists()
+        except Exception as e:
+            logger.warning("watchlist_refresh_failed", error=str(e))
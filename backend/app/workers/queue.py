@@ -0,0 +1,94 @@
+"""Assessment job queues.
+
+Interactive assessments and bulk re-screening run on separate ARQ queues
+served by separate worker pools, so a large re-screen never delays a user
+waiting on a single assessment. Watchlist re-screens after a list change
+also run on the bulk pool.
+"""
+
+import hashlib
+import json
+import uuid
+from enum import StrEnum
+
+from app.core.logging import get_logger
+from app.core.redis import job_queue
+
+logger = get_logger(__name__)
+
+
+class JobPriority(StrEnum):
+    """Which worker pool runs a job."""
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
+
+
+QUEUE_NAMES = {
+    JobPriority.INTERACTIVE: "arq:queue:interactive",
+    JobPriority.BULK: "arq:queue:bulk",
+}
+
+
+def assessment_job_id(assessment_id: str) -> str:
+    """Return the ARQ job id used for an assessment."""
+    return f"assessment:{assessment_id}"
+
+
+async def enqueue_assessment(
+    supplier_url: str,
+    assessment_id: str | None = None,
+    priority: JobPriority = JobPriority.INTERACTIVE,
+    batch_id: str | None = None,
+) -> str:
+    """Queue an assessment of a supplier website.
+
+    The job id is derived from the assessment id, so queueing the same
+    assessment twice while it is pending or its result is kept is a no-op.
+
+    Args:
+        supplier_url: Supplier website to assess.
+        assessment_id: Existing assessment id; a new one is generated if None.
+        priority: Worker pool to run the job on.
+        batch_id: Bulk batch whose progress counters the outcome is added to.
+
+    Returns:
+        The assessment id, which also names its progress event channel.
+    """
+    assessment_id = assessment_id or str(uuid.uuid4())
+    job = await job_queue.enqueue_job(
+        "run_assessment",
+        assessment_id,
+        supplier_url,
+        batch_id,
+        _job_id=assessment_job_id(assessment_id),
+        _queue_name=QUEUE_NAMES[priority],
+    )
+    if job is None:
+        logger.info("assessment_already_queued", assessment_id=assessment_id)
+    else:
+        logger.info(
+            "assessment_queued", assessment_id=assessment_id, priority=priority.value
+        )
+    return assessment_id
+
+
+async def enqueue_rescreen(supplier_domain: str, list_versions: dict[str, str]) -> None:
+    """Queue a watchlist re-screen of a supplier on the bulk pool.
+
+    The job id includes the list versions, so processes that notice the
+    same list change queue one job per supplier.
+
+    Args:
+        supplier_domain: Supplier to re-screen.
+        list_versions: Versions the re-screen must run against.
+    """
+    versions = json.dumps(list_versions, sort_keys=True).encode()
+    digest = hashlib.blake2b(versions, digest_size=8).hexdigest()
+    await job_queue.enqueue_job(
+        "rescreen_supplier",
+        supplier_domain,
+        list_versions,
+        _job_id=f"rescreen:{supplier_domain}:{digest}",
+        _queue_name=QUEUE_NAMES[JobPriority.BULK],
+    )
@@ -0,0 +1,259 @@
+"""ARQ task definitions."""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from arq import Retry
+
+from app.agents.checkpointer import checkpointer
+from app.agents.state import AssessmentState
+from app.agents.tools.text_dedup import load_supplier_history, save_supplier_history
+from app.agents.workflow import run_workflow
+from app.core.config import settings
+from app.core.events import EventPublisher
+from app.core.llm_cache import llm_cache
+from app.core.logging import get_logger
+from app.db.session import async_session_maker
+from app.db.soft_delete import purge_deleted, soft_delete_models
+from app.screening import best_matches, entry_key, screening_engine
+from app.services.bulk_assessment_service import record_batch_outcome
+from app.services.evidence_search import embed_evidence
+from app.services.evidence_writer import EvidenceWriter, collected_evidence
+from app.services.supplier_import import normalize_domain
+from app.services.watchlist_refresh import (
+    record_screening,
+    refresh_watchlists,
+    screened_supplier,
+)
+
+logger = get_logger(__name__)
+
+
+def retry_delay(job_try: int) -> int:
+    """Seconds to wait before retrying after failed attempt ``job_try``."""
+    delay = int(settings.WORKER_RETRY_BACKOFF_SECONDS * 2 ** (job_try - 1))
+    return min(delay, settings.WORKER_RETRY_BACKOFF_MAX_SECONDS)
+
+
+async def run_assessment(
+    ctx: dict[str, Any],
+    assessment_id: str,
+    supplier_url: str,
+    batch_id: str | None = None,
+) -> dict[str, Any]:
+    """Run the assessment workflow for one supplier.
+
+    Failed attempts (including timeouts) are retried with exponential
+    backoff up to WORKER_MAX_TRIES; the final outcome is published as a
+    completed or failed event. Jobs cancelled by a worker shutdown are
+    re-queued by ARQ. With CHECKPOINT_ENABLED each attempt resumes from the
+    last node the previous one completed. Pages collected by a successful
+    run are stored as evidence (and embedded with EMBEDDING_ENABLED), and
+    its watchlist screening is recorded for re-screening on list changes. Jobs
+    from a bulk upload add their final outcome to the batch's progress
+    counters.
+
+    Args:
+        ctx: ARQ job context.
+        assessment_id: Assessment id, used for progress events.
+        supplier_url: Supplier website to assess.
+        batch_id: Bulk batch the assessment belongs to, if any.
+
+    Returns:
+        Summary, report, errors and node timings of the run.
+
+    Raises:
+        Retry: If the attempt failed and tries remain.
+    """
+    job_try = ctx.get("job_try", 1)
+    publisher = EventPublisher(assessment_id)
+    logger.info("assessment_started", assessment_id=assessment_id, job_try=job_try)
+
+    try:
+        async with asyncio.timeout(settings.WORKER_JOB_TIMEOUT_SECONDS):
+            final_state = await run_workflow(
+                supplier_url,
+                assessment_id,
+                checkpointer if settings.CHECKPOINT_ENABLED else None,
+            )
+    except Exception as e:
+        error = str(e) or type(e).__name__
+        if job_try < settings.WORKER_MAX_TRIES:
+            delay = retry_delay(job_try)
+            logger.warning(
+                "assessment_retrying",
+                assessment_id=assessment_id,
+                job_try=job_try,
+                retry_in_seconds=delay,
+                error=error,
+            )
+            await publisher.emit(
+                "retrying", attempt=job_try, retry_in_seconds=delay, error=error
+            )
+            raise Retry(defer=delay) from e
+        logger.error("assessment_failed", assessment_id=assessment_id, error=error)
+        await publisher.emit("failed", attempts=job_try, error=error)
+        if batch_id:
+            await record_batch_outcome(batch_id, "failed")
+        raise
+
+    result = {
+        "assessment_id": assessment_id,
+        "summary": final_state.get("processed_summary", ""),
+        "report": final_state.get("report", ""),
+        "errors": final_state.get("errors", []),
+        "node_timings": final_state.get("node_timings", {}),
+    }
+    await _store_evidence(final_state)
+    await _record_screening(final_state)
+    await publisher.emit(
+        "completed", summary=result["summary"], errors=result["errors"]
+    )
+    if settings.CHECKPOINT_ENABLED:
+        await _compact_checkpoints(assessment_id)
+    if batch_id:
+        await record_batch_outcome(batch_id, "completed")
+    logger.info("assessment_completed", assessment_id=assessment_id)
+    return result
+
+
+async def rescreen_supplier(
+    ctx: dict[str, Any], supplier_domain: str, list_versions: dict[str, str]
+) -> dict[str, Any]:
+    """Screen a supplier's recorded names again after a watchlist change.
+
+    The worker's lists are refreshed first if they are older than
+    ``list_versions``.
+
+    Args:
+        ctx: ARQ job context.
+        supplier_domain: Supplier to re-screen.
+        list_versions: List versions the change was detected at.
+
+    Returns:
+        Entry keys of the new matches, and those added and removed.
+    """
+    if any(
+        screening_engine.versions.get(name) != version
+        for name, version in list_versions.items()
+    ):
+        await refresh_watchlists()
+    record = await screened_supplier(supplier_domain)
+    if record is None:
+        return {"supplier_domain": supplier_domain, "matches": []}
+
+    matches = best_matches(await screening_engine.screen_many(record["names"]))
+    screening = {
+        "names": record["names"],
+        "matches": [match.as_dict() for match in matches],
+    }
+    await record_screening(supplier_domain, record["url"], screening)
+    keys = [entry_key(match.entry) for match in matches]
+    added = sorted(set(keys).difference(record["matches"]))
+    removed = sorted(set(record["matches"]).difference(keys))
+    if added or removed:
+        logger.warning(
+            "watchlist_screening_changed",
+            supplier_domain=supplier_domain,
+            added=added,
+            removed=removed,
+        )
+    return {
+        "supplier_domain": supplier_domain,
+        "matches": keys,
+        "added": added,
+        "removed": removed,
+    }
+
+
+async def prune_checkpoints(ctx: dict[str, Any]) -> int:
+    """Cron task: purge checkpoints of assessments idle past retention."""
+    removed = await checkpointer.purge_expired()
+    logger.info("checkpoints_pruned", threads=removed, write_stats=checkpointer.stats())
+    return removed
+
+
+async def purge_soft_deleted(ctx: dict[str, Any]) -> int:
+    """Cron task: hard-delete rows soft-deleted longer than the retention."""
+    cutoff = datetime.now(timezone.utc) - timedelta(
+        days=settings.SOFT_DELETE_RETENTION_DAYS
+    )
+    removed = 0
+    for model in soft_delete_models():
+        removed += await purge_deleted(
+            async_session_maker,
+            model,
+            cutoff,
+            settings.SOFT_DELETE_PURGE_BATCH_SIZE,
+        )
+    logger.info("soft_delete_purge_finished", rows=removed)
+    return removed
+
+
+async def purge_llm_cache(ctx: dict[str, Any]) -> int:
+    """Cron task: delete LLM cache entries past LLM_CACHE_DB_TTL_DAYS."""
+    if not llm_cache.db_enabled:
+        return 0
+    removed = await llm_cache.purge_expired()
+    logger.info("llm_cache_purged", rows=removed, cache_stats=llm_cache.stats())
+    return removed
+
+
+async def _compact_checkpoints(assessment_id: str) -> None:
+    """Keep only the final checkpoint of a finished assessment."""
+    try:
+        await checkpointer.aprune([assessment_id], strategy="keep_latest")
+    except Exception as e:
+        logger.warning(
+            "checkpoint_compaction_failed", assessment_id=assessment_id, error=str(e)
+        )
+
+
+async def _store_evidence(final_state: AssessmentState) -> None:
+    """Persist collected evidence, then embed it in a separate transaction.
+
+    The evidence is committed first, so an embedding failure (e.g. a
+    provider outage) cannot roll it back.
+    """
+    assessment_id = final_state.get("assessment_id")
+    rows = collected_evidence(final_state)
+    if not rows:
+        return
+    try:
+        async with async_session_maker() as session:
+            async with EvidenceWriter(session) as writer:
+                await writer.add_many(rows)
+            await session.commit()
+    except Exception as e:
+        logger.warning(
+            "evidence_store_failed", assessment_id=assessment_id, error=str(e)
+        )
+        return
+    if settings.EMBEDDING_ENABLED:
+        await _embed_evidence(rows[0]["supplier_domain"], writer.ids, assessment_id)
+
+
+async def _embed_evidence(
+    supplier_domain: str, evidence_ids: list[uuid.UUID], assessment_id: str | None
+) -> None:
+    """Embed stored evidence; failures are logged and leave it unembedded."""
+    try:
+        history = await load_supplier_history(supplier_domain)
+        async with async_session_maker() as session:
+            await embed_evidence(session, evidence_ids, dedup=history)
+            await session.commit()
+        await save_supplier_history(supplier_domain, history)
+    except Exception as e:
+        logger.warning(
+            "evidence_embedding_failed", assessment_id=assessment_id, error=str(e)
+        )
+
+
+async def _record_screening(final_state: AssessmentState) -> None:
+    """Record the run's watchlist screening so list changes can re-screen it."""
+    screening = final_state.get("screening") or {}
+    supplier_domain = normalize_domain(final_state.get("supplier_url", ""))
+    if screening.get("checked") and supplier_domain:
+        await record_screening(supplier_domain, final_state["supplier_url"], screening)
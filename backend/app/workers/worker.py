@@ -0,0 +1,115 @@
+"""ARQ worker entry points.
+
+Run one worker process per queue:
+    arq app.workers.worker.WorkerSettings      # interactive assessments
+    arq app.workers.worker.BulkWorkerSettings  # bulk re-screening
+
+On SIGTERM a worker stops taking jobs and gives running ones
+WORKER_DRAIN_SECONDS to finish; jobs still running after that are
+cancelled and re-queued.
+"""
+
+import asyncio
+from typing import Any
+
+from arq import cron, func
+from arq.connections import RedisSettings
+
+from app.agents.tools.browser_pool import browser_pool
+from app.agents.tools.http_fetcher import tiered_fetcher
+from app.core.config import settings
+from app.core.llm import close_llm_clients
+from app.core.logging import configure_logging, get_logger
+from app.core.redis import job_queue
+from app.core.storage import storage_client
+from app.db.session import close_db, pool_stats
+from app.services.watchlist_refresh import refresh_loop, refresh_watchlists
+from app.workers.queue import QUEUE_NAMES, JobPriority
+from app.workers.tasks import (
+    prune_checkpoints,
+    purge_llm_cache,
+    purge_soft_deleted,
+    rescreen_supplier,
+    run_assessment,
+)
+
+logger = get_logger(__name__)
+
+# Workflow timeout is enforced inside the task so failures can be retried
+# and reported; ARQ's own timeout is only a backstop.
+_JOB_TIMEOUT_GRACE_SECONDS = 60
+
+FUNCTIONS = [
+    func(run_assessment, max_tries=settings.WORKER_MAX_TRIES),
+    func(rescreen_supplier, max_tries=settings.WORKER_MAX_TRIES),
+]
+
+
+async def startup(ctx: dict[str, Any]) -> None:
+    """Warm shared resources before taking jobs."""
+    configure_logging()
+    await storage_client.start()
+    try:
+        await browser_pool.start()
+    except Exception as e:
+        # Most pages are served by the HTTP tier; the pool retries on first use
+        logger.warning("browser_pool_warmup_failed", error=str(e))
+    if settings.SCREENING_LIST_DIR or settings.SCREENING_LIST_PREFIX:
+        try:
+            await refresh_watchlists()
+        except Exception as e:
+            # Assessments still run; their reports say screening was skipped
+            logger.warning("watchlist_load_failed", error=str(e))
+        ctx["watchlist_refresh"] = asyncio.create_task(refresh_loop())
+    logger.info("worker_started")
+
+
+async def shutdown(ctx: dict[str, Any]) -> None:
+    """Release browsers, pooled HTTP and storage clients and DB connections."""
+    if refresher := ctx.get("watchlist_refresh"):
+        refresher.cancel()
+    await tiered_fetcher.close()
+    await browser_pool.close()
+    await close_llm_clients()
+    await storage_client.close()
+    logger.info("worker_stopped", db_pools=pool_stats())
+    await close_db()
+
+
+class WorkerSettings:
+    """Worker for interactive assessments (also runs maintenance crons)."""
+
+    functions = FUNCTIONS
+    cron_jobs = [
+        cron(prune_checkpoints, hour={3}, minute={15}),
+        cron(purge_soft_deleted, hour={3}, minute={45}),
+        cron(purge_llm_cache, hour={4}, minute={15}),
+    ]
+    queue_name = QUEUE_NAMES[JobPriority.INTERACTIVE]
+    redis_pool = job_queue
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL)
+    on_startup = startup
+    on_shutdown = shutdown
+    max_jobs = settings.WORKER_MAX_JOBS
+    job_timeout = settings.WORKER_JOB_TIMEOUT_SECONDS + _JOB_TIMEOUT_GRACE_SECONDS
+    max_tries = settings.WORKER_MAX_TRIES
+    keep_result = settings.WORKER_KEEP_RESULT_SECONDS
+    job_completion_wait = settings.WORKER_DRAIN_SECONDS
+
+
+class BulkWorkerSettings:
+    """Worker for bulk re-screening jobs."""
+
+    # ARQ reads only attributes defined on the class itself, so these are
+    # repeated rather than inherited from WorkerSettings
+    functions = FUNCTIONS
+    queue_name = QUEUE_NAMES[JobPriority.BULK]
+    redis_pool = job_queue
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL)
+    on_startup = startup
+    on_shutdown = shutdown
+    max_jobs = settings.WORKER_BULK_MAX_JOBS
+    job_timeout = settings.WORKER_JOB_TIMEOUT_SECONDS + _JOB_TIMEOUT_GRACE_SECONDS
+    max_tries = settings.WORKER_MAX_TRIES
+    keep_result = settings.WORKER_KEEP_RESULT_SECONDS
+    job_completion_wait = settings.WORKER_DRAIN_SECONDS
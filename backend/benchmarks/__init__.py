@@ -0,0 +1 @@
+# Benchmarks for SME Supply Chain Risk Analysis
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Evidence Ingestion Benchmark
+
+Loads the same synthetic evidence rows into the evidence table three ways:
+
+- orm: ``session.add`` per row, committed every --batch rows
+- insert: EvidenceWriter with multi-row INSERT ... ON CONFLICT DO NOTHING
+- copy: EvidenceWriter with COPY into a staging table
+
+Each method writes under its own assessment id, and the rows are deleted
+again afterwards. Requires the evidence migration to be applied.
+
+Usage (from the backend directory, against a disposable database):
+    python -m benchmarks.evidence_ingest_benchmark
+    python -m benchmarks.evidence_ingest_benchmark --rows 10000 100000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.db.session import EngineRole, create_engine
+from app.db.soft_delete import LiveRowSession
+from app.models.evidence import Evidence
+from app.services.evidence_writer import EvidenceWriter, content_hash
+
+METHODS = ("orm", "insert", "copy")
+
+
+def make_rows(assessment_id: uuid.UUID, count: int) -> list[dict[str, Any]]:
+    """Build ``count`` distinct evidence rows of realistic size."""
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "assessment_id": assessment_id,
+            "supplier_domain": "example.com",
+            "source_url": f"https://example.com/page/{i}",
+            "source_type": "website",
+            "title": f"Page {i}",
+            "content": f"Evidence {i}: " + "lorem ipsum dolor sit amet " * 40,
+            "collector_tool": "benchmark",
+            "collected_at": now,
+            "reliability": "medium",
+            "recency": "current",
+            "relevance_score": 0.5,
+            "risk_categories": ["esg"],
+        }
+        for i in range(count)
+    ]
+
+
+async def load(
+    session_maker: async_sessionmaker,
+    method: str,
+    rows: list[dict[str, Any]],
+    batch: int,
+) -> float:
+    """Write ``rows`` with ``method`` and return the elapsed seconds."""
+    started = time.perf_counter()
+    if method == "orm":
+        async with session_maker() as session:
+            for i, row in enumerate(rows, 1):
+                session.add(Evidence(content_hash=content_hash(row["content"]), **row))
+                if i % batch == 0:
+                    await session.commit()
+            await session.commit()
+    else:
+        async with EvidenceWriter(
+            batch_size=batch, method=method, session_maker=session_maker
+        ) as writer:
+            await writer.add_many(rows)
+        assert len(writer.ids) == len(rows)
+    return time.perf_counter() - started
+
+
+async def run_benchmark(row_counts: list[int], batch: int) -> None:
+    """Benchmark every method at every row count and print a comparison."""
+    engine = create_engine(EngineRole.WORKER)
+    session_maker = async_sessionmaker(
+        engine, expire_on_commit=False, sync_session_class=LiveRowSession
+    )
+    try:
+        for count in row_counts:
+            baseline = None
+            for method in METHODS:
+                assessment_id = uuid.uuid4()
+                rows = make_rows(assessment_id, count)
+                try:
+                    elapsed = await load(session_maker, method, rows, batch)
+                finally:
+                    async with session_maker() as session:
+                        await session.execute(
+                            delete(Evidence).where(
+                                Evidence.assessment_id == assessment_id
+                            )
+                        )
+                        await session.commit()
+                baseline = baseline or elapsed
+                print(
+                    f"{count:>8,} rows  {method:7} {elapsed:8.2f}s  "
+                    f"{count / elapsed:>10,.0f} rows/s  "
+                    f"{baseline / elapsed:5.1f}x vs orm"
+                )
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare ORM inserts with the bulk evidence writer"
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+        help="Row counts to load with each method",
+    )
+    parser.add_argument(
+        "--batch", type=int, default=1000, help="Rows per commit / writer batch"
+    )
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.rows, args.batch))
+
+
+if __name__ == "__main__":
+    main()
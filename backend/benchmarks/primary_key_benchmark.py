@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Primary Key and Index Layout Benchmark
+
+Compares the old BaseModel layout with the current one on a scratch table
+pair in the configured database:
+
+- before: random UUIDv4 ids, a duplicate index on id, a full index on
+  deleted_at and a full (created_at, id) index
+- after: UUIDv7 ids, no duplicate id index, partial indexes over live
+  (created_at, id) and soft-deleted (deleted_at) rows
+
+It reports insert throughput and the size of the primary key and of all
+indexes after the load. The scratch tables are dropped afterwards.
+
+Usage (from the backend directory, against a disposable database):
+    python -m benchmarks.primary_key_benchmark --rows 500000
+    python -m benchmarks.primary_key_benchmark --ids-only   # no database
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+
+from app.db.session import EngineRole, create_engine
+from app.models.base import uuid7
+
+LAYOUTS: dict[str, tuple[Callable[[], uuid.UUID], list[str]]] = {
+    "before (uuid4)": (
+        uuid.uuid4,
+        [
+            "CREATE INDEX ix_{t}_id ON {t} (id)",
+            "CREATE INDEX ix_{t}_deleted_at ON {t} (deleted_at)",
+            "CREATE INDEX ix_{t}_created_at_id ON {t} (created_at, id)",
+        ],
+    ),
+    "after (uuid7)": (
+        uuid7,
+        [
+            "CREATE INDEX ix_{t}_live_created_at_id ON {t} (created_at, id)"
+            " WHERE deleted_at IS NULL",
+            "CREATE INDEX ix_{t}_deleted_at ON {t} (deleted_at)"
+            " WHERE deleted_at IS NOT NULL",
+        ],
+    ),
+}
+
+
+def bench_ids(count: int) -> None:
+    """Time id generation alone."""
+    for name, factory in (("uuid4", uuid.uuid4), ("uuid7", uuid7)):
+        started = time.perf_counter()
+        for _ in range(count):
+            factory()
+        elapsed = time.perf_counter() - started
+        print(f"{name}: {count / elapsed:,.0f} ids/s")
+
+
+async def bench_layout(
+    conn,
+    table: str,
+    id_factory: Callable[[], uuid.UUID],
+    indexes: list[str],
+    rows: int,
+    batch: int,
+) -> dict[str, float]:
+    """Load ``rows`` rows into a fresh table and measure it."""
+    await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+    await conn.execute(
+        text(
+            f"CREATE TABLE {table} (id uuid PRIMARY KEY, created_at timestamptz"
+            " NOT NULL, deleted_at timestamptz, payload text NOT NULL)"
+        )
+    )
+    for ddl in indexes:
+        await conn.execute(text(ddl.format(t=table)))
+    await conn.commit()
+
+    insert = text(
+        f"INSERT INTO {table} (id, created_at, deleted_at, payload)"
+        " VALUES (:id, :created_at, :deleted_at, :payload)"
+    )
+    started = time.perf_counter()
+    for offset in range(0, rows, batch):
+        now = datetime.now(timezone.utc)
+        await conn.execute(
+            insert,
+            [
+                {
+                    "id": id_factory(),
+                    "created_at": now,
+                    # ~1% soft-deleted, like a typical evidence table
+                    "deleted_at": now if (offset + i) % 100 == 0 else None,
+                    "payload": "x" * 200,
+                }
+                for i in range(min(batch, rows - offset))
+            ],
+        )
+        await conn.commit()
+    elapsed = time.perf_counter() - started
+
+    sizes = (
+        await conn.execute(
+            text(
+                "SELECT pg_relation_size(:pk), pg_indexes_size(:t), pg_table_size(:t)"
+            ),
+            {"pk": f"{table}_pkey", "t": table},
+        )
+    ).one()
+    await conn.execute(text(f"DROP TABLE {table}"))
+    await conn.commit()
+    return {
+        "rows_per_second": rows / elapsed,
+        "pk_mb": sizes[0] / 2**20,
+        "indexes_mb": sizes[1] / 2**20,
+        "table_mb": sizes[2] / 2**20,
+    }
+
+
+async def run_benchmark(rows: int, batch: int) -> None:
+    """Benchmark both layouts and print a comparison."""
+    engine = create_engine(EngineRole.MIGRATION)
+    try:
+        async with engine.connect() as conn:
+            for index, (name, (factory, indexes)) in enumerate(LAYOUTS.items()):
+                result = await bench_layout(
+                    conn, f"bench_pk_layout_{index}", factory, indexes, rows, batch
+                )
+                print(
+                    f"{name:16} {result['rows_per_second']:>10,.0f} rows/s  "
+                    f"pk {result['pk_mb']:7.1f} MB  "
+                    f"all indexes {result['indexes_mb']:7.1f} MB  "
+                    f"heap {result['table_mb']:7.1f} MB"
+                )
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare UUIDv4 + full indexes with UUIDv7 + partial indexes"
+    )
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows per layout")
+    parser.add_argument("--batch", type=int, default=1000, help="Rows per INSERT")
+    parser.add_argument(
+        "--ids-only",
+        action="store_true",
+        help="Only time id generation (no database needed)",
+    )
+    args = parser.parse_args()
+
+    bench_ids(min(args.rows, 200_000))
+    if not args.ids_only:
+        asyncio.run(run_benchmark(args.rows, args.batch))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Watchlist Screening Benchmark
+
+Builds a screening index over a synthetic watchlist (people with aliases
+and organizations with legal forms) and screens a batch of names against
+it:
+
+- variants of listed names (typos, swapped name order, transliteration,
+  dropped legal form), which should match;
+- unrelated names, which mostly shouldn't.
+
+It reports index build time and size, names/sec for single and batch
+screening, latency percentiles and the recall on listed-name variants.
+With --index-file the index is written to disk and screening runs against
+the memory-mapped copy, as worker processes sharing SCREENING_INDEX_DIR do.
+
+Usage (from the backend directory; no services needed):
+    python -m benchmarks.screening_benchmark
+    python -m benchmarks.screening_benchmark --entries 100000 --queries 2000
+    python -m benchmarks.screening_benchmark --index-file /tmp/screening.bin
+"""
+
+import argparse
+import gc
+import random
+import resource
+import statistics
+import time
+from pathlib import Path
+
+from app.screening.index import ScreeningIndex, WatchlistEntry
+from app.screening.store import open_index, write_index
+
+_SYLLABLES = (
+    "ka ri mo sa na le to vi an el ar us in ov ma ha de lo ne ro ta mi "
+    "su ya ze bo da fa gu il ja ko lu me ni pe ra se ti va"
+).split()
+# Unrelated names are built from different syllables
+_OTHER_SYLLABLES = "bro stu gle kwa thor pix dru fen scho wix".split()
+_LEGAL_FORMS = ("LLC", "Ltd", "GmbH", "S.A.", "JSC", "Limited", "Inc")
+_ORG_WORDS = ("Trading", "Holdings", "Shipping", "Industries", "Logistics")
+_CYRILLIC = str.maketrans("abvgdeziklmnoprstuf", "абвгдезиклмнопрстуф")
+
+
+def _word(rng: random.Random, syllables: list[str] = _SYLLABLES) -> str:
+    return "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))).title()
+
+
+def make_entries(count: int, seed: int = 7) -> list[WatchlistEntry]:
+    """Generate ``count`` synthetic list entries (70% people)."""
+    rng = random.Random(seed)
+    given = [_word(rng) for _ in range(5000)]
+    family = [_word(rng) for _ in range(50000)]
+    entries = []
+    for i in range(count):
+        if rng.random() < 0.7:
+            name = f"{rng.choice(given)} {rng.choice(family)}"
+            aliases = tuple(
+                f"{rng.choice(given)} {rng.choice(family)}"
+                for _ in range(rng.randint(0, 2))
+            )
+            entity_type = "individual"
+        else:
+            name = (
+                f"{rng.choice(family)} {rng.choice(_ORG_WORDS)} "
+                f"{rng.choice(_LEGAL_FORMS)}"
+            )
+            aliases = ()
+            entity_type = "organization"
+        entries.append(WatchlistEntry("synthetic", str(i), name, aliases, entity_type))
+    return entries
+
+
+def perturb(name: str, rng: random.Random) -> str:
+    """Return a realistic variant of a listed name."""
+    words = name.split()
+    match rng.randrange(4):
+        case 0:  # typo
+            word = rng.randrange(len(words))
+            chars = list(words[word])
+            position = rng.randrange(1, len(chars))
+            chars[position] = rng.choice("aeiouy")
+            words[word] = "".join(chars)
+        case 1:  # name order
+            words.reverse()
+        case 2:  # transliterated spelling
+            words[0] = words[0].lower().translate(_CYRILLIC)
+        case 3:  # legal form or middle initial
+            words = words[:-1] if len(words) > 2 else [*words[:1], "A.", *words[1:]]
+    return " ".join(words)
+
+
+def run_benchmark(entries: int, queries: int, index_file: Path | None) -> None:
+    """Build the index, screen the queries and print the results."""
+    rng = random.Random(11)
+    watchlist = make_entries(entries)
+
+    started = time.perf_counter()
+    index = ScreeningIndex.build(watchlist)
+    build_seconds = time.perf_counter() - started
+    stats = index.stats()
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"index: {stats['entries']:,} entries, {stats['names']:,} names, "
+        f"{stats['keys']:,} keys, built in {build_seconds:.1f}s, "
+        f"arrays {stats['array_bytes'] / 2**20:.0f} MB, peak RSS {rss_mb:.0f} MB"
+    )
+
+    if index_file is not None:
+        started = time.perf_counter()
+        write_index(index, index_file)
+        write_seconds = time.perf_counter() - started
+        del index
+        gc.collect()
+        started = time.perf_counter()
+        index = open_index(index_file)
+        open_ms = (time.perf_counter() - started) * 1000
+        print(
+            f"file: {index_file.stat().st_size / 2**20:.0f} MB, "
+            f"written in {write_seconds:.1f}s, mapped in {open_ms:.1f} ms"
+        )
+
+    listed = rng.sample(watchlist, queries // 2)
+    variants = [perturb(entry.name, rng) for entry in listed]
+    unrelated = [
+        f"{_word(rng, _OTHER_SYLLABLES)} {_word(rng, _OTHER_SYLLABLES)}"
+        for _ in range(queries - len(listed))
+    ]
+    names = variants + unrelated
+
+    latencies = []
+    for name in names:
+        started = time.perf_counter()
+        index.screen(name)
+        latencies.append((time.perf_counter() - started) * 1000)
+    single_rate = len(names) / (sum(latencies) / 1000)
+
+    started = time.perf_counter()
+    results = index.screen_many(names)
+    batch_rate = len(names) / (time.perf_counter() - started)
+
+    found = sum(
+        any(match.entry == entry for match in matches)
+        for entry, matches in zip(listed, results)
+    )
+    flagged = sum(bool(matches) for matches in results[len(listed) :])
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"screen: {single_rate:,.0f} names/s  "
+        f"p50 {quantiles[49]:.2f} ms  p95 {quantiles[94]:.2f} ms  "
+        f"p99 {quantiles[98]:.2f} ms"
+    )
+    print(f"screen_many: {batch_rate:,.0f} names/s")
+    print(
+        f"recall on listed-name variants: {found / len(listed):.1%}  "
+        f"unrelated names flagged: {flagged / len(unrelated):.1%}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark watchlist screening")
+    parser.add_argument(
+        "--entries", type=int, default=1_000_000, help="Synthetic list entries"
+    )
+    parser.add_argument("--queries", type=int, default=5000, help="Names to screen")
+    parser.add_argument(
+        "--index-file", type=Path, help="Write and screen a memory-mapped index"
+    )
+    args = parser.parse_args()
+    run_benchmark(args.entries, args.queries, args.index_file)
+
+
+if __name__ == "__main__":
+    main()
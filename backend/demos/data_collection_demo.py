@@ -2,437 +2,99 @@
 """
 Simple Data Collection Agent Demo
 
-A standalone LangGraph demo that:
+A command-line front end for the assessment workflow in
+app.agents.workflow, which:
 1. Takes a supplier URL
 2. Scrapes corporate info and ESG data using Playwright
 3. Uses LLM to process and summarize findings
 4. Outputs a formatted report
 
-Usage:
-    python demos/data_collection_demo.py "https://example-supplier.com"
+Pages are loaded through the shared browser pool in
+app.agents.tools.browser_pool, so every page of a run reuses warm browsers.
+
+With --assessment-id, node progress and the streamed LLM summary are
+published to Redis and can be followed at
+GET /api/v1/assessments/{id}/events. With --enqueue the assessment is
+handed to the ARQ workers instead of running in this process. With
+--file a CSV, NDJSON or JSON supplier list is streamed into the bulk queue.
+
+Usage (from the backend directory):
+    python -m demos.data_collection_demo "https://example-supplier.com"
+    python -m demos.data_collection_demo --file suppliers.csv --watch
 """
 
 import argparse
 import asyncio
 import json
-import os
+import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import TypedDict
-from urllib.parse import urljoin, urlparse
-
-from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
-from langgraph.graph import END, START, StateGraph
-from playwright.async_api import async_playwright
-
-
-# ---------------------------------------------------------------------------
-# State Definition
-# ---------------------------------------------------------------------------
-class CollectorState(TypedDict):
-    supplier_url: str
-    supplier_name: str
-    corporate_info: dict
-    esg_info: dict
-    processed_summary: str
-    errors: list[str]
-
-
-# ---------------------------------------------------------------------------
-# Playwright Scraping Functions
-# ---------------------------------------------------------------------------
-async def scrape_page(url: str, timeout: int = 30000) -> dict:
-    """Scrape a single page and return its content."""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent="SME-DueDiligence-Bot/1.0 (Research Demo)"
-        )
-        page = await context.new_page()
-
-        try:
-            await page.goto(url, wait_until="networkidle", timeout=timeout)
-            title = await page.title()
-            # Get main text content
-            text_content = await page.evaluate(
-                """
-                () => {
-                    const body = document.body.cloneNode(true);
-                    // Remove script and style elements
-                    body.querySelectorAll('script, style, nav, footer, header').forEach(el => el.remove());
-                    return body.innerText.substring(0, 10000);
-                }
-            """
-            )
-            # Get all links for ESG page discovery
-            links = await page.evaluate(
-                """
-                () => Array.from(document.querySelectorAll('a[href]'))
-                    .map(a => ({href: a.href, text: a.innerText.trim()}))
-                    .filter(l => l.text.length > 0 && l.text.length < 100)
-            """
-            )
 
-            return {
-                "url": url,
-                "title": title,
-                "content": text_content,
-                "links": links,
-                "success": True,
-            }
-        except Exception as e:
-            return {
-                "url": url,
-                "title": "",
-                "content": "",
-                "links": [],
-                "success": False,
-                "error": str(e),
-            }
-        finally:
-            await browser.close()
-
-
-def find_esg_links(links: list[dict], base_url: str) -> list[str]:
-    """Find links that might lead to ESG/sustainability pages."""
-    esg_keywords = [
-        "sustainability",
-        "sustainable",
-        "esg",
-        "environment",
-        "environmental",
-        "csr",
-        "responsibility",
-        "ethics",
-        "governance",
-        "modern slavery",
-        "supply chain",
-        "carbon",
-        "climate",
-        "social",
-    ]
-
-    esg_links = []
-    seen = set()
-
-    for link in links:
-        href = link.get("href", "")
-        text = link.get("text", "").lower()
-
-        # Check if link text or URL contains ESG keywords
-        matches_keyword = any(kw in text or kw in href.lower() for kw in esg_keywords)
-
-        if matches_keyword and href not in seen:
-            # Ensure it's a valid URL on the same domain
-            parsed = urlparse(href)
-            base_parsed = urlparse(base_url)
-            if parsed.netloc == "" or parsed.netloc == base_parsed.netloc:
-                full_url = urljoin(base_url, href)
-                esg_links.append(full_url)
-                seen.add(href)
-
-    return esg_links[:3]  # Limit to 3 ESG pages
-
-
-# ---------------------------------------------------------------------------
-# Graph Nodes
-# ---------------------------------------------------------------------------
-async def collect_corporate(state: CollectorState) -> dict:
-    """Node 1: Scrape main corporate information from supplier website."""
-    print("\n[1/4] Collecting corporate information...")
-
-    url = state["supplier_url"]
-    result = await scrape_page(url)
-
-    if not result["success"]:
-        return {
-            "corporate_info": {},
-            "errors": state.get("errors", [])
-            + [f"Failed to scrape {url}: {result.get('error', 'Unknown error')}"],
-        }
-
-    # Try to find About page
-    about_links = [
-        link["href"]
-        for link in result.get("links", [])
-        if "about" in link.get("text", "").lower()
-        or "about" in link.get("href", "").lower()
-    ]
-
-    about_content = ""
-    if about_links:
-        about_result = await scrape_page(about_links[0])
-        if about_result["success"]:
-            about_content = about_result["content"]
-
-    # Extract company name from title
-    title = result.get("title", "")
-    company_name = (
-        title.split("|")[0].split("-")[0].strip() if title else urlparse(url).netloc
-    )
-
-    return {
-        "supplier_name": company_name,
-        "corporate_info": {
-            "name": company_name,
-            "website": url,
-            "title": title,
-            "main_page_content": result["content"][:3000],
-            "about_page_content": about_content[:3000] if about_content else None,
-            "scraped_at": datetime.now().isoformat(),
-        },
-    }
-
-
-async def collect_esg(state: CollectorState) -> dict:
-    """Node 2: Find and scrape ESG/sustainability pages."""
-    print("[2/4] Collecting ESG information...")
-
-    url = state["supplier_url"]
-
-    # First, get links from homepage
-    homepage = await scrape_page(url)
-    if not homepage["success"]:
-        return {
-            "esg_info": {"found": False, "pages": []},
-            "errors": state.get("errors", [])
-            + ["Could not access homepage for ESG discovery"],
-        }
-
-    # Find ESG-related links
-    esg_links = find_esg_links(homepage.get("links", []), url)
-
-    if not esg_links:
-        return {"esg_info": {"found": False, "pages": [], "note": "No ESG pages found"}}
-
-    # Scrape ESG pages
-    esg_pages = []
-    for esg_url in esg_links:
-        print(f"    Scraping ESG page: {esg_url}")
-        result = await scrape_page(esg_url)
-        if result["success"]:
-            esg_pages.append(
-                {
-                    "url": esg_url,
-                    "title": result["title"],
-                    "content": result["content"][:3000],
-                }
-            )
-
-    return {
-        "esg_info": {
-            "found": len(esg_pages) > 0,
-            "pages_discovered": len(esg_links),
-            "pages_scraped": len(esg_pages),
-            "pages": esg_pages,
-        }
-    }
-
-
-async def process_data(state: CollectorState) -> dict:
-    """Node 3: Use LLM to process and summarize findings."""
-    print("[3/4] Processing data with LLM...")
-
-    # Check for API key - support OpenRouter or direct Anthropic/OpenAI
-    openrouter_key = os.environ.get("OPENROUTER_API_KEY")
-    openai_key = os.environ.get("OPENAI_API_KEY")
-    anthropic_key = os.environ.get("ANTHROPIC_API_KEY")
-
-    if openrouter_key:
-        # Use OpenRouter (OpenAI-compatible API)
-        llm = ChatOpenAI(
-            model=os.environ.get(
-                "OPENROUTER_MODEL", "anthropic/claude-sonnet-4-20250514"
-            ),
-            base_url="https://openrouter.ai/api/v1",
-            api_key=openrouter_key,
-            temperature=0,
-            max_tokens=1500,
-        )
-        print("    Using OpenRouter...")
-    elif openai_key:
-        # Use OpenAI directly
-        llm = ChatOpenAI(
-            model=os.environ.get("OPENAI_MODEL", "gpt-4o"),
-            api_key=openai_key,
-            temperature=0,
-            max_tokens=1500,
-        )
-        print("    Using OpenAI...")
-    elif anthropic_key:
-        # Use Anthropic via OpenRouter-style (or switch to langchain-anthropic if preferred)
-        from langchain_anthropic import ChatAnthropic
-
-        llm = ChatAnthropic(
-            model=os.environ.get("ANTHROPIC_MODEL", "claude-sonnet-4-20250514"),
-            api_key=anthropic_key,
-            temperature=0,
-            max_tokens=1500,
-        )
-        print("    Using Anthropic...")
-    else:
-        return {
-            "processed_summary": "[LLM processing skipped - No API key set. Set OPENROUTER_API_KEY, OPENAI_API_KEY, or ANTHROPIC_API_KEY]",
-            "errors": state.get("errors", []) + ["No LLM API key configured"],
-        }
-
-    # Build context from collected data
-    corporate = state.get("corporate_info", {})
-    esg = state.get("esg_info", {})
-
-    context_parts = [f"Company: {corporate.get('name', 'Unknown')}"]
-
-    if corporate.get("main_page_content"):
-        context_parts.append(
-            f"Main Page Content:\n{corporate['main_page_content'][:2000]}"
-        )
-
-    if corporate.get("about_page_content"):
-        context_parts.append(
-            f"About Page Content:\n{corporate['about_page_content'][:1500]}"
-        )
-
-    if esg.get("pages"):
-        for page in esg["pages"]:
-            context_parts.append(
-                f"ESG Page ({page['title']}):\n{page['content'][:1500]}"
-            )
-
-    context = "\n\n---\n\n".join(context_parts)
-
-    prompt = f"""Analyze this supplier's publicly available information and provide a structured summary.
-
-{context}
-
-Provide a concise analysis covering:
-1. COMPANY OVERVIEW: Brief description, industry, key business areas
-2. ESG INDICATORS: Any sustainability initiatives, certifications, policies mentioned
-3. RISK SIGNALS: Any potential red flags or areas requiring further investigation
-4. DATA QUALITY: Assessment of how much relevant information was available
-
-Keep the response focused and professional. If information is limited, note that clearly."""
-
-    try:
-        response = await llm.ainvoke([HumanMessage(content=prompt)])
-        return {"processed_summary": response.content}
-    except Exception as e:
-        return {
-            "processed_summary": f"[LLM processing failed: {e}]",
-            "errors": state.get("errors", []) + [f"LLM error: {e}"],
-        }
-
-
-def generate_output(state: CollectorState) -> dict:
-    """Node 4: Format and display final report."""
-    print("[4/4] Generating output...\n")
-
-    corporate = state.get("corporate_info", {})
-    esg = state.get("esg_info", {})
-    summary = state.get("processed_summary", "")
-    errors = state.get("errors", [])
-
-    # Build report
-    report = []
-    report.append("=" * 60)
-    report.append("       DATA COLLECTION AGENT - DEMO REPORT")
-    report.append("=" * 60)
-    report.append("")
-    report.append(f"Supplier: {corporate.get('name', 'Unknown')}")
-    report.append(f"URL: {state.get('supplier_url', 'N/A')}")
-    report.append(f"Scraped: {corporate.get('scraped_at', 'N/A')}")
-    report.append("")
-    report.append("-" * 60)
-    report.append("CORPORATE INFORMATION")
-    report.append("-" * 60)
-    report.append(f"Website Title: {corporate.get('title', 'N/A')}")
-    report.append(
-        f"About Page: {'Found' if corporate.get('about_page_content') else 'Not found'}"
-    )
-    report.append("")
-    report.append("-" * 60)
-    report.append("ESG INFORMATION")
-    report.append("-" * 60)
-    report.append(f"ESG Pages Found: {esg.get('found', False)}")
-    report.append(f"Pages Discovered: {esg.get('pages_discovered', 0)}")
-    report.append(f"Pages Scraped: {esg.get('pages_scraped', 0)}")
-
-    if esg.get("pages"):
-        report.append("\nESG Pages:")
-        for page in esg["pages"]:
-            report.append(f"  - {page['title']}: {page['url']}")
-
-    report.append("")
-    report.append("-" * 60)
-    report.append("LLM ANALYSIS")
-    report.append("-" * 60)
-    report.append(summary if summary else "[No analysis available]")
-    report.append("")
-
-    if errors:
-        report.append("-" * 60)
-        report.append("ERRORS ENCOUNTERED")
-        report.append("-" * 60)
-        for error in errors:
-            report.append(f"  - {error}")
-        report.append("")
-
-    report.append("=" * 60)
-
-    output = "\n".join(report)
-    print(output)
-
-    return {}  # No state updates needed
-
-
-# ---------------------------------------------------------------------------
-# Graph Definition
-# ---------------------------------------------------------------------------
-def build_graph() -> StateGraph:
-    """Build the data collection workflow graph."""
-    builder = StateGraph(CollectorState)
-
-    # Add nodes
-    builder.add_node("collect_corporate", collect_corporate)
-    builder.add_node("collect_esg", collect_esg)
-    builder.add_node("process_data", process_data)
-    builder.add_node("generate_output", generate_output)
-
-    # Define flow: START -> collect_corporate -> collect_esg -> process_data -> generate_output -> END
-    builder.add_edge(START, "collect_corporate")
-    builder.add_edge("collect_corporate", "collect_esg")
-    builder.add_edge("collect_esg", "process_data")
-    builder.add_edge("process_data", "generate_output")
-    builder.add_edge("generate_output", END)
-
-    return builder.compile()
+from app.agents.tools.browser_pool import browser_pool
+from app.agents.tools.http_fetcher import tiered_fetcher
+from app.agents.tools.page_cache import page_cache
+from app.agents.workflow import critical_path, run_workflow
+from app.core.events import EventPublisher
+from app.core.llm import close_llm_clients
+from app.core.llm_cache import llm_cache
+from app.core.redis import job_queue
+from app.services.bulk_assessment_service import (
+    BatchStatus,
+    get_batch_progress,
+    submit_bulk_batch,
+)
+from app.services.supplier_import import ImportFormat, parse_suppliers
+from app.workers.queue import JobPriority, enqueue_assessment
+
+_FILE_FORMATS = {
+    ".csv": ImportFormat.CSV,
+    ".ndjson": ImportFormat.NDJSON,
+    ".jsonl": ImportFormat.NDJSON,
+    ".json": ImportFormat.JSON,
+}
 
 
 # ---------------------------------------------------------------------------
 # Main Entry Point
 # ---------------------------------------------------------------------------
-async def run_demo(url: str, output_file: str | None = None):
+async def run_demo(
+    url: str, output_file: str | None = None, assessment_id: str | None = None
+):
     """Run the data collection demo."""
     print("\n" + "=" * 60)
     print("     SME SUPPLY CHAIN - DATA COLLECTION AGENT DEMO")
     print("=" * 60)
     print(f"\nTarget URL: {url}")
+    if assessment_id:
+        print(f"Events: /api/v1/assessments/{assessment_id}/events")
     print("\nStarting workflow...")
 
-    # Build and run graph
-    graph = build_graph()
-
-    initial_state: CollectorState = {
-        "supplier_url": url,
-        "supplier_name": "",
-        "corporate_info": {},
-        "esg_info": {},
-        "processed_summary": "",
-        "errors": [],
-    }
-
-    # Run the graph
-    final_state = await graph.ainvoke(initial_state)
+    # Run the graph, releasing pooled browsers once the run is over
+    publisher = EventPublisher(assessment_id) if assessment_id else None
+    try:
+        final_state = await run_workflow(url, assessment_id or "")
+        if publisher is not None:
+            await publisher.emit(
+                "completed",
+                summary=final_state.get("processed_summary", ""),
+                errors=final_state.get("errors", []),
+            )
+    except Exception as e:
+        if publisher is not None:
+            await publisher.emit("failed", error=str(e))
+        raise
+    finally:
+        await tiered_fetcher.close()
+        await browser_pool.close()
+        await close_llm_clients()
+
+    print()
+    print(final_state.get("report", ""))
+    path, path_ms = critical_path(final_state.get("node_timings", {}))
+    print(f"\n[Critical path: {' -> '.join(path)} ({path_ms} ms)]")
+    print(f"[Page cache: {page_cache.stats()}]")
+    print(f"[Fetch tiers: {tiered_fetcher.stats()}]")
+    print(f"[LLM cache: {llm_cache.stats()}]")
 
     # Save to file if requested
     if output_file:
@@ -447,6 +109,7 @@ async def run_demo(url: str, output_file: str | None = None):
             "esg_info": final_state.get("esg_info", {}),
             "summary": final_state.get("processed_summary", ""),
             "errors": final_state.get("errors", []),
+            "node_timings": final_state.get("node_timings", {}),
             "generated_at": datetime.now().isoformat(),
         }
 
@@ -458,11 +121,47 @@ async def run_demo(url: str, output_file: str | None = None):
     return final_state
 
 
+async def enqueue_demo(url: str, assessment_id: str | None, bulk: bool) -> None:
+    """Queue the assessment for the ARQ workers and print where to follow it."""
+    priority = JobPriority.BULK if bulk else JobPriority.INTERACTIVE
+    try:
+        assessment_id = await enqueue_assessment(url, assessment_id, priority)
+    finally:
+        await job_queue.aclose(close_connection_pool=True)
+    print(f"Queued assessment {assessment_id} ({priority.value})")
+    print(f"Events: /api/v1/assessments/{assessment_id}/events")
+
+
+async def bulk_demo(path: Path, watch: bool) -> None:
+    """Stream a supplier list into the bulk queue and optionally follow it."""
+    import_format = _FILE_FORMATS.get(path.suffix.lower())
+    if import_format is None:
+        raise SystemExit(f"Unsupported file type: {path.suffix or path.name}")
+
+    async def read_chunks():
+        with open(path, "rb") as f:
+            while chunk := f.read(64 * 1024):
+                yield chunk
+
+    try:
+        progress = await submit_bulk_batch(
+            parse_suppliers(read_chunks(), import_format)
+        )
+        print(f"Queued batch {progress['batch_id']}: {progress}")
+        while watch and progress["status"] == BatchStatus.QUEUED:
+            await asyncio.sleep(5)
+            progress = await get_batch_progress(progress["batch_id"]) or progress
+            done = progress["completed"] + progress["failed"]
+            print(f"  {done}/{progress['queued']} done ({progress['failed']} failed)")
+    finally:
+        await job_queue.aclose(close_connection_pool=True)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Data Collection Agent Demo - Scrape supplier info using LangGraph"
     )
-    parser.add_argument("url", help="Supplier website URL to analyze")
+    parser.add_argument("url", nargs="?", help="Supplier website URL to analyze")
     parser.add_argument(
         "-o",
         "--output",
@@ -470,14 +169,54 @@ def main():
         default=None,
     )
 
+    parser.add_argument(
+        "--assessment-id",
+        nargs="?",
+        const="new",
+        default=None,
+        help="Publish progress events for this assessment id (omit value for a new one)",
+    )
+    parser.add_argument(
+        "--enqueue",
+        action="store_true",
+        help="Queue the assessment for the ARQ workers instead of running it here",
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="With --enqueue, use the bulk re-screening queue",
+    )
+    parser.add_argument(
+        "--file",
+        type=Path,
+        help="Queue every supplier in a CSV/NDJSON/JSON list on the bulk queue",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="With --file, poll the batch progress until it finishes",
+    )
+
     args = parser.parse_args()
+    if args.file:
+        asyncio.run(bulk_demo(args.file, args.watch))
+        return
+    if not args.url:
+        parser.error("a supplier URL or --file is required")
+    if args.assessment_id == "new":
+        args.assessment_id = str(uuid.uuid4())
+    elif args.assessment_id:
+        args.assessment_id = str(uuid.UUID(args.assessment_id))
 
     # Validate URL
     if not args.url.startswith(("http://", "https://")):
         args.url = "https://" + args.url
 
     # Run the demo
-    asyncio.run(run_demo(args.url, args.output))
+    if args.enqueue:
+        asyncio.run(enqueue_demo(args.url, args.assessment_id, args.bulk))
+    else:
+        asyncio.run(run_demo(args.url, args.output, args.assessment_id))
 
 
 if __name__ == "__main__":
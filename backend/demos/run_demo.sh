@@ -63,7 +63,7 @@ else
 fi
 
 # Build command (always outputs to file now)
-CMD="python demos/data_collection_demo.py \"$URL\" -o \"$OUTPUT_FILE\""
+CMD="python -m demos.data_collection_demo \"$URL\" -o \"$OUTPUT_FILE\""
 
 # Run
 echo -e "${GREEN}Running demo...${NC}"
@@ -0,0 +1,38 @@
+"""Tests for BaseModel ids and indexes."""
+
+import time
+
+from app.models.base import BaseModel, uuid7
+
+
+class Sample(BaseModel):
+    """Throwaway table for index layout tests."""
+
+    __tablename__ = "base_model_test_samples"
+
+
+def test_uuid7_is_time_ordered() -> None:
+    """Test version bits, embedded timestamp and strict ordering."""
+    before_ms = time.time_ns() // 1_000_000
+    ids = [uuid7() for _ in range(10000)]
+
+    assert all(u.version == 7 for u in ids)
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert ids[0].int >> 80 >= before_ms
+
+
+def test_indexes_skip_primary_key_and_target_live_rows() -> None:
+    """Test that id has only its PK index and deleted_at indexes are partial."""
+    indexes = {index.name: index for index in Sample.__table__.indexes}
+
+    assert not any(
+        [column.name for column in index.columns] == ["id"]
+        for index in indexes.values()
+    )
+    live = indexes["ix_base_model_test_samples_live_created_at_id"]
+    deleted = indexes["ix_base_model_test_samples_deleted_at"]
+    assert str(live.dialect_options["postgresql"]["where"]) == "deleted_at IS NULL"
+    assert str(deleted.dialect_options["postgresql"]["where"]) == (
+        "deleted_at IS NOT NULL"
+    )
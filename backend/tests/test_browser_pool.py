@@ -0,0 +1,154 @@
+"""Tests for the warm headless browser pool."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.agents.tools import browser_pool as browser_pool_module
+from app.agents.tools.browser_pool import BrowserPool
+
+
+class FakeContext:
+    """Browser context stand-in that belongs to one launch."""
+
+    def __init__(self, browser: "FakeBrowser") -> None:
+        self.browser = browser
+
+
+class FakeBrowser:
+    """Chromium stand-in that can be disconnected and reports its memory."""
+
+    def __init__(self, number: int) -> None:
+        self.number = number
+        self.connected = True
+        self.closed = False
+        self.rss_mb = 100.0
+
+    def is_connected(self) -> bool:
+        return self.connected and not self.closed
+
+    async def new_context(self, **_: Any) -> FakeContext:
+        return FakeContext(self)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeLauncher:
+    """Playwright runtime stand-in recording every browser it launches."""
+
+    def __init__(self) -> None:
+        self.browsers: list[FakeBrowser] = []
+        self.chromium = self
+        self.stopped = False
+
+    async def start(self) -> "FakeLauncher":
+        return self
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+    async def launch(self, **_: Any) -> FakeBrowser:
+        browser = FakeBrowser(len(self.browsers))
+        self.browsers.append(browser)
+        return browser
+
+
+@pytest.fixture
+def launcher(monkeypatch: pytest.MonkeyPatch) -> FakeLauncher:
+    fake = FakeLauncher()
+
+    async def browser_rss_mb(browser: FakeBrowser) -> float:
+        return browser.rss_mb
+
+    monkeypatch.setattr(browser_pool_module, "async_playwright", lambda: fake)
+    monkeypatch.setattr(browser_pool_module, "_browser_rss_mb", browser_rss_mb)
+    return fake
+
+
+def make_pool(
+    size: int = 2, max_pages_per_browser: int = 0, max_memory_mb: int = 0
+) -> BrowserPool:
+    return BrowserPool(
+        size=size,
+        max_pages_per_browser=max_pages_per_browser,
+        max_memory_mb=max_memory_mb,
+        user_agent="test-agent",
+    )
+
+
+@pytest.mark.asyncio
+async def test_leases_are_exclusive_and_reuse_warm_browsers(
+    launcher: FakeLauncher,
+) -> None:
+    """Test that each lease holds one browser and returns it to the pool."""
+    pool = make_pool(size=2)
+    active: set[int] = set()
+    peak = 0
+
+    async def visit() -> None:
+        nonlocal peak
+        async with pool.lease() as context:
+            number = context.browser.number
+            assert number not in active
+            active.add(number)
+            peak = max(peak, len(active))
+            await asyncio.sleep(0.01)
+            active.discard(number)
+
+    await asyncio.gather(*(visit() for _ in range(6)))
+
+    assert len(launcher.browsers) == 2
+    assert peak == 2
+    assert pool.stats()["leases"] == 6
+    assert pool.stats()["idle"] == 2
+    assert pool.stats()["recycled"] == 0
+
+    await pool.close()
+    assert launcher.stopped
+    assert all(browser.closed for browser in launcher.browsers)
+    assert not pool.started
+
+
+@pytest.mark.asyncio
+async def test_browser_recycled_after_max_pages(launcher: FakeLauncher) -> None:
+    """Test that a browser is relaunched once it has served its page quota."""
+    pool = make_pool(size=1, max_pages_per_browser=3)
+
+    for _ in range(3):
+        async with pool.lease() as context:
+            assert context.browser is launcher.browsers[0]
+
+    assert launcher.browsers[0].closed
+    assert len(launcher.browsers) == 2
+    assert pool.stats()["recycled"] == 1
+    assert pool.stats()["pages_served"] == [0]
+
+    async with pool.lease() as context:
+        assert context.browser is launcher.browsers[1]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_browser_relaunched_above_memory_ceiling_or_disconnected(
+    launcher: FakeLauncher,
+) -> None:
+    """Test relaunch when resident memory passes the ceiling or Chromium dies."""
+    pool = make_pool(size=1, max_memory_mb=500)
+
+    async with pool.lease() as context:
+        context.browser.rss_mb = 400.0
+    assert len(launcher.browsers) == 1
+
+    async with pool.lease() as context:
+        context.browser.rss_mb = 800.0
+    assert launcher.browsers[0].closed
+    assert len(launcher.browsers) == 2
+
+    # A crash between leases is caught by the health check on the next one
+    launcher.browsers[1].connected = False
+    async with pool.lease() as context:
+        assert context.browser is launcher.browsers[2]
+    assert pool.stats()["recycled"] == 2
+    await pool.close()
@@ -0,0 +1,54 @@
+"""Tests for the database engine factory and pool metrics."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.pool import NullPool
+from sqlalchemy.util import greenlet_spawn
+
+from app.core.config import settings
+from app.db.session import (
+    EngineRole,
+    InstrumentedQueuePool,
+    PoolMetrics,
+    create_engine,
+    pool_stats,
+)
+
+
+@pytest.mark.asyncio
+async def test_pool_records_overflow_and_timeouts() -> None:
+    """Test checkout counters when the pool and its overflow are exhausted."""
+    pool = InstrumentedQueuePool(
+        lambda: MagicMock(), pool_size=1, max_overflow=1, timeout=0.05
+    )
+    pool.metrics = PoolMetrics("api", slow_checkout_ms=1000)
+
+    def exhaust() -> None:
+        first, second = pool.connect(), pool.connect()
+        with pytest.raises(exc.TimeoutError):
+            pool.connect()
+        first.close()
+        second.close()
+
+    await greenlet_spawn(exhaust)
+
+    assert pool.metrics.checkouts == 2
+    assert pool.metrics.overflow_opened == 1
+    assert pool.metrics.timeouts == 1
+    assert pool.checkedout() == 0
+
+
+@pytest.mark.asyncio
+async def test_engine_roles_use_their_pool_settings() -> None:
+    """Test worker pool sizing, unpooled migrations and stats reporting."""
+    worker = create_engine(EngineRole.WORKER)
+    migration = create_engine(EngineRole.MIGRATION)
+    try:
+        assert worker.sync_engine.pool.size() == settings.DB_WORKER_POOL_SIZE
+        assert isinstance(migration.sync_engine.pool, NullPool)
+        assert EngineRole.WORKER in [stats["role"] for stats in pool_stats()]
+    finally:
+        await worker.dispose()
+        await migration.dispose()
@@ -0,0 +1,143 @@
+"""Tests for assessment progress events and LLM token streaming."""
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.api.v1.endpoints.assessments import _format_sse
+from app.core import events
+from app.core.events import EventBroker, EventPublisher
+from app.core.llm import stream_llm
+
+
+def make_event(event_type: str, seq: int | None = None, **data: Any) -> dict:
+    """Build an event as published for assessment "a1"."""
+    event = {"type": event_type, "assessment_id": "a1", **data}
+    if seq is not None:
+        event["seq"] = seq
+    return event
+
+
+@pytest.mark.asyncio
+async def test_stream_llm_forwards_chunks_and_returns_full_message() -> None:
+    """Test that tokens reach the callback and the full message is returned."""
+    llm = GenericFakeChatModel(messages=iter([AIMessage(content="Low risk overall")]))
+    tokens: list[str] = []
+
+    async def on_token(text: str) -> None:
+        tokens.append(text)
+
+    response = await stream_llm(llm, [HumanMessage(content="Summarise")], on_token)
+
+    assert len(tokens) > 1
+    assert "".join(tokens) == "Low risk overall"
+    assert response.content == "Low risk overall"
+
+
+@pytest.mark.asyncio
+async def test_broker_replays_history_then_relays_live_events(monkeypatch) -> None:
+    """Test that replayed events aren't repeated live and streams end on completion."""
+    broker = EventBroker()
+    history = [make_event("node_started", seq=1), make_event("node_completed", seq=2)]
+
+    async def read_history(assessment_id: str) -> list[dict]:
+        return history
+
+    monkeypatch.setattr(events, "_read_history", read_history)
+    monkeypatch.setattr(broker, "_ensure_running", lambda: None)
+
+    async def collect() -> list[dict]:
+        return [event async for event in broker.subscribe("a1", after_seq=1)]
+
+    task = asyncio.create_task(collect())
+    await asyncio.sleep(0)
+    for event in (
+        make_event("node_completed", seq=2),  # already replayed
+        make_event("token", text="Low"),
+        make_event("completed", seq=3),
+    ):
+        broker._dispatch(json.dumps(event))
+    received = await asyncio.wait_for(task, timeout=1)
+
+    assert [(e["type"], e.get("seq")) for e in received] == [
+        ("node_completed", 2),
+        ("token", None),
+        ("completed", 3),
+    ]
+    assert broker._listeners == {}
+
+
+def test_format_sse_includes_id_only_for_sequenced_events() -> None:
+    """Test that progress events carry an SSE id so clients can resume."""
+    assert _format_sse(make_event("node_started", seq=4)).startswith(
+        "id: 4\nevent: node_started\ndata: "
+    )
+    assert _format_sse(make_event("token", text="x")).startswith("event: token\n")
+
+
+class FailingRedis:
+    """Redis client stand-in whose commands fail, like an exhausted pool."""
+
+    def __init__(self, **_: Any) -> None:
+        pass
+
+    async def incr(self, key: str) -> int:
+        raise ConnectionError("Too many connections")
+
+    async def publish(self, channel: str, payload: str) -> int:
+        raise ConnectionError("Too many connections")
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_publisher_logs_redis_errors_instead_of_raising(monkeypatch) -> None:
+    """Test that emit() and token flushes survive Redis being unavailable."""
+    monkeypatch.setattr(events.redis, "Redis", FailingRedis)
+    publisher = EventPublisher("a1", flush_chars=1)
+
+    await publisher.token("Low", node="generate_output")
+    await publisher.emit("node_completed", node="generate_output")
+    await publisher.flush()
+
+
+@pytest.mark.asyncio
+async def test_slow_stream_replays_progress_events_from_history(monkeypatch) -> None:
+    """Test that a full queue drops tokens but never progress events."""
+    broker = EventBroker()
+    history: list[dict] = []
+
+    async def read_history(assessment_id: str) -> list[dict]:
+        return list(history)
+
+    monkeypatch.setattr(events, "_read_history", read_history)
+    monkeypatch.setattr(events.settings, "EVENT_QUEUE_SIZE", 2)
+    monkeypatch.setattr(broker, "_ensure_running", lambda: None)
+    stream = broker.subscribe("a1")
+    assert broker._listeners == {}
+    first = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0)
+
+    # The consumer stalls while a status event, tokens and more progress arrive
+    for event in (
+        make_event("node_started", seq=1),
+        make_event("token", text="a"),
+        make_event("token", text="b"),
+        make_event("node_completed", seq=2),
+        make_event("completed", seq=3),
+    ):
+        if "seq" in event:
+            history.append(event)
+        broker._dispatch(json.dumps(event))
+
+    received = [await first] + [event async for event in stream]
+    assert [(e["type"], e.get("seq")) for e in received] == [
+        ("node_started", 1),
+        ("node_completed", 2),
+        ("completed", 3),
+    ]
@@ -0,0 +1,133 @@
+"""Tests for batched embeddings and evidence similarity search."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.dialects import postgresql
+
+from app.api.v1.endpoints import evidence
+from app.core.embeddings import BatchingEmbedder
+from app.db.session import PRIMARY_PIN_COOKIE, read_router
+from app.main import app
+from app.services.evidence_search import search_select
+
+
+class RecordingProvider:
+    """Embedding provider stand-in that records each batch it receives."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_embedder_coalesces_concurrent_callers_and_dedupes() -> None:
+    """Test that concurrent requests share one deduplicated provider call."""
+    provider = RecordingProvider()
+    embedder = BatchingEmbedder(provider, batch_size=100, max_wait_ms=10)
+
+    first, second = await asyncio.gather(
+        embedder.embed(["alpha", "beta", "alpha"]),
+        embedder.embed(["beta", "gamma!"]),
+    )
+
+    assert provider.batches == [["alpha", "beta", "gamma!"]]
+    assert first == [[5.0, 1.0], [4.0, 1.0], [5.0, 1.0]]
+    assert second == [[4.0, 1.0], [6.0, 1.0]]
+    assert embedder.stats()["deduplicated"] == 2
+
+
+@pytest.mark.asyncio
+async def test_embedder_splits_full_batches_and_propagates_errors() -> None:
+    """Test the size trigger and that a failed call fails its callers."""
+    provider = RecordingProvider()
+    embedder = BatchingEmbedder(provider, batch_size=2, max_wait_ms=10)
+    await embedder.embed(["a", "bb", "ccc"])
+    assert provider.batches == [["a", "bb"], ["ccc"]]
+
+    async def failing(texts: list[str]) -> list[list[float]]:
+        raise RuntimeError("provider down")
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        await BatchingEmbedder(failing, max_wait_ms=1).embed(["a", "b"])
+
+
+def test_supplier_scoped_search_ranks_exactly() -> None:
+    """Test that supplier searches bypass the ANN index and others use it."""
+    scoped = str(
+        search_select([0.1, 0.2], supplier_domain="acme.example").compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    global_search = str(
+        search_select([0.1, 0.2], source_types=["esg"]).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert scoped.startswith("WITH candidates AS MATERIALIZED")
+    assert "supplier_domain = " in scoped
+    assert "WITH" not in global_search
+    assert "evidence_embeddings.embedding <=> " in global_search
+    assert "deleted_at IS NULL" in global_search
+
+
+class ReplicaSession:
+    """Replica session stand-in usable as an async context manager."""
+
+    async def __aenter__(self) -> "ReplicaSession":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_search_reads_from_replica_without_pinning(monkeypatch) -> None:
+    """Test that a search is served by a replica and sets no primary pin."""
+    replica = ReplicaSession()
+    calls: list[dict[str, Any]] = []
+
+    async def replica_session() -> ReplicaSession:
+        return replica
+
+    async def search_evidence(db: Any, query: str, **filters: Any) -> list[Any]:
+        calls.append({"db": db, "query": query, **filters})
+        return []
+
+    monkeypatch.setattr(read_router, "replicas", [object()])
+    monkeypatch.setattr(read_router, "session", replica_session)
+    monkeypatch.setattr(evidence, "search_evidence", search_evidence)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get(
+            "/api/v1/evidence/search",
+            params={
+                "query": "forced labour",
+                "supplier_domain": "acme.example",
+                "source_types": ["news", "website"],
+                "limit": 5,
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.json()["data"] == []
+    assert PRIMARY_PIN_COOKIE not in response.cookies
+    assert "set-cookie" not in response.headers
+    assert calls == [
+        {
+            "db": replica,
+            "query": "forced labour",
+            "supplier_domain": "acme.example",
+            "source_types": ["news", "website"],
+            "collected_after": None,
+            "limit": 5,
+        }
+    ]
@@ -0,0 +1,243 @@
+"""Tests for the buffered evidence writer."""
+
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Insert
+from sqlalchemy.sql.elements import TextClause
+
+from app.services.evidence_writer import (
+    EvidenceWriter,
+    collected_evidence,
+    content_hash,
+)
+
+
+class FakeEvidenceTable:
+    """AsyncSession stand-in that applies evidence INSERTs to a dict."""
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple[uuid.UUID, str], uuid.UUID] = {}
+        self.inserts: list[str] = []
+
+    async def execute(self, stmt: Any) -> list[SimpleNamespace]:
+        if not isinstance(stmt, Insert):
+            return [self._row(key, row_id) for key, row_id in self.rows.items()]
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        self.inserts.append(str(compiled))
+        params, inserted, i = compiled.params, [], 0
+        while f"id_m{i}" in params:
+            key = (params[f"assessment_id_m{i}"], params[f"content_hash_m{i}"])
+            if key not in self.rows:
+                self.rows[key] = params[f"id_m{i}"]
+                inserted.append(self._row(key, self.rows[key]))
+            i += 1
+        return inserted
+
+    async def commit(self) -> None:
+        pass
+
+    @staticmethod
+    def _row(key: tuple[uuid.UUID, str], row_id: uuid.UUID) -> SimpleNamespace:
+        return SimpleNamespace(id=row_id, assessment_id=key[0], content_hash=key[1])
+
+
+def evidence(assessment_id: uuid.UUID, content: str) -> dict[str, Any]:
+    return {
+        "assessment_id": assessment_id,
+        "source_url": "https://www.acme.example/about",
+        "source_type": "website",
+        "content": content,
+        "collector_tool": "collect_corporate",
+    }
+
+
+@pytest.mark.asyncio
+async def test_writer_batches_rows_and_resolves_duplicate_ids() -> None:
+    """Test size-triggered batches, ON CONFLICT inserts and id resolution."""
+    session = FakeEvidenceTable()
+    assessment_id = uuid.uuid4()
+
+    async with EvidenceWriter(
+        session, batch_size=2, flush_interval=60, method="insert"
+    ) as writer:
+        await writer.add(**evidence(assessment_id, "first page"))
+        await writer.add(**evidence(assessment_id, "  first   page "))
+        assert session.inserts == []
+        await writer.add(**evidence(assessment_id, "second page"))
+        assert len(session.inserts) == 1
+        await writer.add(**evidence(assessment_id, "first page"))
+
+    first, first_again, second, first_later = writer.ids
+    assert first == first_again == first_later
+    assert len(session.rows) == 2 and second != first
+    assert len(session.inserts) == 2
+    assert "ON CONFLICT ON CONSTRAINT uq_evidence_assessment_content DO NOTHING" in (
+        session.inserts[0]
+    )
+    assert writer.stats()["rows_written"] == 2
+    assert writer.stats()["duplicates"] == 1
+
+
+@pytest.mark.asyncio
+async def test_writer_discards_buffer_when_the_block_fails() -> None:
+    """Test that rows buffered in a failed block are not written."""
+    session = FakeEvidenceTable()
+
+    with pytest.raises(RuntimeError):
+        async with EvidenceWriter(session, method="insert") as writer:
+            await writer.add(**evidence(uuid.uuid4(), "page"))
+            raise RuntimeError("assessment failed")
+
+    assert session.inserts == [] and writer.ids == []
+
+
+def test_collected_evidence_covers_corporate_and_esg_pages() -> None:
+    """Test building evidence rows from a finished assessment state."""
+    assessment_id = str(uuid.uuid4())
+    state = {
+        "assessment_id": assessment_id,
+        "supplier_url": "https://www.acme.example",
+        "corporate_info": {
+            "website": "https://www.acme.example",
+            "title": "Acme",
+            "main_page_content": "Welcome to Acme",
+            "about_page_content": "Founded in 1949",
+            "about_page_url": "https://www.acme.example/company/about-us",
+        },
+        "esg_info": {
+            "pages": [
+                {
+                    "url": "https://www.acme.example/esg",
+                    "title": "ESG",
+                    "content": "Our report",
+                }
+            ]
+        },
+    }
+
+    rows = collected_evidence(state)
+
+    assert [row["source_type"] for row in rows] == ["website", "website", "esg"]
+    # Each row cites the page its content came from
+    assert [row["source_url"] for row in rows] == [
+        "https://www.acme.example",
+        "https://www.acme.example/company/about-us",
+        "https://www.acme.example/esg",
+    ]
+    assert {row["supplier_domain"] for row in rows} == {"acme.example"}
+
+
+class FakeCopyConnection:
+    """Connection stand-in for the COPY path: staging table, COPY, INSERT."""
+
+    def __init__(self, table: FakeEvidenceTable) -> None:
+        self.table = table
+        self.sql: list[str] = []
+        self.staged: list[tuple] = []
+        self.copied: list[dict[str, Any]] = []
+        self.driver_connection = self
+
+    async def get_raw_connection(self) -> "FakeCopyConnection":
+        return self
+
+    async def copy_records_to_table(
+        self, table_name: str, records: list[tuple], columns: list[str]
+    ) -> None:
+        self.sql.append(f"COPY {table_name}")
+        self.staged += records
+        self.copied += [dict(zip(columns, record)) for record in records]
+
+    async def execute(self, statement: TextClause) -> list[SimpleNamespace]:
+        sql = str(statement)
+        self.sql.append(sql)
+        if not sql.startswith("INSERT"):
+            return []
+        inserted = []
+        for row in self.copied:
+            key = (row["assessment_id"], row["content_hash"])
+            if key not in self.table.rows:
+                self.table.rows[key] = row["id"]
+                inserted.append(self.table._row(key, row["id"]))
+        self.copied = []
+        return inserted
+
+
+class FakeCopySession(FakeEvidenceTable):
+    """AsyncSession stand-in exposing a COPY-capable connection."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.conn = FakeCopyConnection(self)
+
+    async def connection(self) -> FakeCopyConnection:
+        return self.conn
+
+
+@pytest.mark.asyncio
+async def test_copy_method_stages_rows_and_inserts_from_staging() -> None:
+    """Test the default COPY path's statements, JSONB encoding and ids."""
+    session = FakeCopySession()
+    assessment_id = uuid.uuid4()
+    session.rows[(assessment_id, content_hash("already stored"))] = uuid.uuid4()
+
+    async with EvidenceWriter(session, batch_size=10, method="copy") as writer:
+        await writer.add(**evidence(assessment_id, "new page"), risk_categories=["esg"])
+        await writer.add(**evidence(assessment_id, "already stored"))
+
+    create, copy, insert, truncate = session.conn.sql
+    assert create.startswith("CREATE TEMP TABLE IF NOT EXISTS evidence_staging")
+    assert copy == "COPY evidence_staging"
+    assert insert.startswith("INSERT INTO evidence (id, assessment_id,")
+    assert "SELECT id, assessment_id," in insert and "FROM evidence_staging" in insert
+    assert "ON CONFLICT ON CONSTRAINT uq_evidence_assessment_content" in insert
+    assert truncate == "TRUNCATE evidence_staging"
+    # JSONB columns are sent as JSON text
+    assert session.conn.staged[0][-1] == '["esg"]'
+
+    new_id, stored_id = writer.ids
+    assert new_id == session.rows[(assessment_id, content_hash("new page"))]
+    assert stored_id == session.rows[(assessment_id, content_hash("already stored"))]
+    assert writer.stats()["duplicates"] == 1
+
+
+class FailingSessionMaker:
+    """Session maker whose sessions fail to write the first ``failures`` times."""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.table = FakeEvidenceTable()
+
+    def __call__(self) -> "FailingSessionMaker":
+        return self
+
+    async def __aenter__(self) -> FakeEvidenceTable:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        return self.table
+
+    async def __aexit__(self, *exc: object) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_sessionless_writer_keeps_batch_when_write_fails() -> None:
+    """Test that a failed batch stays buffered and is written next flush."""
+    session_maker = FailingSessionMaker(failures=1)
+    writer = EvidenceWriter(
+        batch_size=10, flush_interval=60, method="insert", session_maker=session_maker
+    )
+    assessment_id = uuid.uuid4()
+    await writer.add(**evidence(assessment_id, "first page"))
+
+    with pytest.raises(ConnectionError):
+        await writer.flush()
+    assert writer.stats()["buffered"] == 1
+
+    await writer.add(**evidence(assessment_id, "second page"))
+    assert len(await writer.close()) == 2
+    assert len(session_maker.table.rows) == 2
@@ -0,0 +1,80 @@
+"""Tests for the bounded-concurrency fetch scheduler."""
+
+import asyncio
+import time
+from collections import Counter
+from typing import Any
+from urllib.parse import urlsplit
+
+import pytest
+
+from app.agents.tools.fetch_scheduler import FetchScheduler, as_completed
+
+
+class TrackingFetcher:
+    """Fake page fetcher that records peak concurrency overall and per host."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.active: Counter[str] = Counter()
+        self.peak_total = 0
+        self.peak_per_host = 0
+        self.starts: list[float] = []
+
+    async def __call__(self, url: str, profile: str | None = None) -> dict[str, Any]:
+        host = urlsplit(url).hostname or ""
+        self.active[host] += 1
+        self.starts.append(time.monotonic())
+        self.peak_total = max(self.peak_total, sum(self.active.values()))
+        self.peak_per_host = max(self.peak_per_host, self.active[host])
+        await asyncio.sleep(self.delay)
+        self.active[host] -= 1
+        return {"url": url, "success": True}
+
+
+@pytest.mark.asyncio
+async def test_global_and_per_host_caps() -> None:
+    """Test that neither the global nor the per-host cap is exceeded."""
+    fetcher = TrackingFetcher(delay=0.02)
+    scheduler = FetchScheduler(
+        max_concurrency=3,
+        per_host_concurrency=2,
+        politeness_delay_ms=0,
+        fetcher=fetcher,
+    )
+    urls = [f"https://{host}.com/{i}" for host in "abc" for i in range(4)]
+
+    await asyncio.gather(*(scheduler.fetch(url) for url in urls))
+
+    assert fetcher.peak_total == 3
+    assert fetcher.peak_per_host <= 2
+
+
+@pytest.mark.asyncio
+async def test_politeness_delay_spaces_same_host_starts() -> None:
+    """Test that request starts to one host are spaced by the delay."""
+    fetcher = TrackingFetcher(delay=0)
+    scheduler = FetchScheduler(
+        max_concurrency=4,
+        per_host_concurrency=4,
+        politeness_delay_ms=30,
+        fetcher=fetcher,
+    )
+
+    await asyncio.gather(*(scheduler.fetch(f"https://a.com/{i}") for i in range(3)))
+
+    gaps = [b - a for a, b in zip(fetcher.starts, fetcher.starts[1:])]
+    assert all(gap >= 0.025 for gap in gaps)
+
+
+@pytest.mark.asyncio
+async def test_as_completed_yields_fastest_first() -> None:
+    """Test that results are yielded in completion order."""
+
+    async def after(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    results = [r async for r in as_completed([after(0.03), after(0.01)])]
+
+    assert results == [0.01, 0.03]
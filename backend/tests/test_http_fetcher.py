@@ -0,0 +1,143 @@
+"""Tests for the HTTP-first tiered page fetcher."""
+
+from typing import Any
+
+import httpx
+import pytest
+
+from app.agents.tools.http_fetcher import TieredFetcher, extract_page
+
+STATIC_PAGE = """
+<html><head><title> Acme Ltd | Home </title><script>var x = 1;</script></head>
+<body>
+  <nav><a href="/about">About us</a></nav>
+  <h1>Acme Ltd</h1>
+  <p>We manufacture industrial fasteners for the automotive sector.</p>
+  <p>Read our <a href="https://acme.com/sustainability">Sustainability report</a>.</p>
+  <footer>Copyright Acme</footer>
+</body></html>
+"""
+
+SPA_SHELL = """
+<html><head><title>Acme</title></head>
+<body><div id="root"></div><script src="/bundle.js"></script></body></html>
+"""
+
+
+def make_fetcher(
+    pages: dict[str, str | int | Exception], browser_calls: list[str]
+) -> TieredFetcher:
+    """Build a fetcher over an in-memory site with a fake browser tier.
+
+    A page is its HTML, a status code to answer with, or an error to raise.
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        html = pages.get(str(request.url))
+        if html is None:
+            return httpx.Response(404)
+        if isinstance(html, Exception):
+            raise html
+        if isinstance(html, int):
+            return httpx.Response(html)
+        return httpx.Response(200, text=html, headers={"content-type": "text/html"})
+
+    async def browser(url: str, profile: str | None = None) -> dict[str, Any]:
+        browser_calls.append(url)
+        return {
+            "url": url,
+            "title": "",
+            "content": "rendered",
+            "links": [],
+            "success": True,
+        }
+
+    return TieredFetcher(
+        timeout_seconds=5,
+        max_connections=5,
+        min_text_chars=50,
+        domain_memory_ttl_seconds=60,
+        user_agent="test",
+        use_redis=False,
+        browser_fetcher=browser,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_extract_page_matches_scraper_shape() -> None:
+    """Test that text skips boilerplate while links include navigation."""
+    page = extract_page(STATIC_PAGE, "https://acme.com/")
+
+    assert page["title"] == "Acme Ltd | Home"
+    assert "industrial fasteners" in page["content"]
+    assert "var x" not in page["content"]
+    assert "Copyright" not in page["content"]
+    assert {"href": "https://acme.com/about", "text": "About us"} in page["links"]
+
+
+@pytest.mark.asyncio
+async def test_static_page_is_served_over_http() -> None:
+    """Test that a server-rendered page never touches the browser."""
+    browser_calls: list[str] = []
+    fetcher = make_fetcher({"https://acme.com/": STATIC_PAGE}, browser_calls)
+
+    page = await fetcher.fetch("https://acme.com/")
+    await fetcher.close()
+
+    assert page["tier"] == "http"
+    assert browser_calls == []
+    assert fetcher.stats()["http_hit_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_spa_escalates_and_domain_is_remembered() -> None:
+    """Test that a JS shell escalates and later pages skip the HTTP attempt."""
+    browser_calls: list[str] = []
+    fetcher = make_fetcher({"https://spa.io/": SPA_SHELL}, browser_calls)
+
+    first = await fetcher.fetch("https://spa.io/")
+    second = await fetcher.fetch("https://spa.io/about")
+    await fetcher.close()
+
+    assert first["tier"] == second["tier"] == "browser"
+    assert browser_calls == ["https://spa.io/", "https://spa.io/about"]
+    assert fetcher.stats()["escalated"] == 1
+    assert fetcher.stats()["remembered"] == 1
+
+
+@pytest.mark.asyncio
+async def test_only_content_and_bot_walls_are_remembered() -> None:
+    """Test that network errors and rate limits escalate one page only."""
+    browser_calls: list[str] = []
+    fetcher = make_fetcher(
+        {
+            "https://flaky.com/": httpx.ConnectError("connection reset"),
+            "https://flaky.com/busy": 429,
+            "https://flaky.com/down": 503,
+            "https://flaky.com/about": STATIC_PAGE,
+            "https://walled.com/": 403,
+        },
+        browser_calls,
+    )
+
+    for url in (
+        "https://flaky.com/",
+        "https://flaky.com/busy",
+        "https://flaky.com/down",
+    ):
+        assert (await fetcher.fetch(url))["tier"] == "browser"
+    assert (await fetcher.fetch("https://flaky.com/about"))["tier"] == "http"
+
+    await fetcher.fetch("https://walled.com/")
+    await fetcher.fetch("https://walled.com/contact")
+    await fetcher.close()
+
+    assert browser_calls == [
+        "https://flaky.com/",
+        "https://flaky.com/busy",
+        "https://flaky.com/down",
+        "https://walled.com/",
+        "https://walled.com/contact",
+    ]
+    assert fetcher.stats()["escalated"] == 4
+    assert fetcher.stats()["remembered"] == 1
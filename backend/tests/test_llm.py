@@ -0,0 +1,182 @@
+"""Tests for the LLM provider registry, rate limiting and response cache."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from sqlalchemy.sql.dml import Delete
+
+from app.core import llm_cache as llm_cache_module
+from app.core.llm import TokenBucket, close_llm_clients, get_llm
+from app.core.llm_cache import LLMResponseCache, cache_key
+from app.workers import tasks
+
+
+@pytest.mark.asyncio
+async def test_get_llm_reuses_clients_per_parameter_set() -> None:
+    """Test that identical parameters share one client and others do not."""
+    first = get_llm("openai", "gpt-4o", api_key="sk-test", max_tokens=1500)
+    second = get_llm("openai", "gpt-4o", api_key="sk-test", max_tokens=1500)
+    other = get_llm("openai", "gpt-4o", api_key="sk-test", max_tokens=500)
+
+    assert first is second
+    assert first is not other
+    await close_llm_clients()
+
+
+def test_get_llm_rejects_unknown_provider() -> None:
+    """Test that an unsupported provider raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown LLM provider"):
+        get_llm("nope", "model", api_key="key")
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_queues_when_budget_exhausted() -> None:
+    """Test that a caller waits for the budget to refill."""
+    bucket = TokenBucket(tokens_per_minute=6000)  # 100 tokens per second
+    await bucket.acquire(6000)
+
+    started = time.monotonic()
+    await asyncio.wait_for(bucket.acquire(5), timeout=1)
+
+    assert time.monotonic() - started >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_cache_key_normalizes_prompt_but_not_parameters() -> None:
+    """Test that whitespace is ignored while sampling parameters are not."""
+    llm = get_llm("openai", "gpt-4o", api_key="sk-test", max_tokens=1500)
+    longer = get_llm("openai", "gpt-4o", api_key="sk-test", max_tokens=3000)
+    prompt = [HumanMessage(content="Summarise  Acme Ltd.\n")]
+    reflowed = [HumanMessage(content=" Summarise Acme\nLtd.")]
+
+    assert cache_key(llm, prompt) == cache_key(llm, reflowed)
+    assert cache_key(llm, prompt) != cache_key(longer, prompt)
+    await close_llm_clients()
+
+
+class FakeRedis:
+    """Redis stand-in for the cache's string and sorted-set commands."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.lru: dict[str, float] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.lru.update(mapping)
+        return len(mapping)
+
+    async def zpopmin(self, key: str, count: int) -> list[tuple[str, float]]:
+        oldest = sorted(self.lru.items(), key=lambda item: item[1])[:count]
+        for member, _ in oldest:
+            del self.lru[member]
+        return oldest
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class FakePipeline:
+    """Pipeline stand-in applying queued commands to a FakeRedis."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.results: list[Any] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        pass
+
+    def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.redis.values[key] = value
+        self.results.append(True)
+
+    def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.redis.lru.update(mapping)
+        self.results.append(len(mapping))
+
+    def zcard(self, key: str) -> None:
+        self.results.append(len(self.redis.lru))
+
+    async def execute(self) -> list[Any]:
+        return self.results
+
+
+class FakeSession:
+    """AsyncSession stand-in for the Postgres cache tier."""
+
+    def __init__(self, row: Any = None) -> None:
+        self.row = row
+        self.statements: list[Any] = []
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        pass
+
+    async def scalar(self, statement: Any) -> Any:
+        self.statements.append(statement)
+        return self.row
+
+    async def execute(self, statement: Any) -> SimpleNamespace:
+        self.statements.append(statement)
+        return SimpleNamespace(rowcount=3)
+
+    async def commit(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_response_cache_tiers_and_lru_eviction(monkeypatch) -> None:
+    """Test Redis hits, LRU eviction, Postgres refills and the purge cron."""
+    fake_redis = FakeRedis()
+    monkeypatch.setattr(llm_cache_module.redis, "Redis", lambda **_: fake_redis)
+    cache = LLMResponseCache(
+        ttl_seconds=60, max_entries=2, db_enabled=False, db_ttl_days=1
+    )
+
+    await cache.set("a", "gpt-4o", AIMessage(content="Low risk"), latency_ms=900)
+    await cache.set("b", "gpt-4o", AIMessage(content="High risk"), latency_ms=800)
+    assert (await cache.get("a")).content == "Low risk"  # "a" is now most recent
+    await cache.set("c", "gpt-4o", AIMessage(content="Medium"), latency_ms=700)
+    assert await cache.get("b") is None
+    assert sorted(fake_redis.lru) == ["a", "c"]
+    assert cache.stats()["latency_saved_ms"] == 900
+    assert cache.stats()["hit_rate"] == 0.5
+
+    # A Postgres hit refills Redis
+    row = SimpleNamespace(
+        model="gpt-4o",
+        response={"type": "ai", "data": {"content": "From Postgres"}},
+        latency_ms=500,
+    )
+    session = FakeSession(row)
+    monkeypatch.setattr(llm_cache_module, "async_session_maker", lambda: session)
+    cache.db_enabled = True
+    assert (await cache.get("d")).content == "From Postgres"
+    assert "llm_cache:d" in fake_redis.values
+    assert cache.stats()["db_hits"] == 1
+
+    # The worker cron purges expired rows only when the tier is enabled
+    monkeypatch.setattr(tasks, "llm_cache", cache)
+    assert await tasks.purge_llm_cache({}) == 3
+    assert isinstance(session.statements[-1], Delete)
+    assert "expires_at <" in str(session.statements[-1])
+    cache.db_enabled = False
+    assert await tasks.purge_llm_cache({}) == 0
@@ -0,0 +1,64 @@
+"""Tests for the scraped page snapshot cache."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.agents.tools.page_cache import PageCache, normalize_url, to_run_cache
+
+
+def make_fetcher(calls: list[str], delay: float = 0.0):
+    """Build a fake page fetcher that records the URLs it was asked for."""
+
+    async def fetch(url: str, profile: str | None = None) -> dict[str, Any]:
+        calls.append(url)
+        await asyncio.sleep(delay)
+        return {
+            "url": url,
+            "title": "Acme",
+            "content": "text",
+            "links": [],
+            "success": True,
+        }
+
+    return fetch
+
+
+def test_normalize_url_collapses_equivalent_forms() -> None:
+    """Test that cosmetic URL differences map to the same cache key."""
+    expected = "https://acme.com/about?a=1&b=2"
+    assert normalize_url("HTTPS://Acme.com:443/about/?b=2&a=1#team") == expected
+    assert normalize_url("https://acme.com/about?a=1&utm_source=x&b=2") == expected
+    assert normalize_url("https://acme.com") == "https://acme.com/"
+
+
+@pytest.mark.asyncio
+async def test_run_cache_hit_skips_fetch() -> None:
+    """Test that a page already in the run state is served without fetching."""
+    calls: list[str] = []
+    cache = PageCache(ttl_seconds=60, use_redis=False, fetcher=make_fetcher(calls))
+
+    first = await cache.get("https://acme.com/")
+    second = await cache.get("https://acme.com", to_run_cache(first))
+
+    assert calls == ["https://acme.com/"]
+    assert first["cache"] == "miss"
+    assert second["cache"] == "run"
+    assert cache.stats()["run_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_fetch() -> None:
+    """Test that concurrent lookups of one URL trigger a single fetch."""
+    calls: list[str] = []
+    cache = PageCache(
+        ttl_seconds=60, use_redis=False, fetcher=make_fetcher(calls, delay=0.05)
+    )
+
+    results = await asyncio.gather(
+        cache.get("https://acme.com/esg"), cache.get("https://acme.com/esg/")
+    )
+
+    assert len(calls) == 1
+    assert sorted(r["cache"] for r in results) == ["miss", "shared"]
@@ -0,0 +1,96 @@
+"""Tests for keyset (cursor) pagination."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.db.pagination import keyset_select, paginate
+from app.models.base import BaseModel
+from app.schemas.base import CursorParams, decode_cursor, encode_cursor
+
+
+class Widget(BaseModel):
+    """Throwaway table for pagination tests."""
+
+    __tablename__ = "pagination_test_widgets"
+
+
+class FakeResult:
+    """Result stand-in returning fixed rows from ``scalars().all()``."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+
+    def scalars(self) -> "FakeResult":
+        return self
+
+    def all(self) -> list[Any]:
+        return self.rows
+
+
+class FakeSession:
+    """Session stand-in that records executed statements."""
+
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+        self.statements: list[Any] = []
+
+    async def execute(self, stmt: Any) -> FakeResult:
+        self.statements.append(stmt)
+        return FakeResult(self.rows[: stmt._limit_clause.value])
+
+
+def test_cursor_round_trip_and_validation() -> None:
+    """Test that cursors are opaque, reversible and validated."""
+    created_at = datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, row_id)
+
+    assert decode_cursor(cursor) == (created_at, row_id)
+    assert CursorParams(cursor=cursor).cursor == cursor
+    with pytest.raises(ValidationError):
+        CursorParams(cursor="not-a-cursor")
+
+
+def test_keyset_select_uses_row_comparison_and_index() -> None:
+    """Test the page query seeks past the cursor instead of using OFFSET."""
+    cursor = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+
+    stmt = keyset_select(select(Widget), Widget, CursorParams(cursor=cursor, limit=10))
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "(pagination_test_widgets.created_at, pagination_test_widgets.id) <" in sql
+    assert "ORDER BY pagination_test_widgets.created_at DESC" in sql
+    assert "OFFSET" not in sql
+    assert any(
+        [c.name for c in index.columns] == ["created_at", "id"]
+        for index in Widget.__table__.indexes
+    )
+
+
+@pytest.mark.asyncio
+async def test_paginate_returns_next_cursor_only_when_more_rows() -> None:
+    """Test that the extra fetched row sets the next cursor and is dropped."""
+    now = datetime.now(timezone.utc)
+    rows = [
+        Widget(id=uuid.uuid4(), created_at=now - timedelta(minutes=i)) for i in range(3)
+    ]
+
+    first = await paginate(
+        FakeSession(rows), select(Widget), Widget, CursorParams(limit=2)
+    )
+    last = await paginate(
+        FakeSession(rows[2:]), select(Widget), Widget, CursorParams(limit=2)
+    )
+
+    assert first.items == rows[:2]
+    assert decode_cursor(first.next_cursor) == (rows[1].created_at, rows[1].id)
+    assert first.meta().has_more is True
+    assert last.next_cursor is None
+    assert last.meta().total is None
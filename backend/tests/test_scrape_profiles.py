@@ -0,0 +1,112 @@
+"""Tests for scrape profiles and the browser request filter."""
+
+from typing import Any
+
+import pytest
+
+from app.agents.tools.scrape_profiles import get_profile, is_tracker
+from app.agents.tools.web_scraper import _RequestFilter
+
+
+class FakeRequest:
+    """Playwright request stand-in."""
+
+    def __init__(
+        self,
+        url: str,
+        resource_type: str = "script",
+        navigation: bool = False,
+        body_size: int = 0,
+    ) -> None:
+        self.url = url
+        self.resource_type = resource_type
+        self.navigation = navigation
+        self.body_size = body_size
+
+    def is_navigation_request(self) -> bool:
+        return self.navigation
+
+    async def sizes(self) -> dict[str, int]:
+        return {
+            "requestBodySize": 0,
+            "requestHeadersSize": 100,
+            "responseBodySize": self.body_size,
+            "responseHeadersSize": 200,
+        }
+
+
+class FakeRoute:
+    """Playwright route stand-in recording the decision."""
+
+    def __init__(self) -> None:
+        self.decision = ""
+
+    async def abort(self) -> None:
+        self.decision = "abort"
+
+    async def continue_(self) -> None:
+        self.decision = "continue"
+
+
+async def route(request_filter: _RequestFilter, request: Any) -> str:
+    """Run a request through the filter and return abort or continue."""
+    fake_route = FakeRoute()
+    await request_filter.handle(fake_route, request)  # type: ignore[arg-type]
+    return fake_route.decision
+
+
+def test_trackers_match_by_host_not_substring() -> None:
+    """Test host/subdomain tracker matching and path-based trackers."""
+    assert is_tracker("https://www.google-analytics.com/g/collect?v=2")
+    assert is_tracker("https://cdn.segment.com/analytics.js")
+    assert is_tracker("https://www.facebook.com/tr?id=1&ev=PageView")
+    assert is_tracker("https://www.facebook.com/tr/")
+
+    assert not is_tracker("https://marketsegment.com/")
+    assert not is_tracker("https://acme.com/?ref=google-analytics.com")
+    assert not is_tracker("https://www.facebook.com/acme.fasteners")
+    assert not is_tracker("https://www.facebook.com/travel")
+
+    lite, full = get_profile("lite"), get_profile("full")
+    assert lite.blocks("image", "https://acme.com/logo.png")
+    assert lite.blocks("script", "https://www.googletagmanager.com/gtm.js")
+    assert not lite.blocks("script", "https://acme.com/app.js")
+    assert not full.blocks("image", "https://www.googletagmanager.com/gtm.js")
+
+
+@pytest.mark.asyncio
+async def test_filter_never_blocks_navigation_and_counts_real_sizes() -> None:
+    """Test that documents always load and the budget uses transfer sizes."""
+    request_filter = _RequestFilter(get_profile("lite"))
+    # The supplier's own page, even on a tracker-like host or as a document type
+    assert (
+        await route(
+            request_filter,
+            FakeRequest("https://segment.com/", "document", navigation=True),
+        )
+        == "continue"
+    )
+    assert (
+        await route(request_filter, FakeRequest("https://marketsegment.com/app.js"))
+        == "continue"
+    )
+    assert (
+        await route(request_filter, FakeRequest("https://hotjar.com/c.js")) == "abort"
+    )
+
+    # A chunked response without content-length still counts
+    await request_filter.on_request_finished(
+        FakeRequest("https://acme.com/data.json", body_size=2_000_000)  # type: ignore[arg-type]
+    )
+    assert request_filter.bytes_received == 2_000_200
+    assert (
+        await route(request_filter, FakeRequest("https://acme.com/app.js")) == "abort"
+    )
+    assert (
+        await route(
+            request_filter,
+            FakeRequest("https://acme.com/about", "document", navigation=True),
+        )
+        == "continue"
+    )
+    assert request_filter.blocked == 2
@@ -0,0 +1,78 @@
+"""Tests for watchlist name normalization, matching and list loading."""
+
+import json
+
+import pytest
+
+from app.screening import ScreeningEngine, ScreeningIndex, WatchlistEntry
+from app.screening.normalize import block_keys, normalize_name
+
+ENTRIES = [
+    WatchlistEntry(
+        "sdn", "1", "Sergei Viktorovich Ivanov", ("Sergey Ivanov",), "individual"
+    ),
+    WatchlistEntry("sdn", "2", "Al Rashid Trading Company LLC", (), "organization"),
+    WatchlistEntry("eu", "7", "Mohammed Hassan", ("Muhammad Hasan",), "individual"),
+]
+
+
+def test_normalize_name_transliterates_and_drops_legal_forms() -> None:
+    """Test that script, diacritics, punctuation and legal forms are folded."""
+    assert normalize_name("Иванов Сергей") == "ivanov sergei"
+    assert normalize_name("Société Générale S.A.") == "societe generale"
+    assert normalize_name("Müller-Lüdenscheidt GmbH") == "muller ludenscheidt"
+    assert normalize_name("LLC") == "llc"
+
+    # Spelling variants share a phonetic blocking key
+    assert set(block_keys("mohammed")) & set(block_keys("muhamad"))
+
+
+def test_index_matches_variants_and_aliases() -> None:
+    """Test fuzzy matching across scripts, word order, aliases and joins."""
+    index = ScreeningIndex.build(ENTRIES)
+
+    [match] = index.screen("Иванов Сергей")
+    assert match.entry.entry_id == "1"
+    assert match.matched_name == "Sergey Ivanov"
+    assert match.score >= 90
+
+    assert index.screen("Alrashid Trading Ltd")[0].entry.entry_id == "2"
+    assert index.screen("Mohamed Hasan")[0].entry.entry_id == "7"
+
+    # A shared surname alone, or an unrelated name, does not match
+    assert index.screen("Ivanov") == []
+    assert index.screen("Acme Industrial Fasteners") == []
+
+    results = index.screen_many(["Sergey Ivanov", "Nobody Here", "sergey  IVANOV"])
+    assert [len(matches) for matches in results] == [1, 0, 1]
+
+
+@pytest.mark.asyncio
+async def test_engine_loads_csv_and_ndjson_lists(tmp_path) -> None:
+    """Test reading list files and swapping in the built index."""
+    (tmp_path / "un.csv").write_text(
+        "id,name,aliases,type,countries,programs\n"
+        "QDi.1,Northern Star Shipping Ltd,North Star Shipping;NSS Co,"
+        "organization,KP,DPRK\n"
+        ",,,,,\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "debarred.ndjson").write_text(
+        json.dumps({"id": "WB-9", "name": "Delta Build Group", "countries": ["KE"]})
+        + "\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    engine = ScreeningEngine()
+    assert not engine.ready
+    await engine.load(str(tmp_path))
+
+    assert engine.ready
+    assert len(engine) == 2
+    [match] = await engine.screen("North Star Shipping")
+    assert match.entry.list_name == "un"
+    assert match.entry.aliases == ("North Star Shipping", "NSS Co")
+    assert match.entry.countries == ("KP",)
+    [[match]] = await engine.screen_many(["Delta Build Group Ltd"])
+    assert match.entry.entry_id == "WB-9"
@@ -0,0 +1,77 @@
+"""Tests for the memory-mapped on-disk screening index."""
+
+import mmap
+
+import pytest
+
+from app.screening import ScreeningEngine, ScreeningIndex, WatchlistEntry
+from app.screening.store import open_index, write_index
+
+HEADER = "id,name,aliases,type,countries,programs\n"
+
+
+def test_index_round_trips_through_mmap(tmp_path) -> None:
+    """Test that a mapped index matches the built one without copying it."""
+    built = ScreeningIndex.build(
+        [
+            WatchlistEntry(
+                "sdn", "1", "Sergei Ivanov", ("Сергей Иванов",), "individual"
+            ),
+            WatchlistEntry("un", "QDi.1", "Northern Star Shipping", (), "", ("KP",)),
+        ]
+    )
+    path = tmp_path / "index.bin"
+    write_index(built, path)
+    mapped = open_index(path)
+
+    assert mapped.file == "index.bin"
+    assert isinstance(mapped.sorted_names.data, mmap.mmap)
+    assert list(mapped.entries) == list(built.entries)
+    assert mapped.stats() == built.stats()
+    assert mapped.screen("Sergey Ivanov") == built.screen("Sergey Ivanov")
+    assert mapped.screen("North Star Shipping")[0].entry.countries == ("KP",)
+
+    # An empty index is a valid file too
+    write_index(ScreeningIndex(), path)
+    assert len(open_index(path)) == 0
+
+    path.write_bytes(b"not an index" * 4)
+    with pytest.raises(ValueError):
+        open_index(path)
+
+
+@pytest.mark.asyncio
+async def test_processes_share_published_index(tmp_path) -> None:
+    """Test that engines sharing an index dir open what another published."""
+    lists = tmp_path / "lists"
+    lists.mkdir()
+    (lists / "sdn.csv").write_text(
+        HEADER + "1,Northern Star Shipping,,,,\n2,Delta Build Group,,,,\n",
+        encoding="utf-8",
+    )
+    index_dir = str(tmp_path / "index")
+    builder, reader = ScreeningEngine(index_dir), ScreeningEngine(index_dir)
+
+    [delta] = await builder.load(str(lists))
+    assert len(delta.added) == 2
+    main_file = builder.manifest["main"]
+    assert builder.layers[0].file == main_file
+
+    # The second process only maps the published files
+    assert await reader.load(str(lists)) == []
+    assert reader.layers[0].file == main_file
+    assert len(reader) == 2
+
+    # A delta is published as an overlay plus removals, reusing the main file
+    (lists / "sdn.csv").write_text(
+        HEADER + "1,Northern Star Shipping,,,,\n3,Gamma Metals Trading,,,,\n",
+        encoding="utf-8",
+    )
+    [delta] = await builder.load(str(lists))
+    assert builder.manifest["main"] == main_file
+    assert builder.manifest["removed"] == [1]
+
+    assert await reader.sync()
+    assert reader.versions == builder.versions
+    assert await reader.screen("Delta Build Group") == []
+    assert (await reader.screen("Gamma Metals Trading"))[0].entry.entry_id == "3"
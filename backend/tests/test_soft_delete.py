@@ -0,0 +1,70 @@
+"""Tests for the soft-delete aware query layer."""
+
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+
+from app.db.soft_delete import (
+    INCLUDE_DELETED,
+    LiveRowSession,
+    include_deleted,
+    restore,
+    soft_delete,
+)
+from app.models.base import BaseModel
+
+
+class Note(BaseModel):
+    """Throwaway table for soft-delete tests."""
+
+    __tablename__ = "soft_delete_test_notes"
+
+
+class RecordingSession:
+    """AsyncSession stand-in that records the statement it executes."""
+
+    def __init__(self) -> None:
+        self.statement: Any = None
+
+    async def execute(self, stmt: Any) -> Any:
+        self.statement = stmt
+        return type("Result", (), {"rowcount": 3})()
+
+
+def test_selects_hide_deleted_rows_unless_opted_out() -> None:
+    """Test the automatic live-row filter and both opt-out forms."""
+    engine = create_engine("sqlite://")
+    Note.__table__.create(engine)
+    with LiveRowSession(engine) as session:
+        live, gone = Note(), Note()
+        gone.soft_delete()
+        session.add_all([live, gone])
+        session.commit()
+
+        visible = session.scalars(select(Note)).all()
+        everything = session.scalars(include_deleted(select(Note))).all()
+        via_option = session.scalars(
+            select(Note), execution_options={INCLUDE_DELETED: True}
+        ).all()
+
+    assert [note.id for note in visible] == [live.id]
+    assert {note.id for note in everything} == {live.id, gone.id}
+    assert len(via_option) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_soft_delete_and_restore_are_single_updates() -> None:
+    """Test that bulk operations are one UPDATE guarded by deleted_at."""
+    session = RecordingSession()
+
+    assert await soft_delete(session, Note, Note.id.in_(["a", "b"])) == 3
+    delete_sql = str(session.statement.compile(dialect=postgresql.dialect()))
+    await restore(session, Note)
+    restore_sql = str(session.statement.compile(dialect=postgresql.dialect()))
+
+    assert delete_sql.startswith("UPDATE soft_delete_test_notes SET")
+    assert "deleted_at=now()" in delete_sql
+    assert "deleted_at IS NULL" in delete_sql
+    assert "deleted_at IS NOT NULL" in restore_sql
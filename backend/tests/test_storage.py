@@ -0,0 +1,239 @@
+"""Tests for streamed, ranged and multipart storage transfers."""
+
+import asyncio
+import datetime
+import io
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest import mock
+
+import botocore.session
+import pytest
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from fastapi import HTTPException
+
+from app.api import files
+from app.core import storage
+from app.core.config import settings
+
+
+class FakeBody:
+    """Streaming body stand-in reading from bytes."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = io.BytesIO(data)
+
+    async def __aenter__(self) -> "FakeBody":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        pass
+
+    async def iter_chunks(self, chunk_size: int):  # type: ignore[no-untyped-def]
+        while chunk := self.data.read(chunk_size):
+            yield chunk
+
+
+class FakeS3:
+    """S3 client stand-in keeping objects and multipart uploads in dicts."""
+
+    def __init__(self) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.calls: list[str] = []
+        self.ranges: list[str | None] = []
+        self.fail_part: int | None = None
+
+    async def put_object(self, Key: str, Body: bytes, **_: Any) -> None:
+        self.calls.append("put_object")
+        self.objects[Key] = Body
+
+    async def create_multipart_upload(self, Key: str, **_: Any) -> dict[str, str]:
+        self.calls.append("create_multipart_upload")
+        self.uploads[Key] = {}
+        return {"UploadId": "u1"}
+
+    async def upload_part(
+        self, Key: str, PartNumber: int, Body: bytes, **_: Any
+    ) -> dict[str, str]:
+        await asyncio.sleep(0)
+        if PartNumber == self.fail_part:
+            raise ConnectionError("part failed")
+        self.uploads[Key][PartNumber] = Body
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    async def complete_multipart_upload(
+        self, Key: str, MultipartUpload: dict[str, Any], **_: Any
+    ) -> None:
+        self.calls.append("complete_multipart_upload")
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == list(range(1, len(numbers) + 1))
+        parts = self.uploads.pop(Key)
+        self.objects[Key] = b"".join(parts[number] for number in numbers)
+
+    async def abort_multipart_upload(self, Key: str, **_: Any) -> None:
+        self.calls.append("abort_multipart_upload")
+        del self.uploads[Key]
+
+    async def delete_objects(self, Delete: dict[str, Any], **_: Any) -> dict:
+        self.calls.append("delete_objects")
+        errors = []
+        for item in Delete["Objects"]:
+            if item["Key"].startswith("locked/"):
+                errors.append({"Key": item["Key"], "Code": "AccessDenied"})
+            else:
+                self.objects.pop(item["Key"], None)
+        return {"Errors": errors} if errors else {}
+
+    async def head_object(self, Key: str, **_: Any) -> dict[str, Any]:
+        return {
+            "ContentLength": len(self.objects[Key]),
+            "ContentType": "text/csv",
+            "ETag": '"abc"',
+        }
+
+    async def get_object(
+        self, Key: str, Range: str | None = None, **_: Any
+    ) -> dict[str, Any]:
+        self.ranges.append(Range)
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        data = self.objects[Key]
+        if Range:
+            first, last = Range.removeprefix("bytes=").split("-")
+            if not first:
+                data = data[-int(last) :]
+            else:
+                data = data[int(first) : int(last) + 1 if last else None]
+        return {"Body": FakeBody(data)}
+
+
+@pytest.fixture
+def s3(monkeypatch: pytest.MonkeyPatch) -> FakeS3:
+    client = FakeS3()
+
+    @asynccontextmanager
+    async def get_s3_client():  # type: ignore[no-untyped-def]
+        yield client
+
+    monkeypatch.setattr(storage, "get_s3_client", get_s3_client)
+    monkeypatch.setattr(settings, "STORAGE_CHUNK_SIZE", 4)
+    monkeypatch.setattr(settings, "STORAGE_MULTIPART_THRESHOLD", 20)
+    monkeypatch.setattr(settings, "STORAGE_MULTIPART_PART_SIZE", 8)
+    monkeypatch.setattr(settings, "STORAGE_MULTIPART_CONCURRENCY", 2)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_upload_switches_to_parallel_multipart(s3: FakeS3) -> None:
+    """Test single-request small uploads and multipart uploads above the limit."""
+    await storage.upload_file(b"small file", "small.txt")
+    assert s3.calls == ["put_object"]
+    assert s3.objects["small.txt"] == b"small file"
+
+    async def stream():  # type: ignore[no-untyped-def]
+        for i in range(10):
+            yield f"chunk-{i};".encode()
+
+    data = b"".join([chunk async for chunk in stream()])
+    await storage.upload_file(stream(), "large.txt")
+    await storage.upload_file(io.BytesIO(data), "large-file.txt")
+    assert s3.objects["large.txt"] == s3.objects["large-file.txt"] == data
+    assert s3.calls.count("complete_multipart_upload") == 2
+
+    # A failed part aborts the upload and surfaces the error
+    s3.fail_part = 3
+    with pytest.raises(ConnectionError):
+        await storage.upload_file(data, "broken.txt")
+    assert s3.calls[-1] == "abort_multipart_upload"
+    assert "broken.txt" not in s3.objects and not s3.uploads
+
+
+@pytest.mark.asyncio
+async def test_ranged_reads_and_streaming_response(s3: FakeS3, tmp_path) -> None:
+    """Test chunked and ranged downloads and 200/206/416 file responses."""
+    s3.objects["list.csv"] = b"0123456789"
+
+    assert [c async for c in storage.iter_file("list.csv")] == [
+        b"0123",
+        b"4567",
+        b"89",
+    ]
+    assert await storage.read_range("list.csv", 2, 5) == b"234"
+    assert await storage.read_range("list.csv", -3) == b"789"
+    assert s3.ranges[-2:] == ["bytes=2-4", "bytes=-3"]
+    assert await storage.download_to_path("list.csv", tmp_path / "l.csv") == 10
+    assert (tmp_path / "l.csv").read_bytes() == b"0123456789"
+
+    response = await files.object_response("list.csv", filename="list.csv")
+    assert response.status_code == 200
+    assert response.headers["content-length"] == "10"
+    assert b"".join([c async for c in response.body_iterator]) == b"0123456789"
+
+    response = await files.object_response("list.csv", "bytes=6-")
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 6-9/10"
+    assert b"".join([c async for c in response.body_iterator]) == b"6789"
+
+    assert files.parse_range("bytes=-4", 10) == (6, 10)
+    assert files.parse_range("bytes=0-99", 10) == (0, 10)
+    assert files.parse_range("bytes=0-1,4-5", 10) is None
+    with pytest.raises(HTTPException) as error:
+        files.parse_range("bytes=10-", 10)
+    assert error.value.status_code == 416
+
+
+@pytest.mark.asyncio
+async def test_shared_client_and_batch_operations(s3: FakeS3) -> None:
+    """Test one client per process, bulk deletes and concurrent multi-get."""
+    shared = storage.StorageClient()
+    await shared.start()
+    client = await shared.client()
+    await shared.start()
+    assert await shared.client() is client
+    await shared.close()
+    assert shared._client is None
+
+    s3.objects.update({f"k{i}": b"%d" % i for i in range(5)})
+    s3.objects["locked/a"] = b""
+    contents = await storage.download_files(["k1", "k3", "k1", "missing"])
+    assert contents == {"k1": b"1", "k3": b"3", "missing": None}
+
+    with mock.patch.object(storage, "_DELETE_BATCH_SIZE", 2):
+        failed = await storage.delete_files(["k0", "k1", "k2", "locked/a", "gone"])
+    assert failed == ["locked/a"]
+    assert s3.calls.count("delete_objects") == 3
+    assert sorted(s3.objects) == ["k3", "k4", "locked/a"]
+
+
+def test_presigned_url_matches_client_signature() -> None:
+    """Test that locally signed URLs equal the ones an S3 client generates."""
+    client = botocore.session.get_session().create_client(
+        "s3",
+        endpoint_url=settings.MINIO_URL,
+        aws_access_key_id=settings.MINIO_ACCESS_KEY,
+        aws_secret_access_key=settings.MINIO_SECRET_KEY,
+        region_name="us-east-1",
+        config=Config(signature_version="s3v4", s3={"addressing_style": "path"}),
+    )
+    now = datetime.datetime(2026, 10, 17, 12, 0, 0)
+    with mock.patch("botocore.auth.datetime") as clock:
+        clock.datetime.utcnow.return_value = now
+        clock.datetime.now.return_value = now
+        for operation in ("get_object", "put_object"):
+            expected = client.generate_presigned_url(
+                operation,
+                Params={
+                    "Bucket": settings.MINIO_BUCKET_NAME,
+                    "Key": "reports/a b+é.pdf",
+                },
+                ExpiresIn=600,
+            )
+            url = storage.get_presigned_url(
+                "reports/a b+é.pdf", expires_in=600, operation=operation
+            )
+            assert url == expected
+
+    with pytest.raises(ValueError):
+        storage.get_presigned_url("x", operation="delete_object")
@@ -0,0 +1,170 @@
+"""Tests for streaming supplier list parsing and bulk batch submission."""
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from app.core.config import settings
+from app.services import bulk_assessment_service
+from app.services.bulk_assessment_service import submit_bulk_batch
+from app.services.supplier_import import (
+    ImportFormat,
+    SupplierImportError,
+    SupplierRow,
+    normalize_domain,
+    parse_suppliers,
+)
+
+
+async def chunked(data: bytes, size: int) -> AsyncIterator[bytes]:
+    """Yield ``data`` in fixed-size chunks, like a request body stream."""
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def collect(data: bytes, import_format: ImportFormat, size: int = 7) -> list:
+    """Parse ``data`` split into small chunks and return every row."""
+    return [row async for row in parse_suppliers(chunked(data, size), import_format)]
+
+
+@pytest.mark.asyncio
+async def test_csv_parses_across_chunk_boundaries() -> None:
+    """Test a BOM, CRLF endings and a quoted multi-line field split mid-chunk."""
+    data = (
+        "﻿Name,Website,Country\r\n"
+        '"Acme, Inc.",acme.com,DE\r\n'
+        '"Globex\nHoldings",https://www.globex.co.uk/about,GB\r\n'
+        "No Site,,FR\r\n"
+    ).encode()
+
+    rows = await collect(data, ImportFormat.CSV)
+
+    assert [row.domain for row in rows] == ["acme.com", "globex.co.uk", None]
+    assert rows[0].name == "Acme, Inc."
+    assert rows[0].url == "https://acme.com"
+    assert rows[1].name == "Globex\nHoldings"
+
+
+@pytest.mark.asyncio
+async def test_csv_without_url_column_is_rejected() -> None:
+    """Test that a header with no website column fails the upload."""
+    with pytest.raises(SupplierImportError):
+        await collect(b"name,country\nAcme,DE\n", ImportFormat.CSV)
+
+
+@pytest.mark.asyncio
+async def test_json_array_and_ndjson_stream_records() -> None:
+    """Test JSON array objects split across chunks, and NDJSON bad lines."""
+    array = b'[{"url": "acme.com", "name": "Acme"}, {"website": "initech.io"}]'
+    ndjson = b'{"url": "acme.com"}\nnot json\n{"domain": "initech.io"}\n'
+
+    array_rows = await collect(array, ImportFormat.JSON, size=5)
+    ndjson_rows = await collect(ndjson, ImportFormat.NDJSON, size=5)
+
+    assert [row.domain for row in array_rows] == ["acme.com", "initech.io"]
+    assert [row.domain for row in ndjson_rows] == ["acme.com", None, "initech.io"]
+    with pytest.raises(SupplierImportError):
+        await collect(b'[{"url": "acme.com"}', ImportFormat.JSON)
+
+
+def test_normalize_domain() -> None:
+    """Test that scheme, case, www. and path don't affect the domain."""
+    assert normalize_domain("https://WWW.Acme.com/esg?x=1") == "acme.com"
+    assert normalize_domain("acme.com:8443") == "acme.com"
+    assert normalize_domain("localhost") is None
+    assert normalize_domain("") is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_batch_dedupes_and_counts(monkeypatch) -> None:
+    """Test domain dedupe, invalid rows and batched enqueueing."""
+    enqueued: list[tuple[str, str | None]] = []
+    saved: list[dict[str, Any]] = []
+
+    async def fake_enqueue(url: str, **kwargs: Any) -> str:
+        enqueued.append((url, kwargs.get("batch_id")))
+        return "id"
+
+    async def fake_save(batch_id, counters, status, error="") -> None:
+        saved.append({**counters, "status": status})
+
+    async def no_progress(batch_id: str) -> None:
+        return None
+
+    monkeypatch.setattr(bulk_assessment_service, "enqueue_assessment", fake_enqueue)
+    monkeypatch.setattr(bulk_assessment_service, "_save_progress", fake_save)
+    monkeypatch.setattr(bulk_assessment_service, "get_batch_progress", no_progress)
+    monkeypatch.setattr(settings, "BULK_ENQUEUE_BATCH_SIZE", 2)
+
+    async def rows() -> AsyncIterator[SupplierRow]:
+        for url in ["acme.com", "www.acme.com", "initech.io", "", "globex.com"]:
+            yield SupplierRow(url=url, domain=normalize_domain(url))
+
+    progress = await submit_bulk_batch(rows(), batch_id="b1")
+
+    assert [url for url, _ in enqueued] == ["acme.com", "initech.io", "globex.com"]
+    assert {batch for _, batch in enqueued} == {"b1"}
+    assert progress["total"] == 5
+    assert progress["duplicates"] == 1
+    assert progress["invalid"] == 1
+    assert progress["queued"] == 3
+    # One flush per full batch of two, then the remainder
+    assert [s["queued"] for s in saved] == [0, 2, 3]
+
+
+@pytest.fixture
+def batch_queue(monkeypatch) -> dict[str, list[Any]]:
+    """Record enqueued URLs and saved progress instead of using Redis."""
+    recorded: dict[str, list[Any]] = {"enqueued": [], "saved": []}
+
+    async def fake_enqueue(url: str, **kwargs: Any) -> str:
+        recorded["enqueued"].append(url)
+        return "id"
+
+    async def fake_save(batch_id, counters, status, error="") -> None:
+        recorded["saved"].append({**counters, "status": status, "error": error})
+
+    monkeypatch.setattr(bulk_assessment_service, "enqueue_assessment", fake_enqueue)
+    monkeypatch.setattr(bulk_assessment_service, "_save_progress", fake_save)
+    monkeypatch.setattr(settings, "BULK_ENQUEUE_BATCH_SIZE", 2)
+    return recorded
+
+
+@pytest.mark.asyncio
+async def test_malformed_upload_still_queues_accepted_rows(batch_queue) -> None:
+    """Test that rows parsed before a malformed one run and counters add up."""
+
+    async def rows() -> AsyncIterator[SupplierRow]:
+        for url in ["acme.com", "initech.io", "acme.com", "globex.com"]:
+            yield SupplierRow(url=url, domain=normalize_domain(url))
+        raise SupplierImportError("Row 5: unterminated quoted field")
+
+    with pytest.raises(SupplierImportError):
+        await submit_bulk_batch(rows(), batch_id="b1")
+
+    # globex.com sat in a partial enqueue batch when the error arrived
+    assert batch_queue["enqueued"] == ["acme.com", "initech.io", "globex.com"]
+    final = batch_queue["saved"][-1]
+    assert final["status"] == "aborted"
+    assert "unterminated" in final["error"]
+    assert final["queued"] == 3
+    assert final["total"] - final["duplicates"] - final["invalid"] == final["queued"]
+
+
+@pytest.mark.asyncio
+async def test_upload_over_row_limit_is_aborted(batch_queue, monkeypatch) -> None:
+    """Test that suppliers past BULK_MAX_ROWS are rejected, earlier ones queued."""
+    monkeypatch.setattr(settings, "BULK_MAX_ROWS", 3)
+
+    async def rows() -> AsyncIterator[SupplierRow]:
+        for url in ["a.com", "b.com", "a.com", "", "c.com", "d.com", "e.com"]:
+            yield SupplierRow(url=url, domain=normalize_domain(url))
+
+    with pytest.raises(SupplierImportError, match="more than 3"):
+        await submit_bulk_batch(rows(), batch_id="b1")
+
+    assert batch_queue["enqueued"] == ["a.com", "b.com", "c.com"]
+    final = batch_queue["saved"][-1]
+    assert final["status"] == "aborted"
+    assert final == {**final, "total": 5, "duplicates": 1, "invalid": 1, "queued": 3}
@@ -0,0 +1,122 @@
+"""Tests for scraped text normalization, chunking and deduplication."""
+
+from typing import Any
+
+import pytest
+
+from app.agents.tools import text_dedup
+from app.agents.tools.text_dedup import (
+    TextDeduplicator,
+    load_supplier_history,
+    minhash,
+    pack_chunks,
+    save_supplier_history,
+    similarity,
+    split_paragraphs,
+)
+
+FOOTER = (
+    "Acme Ltd is committed to responsible sourcing and fair labour across "
+    "its entire supply chain. Copyright 2025 Acme Ltd. All rights reserved."
+)
+
+
+def test_split_paragraphs_normalizes_and_bounds_length() -> None:
+    """Test whitespace/Unicode normalization and sentence-level splitting."""
+    text = "  Cookie\u00a0banner \u200b  \n\n---\nOne. Two! Three?\n"
+
+    assert split_paragraphs(text) == ["Cookie banner", "One. Two! Three?"]
+    assert split_paragraphs("One. Two! Three?", max_chars=9) == [
+        "One. Two!",
+        "Three?",
+    ]
+    assert pack_chunks(["aaaa", "bbbb", "cccc"], max_chars=9) == [
+        "aaaa\nbbbb",
+        "cccc",
+    ]
+
+
+def test_deduplicator_drops_exact_and_near_repeats() -> None:
+    """Test that repeated boilerplate is dropped across pages."""
+    dedup = TextDeduplicator(threshold=0.7)
+    home = f"Welcome to Acme\nAccept all cookies\n{FOOTER}"
+    about = (
+        "ACCEPT ALL COOKIES!\n"
+        "Founded in 1990, Acme makes industrial fasteners in Leeds.\n"
+        + FOOTER.replace("2025", "2026")
+    )
+
+    assert dedup.novel_text(home) == home
+    assert dedup.novel_text(about) == (
+        "Founded in 1990, Acme makes industrial fasteners in Leeds."
+    )
+    assert dedup.stats()["exact_duplicates"] == 1
+    assert dedup.stats()["near_duplicates"] == 1
+
+
+def test_minhash_estimates_similarity() -> None:
+    """Test that signatures separate near duplicates from unrelated text."""
+    unrelated = (
+        "Our modern slavery statement describes audits of tier two suppliers "
+        "in textile manufacturing across three countries."
+    )
+
+    assert minhash("too short to shingle") is None
+    assert similarity(minhash(FOOTER), minhash(FOOTER.replace("2025", "2026"))) > 0.6
+    assert similarity(minhash(FOOTER), minhash(unrelated)) < 0.2
+
+
+class DecodingRedis:
+    """Hash-only Redis stand-in that, like the shared pool, decodes replies."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, Any]] = {}
+
+    def __call__(self, **_: Any) -> "DecodingRedis":
+        return self
+
+    async def hlen(self, key: str) -> int:
+        return len(self.hashes.get(key, {}))
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return {
+            field: value.decode() if isinstance(value, bytes) else str(value)
+            for field, value in self.hashes.get(key, {}).items()
+        }
+
+    def pipeline(self, transaction: bool = True) -> "DecodingRedis":
+        return self
+
+    async def __aenter__(self) -> "DecodingRedis":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        pass
+
+    def hset(self, key: str, mapping: dict[str, Any]) -> None:
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def expire(self, key: str, seconds: int) -> None:
+        pass
+
+    async def execute(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_supplier_history_round_trips_through_redis(monkeypatch) -> None:
+    """Test that saved paragraphs and signatures are recognized next run."""
+    monkeypatch.setattr(text_dedup.redis, "Redis", DecodingRedis())
+    first_run = TextDeduplicator()
+    first_run.novel_text(f"Accept all cookies\n{FOOTER}")
+    await save_supplier_history("acme.com", first_run)
+
+    second_run = await load_supplier_history("acme.com")
+
+    # Exact repeats by key, near repeats by the stored signature
+    assert not second_run.is_novel("ACCEPT ALL COOKIES!")
+    assert not second_run.is_novel(f"{FOOTER} Registered in England.")
+    assert second_run.is_novel("Founded in 1990, Acme makes fasteners in Leeds.")
@@ -0,0 +1,90 @@
+"""Tests for incremental watchlist refresh and re-screen targeting."""
+
+import pytest
+
+from app.core.config import settings
+from app.screening import ScreeningEngine, WatchlistDelta, WatchlistEntry
+from app.services.watchlist_refresh import affected_suppliers
+
+HEADER = "id,name,aliases,type,countries,programs\n"
+
+
+@pytest.mark.asyncio
+async def test_refresh_applies_delta_without_rebuilding(tmp_path) -> None:
+    """Test that changed entries are diffed and swapped in incrementally."""
+    path = tmp_path / "sdn.csv"
+    path.write_text(
+        HEADER
+        + "1,Northern Star Shipping,,organization,,\n"
+        + "2,Delta Build Group,,organization,,\n"
+        + "3,Sergei Ivanov,,individual,,\n",
+        encoding="utf-8",
+    )
+    engine = ScreeningEngine()
+    [delta] = await engine.load(str(tmp_path))
+    assert len(delta.added) == 3 and delta.previous_version is None
+    main = engine.layers[0]
+    assert len(main) == 3
+
+    # Unchanged file: nothing is read or swapped
+    assert await engine.load(str(tmp_path)) == []
+
+    # Remove 2, edit 3 (new alias), add 4
+    path.write_text(
+        HEADER
+        + "1,Northern Star Shipping,,organization,,\n"
+        + "3,Sergei Ivanov,Sergey Ivanov,individual,,\n"
+        + "4,Gamma Metals Trading,,organization,,\n",
+        encoding="utf-8",
+    )
+    [delta] = await engine.load(str(tmp_path))
+    assert delta.previous_version is not None
+    assert {e.entry_id for e in delta.added} == {"3", "4"}
+    assert {e.entry_id for e in delta.removed} == {"2", "3"}
+
+    # The main index arrays are reused; additions live in the overlay
+    assert engine.layers[0].postings is main.postings
+    assert len(engine) == 3
+    assert await engine.screen("Delta Build Group") == []
+    [match] = await engine.screen("Sergey Ivanov")
+    assert match.entry.aliases == ("Sergey Ivanov",)
+    [[match]] = await engine.screen_many(["Gamma Metals Trading Ltd"])
+    assert match.entry.entry_id == "4"
+
+
+@pytest.mark.asyncio
+async def test_overlay_is_merged_when_full(tmp_path, monkeypatch) -> None:
+    """Test that a full overlay is merged and dropped lists are removed."""
+    monkeypatch.setattr(settings, "SCREENING_OVERLAY_MAX_ENTRIES", 1)
+    (tmp_path / "un.csv").write_text(
+        HEADER + "1,Northern Star Shipping,,,,\n", encoding="utf-8"
+    )
+    engine = ScreeningEngine()
+    await engine.load(str(tmp_path))
+    (tmp_path / "eu.csv").write_text(
+        HEADER + "7,Delta Build Group,,,,\n8,Gamma Metals,,,,\n", encoding="utf-8"
+    )
+    await engine.load(str(tmp_path))
+
+    main, overlay = engine.layers
+    assert len(main) == 3 and len(overlay) == 0
+    assert (await engine.screen("Gamma Metals"))[0].entry.list_name == "eu"
+
+    (tmp_path / "un.csv").unlink()
+    [delta] = await engine.load(str(tmp_path))
+    assert delta.version == "" and len(delta.removed) == 1
+    assert len(engine) == 2 and list(engine.versions) == ["eu"]
+
+
+def test_affected_suppliers_targets_removed_and_added_matches() -> None:
+    """Test that only suppliers a list change can affect are selected."""
+    removed = WatchlistEntry("sdn", "2", "Delta Build Group")
+    added = WatchlistEntry("sdn", "4", "Gamma Metals Trading")
+    suppliers = {
+        "delta.example": {"names": ["Delta Build"], "matches": ["sdn:2"]},
+        "gamma.example": {"names": ["Acme", "Gamma Metals"], "matches": []},
+        "other.example": {"names": ["Acme Fasteners"], "matches": ["sdn:9"]},
+    }
+    delta = WatchlistDelta("sdn", "v1", "v2", added=[added], removed=[removed])
+
+    assert affected_suppliers(delta, suppliers) == {"delta.example", "gamma.example"}
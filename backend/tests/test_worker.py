@@ -0,0 +1,147 @@
+"""Tests for the ARQ assessment task."""
+
+import uuid
+from typing import Any
+
+import pytest
+from arq import Retry
+
+from app.core.config import settings
+from app.workers import tasks
+from app.workers.tasks import retry_delay, run_assessment
+
+
+class RecordingPublisher:
+    """Stand-in for EventPublisher that records emitted event types."""
+
+    emitted: list[str] = []
+
+    def __init__(self, assessment_id: str) -> None:
+        self.assessment_id = assessment_id
+
+    async def emit(self, event_type: str, **data: Any) -> None:
+        self.emitted.append(event_type)
+
+
+@pytest.fixture
+def publisher(monkeypatch) -> type[RecordingPublisher]:
+    """Record events instead of publishing them to Redis."""
+    RecordingPublisher.emitted = []
+    monkeypatch.setattr(tasks, "EventPublisher", RecordingPublisher)
+    monkeypatch.setattr(settings, "CHECKPOINT_ENABLED", False)
+    return RecordingPublisher
+
+
+async def failing_workflow(
+    supplier_url: str, assessment_id: str, checkpointer: Any = None
+) -> dict:
+    """Workflow stand-in that always fails."""
+    raise RuntimeError("registry unavailable")
+
+
+def test_retry_delay_doubles_up_to_cap() -> None:
+    """Test exponential backoff between attempts."""
+    base = settings.WORKER_RETRY_BACKOFF_SECONDS
+    assert retry_delay(1) == base
+    assert retry_delay(2) == base * 2
+    assert retry_delay(50) == settings.WORKER_RETRY_BACKOFF_MAX_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_failed_attempt_is_retried_with_backoff(monkeypatch, publisher) -> None:
+    """Test that a failure with tries remaining raises Retry, not a terminal event."""
+    monkeypatch.setattr(tasks, "run_workflow", failing_workflow)
+
+    with pytest.raises(Retry) as exc_info:
+        await run_assessment({"job_try": 1}, "a1", "https://acme.com")
+
+    assert exc_info.value.defer_score == retry_delay(1) * 1000
+    assert publisher.emitted == ["retrying"]
+
+
+@pytest.mark.asyncio
+async def test_last_attempt_failure_is_reported(monkeypatch, publisher) -> None:
+    """Test that the final failed attempt publishes a failed event and raises."""
+    monkeypatch.setattr(tasks, "run_workflow", failing_workflow)
+
+    with pytest.raises(RuntimeError, match="registry unavailable"):
+        await run_assessment(
+            {"job_try": settings.WORKER_MAX_TRIES}, "a1", "https://acme.com"
+        )
+
+    assert publisher.emitted == ["failed"]
+
+
+@pytest.mark.asyncio
+async def test_successful_run_returns_summary(monkeypatch, publisher) -> None:
+    """Test that a completed run publishes completion and returns its outputs."""
+
+    async def workflow(
+        supplier_url: str, assessment_id: str, checkpointer: Any = None
+    ) -> dict:
+        return {"processed_summary": "Low risk", "report": "...", "errors": []}
+
+    monkeypatch.setattr(tasks, "run_workflow", workflow)
+
+    result = await run_assessment({"job_try": 1}, "a1", "https://acme.com")
+
+    assert result["summary"] == "Low risk"
+    assert publisher.emitted == ["completed"]
+
+
+class FakeTransaction:
+    """Session stand-in recording commits."""
+
+    commits = 0
+
+    async def __aenter__(self) -> "FakeTransaction":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        pass
+
+    async def commit(self) -> None:
+        FakeTransaction.commits += 1
+
+
+class FakeWriter:
+    """EvidenceWriter stand-in assigning ids to added rows."""
+
+    def __init__(self, session: Any) -> None:
+        self.ids: list[uuid.UUID] = []
+
+    async def __aenter__(self) -> "FakeWriter":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        pass
+
+    async def add_many(self, rows: list[dict]) -> None:
+        self.ids += [uuid.uuid4() for _ in rows]
+
+
+@pytest.mark.asyncio
+async def test_embedding_failure_keeps_stored_evidence(monkeypatch) -> None:
+    """Test that evidence is committed before, and apart from, embedding."""
+    FakeTransaction.commits = 0
+    embedded: list[list[uuid.UUID]] = []
+
+    async def embed_evidence(session: Any, ids: list, dedup: Any = None) -> int:
+        embedded.append(ids)
+        raise RuntimeError("embedding provider rate limited")
+
+    async def load_history(supplier_domain: str) -> None:
+        return None
+
+    rows = [{"supplier_domain": "acme.com", "content": "About Acme"}]
+    monkeypatch.setattr(tasks, "collected_evidence", lambda state: rows)
+    monkeypatch.setattr(tasks, "async_session_maker", FakeTransaction)
+    monkeypatch.setattr(tasks, "EvidenceWriter", FakeWriter)
+    monkeypatch.setattr(tasks, "embed_evidence", embed_evidence)
+    monkeypatch.setattr(tasks, "load_supplier_history", load_history)
+    monkeypatch.setattr(settings, "EMBEDDING_ENABLED", True)
+
+    await tasks._store_evidence({"assessment_id": "a1"})
+
+    assert FakeTransaction.commits == 1  # the evidence, not the embeddings
+    assert len(embedded) == 1 and len(embedded[0]) == 1